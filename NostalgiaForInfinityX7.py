@@ -1,17 +1,30 @@
-import copy
+import bisect
+import csv
 import logging
+import multiprocessing
+import operator
+import os
 import pathlib
+import queue
 import rapidjson
+import threading
+import tracemalloc
 import numpy as np
+import talib
 import talib.abstract as ta
 import pandas as pd
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy import merge_informative_pair
+from freqtrade.exchange import timeframe_to_minutes
 from pandas import DataFrame, Series
 from functools import reduce
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from collections import OrderedDict, deque
 from freqtrade.persistence import Trade, Order
 from datetime import datetime, timedelta
 import time
+from types import MappingProxyType
 from typing import Optional
 import warnings
 
@@ -97,6 +110,24 @@ class NostalgiaForInfinityX7(IStrategy):
     ("USDT", "BUSD", "USDC", "DAI", "TUSD", "FDUSD", "PAX", "USD", "EUR", "GBP", "TRY")
   )
   informative_ohlcv_columns = frozenset(("open", "high", "low", "close", "volume"))
+  # Oscillators (bounded or normalized indicators) and 0/1 flags, stored compact with indicators_compact_storage_enable
+  compact_float32_prefixes = ("RSI_", "STOCHRSIk_", "STOCHk_", "AROONU_", "AROOND_", "WILLR_", "CCI_", "MFI_", "CMF_")
+  # Oscillators the exit functions only read behind an `isinstance(..., np.float64)` check, they stay float64
+  compact_float64_columns = frozenset(("RSI_14_1d", "STOCHRSIk_14_14_3_3_1d", "AROONU_14_1d", "AROOND_14_1d"))
+  compact_flag_columns = frozenset(
+    (
+      "IB_READY",
+      "MRB_BULL",
+      "MRB_BEAR",
+      "PB_HAMMER",
+      "PB_STAR",
+      "ENGULF_BULL",
+      "ENGULF_BEAR",
+      "SFP_BULL",
+      "SFP_BEAR",
+      "SQZ_ON",
+    )
+  )
 
   # Backtest Age Filter emulation
   has_bt_agefilter = False
@@ -122,6 +153,47 @@ class NostalgiaForInfinityX7(IStrategy):
   # Number of cores to use for pandas_ta indicators calculations
   num_cores_indicators_calc = 0
 
+  # Keep the oscillator indicators as float32 and the pattern flags as bool in the analyzed dataframe, to cut its
+  # memory use. Price levels, and the oscillators the exits check to be np.float64, stay float64. Signals can differ
+  # when an oscillator is within float32 rounding of a threshold, check with
+  # tests/backtests/backtesting-focus-group-compact-storage.sh before enabling it.
+  indicators_compact_storage_enable = False
+
+  # Evaluate the entry conditions as a shared expression graph from this dataframe length on (the backtests): the
+  # masks used by several signals are computed once and the large conditions only on the rows left by the others.
+  # Building the graph costs more than it saves on the short live dataframes.
+  entry_conditions_lazy_min_rows = 50000
+
+  # In the backtests, read the last candles of custom_exit from views of the analyzed dataframe columns, instead of
+  # slicing the dataframe and building the candle Series for every open trade on every candle
+  exit_features_enable = True
+
+  # Write the profit targets file at most every this many seconds, instead of on every change. The pending changes
+  # are written by the next change or bot loop once due, and on shutdown. With the journal enabled, each change is
+  # also appended to a side file right away, so a crash in between doesn't lose it.
+  profit_target_cache_write_interval = 5.0
+  profit_target_cache_journal_enable = False
+
+  # Reuse the top of the order book of a pair for this many seconds in the order timeout checks, live and dry-run
+  # only. The tickers of the pairs with open orders are fetched in one call on each bot loop to fill it.
+  top_of_book_cache_ttl = 10.0
+
+  # The grinding, buyback and de-risk notifications are queued and sent by a background thread, live and dry-run
+  # only. The ones of a pair queued less than this many seconds after the last one sent are merged into one message.
+  # Past the max queued, new notifications are dropped instead of waiting.
+  notifications_min_interval = 2.0
+  notifications_max_queued = 1000
+
+  # Time the indicator stages (informative timeframes, merge, 5m indicators, protections, entry conditions) by pair
+  # and timeframe, and with the memory profiling the memory they allocate too (slower, traced by tracemalloc). The
+  # percentiles across the pairs of the last samples of each stage are written to
+  # user_data/nfix7-indicators-profile-<runmode>.json (or .csv) at most every this many seconds.
+  indicators_profiler_enable = False
+  indicators_profiler_memory_enable = False
+  indicators_profiler_format = "json"
+  indicators_profiler_window = 1000
+  indicators_profiler_write_interval = 60.0
+
   # Long Normal mode tags
   long_normal_mode_tags = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13"]
   # Long Pump mode tags
@@ -960,8 +1032,24 @@ class NostalgiaForInfinityX7(IStrategy):
   #############################################################
   # CACHES
 
-  hold_trades_cache = None
+  hold_trades_watcher = None
+  hold_trades_version = None
   target_profit_cache = None
+  btc_informative_cache = None
+  informative_cache = None
+  indicator_pool = None
+  threshold_masks_used = None
+  exit_features = None
+  analyzed_candles_cache = None
+  profit_aggregates = None
+  grind_ladders = None
+  trades_custom_data = None
+  profit_snapshots = None
+  open_trade_index = None
+  enter_tag_modes = None
+  top_of_book_cache = None
+  notification_queue = None
+  indicators_profiler = None
   #############################################################
   #
   #
@@ -995,6 +1083,19 @@ class NostalgiaForInfinityX7(IStrategy):
     # A list of parameters that can be changed through the config.
     NFI_SAFE_PARAMETERS = [
       "num_cores_indicators_calc",
+      "indicators_compact_storage_enable",
+      "entry_conditions_lazy_min_rows",
+      "exit_features_enable",
+      "profit_target_cache_write_interval",
+      "profit_target_cache_journal_enable",
+      "top_of_book_cache_ttl",
+      "notifications_min_interval",
+      "notifications_max_queued",
+      "indicators_profiler_enable",
+      "indicators_profiler_memory_enable",
+      "indicators_profiler_format",
+      "indicators_profiler_window",
+      "indicators_profiler_write_interval",
       "custom_fee_open_rate",
       "custom_fee_close_rate",
       "futures_mode_leverage",
@@ -1089,7 +1190,9 @@ class NostalgiaForInfinityX7(IStrategy):
           + ("-(backtest)" if (runmode_value == "backtest") else "")
           + ("-(hyperopt)" if (runmode_value == "hyperopt") else "")
           + ".json"
-        )
+        ),
+        write_interval=self.profit_target_cache_write_interval,
+        journal=self.profit_target_cache_journal_enable,
       )
     else:
       exchange_name = strategy_config["exchange"]["name"]
@@ -1113,9 +1216,94 @@ class NostalgiaForInfinityX7(IStrategy):
     # If the cached data hasn't changed, it's a no-op
     self.target_profit_cache.save()
 
+    if self.btc_informative_cache is None:
+      self.btc_informative_cache = InformativeCache()
+
+    # Keys of the threshold masks used so far, these are computed right away on the next candles
+    if self.threshold_masks_used is None:
+      self.threshold_masks_used = {"entry": set(), "protections": set()}
+
+    # Filled orders part of the profit of the open trades, by trade id
+    if self.profit_aggregates is None:
+      self.profit_aggregates = {}
+
+    # Grind ladders of the open trades (system v3), by trade id
+    if self.grind_ladders is None:
+      self.grind_ladders = {}
+
+    # Custom data of the open trades, read once and written at the end of the callbacks, by trade id
+    if self.trades_custom_data is None:
+      self.trades_custom_data = {}
+
+    # Orders and profit of the open trades, shared by the callbacks of a candle
+    if self.profit_snapshots is None:
+      self.profit_snapshots = ProfitSnapshots(timeframe_to_minutes(self.timeframe))
+
+    # Enter tags classified by the mode tag groups, for the mode dispatch of the callbacks
+    if self.enter_tag_modes is None:
+      self.enter_tag_modes = EnterTagModes(
+        {name.removesuffix("_mode_tags"): getattr(self, name) for name in dir(self) if name.endswith("_mode_tags")},
+        {
+          "long_rebuy_grind": "long_rebuy",
+          "long_rapid_rebuy_grind": "long_rapid",
+          "long_rapid_rebuy_grind_scalp": "long_rapid",
+          "long_scalp_rebuy_grind": "long_scalp",
+          "short_rebuy_grind": "short_rebuy",
+          "short_rapid_rebuy_grind": "short_rapid",
+          "short_scalp_rebuy_grind": "short_scalp",
+        },
+      )
+
+    # Bid and ask by pair, shared by the order timeout checks
+    if self.top_of_book_cache is None and strategy_config["runmode"].value in ("live", "dry_run"):
+      self.top_of_book_cache = TopOfBookCache(self.top_of_book_cache_ttl)
+
+    # Trade notifications, formatted and sent off the bot loop
+    if self.notification_queue is None and strategy_config["runmode"].value in ("live", "dry_run"):
+      self.notification_queue = NotificationQueue(
+        self.notification_msg, self.send_notification, self.notifications_max_queued, self.notifications_min_interval
+      )
+
+    # Indicator stage timings, to compare the versions with
+    if self.indicators_profiler_enable and self.indicators_profiler is None:
+      self.indicators_profiler = IndicatorsProfiler(
+        strategy_config["user_data_dir"]
+        / (
+          f"nfix7-indicators-profile-{strategy_config['runmode'].value}"
+          + (".csv" if self.indicators_profiler_format == "csv" else ".json")
+        ),
+        memory=self.indicators_profiler_memory_enable,
+        window=self.indicators_profiler_window,
+        write_interval=self.indicators_profiler_write_interval,
+      )
+
+    # Open trades counted by side, mode and pair, for the entry slot checks
+    if self.open_trade_index is None:
+      self.open_trade_index = OpenTradeIndex()
+
+    # Last candles of the analyzed dataframes by pair, shared by the callbacks of a candle
+    if self.analyzed_candles_cache is None:
+      self.analyzed_candles_cache = {}
+
+    # Exit features of the analyzed dataframes by pair, only read by the backtests
+    if (
+      self.exit_features_enable
+      and self.exit_features is None
+      and strategy_config["runmode"].value in ("backtest", "hyperopt")
+    ):
+      self.exit_features = {}
+
+    # Informative frames only get reused in live/dry-run, backtests run each pair once
+    if self.informative_cache is None and strategy_config["runmode"].value in ("live", "dry_run"):
+      num_pairs = max(len(strategy_config["exchange"].get("pair_whitelist", [])), 1)
+      self.informative_cache = InformativeCache(max_entries=num_pairs * len(self.info_timeframes))
+
     # Parameter settings. Backward compatibility with the old configuration style.
     self.update_signals_from_config(strategy_config)
 
+    # The indicator workers are forked here, before the bot starts any thread
+    self.get_indicator_pool()
+
   # Plot configuration for FreqUI
   # ---------------------------------------------------------------------------------------------
   @property
@@ -1858,6 +2046,32 @@ class NostalgiaForInfinityX7(IStrategy):
         append_exit(order)
     return filled_orders, filled_entries, filled_exits
 
+  def trade_custom_data(self, trade: "Trade") -> "TradeCustomData":
+    trade_key = trade.id if trade.id is not None else id(trade)
+    custom_data = self.trades_custom_data.get(trade_key)
+    if custom_data is None or custom_data.trade is not trade:
+      if custom_data is not None:
+        custom_data.flush()
+      custom_data = TradeCustomData(trade)
+      self.trades_custom_data[trade_key] = custom_data
+    return custom_data
+
+  def flush_trade_custom_data(self, trade: "Trade") -> None:
+    trade_key = trade.id if trade.id is not None else id(trade)
+    custom_data = self.trades_custom_data.get(trade_key)
+    if custom_data is not None:
+      custom_data.flush()
+      if not trade.is_open:
+        del self.trades_custom_data[trade_key]
+
+  def trade_grind_ladders(self, trade: "Trade", filled_orders: list) -> "GrindLadders":
+    trade_key = trade.id if trade.id is not None else id(trade)
+    grind_ladders = self.grind_ladders.get(trade_key)
+    if grind_ladders is None or not grind_ladders.is_valid(filled_orders):
+      grind_ladders = GrindLadders(trade.is_short, trade.entry_side, trade.exit_side, filled_orders)
+      self.grind_ladders[trade_key] = grind_ladders
+    return grind_ladders
+
   def trade_order_state(self, trade: "Trade") -> tuple:
     orders = trade.orders
 
@@ -1869,7 +2083,18 @@ class NostalgiaForInfinityX7(IStrategy):
       getattr(last_order, "filled", None),
     )
 
-  def cache_backtest_profit_snapshot(
+  def profit_snapshot_key(self, trade: "Trade", exit_rate: float) -> tuple:
+    trade_key = trade.id if trade.id is not None else id(trade)
+    return (
+      trade_key,
+      exit_rate,
+      self.trade_order_state(trade),
+      trade.fee_open,
+      trade.fee_close,
+      trade.funding_fees,
+    )
+
+  def cache_profit_snapshot(
     self,
     trade: "Trade",
     current_time: "datetime",
@@ -1879,52 +2104,19 @@ class NostalgiaForInfinityX7(IStrategy):
     filled_exits: "Orders",
     profit_values: tuple,
   ) -> None:
-    if not self.is_backtest_mode():
-      return
-
-    trade_key = trade.id if trade.id is not None else id(trade)
-    self._backtest_profit_snapshot = (
-      trade_key,
-      current_time,
-      exit_rate,
-      self.trade_order_state(trade),
-      filled_orders,
-      filled_entries,
-      filled_exits,
-      profit_values,
+    profit_snapshots = self.profit_snapshots
+    profit_snapshots.start_candle(current_time)
+    profit_snapshots.set(
+      self.profit_snapshot_key(trade, exit_rate), (filled_orders, filled_entries, filled_exits, profit_values)
     )
 
-  def backtest_profit_snapshot(self, trade: "Trade", current_time: "datetime", exit_rate: float) -> tuple | None:
-    if not self.is_backtest_mode():
-      return None
-
-    snapshot = getattr(self, "_backtest_profit_snapshot", None)
-    if snapshot is None:
-      return None
-
-    (
-      snapshot_trade_id,
-      snapshot_time,
-      snapshot_exit_rate,
-      snapshot_order_state,
-      filled_orders,
-      filled_entries,
-      filled_exits,
-      profit_values,
-    ) = snapshot
-    trade_key = trade.id if trade.id is not None else id(trade)
-    if (
-      snapshot_trade_id == trade_key
-      and snapshot_time == current_time
-      and snapshot_exit_rate == exit_rate
-      and snapshot_order_state == self.trade_order_state(trade)
-    ):
-      return filled_orders, filled_entries, filled_exits, profit_values
-
-    return None
+  def profit_snapshot(self, trade: "Trade", current_time: "datetime", exit_rate: float) -> tuple | None:
+    profit_snapshots = self.profit_snapshots
+    profit_snapshots.start_candle(current_time)
+    return profit_snapshots.get(self.profit_snapshot_key(trade, exit_rate))
 
   def profit_or_order_snapshot(self, trade: "Trade", current_time: "datetime", exit_rate: float) -> tuple:
-    profit_snapshot = self.backtest_profit_snapshot(trade, current_time, exit_rate)
+    profit_snapshot = self.profit_snapshot(trade, current_time, exit_rate)
     if profit_snapshot is not None:
       return profit_snapshot
 
@@ -1940,59 +2132,68 @@ class NostalgiaForInfinityX7(IStrategy):
     Calculates the absolute profit for open trades.
 
     :param trade: trade object.
-    :param filled_entries: Filled entries list.
-    :param filled_exits: Filled exits list.
+    :param filled_entries: Filled entries list, None to only select them when the orders changed.
+    :param filled_exits: Filled exits list, None to only select them when the orders changed.
     :param exit_rate: The exit rate.
     :return tuple: The total profit in stake, ratio, ratio based on current stake, and ratio based on the first entry stake.
     """
     custom_fee_open_rate = self.custom_fee_open_rate
     custom_fee_close_rate = self.custom_fee_close_rate
-    is_futures_mode = self.is_futures_mode
 
     fee_open_rate = trade.fee_open if custom_fee_open_rate is None else custom_fee_open_rate
     fee_close_rate = trade.fee_close if custom_fee_close_rate is None else custom_fee_close_rate
 
-    total_amount = 0.0
-    total_stake = 0.0
-    total_profit = 0.0
-    if trade.is_short:
-      fee_open_multiplier = 1 - fee_open_rate
-      fee_close_multiplier = 1 + fee_close_rate
-      for entry_order in filled_entries:
-        filled = entry_order.safe_filled
-        entry_stake = filled * entry_order.safe_price * fee_open_multiplier
-        total_amount += filled
-        total_stake += entry_stake
-        total_profit += entry_stake
-      for exit_order in filled_exits:
-        filled = exit_order.safe_filled
-        exit_stake = filled * exit_order.safe_price * fee_close_multiplier
-        total_amount -= filled
-        total_profit -= exit_stake
-      current_stake = total_amount * exit_rate * fee_close_multiplier
-      total_profit -= current_stake
-    else:
-      fee_open_multiplier = 1 + fee_open_rate
-      fee_close_multiplier = 1 - fee_close_rate
-      for entry_order in filled_entries:
-        filled = entry_order.safe_filled
-        entry_stake = filled * entry_order.safe_price * fee_open_multiplier
-        total_amount += filled
-        total_stake += entry_stake
-        total_profit -= entry_stake
-      for exit_order in filled_exits:
-        filled = exit_order.safe_filled
-        exit_stake = filled * exit_order.safe_price * fee_close_multiplier
-        total_amount -= filled
-        total_profit += exit_stake
-      current_stake = total_amount * exit_rate * fee_close_multiplier
-      total_profit += current_stake
-    if is_futures_mode and trade.funding_fees is not None:
-      total_profit += trade.funding_fees
-    total_profit_ratio = total_profit / total_stake
-    current_profit_ratio = total_profit / current_stake
-    init_profit_ratio = total_profit / (filled_entries[0].safe_filled * filled_entries[0].safe_price)
-    return total_profit, total_profit_ratio, current_profit_ratio, init_profit_ratio
+    # The filled orders part is only summed again when the orders or the fees change
+    profit_aggregate = self.profit_aggregate(trade, filled_entries, filled_exits, fee_open_rate, fee_close_rate)
+    funding_fees = trade.funding_fees if self.is_futures_mode else None
+    return profit_aggregate.total_profit(exit_rate, funding_fees)
+
+  def refresh_profit_aggregate(self, trade: "Trade") -> None:
+    """Sum the filled orders again, a fill doesn't always change the order state the aggregate is kept for."""
+    custom_fee_open_rate = self.custom_fee_open_rate
+    custom_fee_close_rate = self.custom_fee_close_rate
+    fee_open_rate = trade.fee_open if custom_fee_open_rate is None else custom_fee_open_rate
+    fee_close_rate = trade.fee_close if custom_fee_close_rate is None else custom_fee_close_rate
+
+    _, filled_entries, filled_exits = self.filled_order_snapshot(trade)
+    if not filled_entries:
+      return
+    trade_key = trade.id if trade.id is not None else id(trade)
+    profit_aggregate = ProfitAggregate(
+      (self.trade_order_state(trade), fee_open_rate, fee_close_rate),
+      trade.is_short,
+      filled_entries,
+      filled_exits,
+      fee_open_rate,
+      fee_close_rate,
+    )
+    self.profit_aggregates[trade_key] = profit_aggregate
+    if trade.id is not None and self.config["runmode"].value in ("live", "dry_run"):
+      self.trade_custom_data(trade).set(key="profit_aggregate", value=profit_aggregate.to_custom_data())
+
+  def profit_aggregate(
+    self,
+    trade: "Trade",
+    filled_entries: list | None,
+    filled_exits: list | None,
+    fee_open_rate: float,
+    fee_close_rate: float,
+  ) -> "ProfitAggregate":
+    trade_key = trade.id if trade.id is not None else id(trade)
+    state = (self.trade_order_state(trade), fee_open_rate, fee_close_rate)
+    profit_aggregates = self.profit_aggregates
+    profit_aggregate = profit_aggregates.get(trade_key)
+    if profit_aggregate is None and trade.id is not None and self.config["runmode"].value in ("live", "dry_run"):
+      # After a restart
+      profit_aggregate = ProfitAggregate.from_custom_data(self.trade_custom_data(trade).get(key="profit_aggregate"))
+    if profit_aggregate is None or profit_aggregate.state != state:
+      if filled_entries is None or filled_exits is None:
+        _, filled_entries, filled_exits = self.filled_order_snapshot(trade)
+      profit_aggregate = ProfitAggregate(
+        state, trade.is_short, filled_entries, filled_exits, fee_open_rate, fee_close_rate
+      )
+    profit_aggregates[trade_key] = profit_aggregate
+    return profit_aggregate
 
   @staticmethod
   def scale_stakes_for_min_stake(stakes, slice_amount, min_stake, stake_leverage, trade_leverage):
@@ -2009,43 +2210,24 @@ class NostalgiaForInfinityX7(IStrategy):
   ):
     trade_is_short = trade.is_short
 
-    long_normal_mode_tags = self.long_normal_mode_tags
-    long_pump_mode_tags = self.long_pump_mode_tags
-    long_quick_mode_tags = self.long_quick_mode_tags
-    long_rebuy_mode_tags = self.long_rebuy_mode_tags
-    long_rebuy_grind_mode_tags = self.long_rebuy_grind_mode_tags
-    long_high_profit_mode_tags = self.long_high_profit_mode_tags
-    long_rapid_mode_tags = self.long_rapid_mode_tags
-    long_rapid_rebuy_grind_scalp_mode_tags = self.long_rapid_rebuy_grind_scalp_mode_tags
-    long_grind_mode_tags = self.long_grind_mode_tags
-    long_btc_mode_tags = self.long_btc_mode_tags
-    long_top_coins_mode_tags = self.long_top_coins_mode_tags
-    long_scalp_mode_tags = self.long_scalp_mode_tags
-    long_scalp_rebuy_grind_mode_tags = self.long_scalp_rebuy_grind_mode_tags
-    long_known_mode_tags = self.long_known_mode_tags
-    short_normal_mode_tags = self.short_normal_mode_tags
-    short_pump_mode_tags = self.short_pump_mode_tags
-    short_quick_mode_tags = self.short_quick_mode_tags
-    short_rebuy_mode_tags = self.short_rebuy_mode_tags
-    short_high_profit_mode_tags = self.short_high_profit_mode_tags
-    short_rapid_mode_tags = self.short_rapid_mode_tags
-    short_scalp_mode_tags = self.short_scalp_mode_tags
-    short_scalp_rebuy_grind_mode_tags = self.short_scalp_rebuy_grind_mode_tags
-    short_exit_known_mode_tags = self.short_exit_known_mode_tags
-
     calc_total_profit = self.calc_total_profit
-    cache_backtest_profit_snapshot = self.cache_backtest_profit_snapshot
     filled_order_snapshot = self.filled_order_snapshot
     long_exit_normal = self.long_exit_normal
     long_exit_pump = self.long_exit_pump
     long_exit_quick = self.long_exit_quick
     short_exit_normal = self.short_exit_normal
 
-    df, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
-    if len(df) < 2:
-      return None
-    last_candle = df.iloc[-1]
-    previous_candle_1 = df.iloc[-2]
+    exit_features = self.exit_features.get(pair) if self.exit_features is not None else None
+    if exit_features is not None:
+      candles = exit_features.candles(current_time)
+      if candles is None:
+        return None
+      last_candle, previous_candle_1 = candles
+    else:
+      candles = self.analyzed_candles(pair)
+      if len(candles) < 2:
+        return None
+      last_candle, previous_candle_1 = candles
 
     enter_tag = "empty"
     if hasattr(trade, "enter_tag"):
@@ -2053,18 +2235,27 @@ class NostalgiaForInfinityX7(IStrategy):
       if trade_enter_tag is not None:
         enter_tag = trade_enter_tag
     enter_tags = enter_tag.split()
-
-    filled_orders, filled_entries, filled_exits = filled_order_snapshot(trade)
+    enter_tag_modes = self.enter_tag_modes
+    tag_modes = enter_tag_modes.modes(enter_tag)
+    any_bits = enter_tag_modes.any_bits
+    all_bits = enter_tag_modes.all_bits
+    mixed_bits = enter_tag_modes.mixed_bits
 
     profit_stake = 0.0
     profit_ratio = 0.0
     profit_current_stake_ratio = 0.0
     profit_init_ratio = 0.0
-    profit_values = calc_total_profit(trade, filled_entries, filled_exits, current_rate)
+    # Reuse the orders and profit of adjust_trade_position on the same candle
+    profit_snapshot = self.profit_snapshot(trade, current_time, current_rate)
+    if profit_snapshot is not None:
+      filled_orders, filled_entries, filled_exits, profit_values = profit_snapshot
+    else:
+      filled_orders, filled_entries, filled_exits = filled_order_snapshot(trade)
+      profit_values = calc_total_profit(trade, filled_entries, filled_exits, current_rate)
+      self.cache_profit_snapshot(
+        trade, current_time, current_rate, filled_orders, filled_entries, filled_exits, profit_values
+      )
     profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = profit_values
-    cache_backtest_profit_snapshot(
-      trade, current_time, current_rate, filled_orders, filled_entries, filled_exits, profit_values
-    )
 
     # Signal 192 (Quad pullback long) tight doom stop: every 192 loss bottoms at a
     # 11.8-14% price drop (the shared 0.35 doom threshold) while winners' max adverse
@@ -2082,7 +2273,7 @@ class NostalgiaForInfinityX7(IStrategy):
     max_loss = 0.0
 
     # Long Normal mode
-    if any(c in long_normal_mode_tags for c in enter_tags):
+    if tag_modes & any_bits["long_normal"]:
       sell, signal_name = long_exit_normal(
         pair,
         current_rate,
@@ -2105,7 +2296,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long Pump mode
-    if any(c in long_pump_mode_tags for c in enter_tags):
+    if tag_modes & any_bits["long_pump"]:
       sell, signal_name = long_exit_pump(
         pair,
         current_rate,
@@ -2128,7 +2319,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long Quick mode
-    if any(c in long_quick_mode_tags for c in enter_tags):
+    if tag_modes & any_bits["long_quick"]:
       sell, signal_name = long_exit_quick(
         pair,
         current_rate,
@@ -2151,9 +2342,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long Rebuy mode
-    if all(c in long_rebuy_mode_tags for c in enter_tags) or (
-      any(c in long_rebuy_mode_tags for c in enter_tags) and all(c in long_rebuy_grind_mode_tags for c in enter_tags)
-    ):
+    if tag_modes & mixed_bits["long_rebuy_grind"]:
       sell, signal_name = self.long_exit_rebuy(
         pair,
         current_rate,
@@ -2175,7 +2364,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long high profit mode
-    if any(c in long_high_profit_mode_tags for c in enter_tags):
+    if tag_modes & any_bits["long_high_profit"]:
       sell, signal_name = self.long_exit_high_profit(
         pair,
         current_rate,
@@ -2198,10 +2387,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long rapid mode
-    if all(c in long_rapid_mode_tags for c in enter_tags) or (
-      any(c in long_rapid_mode_tags for c in enter_tags)
-      and all(c in long_rapid_rebuy_grind_scalp_mode_tags for c in enter_tags)
-    ):
+    if tag_modes & mixed_bits["long_rapid_rebuy_grind_scalp"]:
       sell, signal_name = self.long_exit_rapid(
         pair,
         current_rate,
@@ -2223,7 +2409,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long grind mode
-    if all(c in long_grind_mode_tags for c in enter_tags):
+    if tag_modes & all_bits["long_grind"]:
       sell, signal_name = self.long_exit_grind(
         pair,
         current_rate,
@@ -2245,7 +2431,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long btc mode
-    if all(c in long_btc_mode_tags for c in enter_tags):
+    if tag_modes & all_bits["long_btc"]:
       sell, signal_name = self.long_exit_btc(
         pair,
         current_rate,
@@ -2267,7 +2453,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long Top Coins mode
-    if any(c in long_top_coins_mode_tags for c in enter_tags):
+    if tag_modes & any_bits["long_top_coins"]:
       sell, signal_name = self.long_exit_top_coins(
         pair,
         current_rate,
@@ -2290,10 +2476,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long scalp mode
-    if all(c in long_scalp_mode_tags for c in enter_tags) or (
-      any(c in long_scalp_mode_tags for c in enter_tags)
-      and all(c in long_scalp_rebuy_grind_mode_tags for c in enter_tags)
-    ):
+    if tag_modes & mixed_bits["long_scalp_rebuy_grind"]:
       sell, signal_name = self.long_exit_scalp(
         pair,
         current_rate,
@@ -2315,7 +2498,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Short normal mode
-    if any(c in short_normal_mode_tags for c in enter_tags):
+    if tag_modes & any_bits["short_normal"]:
       sell, signal_name = short_exit_normal(
         pair,
         current_rate,
@@ -2338,7 +2521,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Short Pump mode
-    if any(c in short_pump_mode_tags for c in enter_tags):
+    if tag_modes & any_bits["short_pump"]:
       sell, signal_name = self.short_exit_pump(
         pair,
         current_rate,
@@ -2361,7 +2544,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Short Quick mode
-    if any(c in short_quick_mode_tags for c in enter_tags):
+    if tag_modes & any_bits["short_quick"]:
       sell, signal_name = self.short_exit_quick(
         pair,
         current_rate,
@@ -2384,7 +2567,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Short Rebuy mode
-    if all(c in short_rebuy_mode_tags for c in enter_tags):
+    if tag_modes & all_bits["short_rebuy"]:
       sell, signal_name = self.short_exit_rebuy(
         pair,
         current_rate,
@@ -2406,7 +2589,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Short high profit mode
-    if any(c in short_high_profit_mode_tags for c in enter_tags):
+    if tag_modes & any_bits["short_high_profit"]:
       sell, signal_name = self.short_exit_high_profit(
         pair,
         current_rate,
@@ -2429,7 +2612,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Short rapid mode
-    if any(c in short_rapid_mode_tags for c in enter_tags):
+    if tag_modes & any_bits["short_rapid"]:
       sell, signal_name = self.short_exit_rapid(
         pair,
         current_rate,
@@ -2451,10 +2634,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Short scalp mode
-    if all(c in short_scalp_mode_tags for c in enter_tags) or (
-      any(c in short_scalp_mode_tags for c in enter_tags)
-      and all(c in short_scalp_rebuy_grind_mode_tags for c in enter_tags)
-    ):
+    if tag_modes & mixed_bits["short_scalp_rebuy_grind"]:
       sell, signal_name = self.short_exit_scalp(
         pair,
         current_rate,
@@ -2476,7 +2656,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Trades not opened by X7
-    if not trade_is_short and (not any(c in long_known_mode_tags for c in enter_tags)):
+    if not trade_is_short and (not tag_modes & any_bits["long_known"]):
       # use normal mode for such trades
       sell, signal_name = long_exit_normal(
         pair,
@@ -2500,7 +2680,7 @@ class NostalgiaForInfinityX7(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Trades not opened by X7
-    if trade_is_short and (not any(c in short_exit_known_mode_tags for c in enter_tags)):
+    if trade_is_short and (not tag_modes & any_bits["short_exit_known"]):
       # use normal mode for such trades
       sell, signal_name = short_exit_normal(
         pair,
@@ -2540,25 +2720,17 @@ class NostalgiaForInfinityX7(IStrategy):
     side: str,
     **kwargs,
   ) -> float:
-    long_rebuy_mode_tags = self.long_rebuy_mode_tags
-    long_rebuy_grind_mode_tags = self.long_rebuy_grind_mode_tags
     system_v3_rebuy_mode_stake_multiplier = self.system_v3_rebuy_mode_stake_multiplier
     system_v3_name = self.system_v3_name
     system_v3_2_name = self.system_v3_2_name
     system_v3_2_stake_multiplier = self.system_v3_2_stake_multiplier
     system_v3_1_name = self.system_v3_1_name
     system_v3_1_stake_multiplier = self.system_v3_1_stake_multiplier
-    long_rapid_mode_tags = self.long_rapid_mode_tags
-    short_rebuy_mode_tags = self.short_rebuy_mode_tags
-    short_rebuy_grind_mode_tags = self.short_rebuy_grind_mode_tags
-    short_rapid_mode_tags = self.short_rapid_mode_tags
-    long_rapid_rebuy_grind_mode_tags = self.long_rapid_rebuy_grind_mode_tags
-    long_grind_mode_tags = self.long_grind_mode_tags
-    long_btc_mode_tags = self.long_btc_mode_tags
-    short_rapid_rebuy_grind_mode_tags = self.short_rapid_rebuy_grind_mode_tags
-    short_grind_mode_tags = self.short_grind_mode_tags
 
-    enter_tags = entry_tag.split()
+    enter_tag_modes = self.enter_tag_modes
+    tag_modes = enter_tag_modes.modes(entry_tag)
+    all_bits = enter_tag_modes.all_bits
+    mixed_bits = enter_tag_modes.mixed_bits
     is_futures_mode = self.is_futures_mode
     system_name_use = self.system_name_use
     system_name_is_v3 = system_name_use == system_v3_name
@@ -2586,27 +2758,19 @@ class NostalgiaForInfinityX7(IStrategy):
 
     if side == "long":
       # Rebuy mode
-      if all(c in long_rebuy_mode_tags for c in enter_tags) or (
-        any(c in long_rebuy_mode_tags for c in enter_tags) and all(c in long_rebuy_grind_mode_tags for c in enter_tags)
-      ):
+      if tag_modes & mixed_bits["long_rebuy_grind"]:
         return scaled_stake(system_v3_rebuy_mode_stake_multiplier)
       # Rapid mode
-      if system_name_is_v3 and (
-        all(c in long_rapid_mode_tags for c in enter_tags)
-        or (
-          any(c in long_rapid_mode_tags for c in enter_tags)
-          and all(c in long_rapid_rebuy_grind_mode_tags for c in enter_tags)
-        )
-      ):
+      if system_name_is_v3 and (tag_modes & mixed_bits["long_rapid_rebuy_grind"]):
         return scaled_stake(rapid_mode_stake_multipliers[0])
       # Grind mode
-      elif all(c in long_grind_mode_tags for c in enter_tags):
+      elif tag_modes & all_bits["long_grind"]:
         for item in grind_mode_stake_multipliers:
           stake = proposed_stake * item
           if (min_stake is None) or (stake > min_stake):
             return stake
       # Btc mode
-      elif all(c in long_btc_mode_tags for c in enter_tags):
+      elif tag_modes & all_bits["long_btc"]:
         return proposed_stake * grind_mode_stake_multipliers[0]
       else:
         if system_name_is_v3_2:
@@ -2617,25 +2781,16 @@ class NostalgiaForInfinityX7(IStrategy):
           return scaled_stake(regular_mode_stake_multipliers[0])
     else:
       # Rebuy mode
-      if all(c in short_rebuy_mode_tags for c in enter_tags) or (
-        any(c in short_rebuy_mode_tags for c in enter_tags)
-        and all(c in short_rebuy_grind_mode_tags for c in enter_tags)
-      ):
+      if tag_modes & mixed_bits["short_rebuy_grind"]:
         return scaled_stake(system_v3_rebuy_mode_stake_multiplier)
       # Grind mode
-      elif all(c in short_grind_mode_tags for c in enter_tags):
+      elif tag_modes & all_bits["short_grind"]:
         for item in grind_mode_stake_multipliers:
           stake = proposed_stake * item
           if (min_stake is None) or (stake > min_stake):
             return stake
       # Rapid mode
-      if system_name_is_v3 and (
-        all(c in short_rapid_mode_tags for c in enter_tags)
-        or (
-          any(c in short_rapid_mode_tags for c in enter_tags)
-          and all(c in short_rapid_rebuy_grind_mode_tags for c in enter_tags)
-        )
-      ):
+      if system_name_is_v3 and (tag_modes & mixed_bits["short_rapid_rebuy_grind"]):
         return scaled_stake(rapid_mode_stake_multipliers[0])
       else:
         if system_name_is_v3_2:
@@ -2655,7 +2810,24 @@ class NostalgiaForInfinityX7(IStrategy):
     system_v3_2_name = self.system_v3_2_name
     system_v3_1_name = self.system_v3_1_name
     system_v3_name = self.system_v3_name
-    set_custom_data = trade.set_custom_data
+    set_custom_data = self.trade_custom_data(trade).set
+
+    # Sum the filled orders for the profit calculations now, and keep it with the trade in live
+    trade_key = trade.id if trade.id is not None else id(trade)
+    if not trade.is_open:
+      self.profit_aggregates.pop(trade_key, None)
+      self.grind_ladders.pop(trade_key, None)
+    else:
+      self.refresh_profit_aggregate(trade)
+      grind_ladders = self.grind_ladders.get(trade_key)
+      if grind_ladders is not None:
+        grind_ladders.add(order)
+
+    # Keep the open trades index up to date until the next rebuild
+    if order.ft_order_side == trade.entry_side and trade.is_open:
+      self.index_open_trade(trade)
+    else:
+      self.open_trade_index.closing(trade_key, trade)
 
     if trade.nr_of_successful_entries == 1:
       if system_name_use == system_v3_2_name:
@@ -2665,26 +2837,27 @@ class NostalgiaForInfinityX7(IStrategy):
       elif system_name_use == system_v3_name:
         set_custom_data(key="system_version", value=system_v3_name)
         # set initial data for the trade
-        trade.set_custom_data(key="grind_1_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_1_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_1_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_1_cluster_max_profit_rate", value=0.0)
 
-        trade.set_custom_data(key="grind_2_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_2_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_2_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_2_cluster_max_profit_rate", value=0.0)
 
-        trade.set_custom_data(key="grind_3_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_3_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_3_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_3_cluster_max_profit_rate", value=0.0)
 
-        trade.set_custom_data(key="grind_4_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_4_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_4_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_4_cluster_max_profit_rate", value=0.0)
 
-        trade.set_custom_data(key="grind_5_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_5_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_5_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_5_cluster_max_profit_rate", value=0.0)
 
     if system_name_use == system_v3_2_name:
       filled_entries = trade.select_filled_orders(trade.entry_side)
 
       order_tag = order.ft_order_tag
       if order_tag is None:
+        self.flush_trade_custom_data(trade)
         return None
       order_mode = order_tag.split(" ", 1)
       order_tags = []
@@ -2694,48 +2867,49 @@ class NostalgiaForInfinityX7(IStrategy):
       if len(order_tags) > 1:
         order_tags = order_tags[1:]
       if order_mode in ["derisk_level_1"]:
-        trade.set_custom_data(key="derisk_level_1", value=True)
+        set_custom_data(key="derisk_level_1", value=True)
       elif order_mode in ["derisk_level_2"]:
-        trade.set_custom_data(key="derisk_level_2", value=True)
+        set_custom_data(key="derisk_level_2", value=True)
       elif order_mode in ["derisk_level_3"]:
-        trade.set_custom_data(key="derisk_level_3", value=True)
+        set_custom_data(key="derisk_level_3", value=True)
 
       # elif order_mode in ["grind_1_entry"]:
       elif order_mode in ["grind_1_exit"]:
-        trade.set_custom_data(key="grind_1_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_1_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_1_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_1_cluster_max_profit_rate", value=0.0)
       elif order_mode in ["grind_1_derisk"]:
-        trade.set_custom_data(key="grind_1_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_1_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_1_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_1_cluster_max_profit_rate", value=0.0)
 
       elif order_mode in ["grind_2_exit"]:
-        trade.set_custom_data(key="grind_2_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_2_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_2_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_2_cluster_max_profit_rate", value=0.0)
       elif order_mode in ["grind_2_derisk"]:
-        trade.set_custom_data(key="grind_2_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_2_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_2_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_2_cluster_max_profit_rate", value=0.0)
 
       elif order_mode in ["grind_3_exit"]:
-        trade.set_custom_data(key="grind_3_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_3_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_3_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_3_cluster_max_profit_rate", value=0.0)
       elif order_mode in ["grind_3_derisk"]:
-        trade.set_custom_data(key="grind_3_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_3_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_3_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_3_cluster_max_profit_rate", value=0.0)
 
       elif order_mode in ["grind_4_exit"]:
-        trade.set_custom_data(key="grind_4_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_4_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_4_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_4_cluster_max_profit_rate", value=0.0)
       elif order_mode in ["grind_4_derisk"]:
-        trade.set_custom_data(key="grind_4_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_4_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_4_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_4_cluster_max_profit_rate", value=0.0)
 
       elif order_mode in ["grind_5_exit"]:
-        trade.set_custom_data(key="grind_5_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_5_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_5_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_5_cluster_max_profit_rate", value=0.0)
       elif order_mode in ["grind_5_derisk"]:
-        trade.set_custom_data(key="grind_5_cluster_max_profit_stake", value=0.0)
-        trade.set_custom_data(key="grind_5_cluster_max_profit_rate", value=0.0)
+        set_custom_data(key="grind_5_cluster_max_profit_stake", value=0.0)
+        set_custom_data(key="grind_5_cluster_max_profit_rate", value=0.0)
 
+    self.flush_trade_custom_data(trade)
     return None
 
   # Adjust Trade Position
@@ -2753,6 +2927,36 @@ class NostalgiaForInfinityX7(IStrategy):
     current_entry_profit: float,
     current_exit_profit: float,
     **kwargs,
+  ):
+    try:
+      return self.trade_position_adjustment(
+        trade,
+        current_time,
+        current_rate,
+        current_profit,
+        min_stake,
+        max_stake,
+        current_entry_rate,
+        current_exit_rate,
+        current_entry_profit,
+        current_exit_profit,
+      )
+    finally:
+      # The custom data set while adjusting is written once, at the end
+      self.flush_trade_custom_data(trade)
+
+  def trade_position_adjustment(
+    self,
+    trade: Trade,
+    current_time: datetime,
+    current_rate: float,
+    current_profit: float,
+    min_stake: Optional[float],
+    max_stake: float,
+    current_entry_rate: float,
+    current_exit_rate: float,
+    current_entry_profit: float,
+    current_exit_profit: float,
   ):
     # =========================================================================
     # FAST EXIT
@@ -2770,6 +2974,11 @@ class NostalgiaForInfinityX7(IStrategy):
       if trade_enter_tag is not None:
         enter_tag = trade_enter_tag
     enter_tags = enter_tag.split()
+    enter_tag_modes = self.enter_tag_modes
+    tag_modes = enter_tag_modes.modes(enter_tag)
+    any_bits = enter_tag_modes.any_bits
+    all_bits = enter_tag_modes.all_bits
+    mixed_bits = enter_tag_modes.mixed_bits
 
     # =========================================================================
     # SYSTEM VERSION
@@ -2807,11 +3016,7 @@ class NostalgiaForInfinityX7(IStrategy):
       # -----------------------------------------------------------------------
       # REBUY MODE
       # -----------------------------------------------------------------------
-      is_long_rebuy = all(c in self.long_rebuy_mode_tags for c in enter_tags)
-      if not is_long_rebuy:
-        is_long_rebuy = any(c in self.long_rebuy_mode_tags for c in enter_tags) and all(
-          c in self.long_rebuy_grind_mode_tags for c in enter_tags
-        )
+      is_long_rebuy = tag_modes & mixed_bits["long_rebuy_grind"]
 
       if is_long_rebuy:
         if is_system_v3_family:
@@ -2821,16 +3026,16 @@ class NostalgiaForInfinityX7(IStrategy):
       # -----------------------------------------------------------------------
       # LONG MODE CLASSIFICATION
       # -----------------------------------------------------------------------
-      is_long_grind_mode = all(c in self.long_grind_mode_tags for c in enter_tags)
-      is_long_btc_mode = all(c in self.long_btc_mode_tags for c in enter_tags)
+      is_long_grind_mode = tag_modes & all_bits["long_grind"]
+      is_long_btc_mode = tag_modes & all_bits["long_btc"]
 
       # -----------------------------------------------------------------------
       # V3 GRIND
       # -----------------------------------------------------------------------
       if is_system_v3_family:
         if not is_long_grind_mode and not is_long_btc_mode:
-          is_long_adjust_mode = any(c in self.long_adjust_mode_tags for c in enter_tags)
-          is_long_known_mode = any(c in self.long_known_mode_tags for c in enter_tags)
+          is_long_adjust_mode = tag_modes & any_bits["long_adjust"]
+          is_long_known_mode = tag_modes & any_bits["long_known"]
 
           if is_long_adjust_mode or not is_long_known_mode:
             return self.long_grind_adjust_trade_position_v3(*args)
@@ -2847,8 +3052,8 @@ class NostalgiaForInfinityX7(IStrategy):
       if is_long_grind_mode or is_long_btc_mode or not is_v2_date:
         return self.long_grind_adjust_trade_position(*args)
 
-      is_long_adjust_mode = any(c in self.long_adjust_mode_tags for c in enter_tags)
-      is_long_known_mode = any(c in self.long_known_mode_tags for c in enter_tags)
+      is_long_adjust_mode = tag_modes & any_bits["long_adjust"]
+      is_long_known_mode = tag_modes & any_bits["long_known"]
 
       if is_long_adjust_mode or not is_long_known_mode:
         return self.long_grind_adjust_trade_position_v2(*args)
@@ -2860,11 +3065,7 @@ class NostalgiaForInfinityX7(IStrategy):
       # -----------------------------------------------------------------------
       # REBUY MODE
       # -----------------------------------------------------------------------
-      is_short_rebuy = all(c in self.short_rebuy_mode_tags for c in enter_tags)
-      if not is_short_rebuy:
-        is_short_rebuy = any(c in self.short_rebuy_mode_tags for c in enter_tags) and all(
-          c in self.short_rebuy_grind_mode_tags for c in enter_tags
-        )
+      is_short_rebuy = tag_modes & mixed_bits["short_rebuy_grind"]
       if is_short_rebuy:
         if is_system_v3_family:
           return self.short_rebuy_adjust_trade_position_v3(*args)
@@ -2873,15 +3074,15 @@ class NostalgiaForInfinityX7(IStrategy):
       # -----------------------------------------------------------------------
       # SHORT MODE CLASSIFICATION
       # -----------------------------------------------------------------------
-      is_short_grind_mode = all(c in self.short_grind_mode_tags for c in enter_tags)
+      is_short_grind_mode = tag_modes & all_bits["short_grind"]
 
       # -----------------------------------------------------------------------
       # V3 GRIND
       # -----------------------------------------------------------------------
       if is_system_v3_family:
         if not is_short_grind_mode:
-          is_short_adjust_mode = any(c in self.short_adjust_mode_tags for c in enter_tags)
-          is_short_known_mode = any(c in self.short_known_mode_tags for c in enter_tags)
+          is_short_adjust_mode = tag_modes & any_bits["short_adjust"]
+          is_short_known_mode = tag_modes & any_bits["short_known"]
 
           if is_short_adjust_mode or not is_short_known_mode:
             return self.short_grind_adjust_trade_position_v3(*args)
@@ -2898,8 +3099,8 @@ class NostalgiaForInfinityX7(IStrategy):
       if is_short_grind_mode or not is_v2_date:
         return self.short_grind_adjust_trade_position(*args)
 
-      is_short_adjust_mode = any(c in self.short_adjust_mode_tags for c in enter_tags)
-      is_short_known_mode = any(c in self.short_known_mode_tags for c in enter_tags)
+      is_short_adjust_mode = tag_modes & any_bits["short_adjust"]
+      is_short_known_mode = tag_modes & any_bits["short_known"]
 
       if is_short_adjust_mode or not is_short_known_mode:
         return self.short_grind_adjust_trade_position_v2(*args)
@@ -2942,6 +3143,7 @@ class NostalgiaForInfinityX7(IStrategy):
         - "de-risk"
         - "rebuy-derisk"
         - "rebuy"
+        - "partial-exit"
     tag : str
         Identifier or label for the trade step (e.g., "g1", "dl1").
     pair : str
@@ -3005,6 +3207,7 @@ class NostalgiaForInfinityX7(IStrategy):
       "de-risk": "❌​​ ​**De-risk:** ",
       "rebuy-derisk": "❌​​ ​**Rebuy de-risk:** ",
       "rebuy": "✅ ​**Rebuy:** ",
+      "partial-exit": "❎​ ​**Exit (remaining):** ",
     }
 
     # Start with the header
@@ -3041,6 +3244,47 @@ class NostalgiaForInfinityX7(IStrategy):
 
     return msg
 
+  def notify(
+    self,
+    msg_type: str,
+    tag: str,
+    pair: str,
+    rate: float,
+    stake_amount: float,
+    profit_stake: float,
+    profit_ratio: float,
+    grind_profit_stake: float = None,
+    grind_profit_pct: float = None,
+    stake_currency: str = None,
+    coin_amount: float = None,
+  ) -> None:
+    """
+    Queue a trade notification, with the arguments of notification_msg.
+
+    The message is formatted and sent by the notifications thread. Does nothing in backtesting / hyperopt.
+    """
+    notification_queue = self.notification_queue
+    if notification_queue is None:
+      return
+    notification_queue.put(
+      (
+        msg_type,
+        tag,
+        pair,
+        rate,
+        stake_amount,
+        profit_stake,
+        profit_ratio,
+        grind_profit_stake,
+        grind_profit_pct,
+        stake_currency,
+        coin_amount,
+      )
+    )
+
+  def send_notification(self, msg: str) -> None:
+    self.dp.send_msg(msg)
+
   def btc_informative_pair(self) -> str:
     stake_currency = self.config["stake_currency"]
     is_futures = self.config.get("trading_mode") in ("futures", "margin")
@@ -3063,6 +3307,57 @@ class NostalgiaForInfinityX7(IStrategy):
 
     return informative[keep_cols]
 
+  # Compact Indicator Storage
+  # ---------------------------------------------------------------------------------------------
+  def compact_indicator_storage(self, df: DataFrame) -> DataFrame:
+    """
+    Store the oscillator columns (BTC ones included) as float32 and the 0/1 pattern flags as bool.
+    Flags that have NaNs are stored as float32, which keeps them exact. The `compact_float64_columns` are kept.
+    """
+    compact_dtypes = {}
+    for column in df.columns:
+      if df[column].dtype != np.float64 or column in self.compact_float64_columns:
+        continue
+      if column.removeprefix("BTC_").startswith(self.compact_float32_prefixes):
+        compact_dtypes[column] = np.float32
+      elif column in self.compact_flag_columns:
+        values = df[column].to_numpy()
+        is_flag = ((values == 0.0) | (values == 1.0)).all()
+        compact_dtypes[column] = bool if is_flag else np.float32
+
+    if not compact_dtypes:
+      return df
+    return df.astype(compact_dtypes)
+
+  # Grind Entry Rules
+  # ---------------------------------------------------------------------------------------------
+  def populate_grind_entry_rules(self, df: DataFrame) -> DataFrame:
+    """
+    Add the candle part of the grind entry rules as columns, a bit by rule (see GrindEntryRules), so the trades
+    grinding on a candle only check their own part of the rules. The short ones are only used in futures.
+    """
+    last_candle = CandleColumns(df)
+    previous_candle = CandleColumns(df, periods=1)
+    grind_entries = [
+      (LONG_GRIND_ENTRY_V3_RULES, self.long_grind_entry_v3_rules),
+      (LONG_GRIND_ENTRY_V2_RULES, self.long_grind_entry_v2_rules),
+      (LONG_GRIND_ENTRY_RULES, self.long_grind_entry_rules),
+    ]
+    if self.is_futures_mode:
+      grind_entries += [
+        (SHORT_GRIND_ENTRY_V3_RULES, self.short_grind_entry_v3_rules),
+        (SHORT_GRIND_ENTRY_V2_RULES, self.short_grind_entry_v2_rules),
+        (SHORT_GRIND_ENTRY_RULES, self.short_grind_entry_rules),
+      ]
+    new_cols = DataFrame(
+      {
+        rules.column: rules.bits(grind_entry_rules(last_candle, previous_candle))
+        for rules, grind_entry_rules in grind_entries
+      },
+      index=df.index,
+    )
+    return pd.concat([df, new_cols], axis=1, copy=False)
+
   # Informative Pairs
   # ---------------------------------------------------------------------------------------------
   def informative_pairs(self):
@@ -3076,6 +3371,10 @@ class NostalgiaForInfinityX7(IStrategy):
     for info_timeframe in self.info_timeframes:
       informative_pairs.update((pair, info_timeframe) for pair in pairs)
 
+    # Keep one computed informative frame per pair and timeframe of the current whitelist
+    if self.informative_cache is not None:
+      self.informative_cache.max_entries = max(len(informative_pairs), len(self.info_timeframes))
+
     btc_info_pair = self.btc_informative_pair()
 
     informative_pairs.update((btc_info_pair, btc_info_timeframe) for btc_info_timeframe in self.btc_info_timeframes)
@@ -3200,18 +3499,16 @@ class NostalgiaForInfinityX7(IStrategy):
 
   @staticmethod
   def np_shift(arr, periods):
-    out = np.empty_like(arr)
+    # Flags (bool) shift to float, so the first candles are NaN rather than True
+    out = np.empty_like(arr, dtype=np.promote_types(arr.dtype, np.float32))
     out[:periods] = np.nan
     out[periods:] = arr[:-periods]
     return out
 
   # Informative 1d Timeframe Indicators
   # ---------------------------------------------------------------------------------------------
-  def informative_1d_indicators(self, metadata: dict, info_timeframe) -> DataFrame:
-    debug_time = False
-    if debug_time:
-      tik = time.perf_counter()
-    dp = self.dp
+  def informative_1d_indicators(self, metadata: dict, info_timeframe, source: DataFrame = None) -> DataFrame:
+    dp = self.dp if source is None else None
     fast_pct_change = self.fast_pct_change
     stochrsi_k_func = self.stochrsi_k
     chaikin_money_flow = self.chaikin_money_flow
@@ -3219,15 +3516,15 @@ class NostalgiaForInfinityX7(IStrategy):
     ta_rsi = ta.RSI
     ta_aroon = ta.AROON
     ta_roc = ta.ROC
-    ta_min = ta.MIN
-    ta_max = ta.MAX
+    ta_min = talib.MIN
+    ta_max = talib.MAX
     ta_sma = ta.SMA
 
-    assert dp, "DataProvider is required for multiple timeframes."
+    assert dp or source is not None, "DataProvider is required for multiple timeframes."
 
     # Get dataframe
     metadata_pair = metadata["pair"]
-    informative_1d = dp.get_pair_dataframe(pair=metadata_pair, timeframe=info_timeframe)
+    informative_1d = dp.get_pair_dataframe(pair=metadata_pair, timeframe=info_timeframe) if source is None else source
 
     # Empty dataframe protection
     if informative_1d.empty:
@@ -3365,22 +3662,12 @@ class NostalgiaForInfinityX7(IStrategy):
 
       validate_indicators(df=informative_1d, columns=debug_cols, pair=metadata_pair, timeframe=info_timeframe)
 
-    # =========================================================================
-    # LOGGING
-    # =========================================================================
-    if debug_time:
-      tok = time.perf_counter()
-      log.debug("[%s] informative_1d_indicators took: %.4f seconds.", metadata_pair, tok - tik)
-
     return informative_1d
 
   # Informative 4h Timeframe Indicators
   # ---------------------------------------------------------------------------------------------
-  def informative_4h_indicators(self, metadata: dict, info_timeframe) -> DataFrame:
-    debug_time = False
-    if debug_time:
-      tik = time.perf_counter()
-    dp = self.dp
+  def informative_4h_indicators(self, metadata: dict, info_timeframe, source: DataFrame = None) -> DataFrame:
+    dp = self.dp if source is None else None
     fast_pct_change = self.fast_pct_change
     stochrsi_k_func = self.stochrsi_k
     chaikin_money_flow = self.chaikin_money_flow
@@ -3391,15 +3678,15 @@ class NostalgiaForInfinityX7(IStrategy):
     ta_sma = ta.SMA
     ta_roc = ta.ROC
     ta_ema = ta.EMA
-    ta_max = ta.MAX
-    ta_min = ta.MIN
+    ta_max = talib.MAX
+    ta_min = talib.MIN
     ta_bbands = ta.BBANDS
 
-    assert dp, "DataProvider is required for multiple timeframes."
+    assert dp or source is not None, "DataProvider is required for multiple timeframes."
 
     # Get dataframe
     metadata_pair = metadata["pair"]
-    informative_4h = dp.get_pair_dataframe(pair=metadata_pair, timeframe=info_timeframe)
+    informative_4h = dp.get_pair_dataframe(pair=metadata_pair, timeframe=info_timeframe) if source is None else source
 
     # Empty dataframe protection
     if informative_4h.empty:
@@ -3570,22 +3857,12 @@ class NostalgiaForInfinityX7(IStrategy):
       ]
 
       validate_indicators(df=informative_4h, columns=debug_cols, pair=metadata_pair, timeframe=info_timeframe)
-    # =========================================================================
-    # LOGGING
-    # =========================================================================
-    if debug_time:
-      tok = time.perf_counter()
-      log.debug("[%s] informative_4h_indicators took: %.4f seconds.", metadata_pair, tok - tik)
-
     return informative_4h
 
   # Informative 1h Timeframe Indicators
   # ---------------------------------------------------------------------------------------------
-  def informative_1h_indicators(self, metadata: dict, info_timeframe) -> DataFrame:
-    debug_time = False
-    if debug_time:
-      tik = time.perf_counter()
-    dp = self.dp
+  def informative_1h_indicators(self, metadata: dict, info_timeframe, source: DataFrame = None) -> DataFrame:
+    dp = self.dp if source is None else None
     fast_pct_change = self.fast_pct_change
     stochrsi_k_func = self.stochrsi_k
     chaikin_money_flow = self.chaikin_money_flow
@@ -3598,17 +3875,17 @@ class NostalgiaForInfinityX7(IStrategy):
     ta_roc = ta.ROC
     ta_ema = ta.EMA
     ta_willr = ta.WILLR
-    ta_max = ta.MAX
-    ta_min = ta.MIN
+    ta_max = talib.MAX
+    ta_min = talib.MIN
 
-    assert dp, "DataProvider is required for multiple timeframes."
+    assert dp or source is not None, "DataProvider is required for multiple timeframes."
 
     # =========================================================================
     # GET DATAFRAME
     # =========================================================================
 
     metadata_pair = metadata["pair"]
-    informative_1h = dp.get_pair_dataframe(pair=metadata_pair, timeframe=info_timeframe)
+    informative_1h = dp.get_pair_dataframe(pair=metadata_pair, timeframe=info_timeframe) if source is None else source
 
     # Empty dataframe protection
     if informative_1h.empty:
@@ -3765,22 +4042,12 @@ class NostalgiaForInfinityX7(IStrategy):
 
       validate_indicators(df=informative_1h, columns=debug_cols, pair=metadata_pair, timeframe=info_timeframe)
 
-    # =========================================================================
-    # LOGGING
-    # =========================================================================
-    if debug_time:
-      tok = time.perf_counter()
-      log.debug("[%s] informative_1h_indicators took: %.4f seconds.", metadata_pair, tok - tik)
-
     return informative_1h
 
   # Informative 15m Timeframe Indicators
   # ---------------------------------------------------------------------------------------------
-  def informative_15m_indicators(self, metadata: dict, info_timeframe) -> DataFrame:
-    debug_time = False
-    if debug_time:
-      tik = time.perf_counter()
-    dp = self.dp
+  def informative_15m_indicators(self, metadata: dict, info_timeframe, source: DataFrame = None) -> DataFrame:
+    dp = self.dp if source is None else None
     fast_pct_change = self.fast_pct_change
     stochrsi_k_func = self.stochrsi_k
     chaikin_money_flow = self.chaikin_money_flow
@@ -3788,18 +4055,18 @@ class NostalgiaForInfinityX7(IStrategy):
     ta_rsi = ta.RSI
     ta_aroon = ta.AROON
     ta_ema = ta.EMA
-    ta_min = ta.MIN
-    ta_max = ta.MAX
+    ta_min = talib.MIN
+    ta_max = talib.MAX
     ta_sma = ta.SMA
 
-    assert dp, "DataProvider is required for multiple timeframes."
+    assert dp or source is not None, "DataProvider is required for multiple timeframes."
 
     # =========================================================================
     # GET DATAFRAME
     # =========================================================================
 
     metadata_pair = metadata["pair"]
-    informative_15m = dp.get_pair_dataframe(pair=metadata_pair, timeframe=info_timeframe)
+    informative_15m = dp.get_pair_dataframe(pair=metadata_pair, timeframe=info_timeframe) if source is None else source
 
     # Empty dataframe protection
     if informative_15m.empty:
@@ -3924,21 +4191,11 @@ class NostalgiaForInfinityX7(IStrategy):
 
       validate_indicators(df=informative_15m, columns=debug_cols, pair=metadata_pair, timeframe=info_timeframe)
 
-    # =========================================================================
-    # LOGGING
-    # =========================================================================
-    if debug_time:
-      tok = time.perf_counter()
-      log.debug("[%s] informative_15m_indicators took: %.4f seconds.", metadata_pair, tok - tik)
-
     return informative_15m
 
   # Coin Pair Base Timeframe Indicators
   # ---------------------------------------------------------------------------------------------
   def base_tf_5m_indicators(self, metadata: dict, df: DataFrame) -> DataFrame:
-    debug_time = False
-    if debug_time:
-      tik = time.perf_counter()
     metadata_pair = metadata["pair"]
     fast_pct_change = self.fast_pct_change
     stochrsi_k_func = self.stochrsi_k
@@ -3952,8 +4209,8 @@ class NostalgiaForInfinityX7(IStrategy):
     ta_roc = ta.ROC
     ta_willr = ta.WILLR
     ta_ema = ta.EMA
-    ta_max = ta.MAX
-    ta_min = ta.MIN
+    ta_max = talib.MAX
+    ta_min = talib.MIN
 
     # =========================================================================
     # BASE DATA
@@ -4314,30 +4571,24 @@ class NostalgiaForInfinityX7(IStrategy):
     else:
       df["live_data_ok"] = ta_min(volume_np, timeperiod=72) > 0
 
-    # =========================================================================
-    # LOGGING
-    # =========================================================================
-    if debug_time:
-      tok = time.perf_counter()
-      log.debug("[%s] base_tf_5m_indicators took: %.4f seconds.", metadata_pair, tok - tik)
-
     return df
 
   # BTC Informative 1d Timeframe Indicators
   # ---------------------------------------------------------------------------------------------
-  def btc_informative_1d_indicators(self, btc_pair: str, btc_info_timeframe: str) -> DataFrame:
-    debug_time = False
-    if debug_time:
-      tik = time.perf_counter()
-    dp = self.dp
+  def btc_informative_1d_indicators(
+    self, btc_pair: str, btc_info_timeframe: str, source: DataFrame = None
+  ) -> DataFrame:
+    dp = self.dp if source is None else None
     validate_indicators = self.validate_indicators
 
-    assert dp, "DataProvider is required for multiple timeframes."
+    assert dp or source is not None, "DataProvider is required for multiple timeframes."
 
     # =========================================================================
     # GET DATAFRAME
     # =========================================================================
-    btc_informative_1d = dp.get_pair_dataframe(pair=btc_pair, timeframe=btc_info_timeframe)
+    btc_informative_1d = (
+      dp.get_pair_dataframe(pair=btc_pair, timeframe=btc_info_timeframe) if source is None else source
+    )
 
     # Empty dataframe protection
     if btc_informative_1d.empty:
@@ -4374,30 +4625,24 @@ class NostalgiaForInfinityX7(IStrategy):
 
       validate_indicators(df=btc_informative_1d, columns=debug_cols, pair=btc_pair, timeframe=btc_info_timeframe)
 
-    # =========================================================================
-    # LOGGING
-    # =========================================================================
-    if debug_time:
-      tok = time.perf_counter()
-      log.debug("[%s] btc_informative_1d_indicators took: %.4f seconds.", btc_pair, tok - tik)
-
     return btc_informative_1d
 
   # BTC Informative 4h Timeframe Indicators
   # ---------------------------------------------------------------------------------------------
-  def btc_informative_4h_indicators(self, btc_pair: str, btc_info_timeframe: str) -> DataFrame:
-    debug_time = False
-    if debug_time:
-      tik = time.perf_counter()
-    dp = self.dp
+  def btc_informative_4h_indicators(
+    self, btc_pair: str, btc_info_timeframe: str, source: DataFrame = None
+  ) -> DataFrame:
+    dp = self.dp if source is None else None
     validate_indicators = self.validate_indicators
 
-    assert dp, "DataProvider is required for multiple timeframes."
+    assert dp or source is not None, "DataProvider is required for multiple timeframes."
 
     # =========================================================================
     # GET DATAFRAME
     # =========================================================================
-    btc_informative_4h = dp.get_pair_dataframe(pair=btc_pair, timeframe=btc_info_timeframe)
+    btc_informative_4h = (
+      dp.get_pair_dataframe(pair=btc_pair, timeframe=btc_info_timeframe) if source is None else source
+    )
 
     # Empty dataframe protection
     if btc_informative_4h.empty:
@@ -4435,30 +4680,24 @@ class NostalgiaForInfinityX7(IStrategy):
 
       validate_indicators(df=btc_informative_4h, columns=debug_cols, pair=btc_pair, timeframe=btc_info_timeframe)
 
-    # =========================================================================
-    # LOGGING
-    # =========================================================================
-    if debug_time:
-      tok = time.perf_counter()
-      log.debug("[%s] btc_informative_4h_indicators took: %.4f seconds.", btc_pair, tok - tik)
-
     return btc_informative_4h
 
   # BTC Informative 1h Timeframe Indicators
   # ---------------------------------------------------------------------------------------------
-  def btc_informative_1h_indicators(self, btc_pair: str, btc_info_timeframe: str) -> DataFrame:
-    debug_time = False
-    if debug_time:
-      tik = time.perf_counter()
-    dp = self.dp
+  def btc_informative_1h_indicators(
+    self, btc_pair: str, btc_info_timeframe: str, source: DataFrame = None
+  ) -> DataFrame:
+    dp = self.dp if source is None else None
     validate_indicators = self.validate_indicators
 
-    assert dp, "DataProvider is required for multiple timeframes."
+    assert dp or source is not None, "DataProvider is required for multiple timeframes."
 
     # =========================================================================
     # GET DATAFRAME
     # =========================================================================
-    btc_informative_1h = dp.get_pair_dataframe(pair=btc_pair, timeframe=btc_info_timeframe)
+    btc_informative_1h = (
+      dp.get_pair_dataframe(pair=btc_pair, timeframe=btc_info_timeframe) if source is None else source
+    )
 
     # Empty dataframe protection
     if btc_informative_1h.empty:
@@ -4506,30 +4745,24 @@ class NostalgiaForInfinityX7(IStrategy):
 
       validate_indicators(df=btc_informative_1h, columns=debug_cols, pair=btc_pair, timeframe=btc_info_timeframe)
 
-    # =========================================================================
-    # LOGGING
-    # =========================================================================
-    if debug_time:
-      tok = time.perf_counter()
-      log.debug("[%s] btc_informative_1h_indicators took: %.4f seconds.", btc_pair, tok - tik)
-
     return btc_informative_1h
 
   # BTC Informative 15m Timeframe Indicators
   # ---------------------------------------------------------------------------------------------
-  def btc_informative_15m_indicators(self, btc_pair: str, btc_info_timeframe: str) -> DataFrame:
-    debug_time = False
-    if debug_time:
-      tik = time.perf_counter()
-    dp = self.dp
+  def btc_informative_15m_indicators(
+    self, btc_pair: str, btc_info_timeframe: str, source: DataFrame = None
+  ) -> DataFrame:
+    dp = self.dp if source is None else None
     validate_indicators = self.validate_indicators
 
-    assert dp, "DataProvider is required for multiple timeframes."
+    assert dp or source is not None, "DataProvider is required for multiple timeframes."
 
     # =========================================================================
     # GET DATAFRAME
     # =========================================================================
-    btc_informative_15m = dp.get_pair_dataframe(pair=btc_pair, timeframe=btc_info_timeframe)
+    btc_informative_15m = (
+      dp.get_pair_dataframe(pair=btc_pair, timeframe=btc_info_timeframe) if source is None else source
+    )
 
     # Empty dataframe protection
     if btc_informative_15m.empty:
@@ -4577,30 +4810,24 @@ class NostalgiaForInfinityX7(IStrategy):
 
       validate_indicators(df=btc_informative_15m, columns=debug_cols, pair=btc_pair, timeframe=btc_info_timeframe)
 
-    # =========================================================================
-    # LOGGING
-    # =========================================================================
-    if debug_time:
-      tok = time.perf_counter()
-      log.debug("[%s] btc_informative_15m_indicators took: %.4f seconds.", btc_pair, tok - tik)
-
     return btc_informative_15m
 
   # BTC Informative 5m Timeframe Indicators
   # ---------------------------------------------------------------------------------------------
-  def btc_informative_5m_indicators(self, btc_pair: str, btc_info_timeframe: str) -> DataFrame:
-    debug_time = False
-    if debug_time:
-      tik = time.perf_counter()
-    dp = self.dp
+  def btc_informative_5m_indicators(
+    self, btc_pair: str, btc_info_timeframe: str, source: DataFrame = None
+  ) -> DataFrame:
+    dp = self.dp if source is None else None
     validate_indicators = self.validate_indicators
 
-    assert dp, "DataProvider is required for multiple timeframes."
+    assert dp or source is not None, "DataProvider is required for multiple timeframes."
 
     # =========================================================================
     # GET DATAFRAME
     # =========================================================================
-    btc_informative_5m = dp.get_pair_dataframe(pair=btc_pair, timeframe=btc_info_timeframe)
+    btc_informative_5m = (
+      dp.get_pair_dataframe(pair=btc_pair, timeframe=btc_info_timeframe) if source is None else source
+    )
 
     # Empty dataframe protection
     if btc_informative_5m.empty:
@@ -4648,106 +4875,188 @@ class NostalgiaForInfinityX7(IStrategy):
 
       validate_indicators(df=btc_informative_5m, columns=debug_cols, pair=btc_pair, timeframe=btc_info_timeframe)
 
-    # =========================================================================
-    # LOGGING
-    # =========================================================================
-    if debug_time:
-      tok = time.perf_counter()
-      log.debug("[%s] btc_informative_5m_indicators took: %.4f seconds.", btc_pair, tok - tik)
-
     return btc_informative_5m
 
   # Coin Pair Indicator Switch Case
   # ---------------------------------------------------------------------------------------------
-  def info_switcher(self, metadata: dict, info_timeframe) -> DataFrame:
+  def info_switcher(self, metadata: dict, info_timeframe, source: DataFrame = None) -> DataFrame:
     if info_timeframe == "1d":
-      return self.informative_1d_indicators(metadata, info_timeframe)
+      return self.informative_1d_indicators(metadata, info_timeframe, source)
     elif info_timeframe == "4h":
-      return self.informative_4h_indicators(metadata, info_timeframe)
+      return self.informative_4h_indicators(metadata, info_timeframe, source)
     elif info_timeframe == "1h":
-      return self.informative_1h_indicators(metadata, info_timeframe)
+      return self.informative_1h_indicators(metadata, info_timeframe, source)
     elif info_timeframe == "15m":
-      return self.informative_15m_indicators(metadata, info_timeframe)
+      return self.informative_15m_indicators(metadata, info_timeframe, source)
     else:
       raise RuntimeError(f"{info_timeframe} not supported as informative timeframe for BTC pair.")
 
+  # Informative Frame
+  # ---------------------------------------------------------------------------------------------
+  def informative_frame(self, metadata: dict, info_timeframe: str) -> DataFrame:
+    """
+    Return the merge-ready informative frame of the pair. In live/dry-run it's reused until the informative
+    source frame gets a new candle, so the 1d indicators are computed once per day instead of every 5m candle.
+    """
+    return self.informative_frames([("pair", metadata["pair"], info_timeframe)])[0]
+
   # BTC Indicator Switch Case
   # ---------------------------------------------------------------------------------------------
-  def btc_info_switcher(self, btc_pair: str, btc_info_timeframe) -> DataFrame:
-    # if btc_info_timeframe == "1d":
-    # return self.btc_informative_1d_indicators(btc_pair, btc_info_timeframe)
-    if btc_info_timeframe == "4h":
-      return self.btc_informative_4h_indicators(btc_pair, btc_info_timeframe)
-    # elif btc_info_timeframe == "1h":
-    # return self.btc_informative_1h_indicators(btc_pair, btc_info_timeframe)
-    # elif btc_info_timeframe == "15m":
-    # return self.btc_informative_15m_indicators(btc_pair, btc_info_timeframe)
-    # elif btc_info_timeframe == "5m":
-    # return self.btc_informative_5m_indicators(btc_pair, btc_info_timeframe)
+  def btc_info_switcher(self, btc_pair: str, btc_info_timeframe, source: DataFrame = None) -> DataFrame:
+    if btc_info_timeframe == "1d":
+      return self.btc_informative_1d_indicators(btc_pair, btc_info_timeframe, source)
+    elif btc_info_timeframe == "4h":
+      return self.btc_informative_4h_indicators(btc_pair, btc_info_timeframe, source)
+    elif btc_info_timeframe == "1h":
+      return self.btc_informative_1h_indicators(btc_pair, btc_info_timeframe, source)
+    elif btc_info_timeframe == "15m":
+      return self.btc_informative_15m_indicators(btc_pair, btc_info_timeframe, source)
+    elif btc_info_timeframe == "5m":
+      return self.btc_informative_5m_indicators(btc_pair, btc_info_timeframe, source)
     else:
       raise RuntimeError(f"{btc_info_timeframe} not supported as informative timeframe for BTC pair.")
 
+  # BTC Informative Frame
+  # ---------------------------------------------------------------------------------------------
+  def btc_informative_frame(self, btc_pair: str, btc_info_timeframe: str) -> DataFrame:
+    """
+    Return the merge-ready BTC informative frame. It's the same for every pair, so it's computed once and
+    shared (read-only) until the BTC source frame gets a new candle.
+    """
+    return self.informative_frames([("btc", btc_pair, btc_info_timeframe)])[0]
+
+  # Informative Frames
+  # ---------------------------------------------------------------------------------------------
+  def informative_task(self, source_type: str, pair: str, timeframe: str, source: DataFrame) -> DataFrame:
+    """
+    Compute the merge-ready informative frame of one pair and timeframe from its source frame.
+    It also runs in the indicator workers, so it must only depend on its arguments.
+    """
+    if source_type == "btc":
+      return self.prepare_informative_merge(self.btc_info_switcher(pair, timeframe, source))
+    keep_ohlcv = {"open", "close"} if timeframe == "15m" else set()
+    return self.prepare_informative_merge(self.info_switcher({"pair": pair}, timeframe, source), keep_ohlcv)
+
+  def informative_frames(self, requests: list, metadata_pair: str = None) -> list:
+    """
+    Return the merge-ready informative frames for a list of (source type, pair, timeframe) requests.
+
+    BTC frames are the same for every pair, so they're computed once and shared (read-only) until the BTC
+    source frame gets a new candle. Pair frames are reused the same way in live/dry-run. The frames that need
+    computing go to the indicator workers when `num_cores_indicators_calc` is set, otherwise they're computed
+    serially. The workers stage is profiled under `metadata_pair`, the pair the frames are merged into.
+    """
+    dp = self.dp
+    frames = [None] * len(requests)
+    pending = []
+    for index, (source_type, pair, timeframe) in enumerate(requests):
+      source = dp.get_pair_dataframe(pair=pair, timeframe=timeframe)
+      cache = self.btc_informative_cache if source_type == "btc" else self.informative_cache
+      source_key = None
+      if cache is not None:
+        source_key = cache.source_key(source)
+        frames[index] = cache.get((pair, timeframe), source_key)
+      if frames[index] is None:
+        pending.append((index, source_type, pair, timeframe, source, cache, source_key))
+
+    profiler = self.indicators_profiler
+    results = [None] * len(pending)
+    parallel = [task for task in pending if not task[4].empty]
+    indicator_pool = self.get_indicator_pool() if len(parallel) > 1 else None
+    if indicator_pool is not None:
+      if profiler is not None:
+        mark = profiler.start()
+      try:
+        computed = indicator_pool.compute([task[1:5] for task in parallel])
+      except (queue.Empty, OSError) as exc:
+        log.warning("The indicator workers stopped responding, computing the indicators serially: %s", exc)
+        indicator_pool.close()
+        self.indicator_pool = False
+      except TypeError as exc:
+        # The frames keep their dtypes from one candle to the next, so the workers would fail on every candle
+        log.warning("The indicator workers can't pass these frames, computing the indicators serially: %s", exc)
+        indicator_pool.close()
+        self.indicator_pool = False
+      else:
+        positions = {task[0]: position for position, task in enumerate(pending)}
+        for task, frame in zip(parallel, computed, strict=True):
+          results[positions[task[0]]] = frame
+        # The workers compute the timeframes together, timed as one stage
+        if profiler is not None:
+          profiler.record(mark, metadata_pair or parallel[-1][2], "all", "informative_workers")
+
+    for (index, source_type, pair, timeframe, source, cache, source_key), frame in zip(pending, results, strict=True):
+      if frame is None:
+        if profiler is not None:
+          mark = profiler.start()
+        frame = self.informative_task(source_type, pair, timeframe, source)
+        if profiler is not None:
+          profiler.record(mark, pair, timeframe, f"{source_type}_informative")
+      if cache is not None:
+        cache.set((pair, timeframe), source_key, frame)
+      frames[index] = frame
+
+    return frames
+
+  # Indicator Workers
+  # ---------------------------------------------------------------------------------------------
+  def get_indicator_pool(self):
+    num_workers = self.num_cores_indicators_calc
+    if not num_workers or num_workers <= 0:
+      return None
+    if self.indicator_pool is None:
+      num_workers = min(num_workers, len(self.info_timeframes) + len(self.btc_info_timeframes))
+      try:
+        self.indicator_pool = IndicatorWorkerPool(self, num_workers)
+      except (ValueError, AssertionError, OSError) as exc:
+        log.warning("Unable to start the indicator workers, computing the indicators serially: %s", exc)
+        self.indicator_pool = False
+    return self.indicator_pool or None
+
   # Populate Indicators
   # ---------------------------------------------------------------------------------------------
   def populate_indicators(self, df: DataFrame, metadata: dict) -> DataFrame:
     debug = False
-    debug_time = True
-    if debug_time:
-      tik = time.perf_counter()
+    profiler = self.indicators_profiler
+    if profiler is not None:
+      tik = profiler.start()
     base_timeframe = self.timeframe
-    prepare_informative_merge = self.prepare_informative_merge
     metadata_pair = metadata["pair"]
 
     # ============================================================
     # BTC INFORMATIVE (BATCH PREPARATION)
     # ============================================================
     btc_info_pair = self.btc_informative_pair()
-    btc_info_timeframes = self.btc_info_timeframes
-    btc_info_switcher = self.btc_info_switcher
-    btc_frames = {}
-    for btc_tf in btc_info_timeframes:
-      btc_df = btc_info_switcher(btc_info_pair, btc_tf)
-      if btc_df.empty:
-        continue
-
-      btc_df = prepare_informative_merge(btc_df)
-      btc_frames[btc_tf] = btc_df
+    requests = [("btc", btc_info_pair, btc_tf) for btc_tf in self.btc_info_timeframes]
 
     # ============================================================
     # INFO TF (BATCH PREPARATION)
     # ============================================================
-    info_timeframes = self.info_timeframes
-    info_switcher = self.info_switcher
+    requests.extend(("pair", metadata_pair, info_tf) for info_tf in self.info_timeframes)
+
+    btc_frames = {}
     info_frames = {}
-    for info_tf in info_timeframes:
-      info_df = info_switcher(metadata, info_tf)
-      if info_df.empty:
+    for (source_type, _, tf), frame in zip(requests, self.informative_frames(requests, metadata_pair), strict=True):
+      if frame.empty:
         continue
 
-      keep_ohlcv = {"open", "close"} if info_tf == "15m" else set()
-      info_df = prepare_informative_merge(info_df, keep_ohlcv)
-      info_frames[info_tf] = info_df
-
-    # ============================================================
-    # BTC MERGE
-    # ============================================================
-    for tf, frame in btc_frames.items():
-      df = merge_informative_pair(df, frame, base_timeframe, tf, ffill=False)
-      # BTC date is not needed. only info_tf needs it because of add_informative_ready (not yet implemented) validation(Current PR not affected by this).
-      col = f"date_{tf}"
-      if col in df.columns:
-        df = df.drop(columns=col)
-
-    # ============================================================
-    # NORMAL INFORMATIVE MERGE
-    # ============================================================
-    for tf, frame in info_frames.items():
-      df = merge_informative_pair(df, frame, base_timeframe, tf, ffill=False)
+      if source_type == "btc":
+        btc_frames[tf] = frame
+      else:
+        info_frames[tf] = frame
 
     # ============================================================
-    # FINAL FILL ONLY AFTER ALL MERGES
+    # BTC + NORMAL INFORMATIVE MERGE (SINGLE PASS)
     # ============================================================
-    df = df.ffill()
+    # BTC date is not needed. only info_tf needs it because of add_informative_ready (not yet implemented) validation(Current PR not affected by this).
+    informatives = [(frame, tf, True) for tf, frame in btc_frames.items()]
+    informatives.extend((frame, tf, False) for tf, frame in info_frames.items())
+    if profiler is not None:
+      mark = profiler.start()
+    # Forward-fills the informative columns, no fill needed after the merge
+    df = merge_informative_frames(df, informatives, base_timeframe)
+    if profiler is not None:
+      mark = profiler.record(mark, metadata_pair, base_timeframe, "merge")
 
     # ============================================================
     # POST-FFILL VALIDATION
@@ -4780,6 +5089,8 @@ class NostalgiaForInfinityX7(IStrategy):
     # BASE TF (LAST)
     # ============================================================
     df = self.base_tf_5m_indicators(metadata, df)
+    if profiler is not None:
+      mark = profiler.record(mark, metadata_pair, base_timeframe, "indicators")
 
     # ============================================================
     # FINAL INDICATOR VALIDATION
@@ -4795,8 +5106,8 @@ class NostalgiaForInfinityX7(IStrategy):
           final_nan.sort_values(ascending=False).to_string(),
         )
 
-    if debug_time:
-      tok_before_protections = time.perf_counter()
+    if profiler is not None:
+      tok_before_protections = profiler.start()
 
     np_view = lambda c: df[c].to_numpy(copy=False)
     np_shift = self.np_shift
@@ -4872,302 +5183,305 @@ class NostalgiaForInfinityX7(IStrategy):
     protection_roc_2_4h = np_view("ROC_2_4h")
     protection_aroond_14_15m = np_view("AROOND_14_15m")
 
+    # The masks not used on the previous candles are only computed when used
+    masks = ThresholdMasks(np_view, self.threshold_masks_used["protections"])
+
     # Reused protection comparison masks
-    aroonu_14_15m_lt_30 = protection_aroonu_14_15m < 30.0
-    aroonu_14_15m_lt_40 = protection_aroonu_14_15m < 40.0
-    aroonu_14_15m_lt_50 = protection_aroonu_14_15m < 50.0
-    aroonu_14_15m_lt_60 = protection_aroonu_14_15m < 60.0
-    aroonu_14_15m_lt_70 = protection_aroonu_14_15m < 70.0
-    aroonu_14_1h_lt_100 = protection_aroonu_14_1h < 100.0
-    aroonu_14_1h_lt_20 = protection_aroonu_14_1h < 20.0
-    aroonu_14_1h_lt_25 = protection_aroonu_14_1h < 25.0
-    aroonu_14_1h_lt_30 = protection_aroonu_14_1h < 30.0
-    aroonu_14_1h_lt_40 = protection_aroonu_14_1h < 40.0
-    aroonu_14_1h_lt_50 = protection_aroonu_14_1h < 50.0
-    aroonu_14_1h_lt_60 = protection_aroonu_14_1h < 60.0
-    aroonu_14_1h_lt_70 = protection_aroonu_14_1h < 70.0
-    aroonu_14_1h_lt_75 = protection_aroonu_14_1h < 75.0
-    aroonu_14_1h_lt_80 = protection_aroonu_14_1h < 80.0
-    aroonu_14_1h_lt_85 = protection_aroonu_14_1h < 85.0
-    aroonu_14_1h_lt_90 = protection_aroonu_14_1h < 90.0
-    aroonu_14_4h_lt_100 = protection_aroonu_14_4h < 100.0
-    aroonu_14_4h_lt_20 = protection_aroonu_14_4h < 20.0
-    aroonu_14_4h_lt_25 = protection_aroonu_14_4h < 25.0
-    aroonu_14_4h_lt_30 = protection_aroonu_14_4h < 30.0
-    aroonu_14_4h_lt_40 = protection_aroonu_14_4h < 40.0
-    aroonu_14_4h_lt_50 = protection_aroonu_14_4h < 50.0
-    aroonu_14_4h_lt_60 = protection_aroonu_14_4h < 60.0
-    aroonu_14_4h_lt_70 = protection_aroonu_14_4h < 70.0
-    aroonu_14_4h_lt_75 = protection_aroonu_14_4h < 75.0
-    aroonu_14_4h_lt_80 = protection_aroonu_14_4h < 80.0
-    aroonu_14_4h_lt_85 = protection_aroonu_14_4h < 85.0
-    aroonu_14_4h_lt_90 = protection_aroonu_14_4h < 90.0
-    cmf_20_15m_gt_neg_0 = protection_cmf_20_15m > -0.0
-    cmf_20_15m_gt_neg_010 = protection_cmf_20_15m > -0.10
-    cmf_20_15m_gt_neg_015 = protection_cmf_20_15m > -0.15
-    cmf_20_15m_gt_neg_02 = protection_cmf_20_15m > -0.2
-    cmf_20_15m_gt_neg_020 = protection_cmf_20_15m > -0.20
-    cmf_20_15m_gt_neg_025 = protection_cmf_20_15m > -0.25
-    cmf_20_15m_gt_neg_03 = protection_cmf_20_15m > -0.3
-    cmf_20_15m_gt_neg_030 = protection_cmf_20_15m > -0.30
-    cmf_20_15m_gt_neg_035 = protection_cmf_20_15m > -0.35
-    cmf_20_15m_gt_neg_040 = protection_cmf_20_15m > -0.40
-    cmf_20_15m_gt_neg_05 = protection_cmf_20_15m > -0.5
-    cmf_20_15m_gt_neg_050 = protection_cmf_20_15m > -0.50
-    cmf_20_1h_gt_neg_0 = protection_cmf_20_1h > -0.0
-    cmf_20_1h_gt_neg_010 = protection_cmf_20_1h > -0.10
-    cmf_20_1h_gt_neg_015 = protection_cmf_20_1h > -0.15
-    cmf_20_1h_gt_neg_02 = protection_cmf_20_1h > -0.2
-    cmf_20_1h_gt_neg_020 = protection_cmf_20_1h > -0.20
-    cmf_20_1h_gt_neg_025 = protection_cmf_20_1h > -0.25
-    cmf_20_1h_gt_neg_03 = protection_cmf_20_1h > -0.3
-    cmf_20_1h_gt_neg_030 = protection_cmf_20_1h > -0.30
-    cmf_20_1h_gt_neg_04 = protection_cmf_20_1h > -0.4
-    cmf_20_1h_gt_neg_040 = protection_cmf_20_1h > -0.40
-    cmf_20_1h_gt_neg_05 = protection_cmf_20_1h > -0.5
-    cmf_20_4h_gt_neg_0 = protection_cmf_20_4h > -0.0
-    cmf_20_4h_gt_neg_01 = protection_cmf_20_4h > -0.1
-    cmf_20_4h_gt_neg_010 = protection_cmf_20_4h > -0.10
-    cmf_20_4h_gt_neg_015 = protection_cmf_20_4h > -0.15
-    cmf_20_4h_gt_neg_02 = protection_cmf_20_4h > -0.2
-    cmf_20_4h_gt_neg_020 = protection_cmf_20_4h > -0.20
-    cmf_20_4h_gt_neg_025 = protection_cmf_20_4h > -0.25
-    cmf_20_4h_gt_neg_03 = protection_cmf_20_4h > -0.3
-    cmf_20_4h_gt_neg_030 = protection_cmf_20_4h > -0.30
-    cmf_20_4h_gt_neg_035 = protection_cmf_20_4h > -0.35
-    cmf_20_4h_gt_neg_04 = protection_cmf_20_4h > -0.4
-    cmf_20_4h_gt_neg_040 = protection_cmf_20_4h > -0.40
-    cmf_20_4h_gt_neg_05 = protection_cmf_20_4h > -0.5
-    roc_9_1d_lt_100 = protection_roc_9_1d < 100.0
-    roc_9_1d_lt_15 = protection_roc_9_1d < 15.0
-    roc_9_1d_lt_150 = protection_roc_9_1d < 150.0
-    roc_9_1d_lt_20 = protection_roc_9_1d < 20.0
-    roc_9_1d_lt_200 = protection_roc_9_1d < 200.0
-    roc_9_1d_lt_25 = protection_roc_9_1d < 25.0
-    roc_9_1d_lt_250 = protection_roc_9_1d < 250.0
-    roc_9_1d_lt_30 = protection_roc_9_1d < 30.0
-    roc_9_1d_lt_40 = protection_roc_9_1d < 40.0
-    roc_9_1d_lt_50 = protection_roc_9_1d < 50.0
-    roc_9_1d_lt_60 = protection_roc_9_1d < 60.0
-    roc_9_1d_lt_70 = protection_roc_9_1d < 70.0
-    roc_9_1d_lt_75 = protection_roc_9_1d < 75.0
-    roc_9_1d_lt_80 = protection_roc_9_1d < 80.0
-    roc_9_1h_gt_neg_10 = protection_roc_9_1h > -10.0
-    roc_9_1h_gt_neg_15 = protection_roc_9_1h > -15.0
-    roc_9_1h_gt_neg_20 = protection_roc_9_1h > -20.0
-    roc_9_1h_gt_neg_25 = protection_roc_9_1h > -25.0
-    roc_9_1h_gt_neg_30 = protection_roc_9_1h > -30.0
-    roc_9_1h_gt_neg_50 = protection_roc_9_1h > -50.0
-    roc_9_1h_gt_neg_60 = protection_roc_9_1h > -60.0
-    roc_9_1h_lt_10 = protection_roc_9_1h < 10.0
-    roc_9_1h_lt_15 = protection_roc_9_1h < 15.0
-    roc_9_1h_lt_20 = protection_roc_9_1h < 20.0
-    roc_9_1h_lt_30 = protection_roc_9_1h < 30.0
-    roc_9_1h_lt_40 = protection_roc_9_1h < 40.0
-    roc_9_1h_lt_50 = protection_roc_9_1h < 50.0
-    roc_9_1h_lt_70 = protection_roc_9_1h < 70.0
-    roc_9_1h_lt_80 = protection_roc_9_1h < 80.0
-    roc_9_4h_gt_neg_10 = protection_roc_9_4h > -10.0
-    roc_9_4h_gt_neg_15 = protection_roc_9_4h > -15.0
-    roc_9_4h_gt_neg_20 = protection_roc_9_4h > -20.0
-    roc_9_4h_gt_neg_25 = protection_roc_9_4h > -25.0
-    roc_9_4h_gt_neg_30 = protection_roc_9_4h > -30.0
-    roc_9_4h_gt_neg_35 = protection_roc_9_4h > -35.0
-    roc_9_4h_gt_neg_40 = protection_roc_9_4h > -40.0
-    roc_9_4h_gt_neg_50 = protection_roc_9_4h > -50.0
-    roc_9_4h_gt_neg_60 = protection_roc_9_4h > -60.0
-    roc_9_4h_gt_neg_70 = protection_roc_9_4h > -70.0
-    roc_9_4h_lt_10 = protection_roc_9_4h < 10.0
-    roc_9_4h_lt_100 = protection_roc_9_4h < 100.0
-    roc_9_4h_lt_120 = protection_roc_9_4h < 120.0
-    roc_9_4h_lt_130 = protection_roc_9_4h < 130.0
-    roc_9_4h_lt_15 = protection_roc_9_4h < 15.0
-    roc_9_4h_lt_20 = protection_roc_9_4h < 20.0
-    roc_9_4h_lt_25 = protection_roc_9_4h < 25.0
-    roc_9_4h_lt_250 = protection_roc_9_4h < 250.0
-    roc_9_4h_lt_30 = protection_roc_9_4h < 30.0
-    roc_9_4h_lt_300 = protection_roc_9_4h < 300.0
-    roc_9_4h_lt_35 = protection_roc_9_4h < 35.0
-    roc_9_4h_lt_40 = protection_roc_9_4h < 40.0
-    roc_9_4h_lt_50 = protection_roc_9_4h < 50.0
-    roc_9_4h_lt_60 = protection_roc_9_4h < 60.0
-    roc_9_4h_lt_70 = protection_roc_9_4h < 70.0
-    roc_9_4h_lt_75 = protection_roc_9_4h < 75.0
-    roc_9_4h_lt_80 = protection_roc_9_4h < 80.0
-    rsi_14_15m_gt_70 = protection_rsi_14_15m > 70.0
-    rsi_14_15m_gt_80 = protection_rsi_14_15m > 80.0
-    rsi_14_15m_gt_85 = protection_rsi_14_15m > 85.0
-    rsi_14_15m_gt_90 = protection_rsi_14_15m > 90.0
-    rsi_14_15m_gt_95 = protection_rsi_14_15m > 95.0
-    rsi_14_1h_gt_70 = protection_rsi_14_1h > 70.0
-    rsi_14_1h_gt_75 = protection_rsi_14_1h > 75.0
-    rsi_14_1h_gt_80 = protection_rsi_14_1h > 80.0
-    rsi_14_1h_gt_85 = protection_rsi_14_1h > 85.0
-    rsi_14_1h_gt_90 = protection_rsi_14_1h > 90.0
-    rsi_14_1h_gt_95 = protection_rsi_14_1h > 95.0
-    rsi_14_4h_gt_60 = protection_rsi_14_4h > 60.0
-    rsi_14_4h_gt_70 = protection_rsi_14_4h > 70.0
-    rsi_14_4h_gt_80 = protection_rsi_14_4h > 80.0
-    rsi_14_4h_gt_90 = protection_rsi_14_4h > 90.0
-    rsi_14_4h_gt_95 = protection_rsi_14_4h > 95.0
-    rsi_3_15m_lt_70 = protection_rsi_3_15m < 70.0
-    rsi_3_15m_lt_75 = protection_rsi_3_15m < 75.0
-    rsi_3_15m_lt_80 = protection_rsi_3_15m < 80.0
-    rsi_3_15m_lt_85 = protection_rsi_3_15m < 85.0
-    rsi_3_15m_lt_90 = protection_rsi_3_15m < 90.0
-    rsi_3_1d_gt_10 = protection_rsi_3_1d > 10.0
-    rsi_3_1d_gt_15 = protection_rsi_3_1d > 15.0
-    rsi_3_1d_gt_20 = protection_rsi_3_1d > 20.0
-    rsi_3_1d_gt_25 = protection_rsi_3_1d > 25.0
-    rsi_3_1d_gt_3 = protection_rsi_3_1d > 3.0
-    rsi_3_1d_gt_30 = protection_rsi_3_1d > 30.0
-    rsi_3_1d_gt_35 = protection_rsi_3_1d > 35.0
-    rsi_3_1d_gt_40 = protection_rsi_3_1d > 40.0
-    rsi_3_1d_gt_45 = protection_rsi_3_1d > 45.0
-    rsi_3_1d_gt_5 = protection_rsi_3_1d > 5.0
-    rsi_3_1d_gt_50 = protection_rsi_3_1d > 50.0
-    rsi_3_1d_gt_55 = protection_rsi_3_1d > 55.0
-    rsi_3_1d_gt_60 = protection_rsi_3_1d > 60.0
-    rsi_3_1d_gt_65 = protection_rsi_3_1d > 65.0
-    rsi_3_1h_gt_20 = protection_rsi_3_1h > 20.0
-    rsi_3_1h_gt_25 = protection_rsi_3_1h > 25.0
-    rsi_3_1h_gt_35 = protection_rsi_3_1h > 35.0
-    rsi_3_1h_gt_40 = protection_rsi_3_1h > 40.0
-    rsi_3_1h_gt_45 = protection_rsi_3_1h > 45.0
-    rsi_3_1h_gt_50 = protection_rsi_3_1h > 50.0
-    rsi_3_1h_gt_55 = protection_rsi_3_1h > 55.0
-    rsi_3_1h_lt_60 = protection_rsi_3_1h < 60.0
-    rsi_3_1h_lt_70 = protection_rsi_3_1h < 70.0
-    rsi_3_1h_lt_75 = protection_rsi_3_1h < 75.0
-    rsi_3_1h_lt_80 = protection_rsi_3_1h < 80.0
-    rsi_3_1h_lt_85 = protection_rsi_3_1h < 85.0
-    rsi_3_1h_lt_90 = protection_rsi_3_1h < 90.0
-    rsi_3_4h_gt_20 = protection_rsi_3_4h > 20.0
-    rsi_3_4h_gt_25 = protection_rsi_3_4h > 25.0
-    rsi_3_4h_gt_30 = protection_rsi_3_4h > 30.0
-    rsi_3_4h_gt_35 = protection_rsi_3_4h > 35.0
-    rsi_3_4h_gt_40 = protection_rsi_3_4h > 40.0
-    rsi_3_4h_gt_45 = protection_rsi_3_4h > 45.0
-    rsi_3_4h_gt_50 = protection_rsi_3_4h > 50.0
-    rsi_3_4h_gt_55 = protection_rsi_3_4h > 55.0
-    rsi_3_4h_gt_65 = protection_rsi_3_4h > 65.0
-    stochrsi_k_15m_lt_10 = protection_stochrsik_14_14_3_3_15m < 10.0
-    stochrsi_k_15m_lt_20 = protection_stochrsik_14_14_3_3_15m < 20.0
-    stochrsi_k_15m_lt_30 = protection_stochrsik_14_14_3_3_15m < 30.0
-    stochrsi_k_15m_lt_40 = protection_stochrsik_14_14_3_3_15m < 40.0
-    stochrsi_k_15m_lt_50 = protection_stochrsik_14_14_3_3_15m < 50.0
-    stochrsi_k_15m_lt_60 = protection_stochrsik_14_14_3_3_15m < 60.0
-    stochrsi_k_15m_lt_70 = protection_stochrsik_14_14_3_3_15m < 70.0
-    stochrsi_k_15m_lt_80 = protection_stochrsik_14_14_3_3_15m < 80.0
-    stochrsi_k_15m_lt_90 = protection_stochrsik_14_14_3_3_15m < 90.0
-    stochrsi_k_1h_lt_15 = protection_stochrsik_14_14_3_3_1h < 15.0
-    stochrsi_k_1h_lt_20 = protection_stochrsik_14_14_3_3_1h < 20.0
-    stochrsi_k_1h_lt_30 = protection_stochrsik_14_14_3_3_1h < 30.0
-    stochrsi_k_1h_lt_40 = protection_stochrsik_14_14_3_3_1h < 40.0
-    stochrsi_k_1h_lt_50 = protection_stochrsik_14_14_3_3_1h < 50.0
-    stochrsi_k_1h_lt_60 = protection_stochrsik_14_14_3_3_1h < 60.0
-    stochrsi_k_1h_lt_70 = protection_stochrsik_14_14_3_3_1h < 70.0
-    stochrsi_k_1h_lt_80 = protection_stochrsik_14_14_3_3_1h < 80.0
-    stochrsi_k_1h_lt_85 = protection_stochrsik_14_14_3_3_1h < 85.0
-    stochrsi_k_1h_lt_90 = protection_stochrsik_14_14_3_3_1h < 90.0
-    stochrsi_k_4h_lt_10 = protection_stochrsik_14_14_3_3_4h < 10.0
-    stochrsi_k_4h_lt_15 = protection_stochrsik_14_14_3_3_4h < 15.0
-    stochrsi_k_4h_lt_20 = protection_stochrsik_14_14_3_3_4h < 20.0
-    stochrsi_k_4h_lt_30 = protection_stochrsik_14_14_3_3_4h < 30.0
-    stochrsi_k_4h_lt_40 = protection_stochrsik_14_14_3_3_4h < 40.0
-    stochrsi_k_4h_lt_50 = protection_stochrsik_14_14_3_3_4h < 50.0
-    stochrsi_k_4h_lt_60 = protection_stochrsik_14_14_3_3_4h < 60.0
-    stochrsi_k_4h_lt_70 = protection_stochrsik_14_14_3_3_4h < 70.0
-    stochrsi_k_4h_lt_80 = protection_stochrsik_14_14_3_3_4h < 80.0
-    stochrsi_k_4h_lt_85 = protection_stochrsik_14_14_3_3_4h < 85.0
-    stochrsi_k_4h_lt_90 = protection_stochrsik_14_14_3_3_4h < 90.0
+    aroonu_14_15m_lt_30 = masks.lt("AROONU_14_15m", 30.0)
+    aroonu_14_15m_lt_40 = masks.lt("AROONU_14_15m", 40.0)
+    aroonu_14_15m_lt_50 = masks.lt("AROONU_14_15m", 50.0)
+    aroonu_14_15m_lt_60 = masks.lt("AROONU_14_15m", 60.0)
+    aroonu_14_15m_lt_70 = masks.lt("AROONU_14_15m", 70.0)
+    aroonu_14_1h_lt_100 = masks.lt("AROONU_14_1h", 100.0)
+    aroonu_14_1h_lt_20 = masks.lt("AROONU_14_1h", 20.0)
+    aroonu_14_1h_lt_25 = masks.lt("AROONU_14_1h", 25.0)
+    aroonu_14_1h_lt_30 = masks.lt("AROONU_14_1h", 30.0)
+    aroonu_14_1h_lt_40 = masks.lt("AROONU_14_1h", 40.0)
+    aroonu_14_1h_lt_50 = masks.lt("AROONU_14_1h", 50.0)
+    aroonu_14_1h_lt_60 = masks.lt("AROONU_14_1h", 60.0)
+    aroonu_14_1h_lt_70 = masks.lt("AROONU_14_1h", 70.0)
+    aroonu_14_1h_lt_75 = masks.lt("AROONU_14_1h", 75.0)
+    aroonu_14_1h_lt_80 = masks.lt("AROONU_14_1h", 80.0)
+    aroonu_14_1h_lt_85 = masks.lt("AROONU_14_1h", 85.0)
+    aroonu_14_1h_lt_90 = masks.lt("AROONU_14_1h", 90.0)
+    aroonu_14_4h_lt_100 = masks.lt("AROONU_14_4h", 100.0)
+    aroonu_14_4h_lt_20 = masks.lt("AROONU_14_4h", 20.0)
+    aroonu_14_4h_lt_25 = masks.lt("AROONU_14_4h", 25.0)
+    aroonu_14_4h_lt_30 = masks.lt("AROONU_14_4h", 30.0)
+    aroonu_14_4h_lt_40 = masks.lt("AROONU_14_4h", 40.0)
+    aroonu_14_4h_lt_50 = masks.lt("AROONU_14_4h", 50.0)
+    aroonu_14_4h_lt_60 = masks.lt("AROONU_14_4h", 60.0)
+    aroonu_14_4h_lt_70 = masks.lt("AROONU_14_4h", 70.0)
+    aroonu_14_4h_lt_75 = masks.lt("AROONU_14_4h", 75.0)
+    aroonu_14_4h_lt_80 = masks.lt("AROONU_14_4h", 80.0)
+    aroonu_14_4h_lt_85 = masks.lt("AROONU_14_4h", 85.0)
+    aroonu_14_4h_lt_90 = masks.lt("AROONU_14_4h", 90.0)
+    cmf_20_15m_gt_neg_0 = masks.gt("CMF_20_15m", -0.0)
+    cmf_20_15m_gt_neg_010 = masks.gt("CMF_20_15m", -0.10)
+    cmf_20_15m_gt_neg_015 = masks.gt("CMF_20_15m", -0.15)
+    cmf_20_15m_gt_neg_02 = masks.gt("CMF_20_15m", -0.2)
+    cmf_20_15m_gt_neg_020 = masks.gt("CMF_20_15m", -0.20)
+    cmf_20_15m_gt_neg_025 = masks.gt("CMF_20_15m", -0.25)
+    cmf_20_15m_gt_neg_03 = masks.gt("CMF_20_15m", -0.3)
+    cmf_20_15m_gt_neg_030 = masks.gt("CMF_20_15m", -0.30)
+    cmf_20_15m_gt_neg_035 = masks.gt("CMF_20_15m", -0.35)
+    cmf_20_15m_gt_neg_040 = masks.gt("CMF_20_15m", -0.40)
+    cmf_20_15m_gt_neg_05 = masks.gt("CMF_20_15m", -0.5)
+    cmf_20_15m_gt_neg_050 = masks.gt("CMF_20_15m", -0.50)
+    cmf_20_1h_gt_neg_0 = masks.gt("CMF_20_1h", -0.0)
+    cmf_20_1h_gt_neg_010 = masks.gt("CMF_20_1h", -0.10)
+    cmf_20_1h_gt_neg_015 = masks.gt("CMF_20_1h", -0.15)
+    cmf_20_1h_gt_neg_02 = masks.gt("CMF_20_1h", -0.2)
+    cmf_20_1h_gt_neg_020 = masks.gt("CMF_20_1h", -0.20)
+    cmf_20_1h_gt_neg_025 = masks.gt("CMF_20_1h", -0.25)
+    cmf_20_1h_gt_neg_03 = masks.gt("CMF_20_1h", -0.3)
+    cmf_20_1h_gt_neg_030 = masks.gt("CMF_20_1h", -0.30)
+    cmf_20_1h_gt_neg_04 = masks.gt("CMF_20_1h", -0.4)
+    cmf_20_1h_gt_neg_040 = masks.gt("CMF_20_1h", -0.40)
+    cmf_20_1h_gt_neg_05 = masks.gt("CMF_20_1h", -0.5)
+    cmf_20_4h_gt_neg_0 = masks.gt("CMF_20_4h", -0.0)
+    cmf_20_4h_gt_neg_01 = masks.gt("CMF_20_4h", -0.1)
+    cmf_20_4h_gt_neg_010 = masks.gt("CMF_20_4h", -0.10)
+    cmf_20_4h_gt_neg_015 = masks.gt("CMF_20_4h", -0.15)
+    cmf_20_4h_gt_neg_02 = masks.gt("CMF_20_4h", -0.2)
+    cmf_20_4h_gt_neg_020 = masks.gt("CMF_20_4h", -0.20)
+    cmf_20_4h_gt_neg_025 = masks.gt("CMF_20_4h", -0.25)
+    cmf_20_4h_gt_neg_03 = masks.gt("CMF_20_4h", -0.3)
+    cmf_20_4h_gt_neg_030 = masks.gt("CMF_20_4h", -0.30)
+    cmf_20_4h_gt_neg_035 = masks.gt("CMF_20_4h", -0.35)
+    cmf_20_4h_gt_neg_04 = masks.gt("CMF_20_4h", -0.4)
+    cmf_20_4h_gt_neg_040 = masks.gt("CMF_20_4h", -0.40)
+    cmf_20_4h_gt_neg_05 = masks.gt("CMF_20_4h", -0.5)
+    roc_9_1d_lt_100 = masks.lt("ROC_9_1d", 100.0)
+    roc_9_1d_lt_15 = masks.lt("ROC_9_1d", 15.0)
+    roc_9_1d_lt_150 = masks.lt("ROC_9_1d", 150.0)
+    roc_9_1d_lt_20 = masks.lt("ROC_9_1d", 20.0)
+    roc_9_1d_lt_200 = masks.lt("ROC_9_1d", 200.0)
+    roc_9_1d_lt_25 = masks.lt("ROC_9_1d", 25.0)
+    roc_9_1d_lt_250 = masks.lt("ROC_9_1d", 250.0)
+    roc_9_1d_lt_30 = masks.lt("ROC_9_1d", 30.0)
+    roc_9_1d_lt_40 = masks.lt("ROC_9_1d", 40.0)
+    roc_9_1d_lt_50 = masks.lt("ROC_9_1d", 50.0)
+    roc_9_1d_lt_60 = masks.lt("ROC_9_1d", 60.0)
+    roc_9_1d_lt_70 = masks.lt("ROC_9_1d", 70.0)
+    roc_9_1d_lt_75 = masks.lt("ROC_9_1d", 75.0)
+    roc_9_1d_lt_80 = masks.lt("ROC_9_1d", 80.0)
+    roc_9_1h_gt_neg_10 = masks.gt("ROC_9_1h", -10.0)
+    roc_9_1h_gt_neg_15 = masks.gt("ROC_9_1h", -15.0)
+    roc_9_1h_gt_neg_20 = masks.gt("ROC_9_1h", -20.0)
+    roc_9_1h_gt_neg_25 = masks.gt("ROC_9_1h", -25.0)
+    roc_9_1h_gt_neg_30 = masks.gt("ROC_9_1h", -30.0)
+    roc_9_1h_gt_neg_50 = masks.gt("ROC_9_1h", -50.0)
+    roc_9_1h_gt_neg_60 = masks.gt("ROC_9_1h", -60.0)
+    roc_9_1h_lt_10 = masks.lt("ROC_9_1h", 10.0)
+    roc_9_1h_lt_15 = masks.lt("ROC_9_1h", 15.0)
+    roc_9_1h_lt_20 = masks.lt("ROC_9_1h", 20.0)
+    roc_9_1h_lt_30 = masks.lt("ROC_9_1h", 30.0)
+    roc_9_1h_lt_40 = masks.lt("ROC_9_1h", 40.0)
+    roc_9_1h_lt_50 = masks.lt("ROC_9_1h", 50.0)
+    roc_9_1h_lt_70 = masks.lt("ROC_9_1h", 70.0)
+    roc_9_1h_lt_80 = masks.lt("ROC_9_1h", 80.0)
+    roc_9_4h_gt_neg_10 = masks.gt("ROC_9_4h", -10.0)
+    roc_9_4h_gt_neg_15 = masks.gt("ROC_9_4h", -15.0)
+    roc_9_4h_gt_neg_20 = masks.gt("ROC_9_4h", -20.0)
+    roc_9_4h_gt_neg_25 = masks.gt("ROC_9_4h", -25.0)
+    roc_9_4h_gt_neg_30 = masks.gt("ROC_9_4h", -30.0)
+    roc_9_4h_gt_neg_35 = masks.gt("ROC_9_4h", -35.0)
+    roc_9_4h_gt_neg_40 = masks.gt("ROC_9_4h", -40.0)
+    roc_9_4h_gt_neg_50 = masks.gt("ROC_9_4h", -50.0)
+    roc_9_4h_gt_neg_60 = masks.gt("ROC_9_4h", -60.0)
+    roc_9_4h_gt_neg_70 = masks.gt("ROC_9_4h", -70.0)
+    roc_9_4h_lt_10 = masks.lt("ROC_9_4h", 10.0)
+    roc_9_4h_lt_100 = masks.lt("ROC_9_4h", 100.0)
+    roc_9_4h_lt_120 = masks.lt("ROC_9_4h", 120.0)
+    roc_9_4h_lt_130 = masks.lt("ROC_9_4h", 130.0)
+    roc_9_4h_lt_15 = masks.lt("ROC_9_4h", 15.0)
+    roc_9_4h_lt_20 = masks.lt("ROC_9_4h", 20.0)
+    roc_9_4h_lt_25 = masks.lt("ROC_9_4h", 25.0)
+    roc_9_4h_lt_250 = masks.lt("ROC_9_4h", 250.0)
+    roc_9_4h_lt_30 = masks.lt("ROC_9_4h", 30.0)
+    roc_9_4h_lt_300 = masks.lt("ROC_9_4h", 300.0)
+    roc_9_4h_lt_35 = masks.lt("ROC_9_4h", 35.0)
+    roc_9_4h_lt_40 = masks.lt("ROC_9_4h", 40.0)
+    roc_9_4h_lt_50 = masks.lt("ROC_9_4h", 50.0)
+    roc_9_4h_lt_60 = masks.lt("ROC_9_4h", 60.0)
+    roc_9_4h_lt_70 = masks.lt("ROC_9_4h", 70.0)
+    roc_9_4h_lt_75 = masks.lt("ROC_9_4h", 75.0)
+    roc_9_4h_lt_80 = masks.lt("ROC_9_4h", 80.0)
+    rsi_14_15m_gt_70 = masks.gt("RSI_14_15m", 70.0)
+    rsi_14_15m_gt_80 = masks.gt("RSI_14_15m", 80.0)
+    rsi_14_15m_gt_85 = masks.gt("RSI_14_15m", 85.0)
+    rsi_14_15m_gt_90 = masks.gt("RSI_14_15m", 90.0)
+    rsi_14_15m_gt_95 = masks.gt("RSI_14_15m", 95.0)
+    rsi_14_1h_gt_70 = masks.gt("RSI_14_1h", 70.0)
+    rsi_14_1h_gt_75 = masks.gt("RSI_14_1h", 75.0)
+    rsi_14_1h_gt_80 = masks.gt("RSI_14_1h", 80.0)
+    rsi_14_1h_gt_85 = masks.gt("RSI_14_1h", 85.0)
+    rsi_14_1h_gt_90 = masks.gt("RSI_14_1h", 90.0)
+    rsi_14_1h_gt_95 = masks.gt("RSI_14_1h", 95.0)
+    rsi_14_4h_gt_60 = masks.gt("RSI_14_4h", 60.0)
+    rsi_14_4h_gt_70 = masks.gt("RSI_14_4h", 70.0)
+    rsi_14_4h_gt_80 = masks.gt("RSI_14_4h", 80.0)
+    rsi_14_4h_gt_90 = masks.gt("RSI_14_4h", 90.0)
+    rsi_14_4h_gt_95 = masks.gt("RSI_14_4h", 95.0)
+    rsi_3_15m_lt_70 = masks.lt("RSI_3_15m", 70.0)
+    rsi_3_15m_lt_75 = masks.lt("RSI_3_15m", 75.0)
+    rsi_3_15m_lt_80 = masks.lt("RSI_3_15m", 80.0)
+    rsi_3_15m_lt_85 = masks.lt("RSI_3_15m", 85.0)
+    rsi_3_15m_lt_90 = masks.lt("RSI_3_15m", 90.0)
+    rsi_3_1d_gt_10 = masks.gt("RSI_3_1d", 10.0)
+    rsi_3_1d_gt_15 = masks.gt("RSI_3_1d", 15.0)
+    rsi_3_1d_gt_20 = masks.gt("RSI_3_1d", 20.0)
+    rsi_3_1d_gt_25 = masks.gt("RSI_3_1d", 25.0)
+    rsi_3_1d_gt_3 = masks.gt("RSI_3_1d", 3.0)
+    rsi_3_1d_gt_30 = masks.gt("RSI_3_1d", 30.0)
+    rsi_3_1d_gt_35 = masks.gt("RSI_3_1d", 35.0)
+    rsi_3_1d_gt_40 = masks.gt("RSI_3_1d", 40.0)
+    rsi_3_1d_gt_45 = masks.gt("RSI_3_1d", 45.0)
+    rsi_3_1d_gt_5 = masks.gt("RSI_3_1d", 5.0)
+    rsi_3_1d_gt_50 = masks.gt("RSI_3_1d", 50.0)
+    rsi_3_1d_gt_55 = masks.gt("RSI_3_1d", 55.0)
+    rsi_3_1d_gt_60 = masks.gt("RSI_3_1d", 60.0)
+    rsi_3_1d_gt_65 = masks.gt("RSI_3_1d", 65.0)
+    rsi_3_1h_gt_20 = masks.gt("RSI_3_1h", 20.0)
+    rsi_3_1h_gt_25 = masks.gt("RSI_3_1h", 25.0)
+    rsi_3_1h_gt_35 = masks.gt("RSI_3_1h", 35.0)
+    rsi_3_1h_gt_40 = masks.gt("RSI_3_1h", 40.0)
+    rsi_3_1h_gt_45 = masks.gt("RSI_3_1h", 45.0)
+    rsi_3_1h_gt_50 = masks.gt("RSI_3_1h", 50.0)
+    rsi_3_1h_gt_55 = masks.gt("RSI_3_1h", 55.0)
+    rsi_3_1h_lt_60 = masks.lt("RSI_3_1h", 60.0)
+    rsi_3_1h_lt_70 = masks.lt("RSI_3_1h", 70.0)
+    rsi_3_1h_lt_75 = masks.lt("RSI_3_1h", 75.0)
+    rsi_3_1h_lt_80 = masks.lt("RSI_3_1h", 80.0)
+    rsi_3_1h_lt_85 = masks.lt("RSI_3_1h", 85.0)
+    rsi_3_1h_lt_90 = masks.lt("RSI_3_1h", 90.0)
+    rsi_3_4h_gt_20 = masks.gt("RSI_3_4h", 20.0)
+    rsi_3_4h_gt_25 = masks.gt("RSI_3_4h", 25.0)
+    rsi_3_4h_gt_30 = masks.gt("RSI_3_4h", 30.0)
+    rsi_3_4h_gt_35 = masks.gt("RSI_3_4h", 35.0)
+    rsi_3_4h_gt_40 = masks.gt("RSI_3_4h", 40.0)
+    rsi_3_4h_gt_45 = masks.gt("RSI_3_4h", 45.0)
+    rsi_3_4h_gt_50 = masks.gt("RSI_3_4h", 50.0)
+    rsi_3_4h_gt_55 = masks.gt("RSI_3_4h", 55.0)
+    rsi_3_4h_gt_65 = masks.gt("RSI_3_4h", 65.0)
+    stochrsi_k_15m_lt_10 = masks.lt("STOCHRSIk_14_14_3_3_15m", 10.0)
+    stochrsi_k_15m_lt_20 = masks.lt("STOCHRSIk_14_14_3_3_15m", 20.0)
+    stochrsi_k_15m_lt_30 = masks.lt("STOCHRSIk_14_14_3_3_15m", 30.0)
+    stochrsi_k_15m_lt_40 = masks.lt("STOCHRSIk_14_14_3_3_15m", 40.0)
+    stochrsi_k_15m_lt_50 = masks.lt("STOCHRSIk_14_14_3_3_15m", 50.0)
+    stochrsi_k_15m_lt_60 = masks.lt("STOCHRSIk_14_14_3_3_15m", 60.0)
+    stochrsi_k_15m_lt_70 = masks.lt("STOCHRSIk_14_14_3_3_15m", 70.0)
+    stochrsi_k_15m_lt_80 = masks.lt("STOCHRSIk_14_14_3_3_15m", 80.0)
+    stochrsi_k_15m_lt_90 = masks.lt("STOCHRSIk_14_14_3_3_15m", 90.0)
+    stochrsi_k_1h_lt_15 = masks.lt("STOCHRSIk_14_14_3_3_1h", 15.0)
+    stochrsi_k_1h_lt_20 = masks.lt("STOCHRSIk_14_14_3_3_1h", 20.0)
+    stochrsi_k_1h_lt_30 = masks.lt("STOCHRSIk_14_14_3_3_1h", 30.0)
+    stochrsi_k_1h_lt_40 = masks.lt("STOCHRSIk_14_14_3_3_1h", 40.0)
+    stochrsi_k_1h_lt_50 = masks.lt("STOCHRSIk_14_14_3_3_1h", 50.0)
+    stochrsi_k_1h_lt_60 = masks.lt("STOCHRSIk_14_14_3_3_1h", 60.0)
+    stochrsi_k_1h_lt_70 = masks.lt("STOCHRSIk_14_14_3_3_1h", 70.0)
+    stochrsi_k_1h_lt_80 = masks.lt("STOCHRSIk_14_14_3_3_1h", 80.0)
+    stochrsi_k_1h_lt_85 = masks.lt("STOCHRSIk_14_14_3_3_1h", 85.0)
+    stochrsi_k_1h_lt_90 = masks.lt("STOCHRSIk_14_14_3_3_1h", 90.0)
+    stochrsi_k_4h_lt_10 = masks.lt("STOCHRSIk_14_14_3_3_4h", 10.0)
+    stochrsi_k_4h_lt_15 = masks.lt("STOCHRSIk_14_14_3_3_4h", 15.0)
+    stochrsi_k_4h_lt_20 = masks.lt("STOCHRSIk_14_14_3_3_4h", 20.0)
+    stochrsi_k_4h_lt_30 = masks.lt("STOCHRSIk_14_14_3_3_4h", 30.0)
+    stochrsi_k_4h_lt_40 = masks.lt("STOCHRSIk_14_14_3_3_4h", 40.0)
+    stochrsi_k_4h_lt_50 = masks.lt("STOCHRSIk_14_14_3_3_4h", 50.0)
+    stochrsi_k_4h_lt_60 = masks.lt("STOCHRSIk_14_14_3_3_4h", 60.0)
+    stochrsi_k_4h_lt_70 = masks.lt("STOCHRSIk_14_14_3_3_4h", 70.0)
+    stochrsi_k_4h_lt_80 = masks.lt("STOCHRSIk_14_14_3_3_4h", 80.0)
+    stochrsi_k_4h_lt_85 = masks.lt("STOCHRSIk_14_14_3_3_4h", 85.0)
+    stochrsi_k_4h_lt_90 = masks.lt("STOCHRSIk_14_14_3_3_4h", 90.0)
 
     # Reused long-global RSI comparison masks
-    rsi_14_15m_lt_30 = protection_rsi_14_15m < 30.0
-    rsi_14_1h_lt_40 = protection_rsi_14_1h < 40.0
-    rsi_14_4h_lt_50 = protection_rsi_14_4h < 50.0
-    rsi_14_15m_lt_40 = protection_rsi_14_15m < 40.0
-    rsi_14_4h_lt_40 = protection_rsi_14_4h < 40.0
-    rsi_14_1h_lt_30 = protection_rsi_14_1h < 30.0
-    rsi_14_1h_lt_50 = protection_rsi_14_1h < 50.0
-    rsi_3_15m_gt_20 = protection_rsi_3_15m > 20.0
-    rsi_3_15m_gt_15 = protection_rsi_3_15m > 15.0
-    rsi_3_15m_gt_10 = protection_rsi_3_15m > 10.0
-    rsi_3_15m_gt_25 = protection_rsi_3_15m > 25.0
-    rsi_14_4h_lt_30 = protection_rsi_14_4h < 30.0
-    rsi_3_15m_gt_30 = protection_rsi_3_15m > 30.0
-    rsi_3_1h_gt_30 = protection_rsi_3_1h > 30.0
-    rsi_14_15m_lt_20 = protection_rsi_14_15m < 20.0
-    rsi_3_4h_gt_60 = protection_rsi_3_4h > 60.0
-    rsi_3_15m_gt_5 = protection_rsi_3_15m > 5.0
-    rsi_3_15m_gt_35 = protection_rsi_3_15m > 35.0
-    rsi_3_15m_gt_40 = protection_rsi_3_15m > 40.0
-    rsi_3_15m_gt_45 = protection_rsi_3_15m > 45.0
-    rsi_3_1h_gt_5 = protection_rsi_3_1h > 5.0
-    rsi_3_1h_gt_10 = protection_rsi_3_1h > 10.0
-    rsi_3_1h_gt_15 = protection_rsi_3_1h > 15.0
-    rsi_3_1h_gt_60 = protection_rsi_3_1h > 60.0
-    rsi_3_1h_gt_65 = protection_rsi_3_1h > 65.0
-    rsi_3_4h_gt_3 = protection_rsi_3_4h > 3.0
-    rsi_3_4h_gt_5 = protection_rsi_3_4h > 5.0
-    rsi_3_4h_gt_10 = protection_rsi_3_4h > 10.0
-    rsi_3_4h_gt_15 = protection_rsi_3_4h > 15.0
-    rsi_14_4h_lt_20 = protection_rsi_14_4h < 20.0
-    rsi_14_4h_lt_60 = protection_rsi_14_4h < 60.0
-    rsi_14_4h_lt_70 = protection_rsi_14_4h < 70.0
-    rsi_14_4h_lt_80 = protection_rsi_14_4h < 80.0
-    rsi_14_1h_lt_20 = protection_rsi_14_1h < 20.0
-    rsi_14_1h_lt_60 = protection_rsi_14_1h < 60.0
-    rsi_14_1h_lt_70 = protection_rsi_14_1h < 70.0
-    rsi_14_15m_lt_50 = protection_rsi_14_15m < 50.0
+    rsi_14_15m_lt_30 = masks.lt("RSI_14_15m", 30.0)
+    rsi_14_1h_lt_40 = masks.lt("RSI_14_1h", 40.0)
+    rsi_14_4h_lt_50 = masks.lt("RSI_14_4h", 50.0)
+    rsi_14_15m_lt_40 = masks.lt("RSI_14_15m", 40.0)
+    rsi_14_4h_lt_40 = masks.lt("RSI_14_4h", 40.0)
+    rsi_14_1h_lt_30 = masks.lt("RSI_14_1h", 30.0)
+    rsi_14_1h_lt_50 = masks.lt("RSI_14_1h", 50.0)
+    rsi_3_15m_gt_20 = masks.gt("RSI_3_15m", 20.0)
+    rsi_3_15m_gt_15 = masks.gt("RSI_3_15m", 15.0)
+    rsi_3_15m_gt_10 = masks.gt("RSI_3_15m", 10.0)
+    rsi_3_15m_gt_25 = masks.gt("RSI_3_15m", 25.0)
+    rsi_14_4h_lt_30 = masks.lt("RSI_14_4h", 30.0)
+    rsi_3_15m_gt_30 = masks.gt("RSI_3_15m", 30.0)
+    rsi_3_1h_gt_30 = masks.gt("RSI_3_1h", 30.0)
+    rsi_14_15m_lt_20 = masks.lt("RSI_14_15m", 20.0)
+    rsi_3_4h_gt_60 = masks.gt("RSI_3_4h", 60.0)
+    rsi_3_15m_gt_5 = masks.gt("RSI_3_15m", 5.0)
+    rsi_3_15m_gt_35 = masks.gt("RSI_3_15m", 35.0)
+    rsi_3_15m_gt_40 = masks.gt("RSI_3_15m", 40.0)
+    rsi_3_15m_gt_45 = masks.gt("RSI_3_15m", 45.0)
+    rsi_3_1h_gt_5 = masks.gt("RSI_3_1h", 5.0)
+    rsi_3_1h_gt_10 = masks.gt("RSI_3_1h", 10.0)
+    rsi_3_1h_gt_15 = masks.gt("RSI_3_1h", 15.0)
+    rsi_3_1h_gt_60 = masks.gt("RSI_3_1h", 60.0)
+    rsi_3_1h_gt_65 = masks.gt("RSI_3_1h", 65.0)
+    rsi_3_4h_gt_3 = masks.gt("RSI_3_4h", 3.0)
+    rsi_3_4h_gt_5 = masks.gt("RSI_3_4h", 5.0)
+    rsi_3_4h_gt_10 = masks.gt("RSI_3_4h", 10.0)
+    rsi_3_4h_gt_15 = masks.gt("RSI_3_4h", 15.0)
+    rsi_14_4h_lt_20 = masks.lt("RSI_14_4h", 20.0)
+    rsi_14_4h_lt_60 = masks.lt("RSI_14_4h", 60.0)
+    rsi_14_4h_lt_70 = masks.lt("RSI_14_4h", 70.0)
+    rsi_14_4h_lt_80 = masks.lt("RSI_14_4h", 80.0)
+    rsi_14_1h_lt_20 = masks.lt("RSI_14_1h", 20.0)
+    rsi_14_1h_lt_60 = masks.lt("RSI_14_1h", 60.0)
+    rsi_14_1h_lt_70 = masks.lt("RSI_14_1h", 70.0)
+    rsi_14_15m_lt_50 = masks.lt("RSI_14_15m", 50.0)
 
     # Global protections Long
     # Reused protection RSI and ROC masks
-    rsi_3_15m_gt_3 = protection_rsi_3_15m > 3.0
-    rsi_3_4h_lt_80 = protection_rsi_3_4h < 80.0
-    rsi_3_4h_lt_90 = protection_rsi_3_4h < 90.0
-    roc_9_1d_gt_neg_50 = protection_roc_9_1d > -50.0
-    top_wick_pct_1d_lt_10 = protection_top_wick_pct_1d < 10.0
-    rsi_3_4h_lt_70 = protection_rsi_3_4h < 70.0
-    aroonu_14_15m_lt_20 = protection_aroonu_14_15m < 20.0
-    aroonu_14_15m_lt_25 = protection_aroonu_14_15m < 25.0
-    rsi_3_4h_lt_60 = protection_rsi_3_4h < 60.0
-    rsi_3_gt_10 = protection_rsi_3 > 10.0
-    rsi_14_15m_lt_10 = protection_rsi_14_15m < 10.0
-    roc_9_1d_gt_neg_40 = protection_roc_9_1d > -40.0
-    change_pct_1d_lt_10 = protection_change_pct_1d < 10.0
-    top_wick_pct_1d_lt_20 = protection_top_wick_pct_1d < 20.0
-    rsi_3_1h_gt_3 = protection_rsi_3_1h > 3.0
-    rsi_3_gt_5 = protection_rsi_3 > 5.0
-    roc_9_1d_gt_neg_30 = protection_roc_9_1d > -30.0
-    change_pct_1d_gt_neg_10 = protection_change_pct_1d > -10.0
-    change_pct_1d_lt_30 = protection_change_pct_1d < 30.0
-    cci_20_4h_lt_neg_200 = protection_cci_20_4h < -200.0
-    cci_20_1h_gt_250 = protection_cci_20_1h > 250.0
-    top_wick_pct_1d_lt_25 = protection_top_wick_pct_1d < 25.0
-    stochrsik_14_14_3_3_1h_gt_70 = protection_stochrsik_14_14_3_3_1h > 70.0
-    roc_9_1d_gt_neg_15 = protection_roc_9_1d > -15.0
-    change_pct_1d_lt_50 = protection_change_pct_1d < 50.0
-    cci_20_4h_gt_200 = protection_cci_20_4h > 200.0
-    cci_20_15m_gt_250 = protection_cci_20_15m > 250.0
-    aroonu_14_15m_lt_80 = protection_aroonu_14_15m < 80.0
-    rsi_3_15m_lt_95 = protection_rsi_3_15m < 95.0
-    rsi_14_4h_lt_75 = protection_rsi_14_4h < 75.0
-    rsi_14_4h_lt_45 = protection_rsi_14_4h < 45.0
-    rsi_14_1h_lt_35 = protection_rsi_14_1h < 35.0
-    rsi_14_1d_gt_50 = protection_rsi_14_1d > 50.0
-    rsi_14_15m_lt_25 = protection_rsi_14_15m < 25.0
-    roc_9_1d_gt_neg_25 = protection_roc_9_1d > -25.0
-    roc_9_15m_lt_10 = protection_roc_9_15m < 10.0
-    cmf_20_1d_gt_neg_0_20 = protection_cmf_20_1d > -0.20
-    change_pct_1d_gt_neg_20 = protection_change_pct_1d > -20.0
-    cci_20_1h_lt_neg_250 = protection_cci_20_1h < -250.0
-    aroond_14_4h_lt_50 = protection_aroond_14_4h < 50.0
-    willr_14_4h_gt_neg_10 = protection_willr_14_4h > -10.0
-    top_wick_pct_4h_lt_10 = protection_top_wick_pct_4h < 10.0
-    top_wick_pct_1d_lt_50 = protection_top_wick_pct_1d < 50.0
-    stochrsik_14_14_3_3_4h_gt_80 = protection_stochrsik_14_14_3_3_4h > 80.0
-    stochrsik_14_14_3_3_4h_gt_60 = protection_stochrsik_14_14_3_3_4h > 60.0
+    rsi_3_15m_gt_3 = masks.gt("RSI_3_15m", 3.0)
+    rsi_3_4h_lt_80 = masks.lt("RSI_3_4h", 80.0)
+    rsi_3_4h_lt_90 = masks.lt("RSI_3_4h", 90.0)
+    roc_9_1d_gt_neg_50 = masks.gt("ROC_9_1d", -50.0)
+    top_wick_pct_1d_lt_10 = masks.lt("top_wick_pct_1d", 10.0)
+    rsi_3_4h_lt_70 = masks.lt("RSI_3_4h", 70.0)
+    aroonu_14_15m_lt_20 = masks.lt("AROONU_14_15m", 20.0)
+    aroonu_14_15m_lt_25 = masks.lt("AROONU_14_15m", 25.0)
+    rsi_3_4h_lt_60 = masks.lt("RSI_3_4h", 60.0)
+    rsi_3_gt_10 = masks.gt("RSI_3", 10.0)
+    rsi_14_15m_lt_10 = masks.lt("RSI_14_15m", 10.0)
+    roc_9_1d_gt_neg_40 = masks.gt("ROC_9_1d", -40.0)
+    change_pct_1d_lt_10 = masks.lt("change_pct_1d", 10.0)
+    top_wick_pct_1d_lt_20 = masks.lt("top_wick_pct_1d", 20.0)
+    rsi_3_1h_gt_3 = masks.gt("RSI_3_1h", 3.0)
+    rsi_3_gt_5 = masks.gt("RSI_3", 5.0)
+    roc_9_1d_gt_neg_30 = masks.gt("ROC_9_1d", -30.0)
+    change_pct_1d_gt_neg_10 = masks.gt("change_pct_1d", -10.0)
+    change_pct_1d_lt_30 = masks.lt("change_pct_1d", 30.0)
+    cci_20_4h_lt_neg_200 = masks.lt("CCI_20_4h", -200.0)
+    cci_20_1h_gt_250 = masks.gt("CCI_20_1h", 250.0)
+    top_wick_pct_1d_lt_25 = masks.lt("top_wick_pct_1d", 25.0)
+    stochrsik_14_14_3_3_1h_gt_70 = masks.gt("STOCHRSIk_14_14_3_3_1h", 70.0)
+    roc_9_1d_gt_neg_15 = masks.gt("ROC_9_1d", -15.0)
+    change_pct_1d_lt_50 = masks.lt("change_pct_1d", 50.0)
+    cci_20_4h_gt_200 = masks.gt("CCI_20_4h", 200.0)
+    cci_20_15m_gt_250 = masks.gt("CCI_20_15m", 250.0)
+    aroonu_14_15m_lt_80 = masks.lt("AROONU_14_15m", 80.0)
+    rsi_3_15m_lt_95 = masks.lt("RSI_3_15m", 95.0)
+    rsi_14_4h_lt_75 = masks.lt("RSI_14_4h", 75.0)
+    rsi_14_4h_lt_45 = masks.lt("RSI_14_4h", 45.0)
+    rsi_14_1h_lt_35 = masks.lt("RSI_14_1h", 35.0)
+    rsi_14_1d_gt_50 = masks.gt("RSI_14_1d", 50.0)
+    rsi_14_15m_lt_25 = masks.lt("RSI_14_15m", 25.0)
+    roc_9_1d_gt_neg_25 = masks.gt("ROC_9_1d", -25.0)
+    roc_9_15m_lt_10 = masks.lt("ROC_9_15m", 10.0)
+    cmf_20_1d_gt_neg_0_20 = masks.gt("CMF_20_1d", -0.20)
+    change_pct_1d_gt_neg_20 = masks.gt("change_pct_1d", -20.0)
+    cci_20_1h_lt_neg_250 = masks.lt("CCI_20_1h", -250.0)
+    aroond_14_4h_lt_50 = masks.lt("AROOND_14_4h", 50.0)
+    willr_14_4h_gt_neg_10 = masks.gt("WILLR_14_4h", -10.0)
+    top_wick_pct_4h_lt_10 = masks.lt("top_wick_pct_4h", 10.0)
+    top_wick_pct_1d_lt_50 = masks.lt("top_wick_pct_1d", 50.0)
+    stochrsik_14_14_3_3_4h_gt_80 = masks.gt("STOCHRSIk_14_14_3_3_4h", 80.0)
+    stochrsik_14_14_3_3_4h_gt_60 = masks.gt("STOCHRSIk_14_14_3_3_4h", 60.0)
 
     df["protections_long_global"] = (
       # 5m & 15m & 1h & 4h & 1d down move, 1h & 4h & 1d still not low enough
@@ -12448,19 +12762,44 @@ class NostalgiaForInfinityX7(IStrategy):
     )
     df["protections_short_rebuy"] = True
 
-    if debug_time:
-      tok_after_protections = time.perf_counter()
-      tok_total = time.perf_counter()
+    if debug:
+      log.debug("[%s] Protections: %s", metadata_pair, masks.report())
+
+    # ============================================================
+    # COMPACT STORAGE
+    # ============================================================
+    if self.indicators_compact_storage_enable:
+      df = self.compact_indicator_storage(df)
+
+    if profiler is not None:
+      tok_after_protections = profiler.record(tok_before_protections, metadata_pair, base_timeframe, "protections")
       log.debug(
         f"[{metadata_pair}] "
         f"populate_indicators pre-protections: "
-        f"{tok_before_protections - tik:0.4f}s | "
+        f"{tok_before_protections[0] - tik[0]:0.4f}s | "
         f"protections: "
-        f"{tok_after_protections - tok_before_protections:0.4f}s | "
+        f"{tok_after_protections[0] - tok_before_protections[0]:0.4f}s | "
         f"total: "
-        f"{tok_total - tik:0.4f}s"
+        f"{tok_after_protections[0] - tik[0]:0.4f}s | "
+        f"BTC cache hits/misses: "
+        f"{self.btc_informative_cache.hits}/{self.btc_informative_cache.misses}"
+        + (
+          f" | informative cache hits/misses: {self.informative_cache.hits}/{self.informative_cache.misses}"
+          if self.informative_cache is not None
+          else ""
+        )
       )
 
+    # ============================================================
+    # GRIND ENTRIES
+    # ============================================================
+    # From the stored columns, as the grind entries read them
+    if profiler is not None:
+      mark = profiler.start()
+    df = self.populate_grind_entry_rules(df)
+    if profiler is not None:
+      profiler.record(mark, metadata_pair, base_timeframe, "grind_entries")
+
     return df
 
   # Confirm Trade Entry
@@ -12482,17 +12821,16 @@ class NostalgiaForInfinityX7(IStrategy):
       return True
 
     # Mode Validation
-    entry_tags = entry_tag.split()
     is_long_side = side == "long"
     is_short_side = side == "short"
-    long_grind_mode_tags = self.long_grind_mode_tags
-    long_top_coins_mode_tags = self.long_top_coins_mode_tags
-    long_scalp_mode_tags = self.long_scalp_mode_tags
-    if all(c in long_grind_mode_tags for c in entry_tags):
+    enter_tag_modes = self.enter_tag_modes
+    tag_modes = enter_tag_modes.modes(entry_tag)
+    all_bits = enter_tag_modes.all_bits
+    if tag_modes & all_bits["long_grind"]:
       return self._handle_grind_mode(pair, current_time)
-    if all(c in long_top_coins_mode_tags for c in entry_tags):
+    if tag_modes & all_bits["long_top_coins"]:
       return self._handle_top_coins_mode(pair, current_time)
-    if all(c in long_scalp_mode_tags for c in entry_tags):
+    if tag_modes & all_bits["long_scalp"]:
       return self._handle_scalp_mode(pair, current_time)
 
     # Long/Short Slot Validation (only in futures mode)
@@ -12504,8 +12842,7 @@ class NostalgiaForInfinityX7(IStrategy):
         max_side_trades = self.futures_max_open_trades_short
 
       if max_side_trades != 0:
-        open_trades = Trade.get_trades_proxy(is_open=True)
-        side_trades = sum(1 for t in open_trades if t.trade_direction == side)
+        side_trades = self.open_trades().side_count(side)
         if side_trades >= max_side_trades:
           log.info(
             f"[{current_time}] Cancelling entry for {pair} due to {side} trades reaching the max limit of {max_side_trades}."
@@ -12515,9 +12852,9 @@ class NostalgiaForInfinityX7(IStrategy):
     max_slippage = self.max_slippage
 
     # Slippage Validation
-    df, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
-    if len(df) >= 1:
-      last_candle = df.iloc[-1]
+    candles = self.analyzed_candles(pair)
+    if len(candles) >= 1:
+      last_candle = candles[0]
       last_close = last_candle["close"]
       if (is_long_side and rate > last_close) or (is_short_side and rate < last_close):
         slippage = (rate / last_close) - 1.0
@@ -12527,20 +12864,47 @@ class NostalgiaForInfinityX7(IStrategy):
           log.warning(f"[{current_time}] Cancelling entry for {pair} due to slippage {(slippage * 100.0):.2f}%")
           return False
 
+    self.open_trade_index.pending(pair, side, self.open_trade_modes(entry_tag))
     return True
 
+  def open_trade_modes(self, enter_tag: Optional[str]) -> tuple:
+    """The modes (grind, scalp, rebuy, top_coins) the tags of a trade are all part of."""
+    if enter_tag is None:
+      return ()
+    enter_tag_modes = self.enter_tag_modes
+    tag_modes = enter_tag_modes.modes(enter_tag)
+    all_bits = enter_tag_modes.all_bits
+    return tuple(mode for mode in ("grind", "scalp", "rebuy", "top_coins") if tag_modes & all_bits[f"long_{mode}"])
+
+  def index_open_trade(self, trade: "Trade") -> None:
+    trade_key = trade.id if trade.id is not None else id(trade)
+    self.open_trade_index.add(
+      trade_key, trade, trade.pair, trade.trade_direction, self.open_trade_modes(trade.enter_tag)
+    )
+
+  def open_trades(self) -> "OpenTradeIndex":
+    """The open trades index, rebuilt from the open trades on its first use in each bot loop."""
+    open_trade_index = self.open_trade_index
+    if not open_trade_index.built:
+      self.rebuild_open_trade_index()
+    return open_trade_index
+
+  def rebuild_open_trade_index(self) -> None:
+    self.open_trade_index.clear()
+    for trade in Trade.get_trades_proxy(is_open=True):
+      self.index_open_trade(trade)
+    self.open_trade_index.built = True
+
   def _handle_grind_mode(self, pair: str, current_time: datetime) -> bool:
     grind_mode_coins = self.grind_mode_coins
     grind_mode_max_slots = self.grind_mode_max_slots
-    long_grind_mode_tags = self.long_grind_mode_tags
 
     is_pair_grind_mode = pair.partition("/")[0] in grind_mode_coins
     if not is_pair_grind_mode:
       log.info(f"[{current_time}] Cancelling entry for {pair} due to not being in grind mode coins list.")
       return False
 
-    open_trades = Trade.get_trades_proxy(is_open=True)
-    num_open_grind_mode = sum(1 for t in open_trades if all(c in long_grind_mode_tags for c in t.enter_tag.split()))
+    num_open_grind_mode = self.open_trades().mode_count("grind")
     if num_open_grind_mode >= grind_mode_max_slots:
       log.info(f"[{current_time}] Cancelling entry for {pair} due to grind mode slots limit reached.")
       return False
@@ -12555,7 +12919,7 @@ class NostalgiaForInfinityX7(IStrategy):
     return True
 
   def _handle_scalp_mode(self, pair: str, current_time: datetime) -> bool:
-    current_free_slots = self.config["max_open_trades"] - Trade.get_open_trade_count()
+    current_free_slots = self.config["max_open_trades"] - self.open_trades().count()
     if current_free_slots < self.min_free_slots_scalp_mode:
       log.info(f"[{current_time}] Cancelling entry for {pair} due to insufficient free slots.")
       return False
@@ -12608,14 +12972,13 @@ class NostalgiaForInfinityX7(IStrategy):
           return False
 
     self._remove_profit_target(pair)
+    self.open_trade_index.closing(trade.id if trade.id is not None else id(trade), trade)
     return True
 
   # Check Entry Timeout
   # ---------------------------------------------------------------------------------------------
   def check_entry_timeout(self, pair: str, trade: Trade, order: Order, current_time: datetime, **kwargs) -> bool:
-    ob = self.dp.orderbook(pair, 1)
-    bids = ob["bids"][0][0]
-    asks = ob["asks"][0][0]
+    bids, asks = self.top_of_book(pair)
     # Cancel order if price is more than 3% difference.
     if trade.is_short:
       if asks < order.price * 0.97:
@@ -12631,9 +12994,7 @@ class NostalgiaForInfinityX7(IStrategy):
     # If force exit skip the check
     if order.ft_order_tag is not None and order.ft_order_tag == "force_exit":
       return False
-    ob = self.dp.orderbook(pair, 1)
-    bids = ob["bids"][0][0]
-    asks = ob["asks"][0][0]
+    bids, asks = self.top_of_book(pair)
     # Cancel order if price is more than 3% difference.
     if trade.is_short:
       if bids > order.price * 1.03:
@@ -12643,17 +13004,60 @@ class NostalgiaForInfinityX7(IStrategy):
         return True
     return False
 
+  # Top Of Book
+  # ---------------------------------------------------------------------------------------------
+  def top_of_book(self, pair: str) -> tuple:
+    """The best bid and ask of the pair."""
+    top_of_book_cache = self.top_of_book_cache
+    if top_of_book_cache is not None:
+      return top_of_book_cache.get(self.dp, pair)
+    ob = self.dp.orderbook(pair, 1)
+    return ob["bids"][0][0], ob["asks"][0][0]
+
   # Bot Loop Start
   # ---------------------------------------------------------------------------------------------
   def bot_loop_start(self, current_time: datetime, **kwargs) -> None:
+    # Rebuilt from the open trades on its first use in this loop
+    self.open_trade_index.clear()
+
+    # Write the pending profit target changes once due
+    self.target_profit_cache.flush()
+    if self.indicators_profiler is not None:
+      self.indicators_profiler.flush()
+
     if self.config["runmode"].value not in ("live", "dry_run"):
       return super().bot_loop_start(datetime, **kwargs)
 
     if self.hold_support_enabled:
       self.load_hold_trades_config()
 
+    # The order timeout checks of this loop read the bid and ask of these pairs
+    if self.top_of_book_cache is not None:
+      self.top_of_book_cache.prefetch(self.dp, self.open_trades().pairs_with_open_orders())
+
+    if self.notification_queue is not None:
+      self.notification_queue.start()
+
     return super().bot_loop_start(current_time, **kwargs)
 
+  # Bot Cleanup
+  # ---------------------------------------------------------------------------------------------
+  def ft_bot_cleanup(self) -> None:
+    super().ft_bot_cleanup()
+    # Write the pending profit target changes before exiting
+    if self.target_profit_cache is not None:
+      self.target_profit_cache.save()
+    if self.hold_trades_watcher is not None:
+      self.hold_trades_watcher.stop()
+    # Send the queued notifications
+    if self.notification_queue is not None:
+      self.notification_queue.stop()
+    if self.indicators_profiler is not None:
+      self.indicators_profiler.save()
+    if self.indicator_pool:
+      self.indicator_pool.close()
+      self.indicator_pool = False
+
   # Leverage
   # ---------------------------------------------------------------------------------------------
   def leverage(
@@ -12667,12 +13071,12 @@ class NostalgiaForInfinityX7(IStrategy):
     side: str,
     **kwargs,
   ) -> float:
-    enter_tags = entry_tag.split()
-    long_rebuy_mode_tags = self.long_rebuy_mode_tags
-    long_grind_mode_tags = self.long_grind_mode_tags
-    if all(c in long_rebuy_mode_tags for c in enter_tags):
+    enter_tag_modes = self.enter_tag_modes
+    tag_modes = enter_tag_modes.modes(entry_tag)
+    all_bits = enter_tag_modes.all_bits
+    if tag_modes & all_bits["long_rebuy"]:
       return self.futures_mode_leverage_rebuy_mode
-    elif all(c in long_grind_mode_tags for c in enter_tags):
+    elif tag_modes & all_bits["long_grind"]:
       return self.futures_mode_leverage_grind_mode
     return self.futures_mode_leverage
 
@@ -12689,21 +13093,39 @@ class NostalgiaForInfinityX7(IStrategy):
     """Check if the current run mode is backtest or hyperopt"""
     return self.dp.runmode.value in ["backtest", "hyperopt"]
 
+  def analyzed_candles(self, pair: str) -> tuple:
+    """
+    The last and the previous candle of the analyzed dataframe of the pair (fewer on a shorter dataframe), as
+    CandleRow. They are made once per candle and analysis, and shared by all the callbacks.
+    """
+    df, analyzed_time = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+    if len(df) == 0:
+      return ()
+    # The backtests get slices of the same analyzed dataframe, told apart by the index label of their last candle
+    key = (analyzed_time, len(df), df.index[-1])
+    cached = self.analyzed_candles_cache.get(pair)
+    if cached is not None and cached[0] == key:
+      return cached[1]
+    columns = CandleColumns(df)
+    candles = tuple(CandleRow(columns, position) for position in range(len(df) - 1, max(len(df) - 3, -1), -1))
+    self.analyzed_candles_cache[pair] = (key, candles)
+    return candles
+
   def is_system_v3(self, trade: Trade) -> bool:
     """Check if the current system is v3"""
-    return trade.get_custom_data(key="system_version") == self.system_v3_name
+    return self.trade_custom_data(trade).get(key="system_version") == self.system_v3_name
 
   def is_system_v3_1(self, trade: Trade) -> bool:
     """Check if the current system is v3_1"""
-    return trade.get_custom_data(key="system_version") == self.system_v3_1_name
+    return self.trade_custom_data(trade).get(key="system_version") == self.system_v3_1_name
 
   def is_system_v3_2(self, trade: Trade) -> bool:
     """Check if the current system is v3_2"""
-    return trade.get_custom_data(key="system_version") == self.system_v3_2_name
+    return self.trade_custom_data(trade).get(key="system_version") == self.system_v3_2_name
 
   def get_system_version_flags(self, trade: Trade) -> tuple[bool, bool, bool]:
     """Check the current system version flags with one custom-data lookup."""
-    system_version = trade.get_custom_data(key="system_version")
+    system_version = self.trade_custom_data(trade).get(key="system_version")
     return (
       system_version == self.system_v3_name,
       system_version == self.system_v3_1_name,
@@ -12750,13 +13172,17 @@ class NostalgiaForInfinityX7(IStrategy):
   def _set_profit_target(
     self, pair: str, sell_reason: str, rate: float, current_profit: float, current_time: datetime
   ):
-    self.target_profit_cache.data[pair] = {
-      "rate": rate,
-      "profit": current_profit,
-      "sell_reason": sell_reason,
-      "time_profit_reached": current_time.isoformat(),
-    }
-    self.target_profit_cache.save()
+    target_profit_cache = self.target_profit_cache
+    target_profit_cache.set(
+      pair,
+      {
+        "rate": rate,
+        "profit": current_profit,
+        "sell_reason": sell_reason,
+        "time_profit_reached": current_time.isoformat(),
+      },
+    )
+    target_profit_cache.flush()
 
   # Remove Profit Target
   # ---------------------------------------------------------------------------------------------
@@ -12764,8 +13190,8 @@ class NostalgiaForInfinityX7(IStrategy):
     target_profit_cache = self.target_profit_cache
 
     if target_profit_cache is not None:
-      target_profit_cache.data.pop(pair, None)
-      target_profit_cache.save()
+      target_profit_cache.remove(pair)
+      target_profit_cache.flush()
 
   # Get Hold Trades Config File
   # ---------------------------------------------------------------------------------------------
@@ -12796,17 +13222,54 @@ class NostalgiaForInfinityX7(IStrategy):
 
   # Load Hold Trades Config
   # ---------------------------------------------------------------------------------------------
-  def load_hold_trades_config(self):
-    hold_trades_cache = self.hold_trades_cache
-    if hold_trades_cache is None:
-      hold_trades_config_file = self.get_hold_trades_config_file()
-      if hold_trades_config_file:
-        log.warning("Loading hold support data from %s", hold_trades_config_file)
-        hold_trades_cache = HoldsCache(hold_trades_config_file)
-        self.hold_trades_cache = hold_trades_cache
-
-    if hold_trades_cache:
-      hold_trades_cache.load()
+  def load_hold_trades_config(self) -> "HoldTrades":
+    hold_trades_watcher = self.hold_trades_watcher
+    if hold_trades_watcher is None:
+      hold_trades_watcher = HoldTradesWatcher(self.get_hold_trades_config_file)
+      # The first load is done right away, so the holds apply from the first bot loop on
+      hold_trades_watcher.reload()
+      hold_trades_watcher.start()
+      self.hold_trades_watcher = hold_trades_watcher
+
+    hold_trades = hold_trades_watcher.hold_trades
+    if hold_trades.version != self.hold_trades_version:
+      self.hold_trades_version = hold_trades.version
+      self.log_hold_trades(hold_trades)
+    return hold_trades
+
+  def log_hold_trades(self, hold_trades: "HoldTrades") -> None:
+    if not hold_trades.trade_ids and not hold_trades.trade_pairs:
+      return
+
+    hold_trades_path = self.hold_trades_watcher.path
+    open_trades = {}
+    for trade in Trade.get_trades_proxy(is_open=True):
+      open_trades[trade.id] = open_trades[trade.pair] = trade
+
+    for trade_id, profit_ratio in hold_trades.trade_ids.items():
+      if trade_id in open_trades:
+        log.warning(
+          "The trade %s is configured to HOLD until the profit ratio of %s is met",
+          open_trades[trade_id],
+          f"{profit_ratio * 100}%",
+        )
+      else:
+        log.warning(
+          "The trade_id(%s) is no longer open. Please remove it from 'trade_ids' in %s", trade_id, hold_trades_path
+        )
+    for trade_pair, profit_ratio in hold_trades.trade_pairs.items():
+      if trade_pair in open_trades:
+        log.warning(
+          "The trade %s is configured to HOLD until the profit ratio of %s is met",
+          open_trades[trade_pair],
+          f"{profit_ratio * 100}%",
+        )
+      else:
+        log.warning(
+          "The trade pair %s is configured to HOLD until the profit ratio of %s is met",
+          trade_pair,
+          f"{profit_ratio * 100}%",
+        )
 
   # Should Hold Trade
   # ---------------------------------------------------------------------------------------------
@@ -12822,15 +13285,8 @@ class NostalgiaForInfinityX7(IStrategy):
       return False
 
     # Just to be sure our hold data is loaded, should be a no-op call after the first bot loop
-    self.load_hold_trades_config()
-
-    hold_trades_cache = self.hold_trades_cache
-    if not hold_trades_cache:
-      # Cache hasn't been setup, likely because the corresponding file does not exist, sell
-      return False
-
-    hold_trades_data = hold_trades_cache.data
-    if not hold_trades_data:
+    hold_trades = self.load_hold_trades_config()
+    if not hold_trades.trade_ids and not hold_trades.trade_pairs:
       # We have no pairs we want to hold until profit, sell
       return False
 
@@ -12841,15 +13297,12 @@ class NostalgiaForInfinityX7(IStrategy):
     def get_profit_values():
       nonlocal profit_values
       if profit_values is None:
-        filled_entries = trade.select_filled_orders(trade.entry_side)
-        filled_exits = trade.select_filled_orders(trade.exit_side)
-        profit_values = calc_total_profit(trade, filled_entries, filled_exits, rate)
+        profit_values = calc_total_profit(trade, None, None, rate)
 
       return profit_values
 
-    for hold_key_name, hold_key in (("trade_ids", trade_id), ("trade_pairs", trade_pair)):
-      hold_targets: dict = hold_trades_data.get(hold_key_name)
-      if not hold_targets or hold_key not in hold_targets:
+    for hold_targets, hold_key in ((hold_trades.trade_ids, trade_id), (hold_trades.trade_pairs, trade_pair)):
+      if hold_key not in hold_targets:
         continue
 
       trade_profit_ratio = hold_targets[hold_key]
@@ -12887,6 +13340,10 @@ class NostalgiaForInfinityX7(IStrategy):
     df.loc[:, "exit_long"] = 0
     df.loc[:, "exit_short"] = 0
 
+    # This is the analyzed dataframe custom_exit gets the candles of
+    if self.exit_features is not None:
+      self.exit_features[metadata["pair"]] = ExitFeatures(df, self.timeframe)
+
     return df
 
   #
@@ -12917,6 +13374,9 @@ class NostalgiaForInfinityX7(IStrategy):
     debug = False
     if debug:
       tik = time.perf_counter()
+    profiler = self.indicators_profiler
+    if profiler is not None:
+      mark = profiler.start()
     config = self.config
     long_entry_signal_params = self.long_entry_signal_params
     short_entry_signal_params = self.short_entry_signal_params
@@ -12925,11 +13385,14 @@ class NostalgiaForInfinityX7(IStrategy):
     long_entry_conditions = []
     short_entry_conditions = []
 
-    entry_tags = np.full(len(df), "", dtype=object)
     df.loc[:, "enter_long"] = 0
     df.loc[:, "enter_short"] = 0
-    np_view = lambda c: df[c].to_numpy(copy=False)
-    np_shift = self.np_shift
+    # On long dataframes the columns and the conditions built from them are lazy
+    expressions = EntryExpressions(df, self.np_shift, len(df) >= self.entry_conditions_lazy_min_rows)
+    np_view = expressions.column
+    np_shift = expressions.shift
+    # The masks not used on the previous candles are only computed when used, the lazy expressions skip them anyway
+    masks = ThresholdMasks(np_view, None if expressions.is_lazy else self.threshold_masks_used["entry"])
     rsi_3_1h = np_view("RSI_3_1h")
     rsi_3_15m = np_view("RSI_3_15m")
     rsi_3_4h = np_view("RSI_3_4h")
@@ -12992,14 +13455,12 @@ class NostalgiaForInfinityX7(IStrategy):
     bbl_20_2_0 = np_view("BBL_20_2.0")
     bbu_20_2_0 = np_view("BBU_20_2.0")
     _bb_rng = bbu_20_2_0 - bbl_20_2_0
-    bbp_20_2_0 = np.divide(close - bbl_20_2_0, _bb_rng, out=np.full_like(_bb_rng, np.nan), where=_bb_rng != 0)
+    bbp_20_2_0 = expressions.divide(close - bbl_20_2_0, _bb_rng)
     # 1h band position for confluence signals (67/70/71 family)
     bbl_20_2_0_1h = np_view("BBL_20_2.0_1h")
     bbu_20_2_0_1h = np_view("BBU_20_2.0_1h")
     _bb_rng_1h = bbu_20_2_0_1h - bbl_20_2_0_1h
-    bbp_20_2_0_1h = np.divide(
-      close - bbl_20_2_0_1h, _bb_rng_1h, out=np.full_like(_bb_rng_1h, np.nan), where=_bb_rng_1h != 0
-    )
+    bbp_20_2_0_1h = expressions.divide(close - bbl_20_2_0_1h, _bb_rng_1h)
     cci_20_change_pct_1h = np_view("CCI_20_change_pct_1h")
     cci_20_1h = np_view("CCI_20_1h")
     cci_20_4h = np_view("CCI_20_4h")
@@ -13153,434 +13614,428 @@ class NostalgiaForInfinityX7(IStrategy):
     bbl_40_2_0_shift_1 = np_shift(bbl_40_2_0, 1)
     close_delta = np_view("close_delta")
 
-    rsi_3_gt_3 = rsi_3 > 3.0
-    rsi_3_gt_5 = rsi_3 > 5.0
-    rsi_3_gt_10 = rsi_3 > 10.0
-    rsi_3_gt_15 = rsi_3 > 15.0
-    rsi_3_15m_gt_3 = rsi_3_15m > 3.0
-    rsi_3_15m_gt_5 = rsi_3_15m > 5.0
-    rsi_3_15m_gt_10 = rsi_3_15m > 10.0
-    rsi_3_15m_gt_15 = rsi_3_15m > 15.0
-    rsi_3_15m_gt_20 = rsi_3_15m > 20.0
-    rsi_3_15m_gt_25 = rsi_3_15m > 25.0
-    rsi_3_15m_gt_30 = rsi_3_15m > 30.0
-    rsi_3_15m_gt_35 = rsi_3_15m > 35.0
-    rsi_3_15m_gt_40 = rsi_3_15m > 40.0
-    rsi_3_15m_gt_45 = rsi_3_15m > 45.0
-    rsi_3_15m_gt_50 = rsi_3_15m > 50.0
-    rsi_3_15m_gt_55 = rsi_3_15m > 55.0
-    rsi_3_1h_gt_3 = rsi_3_1h > 3.0
-    rsi_3_1h_gt_5 = rsi_3_1h > 5.0
-    rsi_3_1h_gt_10 = rsi_3_1h > 10.0
-    rsi_3_1h_gt_15 = rsi_3_1h > 15.0
-    rsi_3_1h_gt_20 = rsi_3_1h > 20.0
-    rsi_3_1h_gt_25 = rsi_3_1h > 25.0
-    rsi_3_1h_gt_30 = rsi_3_1h > 30.0
-    rsi_3_1h_gt_35 = rsi_3_1h > 35.0
-    rsi_3_1h_gt_40 = rsi_3_1h > 40.0
-    rsi_3_1h_gt_45 = rsi_3_1h > 45.0
-    rsi_3_1h_gt_50 = rsi_3_1h > 50.0
-    rsi_3_1h_gt_55 = rsi_3_1h > 55.0
-    rsi_3_1h_gt_60 = rsi_3_1h > 60.0
-    rsi_3_1h_gt_65 = rsi_3_1h > 65.0
-    rsi_3_4h_gt_3 = rsi_3_4h > 3.0
-    rsi_3_4h_gt_5 = rsi_3_4h > 5.0
-    rsi_3_4h_gt_10 = rsi_3_4h > 10.0
-    rsi_3_4h_gt_15 = rsi_3_4h > 15.0
-    rsi_3_4h_gt_20 = rsi_3_4h > 20.0
-    rsi_3_4h_gt_25 = rsi_3_4h > 25.0
-    rsi_3_4h_gt_30 = rsi_3_4h > 30.0
-    rsi_3_4h_gt_35 = rsi_3_4h > 35.0
-    rsi_3_4h_gt_40 = rsi_3_4h > 40.0
-    rsi_3_4h_gt_45 = rsi_3_4h > 45.0
-    rsi_3_4h_gt_50 = rsi_3_4h > 50.0
-    rsi_3_4h_gt_55 = rsi_3_4h > 55.0
-    rsi_3_4h_gt_60 = rsi_3_4h > 60.0
-    rsi_3_4h_gt_65 = rsi_3_4h > 65.0
-    rsi_3_1d_gt_3 = rsi_3_1d > 3.0
-    rsi_3_1d_gt_5 = rsi_3_1d > 5.0
-    rsi_3_1d_gt_10 = rsi_3_1d > 10.0
-    rsi_3_1d_gt_15 = rsi_3_1d > 15.0
-    rsi_3_1d_gt_20 = rsi_3_1d > 20.0
-    rsi_3_1d_gt_25 = rsi_3_1d > 25.0
-    rsi_3_1d_gt_30 = rsi_3_1d > 30.0
-    rsi_3_1d_gt_35 = rsi_3_1d > 35.0
-    rsi_3_1d_gt_40 = rsi_3_1d > 40.0
-    rsi_3_1d_gt_45 = rsi_3_1d > 45.0
-    rsi_3_1d_gt_50 = rsi_3_1d > 50.0
-    rsi_3_1d_gt_55 = rsi_3_1d > 55.0
-    rsi_3_1d_gt_60 = rsi_3_1d > 60.0
-    rsi_3_1d_gt_65 = rsi_3_1d > 65.0
-    rsi_3_lt_40 = rsi_3 < 40.0
-    rsi_3_lt_46 = rsi_3 < 46.0
-    rsi_3_lt_50 = rsi_3 < 50.0
-    rsi_3_lt_90 = rsi_3 < 90.0
-    rsi_3_lt_95 = rsi_3 < 95.0
-    rsi_3_lt_97 = rsi_3 < 97.0
-    rsi_3_lt_98 = rsi_3 < 98.0
-    rsi_3_15m_lt_50 = rsi_3_15m < 50.0
-    rsi_3_15m_lt_55 = rsi_3_15m < 55.0
-    rsi_3_15m_lt_60 = rsi_3_15m < 60.0
-    rsi_3_15m_lt_70 = rsi_3_15m < 70.0
-    rsi_3_15m_lt_75 = rsi_3_15m < 75.0
-    rsi_3_15m_lt_80 = rsi_3_15m < 80.0
-    rsi_3_15m_lt_85 = rsi_3_15m < 85.0
-    rsi_3_15m_lt_90 = rsi_3_15m < 90.0
-    rsi_3_15m_lt_95 = rsi_3_15m < 95.0
-    rsi_3_15m_lt_97 = rsi_3_15m < 97.0
-    rsi_3_1h_lt_40 = rsi_3_1h < 40.0
-    rsi_3_1h_lt_50 = rsi_3_1h < 50.0
-    rsi_3_1h_lt_55 = rsi_3_1h < 55.0
-    rsi_3_1h_lt_60 = rsi_3_1h < 60.0
-    rsi_3_1h_lt_65 = rsi_3_1h < 65.0
-    rsi_3_1h_lt_70 = rsi_3_1h < 70.0
-    rsi_3_1h_lt_75 = rsi_3_1h < 75.0
-    rsi_3_1h_lt_80 = rsi_3_1h < 80.0
-    rsi_3_1h_lt_85 = rsi_3_1h < 85.0
-    rsi_3_1h_lt_90 = rsi_3_1h < 90.0
-    rsi_3_1h_lt_95 = rsi_3_1h < 95.0
-    rsi_3_4h_lt_40 = rsi_3_4h < 40.0
-    rsi_3_4h_lt_50 = rsi_3_4h < 50.0
-    rsi_3_4h_lt_60 = rsi_3_4h < 60.0
-    rsi_3_4h_lt_70 = rsi_3_4h < 70.0
-    rsi_3_4h_lt_75 = rsi_3_4h < 75.0
-    rsi_3_4h_lt_80 = rsi_3_4h < 80.0
-    rsi_3_4h_lt_85 = rsi_3_4h < 85.0
-    rsi_3_4h_lt_90 = rsi_3_4h < 90.0
-    rsi_3_4h_lt_95 = rsi_3_4h < 95.0
-    rsi_3_1d_lt_80 = rsi_3_1d < 80.0
-    rsi_3_1d_lt_90 = rsi_3_1d < 90.0
-    rsi_3_1d_lt_95 = rsi_3_1d < 95.0
-    rsi_14_15m_lt_30 = rsi_14_15m < 30.0
-    rsi_14_15m_lt_35 = rsi_14_15m < 35.0
-    rsi_14_15m_lt_40 = rsi_14_15m < 40.0
-    rsi_14_15m_lt_50 = rsi_14_15m < 50.0
-    rsi_14_1h_gt_20 = rsi_14_1h > 20.0
-    rsi_14_1h_lt_30 = rsi_14_1h < 30.0
-    rsi_14_1h_lt_40 = rsi_14_1h < 40.0
-    rsi_14_1h_lt_50 = rsi_14_1h < 50.0
-    rsi_14_1h_lt_80 = rsi_14_1h < 80.0
-    rsi_14_4h_gt_20 = rsi_14_4h > 20.0
-    rsi_14_4h_gt_30 = rsi_14_4h > 30.0
-    rsi_14_4h_gt_40 = rsi_14_4h > 40.0
-    rsi_14_4h_gt_50 = rsi_14_4h > 50.0
-    rsi_14_4h_gt_60 = rsi_14_4h > 60.0
-    rsi_14_4h_gt_80 = rsi_14_4h > 80.0
-    rsi_14_4h_lt_30 = rsi_14_4h < 30.0
-    rsi_14_4h_lt_40 = rsi_14_4h < 40.0
-    rsi_14_4h_lt_50 = rsi_14_4h < 50.0
-    rsi_14_4h_lt_70 = rsi_14_4h < 70.0
-    rsi_14_4h_lt_75 = rsi_14_4h < 75.0
-    rsi_14_4h_lt_80 = rsi_14_4h < 80.0
-    rsi_14_1d_gt_10 = rsi_14_1d > 10.0
-    rsi_14_1d_gt_40 = rsi_14_1d > 40.0
-    rsi_14_1d_gt_50 = rsi_14_1d > 50.0
-    rsi_14_1d_gt_60 = rsi_14_1d > 60.0
-    rsi_14_1d_lt_40 = rsi_14_1d < 40.0
-    rsi_14_1d_lt_50 = rsi_14_1d < 50.0
-    rsi_14_1d_lt_60 = rsi_14_1d < 60.0
-    rsi_14_1d_lt_70 = rsi_14_1d < 70.0
-    rsi_14_1d_lt_80 = rsi_14_1d < 80.0
-
-    aroond_14_lt_25 = aroond_14 < 25.0
-    aroond_14_gt_75 = aroond_14 > 75.0
-    aroond_14_15m_lt_25 = aroond_14_15m < 25.0
-    aroond_14_15m_lt_50 = aroond_14_15m < 50.0
-    aroond_14_15m_lt_70 = aroond_14_15m < 70.0
-    aroond_14_15m_lt_80 = aroond_14_15m < 80.0
-    aroond_14_1h_lt_25 = aroond_14_1h < 25.0
-    aroond_14_1h_lt_50 = aroond_14_1h < 50.0
-    aroond_14_1h_lt_70 = aroond_14_1h < 70.0
-    aroond_14_4h_lt_25 = aroond_14_4h < 25.0
-    aroond_14_4h_lt_40 = aroond_14_4h < 40.0
-    aroond_14_4h_lt_50 = aroond_14_4h < 50.0
-    aroond_14_4h_lt_70 = aroond_14_4h < 70.0
-    aroond_14_4h_lt_80 = aroond_14_4h < 80.0
-    aroond_14_4h_lt_85 = aroond_14_4h < 85.0
-    aroonu_14_gt_75 = aroonu_14 > 75.0
-    aroonu_14_15m_gt_0 = aroonu_14_15m > 0.0
-    aroonu_14_15m_gt_10 = aroonu_14_15m > 10.0
-    aroonu_14_15m_gt_20 = aroonu_14_15m > 20.0
-    aroonu_14_15m_gt_40 = aroonu_14_15m > 40.0
-    aroonu_14_15m_gt_50 = aroonu_14_15m > 50.0
-    aroonu_14_15m_gt_60 = aroonu_14_15m > 60.0
-    aroonu_14_1h_gt_0 = aroonu_14_1h > 0.0
-    aroonu_14_1h_gt_10 = aroonu_14_1h > 10.0
-    aroonu_14_1h_gt_20 = aroonu_14_1h > 20.0
-    aroonu_14_1h_gt_30 = aroonu_14_1h > 30.0
-    aroonu_14_1h_gt_40 = aroonu_14_1h > 40.0
-    aroonu_14_1h_gt_60 = aroonu_14_1h > 60.0
-    aroonu_14_4h_gt_0 = aroonu_14_4h > 0.0
-    aroonu_14_4h_gt_10 = aroonu_14_4h > 10.0
-    aroonu_14_4h_gt_20 = aroonu_14_4h > 20.0
-    aroonu_14_4h_gt_30 = aroonu_14_4h > 30.0
-    aroonu_14_4h_gt_50 = aroonu_14_4h > 50.0
-    aroonu_14_4h_gt_70 = aroonu_14_4h > 70.0
-    aroonu_14_4h_gt_80 = aroonu_14_4h > 80.0
-    aroonu_14_1d_gt_0 = aroonu_14_1d > 0.0
-    aroonu_14_1d_gt_10 = aroonu_14_1d > 10.0
-    aroonu_14_1d_gt_20 = aroonu_14_1d > 20.0
-    aroonu_14_1d_gt_30 = aroonu_14_1d > 30.0
-    aroonu_14_1d_gt_50 = aroonu_14_1d > 50.0
-    aroonu_14_lt_25 = aroonu_14 < 25.0
-    aroonu_14_lt_30 = aroonu_14 < 30.0
-    aroonu_14_15m_lt_20 = aroonu_14_15m < 20.0
-    aroonu_14_15m_lt_25 = aroonu_14_15m < 25.0
-    aroonu_14_15m_lt_30 = aroonu_14_15m < 30.0
-    aroonu_14_15m_lt_40 = aroonu_14_15m < 40.0
-    aroonu_14_15m_lt_50 = aroonu_14_15m < 50.0
-    aroonu_14_15m_lt_60 = aroonu_14_15m < 60.0
-    aroonu_14_15m_lt_70 = aroonu_14_15m < 70.0
-    aroonu_14_15m_lt_75 = aroonu_14_15m < 75.0
-    aroonu_14_15m_lt_80 = aroonu_14_15m < 80.0
-    aroonu_14_15m_lt_85 = aroonu_14_15m < 85.0
-    aroonu_14_15m_lt_90 = aroonu_14_15m < 90.0
-    aroonu_14_15m_lt_100 = aroonu_14_15m < 100.0
-    aroonu_14_1h_lt_20 = aroonu_14_1h < 20.0
-    aroonu_14_1h_lt_25 = aroonu_14_1h < 25.0
-    aroonu_14_1h_lt_30 = aroonu_14_1h < 30.0
-    aroonu_14_1h_lt_40 = aroonu_14_1h < 40.0
-    aroonu_14_1h_lt_50 = aroonu_14_1h < 50.0
-    aroonu_14_1h_lt_60 = aroonu_14_1h < 60.0
-    aroonu_14_1h_lt_70 = aroonu_14_1h < 70.0
-    aroonu_14_1h_lt_75 = aroonu_14_1h < 75.0
-    aroonu_14_1h_lt_80 = aroonu_14_1h < 80.0
-    aroonu_14_1h_lt_85 = aroonu_14_1h < 85.0
-    aroonu_14_1h_lt_90 = aroonu_14_1h < 90.0
-    aroonu_14_1h_lt_100 = aroonu_14_1h < 100.0
-    aroonu_14_4h_lt_20 = aroonu_14_4h < 20.0
-    aroonu_14_4h_lt_30 = aroonu_14_4h < 30.0
-    aroonu_14_4h_lt_40 = aroonu_14_4h < 40.0
-    aroonu_14_4h_lt_50 = aroonu_14_4h < 50.0
-    aroonu_14_4h_lt_60 = aroonu_14_4h < 60.0
-    aroonu_14_4h_lt_70 = aroonu_14_4h < 70.0
-    aroonu_14_4h_lt_75 = aroonu_14_4h < 75.0
-    aroonu_14_4h_lt_80 = aroonu_14_4h < 80.0
-    aroonu_14_4h_lt_85 = aroonu_14_4h < 85.0
-    aroonu_14_4h_lt_90 = aroonu_14_4h < 90.0
-    aroonu_14_4h_lt_100 = aroonu_14_4h < 100.0
-    aroonu_14_1d_lt_30 = aroonu_14_1d < 30.0
-    aroonu_14_1d_lt_40 = aroonu_14_1d < 40.0
-    aroonu_14_1d_lt_50 = aroonu_14_1d < 50.0
-    aroonu_14_1d_lt_60 = aroonu_14_1d < 60.0
-    aroonu_14_1d_lt_70 = aroonu_14_1d < 70.0
-    aroonu_14_1d_lt_75 = aroonu_14_1d < 75.0
-    aroonu_14_1d_lt_80 = aroonu_14_1d < 80.0
-    aroonu_14_1d_lt_85 = aroonu_14_1d < 85.0
-    aroonu_14_1d_lt_90 = aroonu_14_1d < 90.0
-    aroonu_14_1d_lt_100 = aroonu_14_1d < 100.0
-
-    cmf_20_15m_gt_neg_0_20 = cmf_20_15m > -0.20
-    cmf_20_15m_gt_neg_0_30 = cmf_20_15m > -0.30
-    cmf_20_15m_gt_neg_0_35 = cmf_20_15m > -0.35
-    cmf_20_15m_gt_neg_0_40 = cmf_20_15m > -0.40
-    cmf_20_15m_gt_neg_0_50 = cmf_20_15m > -0.50
-    cmf_20_15m_lt_0_10 = cmf_20_15m < 0.10
-    cmf_20_15m_lt_0_20 = cmf_20_15m < 0.20
-    cmf_20_15m_lt_0_30 = cmf_20_15m < 0.30
-    cmf_20_1h_gt_neg_0_10 = cmf_20_1h > -0.10
-    cmf_20_1h_gt_neg_0_20 = cmf_20_1h > -0.20
-    cmf_20_1h_gt_neg_0_25 = cmf_20_1h > -0.25
-    cmf_20_1h_gt_neg_0_30 = cmf_20_1h > -0.30
-    cmf_20_1h_gt_neg_0_40 = cmf_20_1h > -0.40
-    cmf_20_1h_lt_0_10 = cmf_20_1h < 0.10
-    cmf_20_1h_lt_0_20 = cmf_20_1h < 0.20
-    cmf_20_1h_lt_0_30 = cmf_20_1h < 0.30
-    cmf_20_4h_gt_neg_0_0 = cmf_20_4h > -0.0
-    cmf_20_4h_gt_neg_0_10 = cmf_20_4h > -0.10
-    cmf_20_4h_gt_neg_0_20 = cmf_20_4h > -0.20
-    cmf_20_4h_gt_neg_0_25 = cmf_20_4h > -0.25
-    cmf_20_4h_gt_neg_0_30 = cmf_20_4h > -0.30
-    cmf_20_4h_gt_neg_0_35 = cmf_20_4h > -0.35
-    cmf_20_4h_gt_neg_0_40 = cmf_20_4h > -0.40
-    cmf_20_4h_gt_neg_0_50 = cmf_20_4h > -0.50
-    cmf_20_4h_lt_0_15 = cmf_20_4h < 0.15
-    cmf_20_1d_gt_neg_0_0 = cmf_20_1d > -0.0
-    cmf_20_1d_gt_neg_0_10 = cmf_20_1d > -0.10
-    cmf_20_1d_gt_neg_0_20 = cmf_20_1d > -0.20
-    cmf_20_1d_gt_neg_0_25 = cmf_20_1d > -0.25
-    cmf_20_1d_gt_neg_0_30 = cmf_20_1d > -0.30
-    cmf_20_1d_gt_neg_0_40 = cmf_20_1d > -0.40
-    cmf_20_1d_gt_neg_0_50 = cmf_20_1d > -0.50
-    cmf_20_1d_lt_0_10 = cmf_20_1d < 0.10
-
-    stochrsi_k_lt_20 = stochrsi_k < 20.0
-    stochrsi_k_lt_30 = stochrsi_k < 30.0
-    stochrsi_k_gt_80 = stochrsi_k > 80.0
-    stochrsi_k_15m_gt_10 = stochrsi_k_15m > 10.0
-    stochrsi_k_15m_gt_20 = stochrsi_k_15m > 20.0
-    stochrsi_k_15m_gt_30 = stochrsi_k_15m > 30.0
-    stochrsi_k_15m_gt_40 = stochrsi_k_15m > 40.0
-    stochrsi_k_15m_gt_50 = stochrsi_k_15m > 50.0
-    stochrsi_k_15m_gt_60 = stochrsi_k_15m > 60.0
-    stochrsi_k_15m_gt_70 = stochrsi_k_15m > 70.0
-    stochrsi_k_15m_gt_80 = stochrsi_k_15m > 80.0
-    stochrsi_k_15m_gt_90 = stochrsi_k_15m > 90.0
-    stochrsi_k_4h_gt_10 = stochrsi_k_4h > 10.0
-    stochrsi_k_4h_gt_20 = stochrsi_k_4h > 20.0
-    stochrsi_k_4h_gt_30 = stochrsi_k_4h > 30.0
-    stochrsi_k_4h_gt_40 = stochrsi_k_4h > 40.0
-    stochrsi_k_4h_gt_50 = stochrsi_k_4h > 50.0
-    stochrsi_k_4h_gt_60 = stochrsi_k_4h > 60.0
-    stochrsi_k_4h_gt_70 = stochrsi_k_4h > 70.0
-    stochrsi_k_4h_gt_75 = stochrsi_k_4h > 75.0
-    stochrsi_k_4h_gt_80 = stochrsi_k_4h > 80.0
-    stochrsi_k_4h_gt_90 = stochrsi_k_4h > 90.0
-    stochrsi_k_15m_lt_20 = stochrsi_k_15m < 20.0
-    stochrsi_k_15m_lt_30 = stochrsi_k_15m < 30.0
-    stochrsi_k_15m_lt_40 = stochrsi_k_15m < 40.0
-    stochrsi_k_15m_lt_50 = stochrsi_k_15m < 50.0
-    stochrsi_k_15m_lt_60 = stochrsi_k_15m < 60.0
-    stochrsi_k_15m_lt_70 = stochrsi_k_15m < 70.0
-    stochrsi_k_15m_lt_80 = stochrsi_k_15m < 80.0
-    stochrsi_k_1h_gt_10 = stochrsi_k_1h > 10.0
-    stochrsi_k_1h_gt_20 = stochrsi_k_1h > 20.0
-    stochrsi_k_1h_gt_30 = stochrsi_k_1h > 30.0
-    stochrsi_k_1h_gt_40 = stochrsi_k_1h > 40.0
-    stochrsi_k_1h_gt_50 = stochrsi_k_1h > 50.0
-    stochrsi_k_1h_gt_60 = stochrsi_k_1h > 60.0
-    stochrsi_k_1h_gt_70 = stochrsi_k_1h > 70.0
-    stochrsi_k_1h_gt_75 = stochrsi_k_1h > 75.0
-    stochrsi_k_1h_gt_80 = stochrsi_k_1h > 80.0
-    stochrsi_k_1h_gt_90 = stochrsi_k_1h > 90.0
-    stochrsi_k_1h_lt_20 = stochrsi_k_1h < 20.0
-    stochrsi_k_1h_lt_30 = stochrsi_k_1h < 30.0
-    stochrsi_k_1h_lt_40 = stochrsi_k_1h < 40.0
-    stochrsi_k_1h_lt_50 = stochrsi_k_1h < 50.0
-    stochrsi_k_1h_lt_60 = stochrsi_k_1h < 60.0
-    stochrsi_k_1h_lt_70 = stochrsi_k_1h < 70.0
-    stochrsi_k_1h_lt_80 = stochrsi_k_1h < 80.0
-    stochrsi_k_1h_lt_90 = stochrsi_k_1h < 90.0
-    stochrsi_k_4h_lt_10 = stochrsi_k_4h < 10.0
-    stochrsi_k_4h_lt_20 = stochrsi_k_4h < 20.0
-    stochrsi_k_4h_lt_30 = stochrsi_k_4h < 30.0
-    stochrsi_k_4h_lt_40 = stochrsi_k_4h < 40.0
-    stochrsi_k_4h_lt_50 = stochrsi_k_4h < 50.0
-    stochrsi_k_4h_lt_60 = stochrsi_k_4h < 60.0
-    stochrsi_k_4h_lt_70 = stochrsi_k_4h < 70.0
-    stochrsi_k_4h_lt_80 = stochrsi_k_4h < 80.0
-    stochrsi_k_4h_lt_90 = stochrsi_k_4h < 90.0
-    stochrsi_k_1d_gt_10 = stochrsi_k_1d > 10.0
-    stochrsi_k_1d_gt_20 = stochrsi_k_1d > 20.0
-    stochrsi_k_1d_gt_30 = stochrsi_k_1d > 30.0
-    stochrsi_k_1d_gt_40 = stochrsi_k_1d > 40.0
-    stochrsi_k_1d_gt_50 = stochrsi_k_1d > 50.0
-    stochrsi_k_1d_gt_60 = stochrsi_k_1d > 60.0
-    stochrsi_k_1d_gt_70 = stochrsi_k_1d > 70.0
-    stochrsi_k_1d_lt_20 = stochrsi_k_1d < 20.0
-    stochrsi_k_1d_lt_30 = stochrsi_k_1d < 30.0
-    stochrsi_k_1d_lt_40 = stochrsi_k_1d < 40.0
-    stochrsi_k_1d_lt_50 = stochrsi_k_1d < 50.0
-    stochrsi_k_1d_lt_60 = stochrsi_k_1d < 60.0
-    stochrsi_k_1d_lt_70 = stochrsi_k_1d < 70.0
-    stochrsi_k_1d_lt_80 = stochrsi_k_1d < 80.0
-    stochrsi_k_1d_lt_90 = stochrsi_k_1d < 90.0
-
-    roc_9_1h_lt_10 = roc_9_1h < 10.0
-    roc_9_1h_gt_neg_50 = roc_9_1h > -50.0
-    roc_9_1h_gt_neg_40 = roc_9_1h > -40.0
-    roc_9_1h_gt_neg_30 = roc_9_1h > -30.0
-    roc_9_1h_gt_neg_25 = roc_9_1h > -25.0
-    roc_9_1h_gt_neg_20 = roc_9_1h > -20.0
-    roc_9_1h_gt_neg_15 = roc_9_1h > -15.0
-    roc_9_1h_gt_neg_10 = roc_9_1h > -10.0
-    roc_9_1h_lt_15 = roc_9_1h < 15.0
-    roc_9_1h_lt_20 = roc_9_1h < 20.0
-    roc_9_1h_lt_25 = roc_9_1h < 25.0
-    roc_9_1h_lt_30 = roc_9_1h < 30.0
-    roc_9_1h_lt_40 = roc_9_1h < 40.0
-    roc_9_1h_lt_50 = roc_9_1h < 50.0
-    roc_9_1h_lt_60 = roc_9_1h < 60.0
-    roc_9_1h_lt_80 = roc_9_1h < 80.0
-    roc_9_1h_lt_100 = roc_9_1h < 100.0
-    roc_9_4h_gt_neg_30 = roc_9_4h > -30.0
-    roc_9_4h_gt_neg_70 = roc_9_4h > -70.0
-    roc_9_4h_gt_neg_50 = roc_9_4h > -50.0
-    roc_9_4h_gt_neg_40 = roc_9_4h > -40.0
-    roc_9_4h_gt_neg_35 = roc_9_4h > -35.0
-    roc_9_4h_gt_neg_25 = roc_9_4h > -25.0
-    roc_9_4h_gt_neg_15 = roc_9_4h > -15.0
-    roc_9_4h_gt_neg_10 = roc_9_4h > -10.0
-    roc_9_4h_gt_neg_20 = roc_9_4h > -20.0
-    roc_9_4h_lt_5 = roc_9_4h < 5.0
-    roc_9_4h_lt_10 = roc_9_4h < 10.0
-    roc_9_4h_lt_15 = roc_9_4h < 15.0
-    roc_9_4h_lt_20 = roc_9_4h < 20.0
-    roc_9_4h_lt_25 = roc_9_4h < 25.0
-    roc_9_4h_lt_30 = roc_9_4h < 30.0
-    roc_9_4h_lt_40 = roc_9_4h < 40.0
-    roc_9_4h_lt_50 = roc_9_4h < 50.0
-    roc_9_4h_lt_60 = roc_9_4h < 60.0
-    roc_9_4h_lt_70 = roc_9_4h < 70.0
-    roc_9_4h_lt_80 = roc_9_4h < 80.0
-    roc_9_4h_lt_100 = roc_9_4h < 100.0
-    roc_9_1d_gt_neg_50 = roc_9_1d > -50.0
-    roc_9_1d_gt_neg_100 = roc_9_1d > -100.0
-    roc_9_1d_gt_neg_80 = roc_9_1d > -80.0
-    roc_9_1d_gt_neg_70 = roc_9_1d > -70.0
-    roc_9_1d_gt_neg_60 = roc_9_1d > -60.0
-    roc_9_1d_gt_neg_25 = roc_9_1d > -25.0
-    roc_9_1d_gt_neg_15 = roc_9_1d > -15.0
-    roc_9_1d_gt_neg_10 = roc_9_1d > -10.0
-    roc_9_1d_gt_neg_40 = roc_9_1d > -40.0
-    roc_9_1d_gt_neg_30 = roc_9_1d > -30.0
-    roc_9_1d_gt_neg_20 = roc_9_1d > -20.0
-    roc_9_1d_lt_10 = roc_9_1d < 10.0
-    roc_9_1d_lt_15 = roc_9_1d < 15.0
-    roc_9_1d_lt_20 = roc_9_1d < 20.0
-    roc_9_1d_lt_25 = roc_9_1d < 25.0
-    roc_9_1d_lt_30 = roc_9_1d < 30.0
-    roc_9_1d_lt_35 = roc_9_1d < 35.0
-    roc_9_1d_lt_40 = roc_9_1d < 40.0
-    roc_9_1d_lt_50 = roc_9_1d < 50.0
-    roc_9_1d_lt_60 = roc_9_1d < 60.0
-    roc_9_1d_lt_70 = roc_9_1d < 70.0
-    roc_9_1d_lt_80 = roc_9_1d < 80.0
-    roc_9_1d_lt_100 = roc_9_1d < 100.0
-    roc_9_1d_lt_150 = roc_9_1d < 150.0
-    roc_9_1d_lt_200 = roc_9_1d < 200.0
-    cci_20_change_pct_1h_gt_neg_0 = cci_20_change_pct_1h > -0.0
-    cci_20_change_pct_1h_lt_neg_0 = cci_20_change_pct_1h < -0.0
-    cci_20_change_pct_1h_lt_0 = cci_20_change_pct_1h < 0.0
-    cci_20_change_pct_4h_lt_neg_0 = cci_20_change_pct_4h < -0.0
-    cci_20_change_pct_4h_lt_0 = cci_20_change_pct_4h < 0.0
-    change_pct_1d_gt_neg_50 = change_pct_1d > -50.0
-    change_pct_1d_gt_neg_30 = change_pct_1d > -30.0
-    change_pct_1d_gt_neg_20 = change_pct_1d > -20.0
-    change_pct_1d_gt_neg_15 = change_pct_1d > -15.0
-    change_pct_1d_gt_neg_10 = change_pct_1d > -10.0
-    change_pct_1d_gt_neg_5 = change_pct_1d > -5.0
-    change_pct_1d_lt_10 = change_pct_1d < 10.0
-    change_pct_1d_lt_15 = change_pct_1d < 15.0
-    change_pct_1d_lt_25 = change_pct_1d < 25.0
-    change_pct_1d_lt_30 = change_pct_1d < 30.0
-    change_pct_1d_lt_40 = change_pct_1d < 40.0
-    change_pct_1d_lt_50 = change_pct_1d < 50.0
-    top_wick_pct_1d_lt_8 = top_wick_pct_1d < 8.0
-    top_wick_pct_1d_lt_10 = top_wick_pct_1d < 10.0
-    top_wick_pct_1d_lt_15 = top_wick_pct_1d < 15.0
-    top_wick_pct_1d_lt_20 = top_wick_pct_1d < 20.0
-    top_wick_pct_1d_lt_25 = top_wick_pct_1d < 25.0
-    top_wick_pct_1d_lt_30 = top_wick_pct_1d < 30.0
-    top_wick_pct_1d_lt_50 = top_wick_pct_1d < 50.0
+    rsi_3_gt_3 = masks.gt("RSI_3", 3.0)
+    rsi_3_gt_5 = masks.gt("RSI_3", 5.0)
+    rsi_3_gt_10 = masks.gt("RSI_3", 10.0)
+    rsi_3_gt_15 = masks.gt("RSI_3", 15.0)
+    rsi_3_15m_gt_3 = masks.gt("RSI_3_15m", 3.0)
+    rsi_3_15m_gt_5 = masks.gt("RSI_3_15m", 5.0)
+    rsi_3_15m_gt_10 = masks.gt("RSI_3_15m", 10.0)
+    rsi_3_15m_gt_15 = masks.gt("RSI_3_15m", 15.0)
+    rsi_3_15m_gt_20 = masks.gt("RSI_3_15m", 20.0)
+    rsi_3_15m_gt_25 = masks.gt("RSI_3_15m", 25.0)
+    rsi_3_15m_gt_30 = masks.gt("RSI_3_15m", 30.0)
+    rsi_3_15m_gt_35 = masks.gt("RSI_3_15m", 35.0)
+    rsi_3_15m_gt_40 = masks.gt("RSI_3_15m", 40.0)
+    rsi_3_15m_gt_45 = masks.gt("RSI_3_15m", 45.0)
+    rsi_3_15m_gt_50 = masks.gt("RSI_3_15m", 50.0)
+    rsi_3_15m_gt_55 = masks.gt("RSI_3_15m", 55.0)
+    rsi_3_1h_gt_3 = masks.gt("RSI_3_1h", 3.0)
+    rsi_3_1h_gt_5 = masks.gt("RSI_3_1h", 5.0)
+    rsi_3_1h_gt_10 = masks.gt("RSI_3_1h", 10.0)
+    rsi_3_1h_gt_15 = masks.gt("RSI_3_1h", 15.0)
+    rsi_3_1h_gt_20 = masks.gt("RSI_3_1h", 20.0)
+    rsi_3_1h_gt_25 = masks.gt("RSI_3_1h", 25.0)
+    rsi_3_1h_gt_30 = masks.gt("RSI_3_1h", 30.0)
+    rsi_3_1h_gt_35 = masks.gt("RSI_3_1h", 35.0)
+    rsi_3_1h_gt_40 = masks.gt("RSI_3_1h", 40.0)
+    rsi_3_1h_gt_45 = masks.gt("RSI_3_1h", 45.0)
+    rsi_3_1h_gt_50 = masks.gt("RSI_3_1h", 50.0)
+    rsi_3_1h_gt_55 = masks.gt("RSI_3_1h", 55.0)
+    rsi_3_1h_gt_60 = masks.gt("RSI_3_1h", 60.0)
+    rsi_3_1h_gt_65 = masks.gt("RSI_3_1h", 65.0)
+    rsi_3_4h_gt_3 = masks.gt("RSI_3_4h", 3.0)
+    rsi_3_4h_gt_5 = masks.gt("RSI_3_4h", 5.0)
+    rsi_3_4h_gt_10 = masks.gt("RSI_3_4h", 10.0)
+    rsi_3_4h_gt_15 = masks.gt("RSI_3_4h", 15.0)
+    rsi_3_4h_gt_20 = masks.gt("RSI_3_4h", 20.0)
+    rsi_3_4h_gt_25 = masks.gt("RSI_3_4h", 25.0)
+    rsi_3_4h_gt_30 = masks.gt("RSI_3_4h", 30.0)
+    rsi_3_4h_gt_35 = masks.gt("RSI_3_4h", 35.0)
+    rsi_3_4h_gt_40 = masks.gt("RSI_3_4h", 40.0)
+    rsi_3_4h_gt_45 = masks.gt("RSI_3_4h", 45.0)
+    rsi_3_4h_gt_50 = masks.gt("RSI_3_4h", 50.0)
+    rsi_3_4h_gt_55 = masks.gt("RSI_3_4h", 55.0)
+    rsi_3_4h_gt_60 = masks.gt("RSI_3_4h", 60.0)
+    rsi_3_4h_gt_65 = masks.gt("RSI_3_4h", 65.0)
+    rsi_3_1d_gt_3 = masks.gt("RSI_3_1d", 3.0)
+    rsi_3_1d_gt_5 = masks.gt("RSI_3_1d", 5.0)
+    rsi_3_1d_gt_10 = masks.gt("RSI_3_1d", 10.0)
+    rsi_3_1d_gt_15 = masks.gt("RSI_3_1d", 15.0)
+    rsi_3_1d_gt_20 = masks.gt("RSI_3_1d", 20.0)
+    rsi_3_1d_gt_25 = masks.gt("RSI_3_1d", 25.0)
+    rsi_3_1d_gt_30 = masks.gt("RSI_3_1d", 30.0)
+    rsi_3_1d_gt_35 = masks.gt("RSI_3_1d", 35.0)
+    rsi_3_1d_gt_40 = masks.gt("RSI_3_1d", 40.0)
+    rsi_3_1d_gt_45 = masks.gt("RSI_3_1d", 45.0)
+    rsi_3_1d_gt_50 = masks.gt("RSI_3_1d", 50.0)
+    rsi_3_1d_gt_55 = masks.gt("RSI_3_1d", 55.0)
+    rsi_3_1d_gt_60 = masks.gt("RSI_3_1d", 60.0)
+    rsi_3_1d_gt_65 = masks.gt("RSI_3_1d", 65.0)
+    rsi_3_lt_40 = masks.lt("RSI_3", 40.0)
+    rsi_3_lt_46 = masks.lt("RSI_3", 46.0)
+    rsi_3_lt_50 = masks.lt("RSI_3", 50.0)
+    rsi_3_lt_90 = masks.lt("RSI_3", 90.0)
+    rsi_3_lt_95 = masks.lt("RSI_3", 95.0)
+    rsi_3_lt_97 = masks.lt("RSI_3", 97.0)
+    rsi_3_lt_98 = masks.lt("RSI_3", 98.0)
+    rsi_3_15m_lt_50 = masks.lt("RSI_3_15m", 50.0)
+    rsi_3_15m_lt_55 = masks.lt("RSI_3_15m", 55.0)
+    rsi_3_15m_lt_60 = masks.lt("RSI_3_15m", 60.0)
+    rsi_3_15m_lt_70 = masks.lt("RSI_3_15m", 70.0)
+    rsi_3_15m_lt_75 = masks.lt("RSI_3_15m", 75.0)
+    rsi_3_15m_lt_80 = masks.lt("RSI_3_15m", 80.0)
+    rsi_3_15m_lt_85 = masks.lt("RSI_3_15m", 85.0)
+    rsi_3_15m_lt_90 = masks.lt("RSI_3_15m", 90.0)
+    rsi_3_15m_lt_95 = masks.lt("RSI_3_15m", 95.0)
+    rsi_3_15m_lt_97 = masks.lt("RSI_3_15m", 97.0)
+    rsi_3_1h_lt_40 = masks.lt("RSI_3_1h", 40.0)
+    rsi_3_1h_lt_50 = masks.lt("RSI_3_1h", 50.0)
+    rsi_3_1h_lt_55 = masks.lt("RSI_3_1h", 55.0)
+    rsi_3_1h_lt_60 = masks.lt("RSI_3_1h", 60.0)
+    rsi_3_1h_lt_65 = masks.lt("RSI_3_1h", 65.0)
+    rsi_3_1h_lt_70 = masks.lt("RSI_3_1h", 70.0)
+    rsi_3_1h_lt_75 = masks.lt("RSI_3_1h", 75.0)
+    rsi_3_1h_lt_80 = masks.lt("RSI_3_1h", 80.0)
+    rsi_3_1h_lt_85 = masks.lt("RSI_3_1h", 85.0)
+    rsi_3_1h_lt_90 = masks.lt("RSI_3_1h", 90.0)
+    rsi_3_1h_lt_95 = masks.lt("RSI_3_1h", 95.0)
+    rsi_3_4h_lt_40 = masks.lt("RSI_3_4h", 40.0)
+    rsi_3_4h_lt_50 = masks.lt("RSI_3_4h", 50.0)
+    rsi_3_4h_lt_60 = masks.lt("RSI_3_4h", 60.0)
+    rsi_3_4h_lt_70 = masks.lt("RSI_3_4h", 70.0)
+    rsi_3_4h_lt_75 = masks.lt("RSI_3_4h", 75.0)
+    rsi_3_4h_lt_80 = masks.lt("RSI_3_4h", 80.0)
+    rsi_3_4h_lt_85 = masks.lt("RSI_3_4h", 85.0)
+    rsi_3_4h_lt_90 = masks.lt("RSI_3_4h", 90.0)
+    rsi_3_4h_lt_95 = masks.lt("RSI_3_4h", 95.0)
+    rsi_3_1d_lt_80 = masks.lt("RSI_3_1d", 80.0)
+    rsi_3_1d_lt_90 = masks.lt("RSI_3_1d", 90.0)
+    rsi_3_1d_lt_95 = masks.lt("RSI_3_1d", 95.0)
+    rsi_14_15m_lt_30 = masks.lt("RSI_14_15m", 30.0)
+    rsi_14_15m_lt_35 = masks.lt("RSI_14_15m", 35.0)
+    rsi_14_15m_lt_40 = masks.lt("RSI_14_15m", 40.0)
+    rsi_14_15m_lt_50 = masks.lt("RSI_14_15m", 50.0)
+    rsi_14_1h_gt_20 = masks.gt("RSI_14_1h", 20.0)
+    rsi_14_1h_lt_30 = masks.lt("RSI_14_1h", 30.0)
+    rsi_14_1h_lt_40 = masks.lt("RSI_14_1h", 40.0)
+    rsi_14_1h_lt_50 = masks.lt("RSI_14_1h", 50.0)
+    rsi_14_1h_lt_80 = masks.lt("RSI_14_1h", 80.0)
+    rsi_14_4h_gt_20 = masks.gt("RSI_14_4h", 20.0)
+    rsi_14_4h_gt_30 = masks.gt("RSI_14_4h", 30.0)
+    rsi_14_4h_gt_40 = masks.gt("RSI_14_4h", 40.0)
+    rsi_14_4h_gt_50 = masks.gt("RSI_14_4h", 50.0)
+    rsi_14_4h_gt_60 = masks.gt("RSI_14_4h", 60.0)
+    rsi_14_4h_gt_80 = masks.gt("RSI_14_4h", 80.0)
+    rsi_14_4h_lt_30 = masks.lt("RSI_14_4h", 30.0)
+    rsi_14_4h_lt_40 = masks.lt("RSI_14_4h", 40.0)
+    rsi_14_4h_lt_50 = masks.lt("RSI_14_4h", 50.0)
+    rsi_14_4h_lt_70 = masks.lt("RSI_14_4h", 70.0)
+    rsi_14_4h_lt_75 = masks.lt("RSI_14_4h", 75.0)
+    rsi_14_4h_lt_80 = masks.lt("RSI_14_4h", 80.0)
+    rsi_14_1d_gt_10 = masks.gt("RSI_14_1d", 10.0)
+    rsi_14_1d_gt_40 = masks.gt("RSI_14_1d", 40.0)
+    rsi_14_1d_gt_50 = masks.gt("RSI_14_1d", 50.0)
+    rsi_14_1d_gt_60 = masks.gt("RSI_14_1d", 60.0)
+    rsi_14_1d_lt_40 = masks.lt("RSI_14_1d", 40.0)
+    rsi_14_1d_lt_50 = masks.lt("RSI_14_1d", 50.0)
+    rsi_14_1d_lt_60 = masks.lt("RSI_14_1d", 60.0)
+    rsi_14_1d_lt_70 = masks.lt("RSI_14_1d", 70.0)
+    rsi_14_1d_lt_80 = masks.lt("RSI_14_1d", 80.0)
+
+    aroond_14_lt_25 = masks.lt("AROOND_14", 25.0)
+    aroond_14_gt_75 = masks.gt("AROOND_14", 75.0)
+    aroond_14_15m_lt_25 = masks.lt("AROOND_14_15m", 25.0)
+    aroond_14_15m_lt_50 = masks.lt("AROOND_14_15m", 50.0)
+    aroond_14_15m_lt_70 = masks.lt("AROOND_14_15m", 70.0)
+    aroond_14_15m_lt_80 = masks.lt("AROOND_14_15m", 80.0)
+    aroond_14_1h_lt_25 = masks.lt("AROOND_14_1h", 25.0)
+    aroond_14_1h_lt_50 = masks.lt("AROOND_14_1h", 50.0)
+    aroond_14_1h_lt_70 = masks.lt("AROOND_14_1h", 70.0)
+    aroond_14_4h_lt_25 = masks.lt("AROOND_14_4h", 25.0)
+    aroond_14_4h_lt_40 = masks.lt("AROOND_14_4h", 40.0)
+    aroond_14_4h_lt_50 = masks.lt("AROOND_14_4h", 50.0)
+    aroond_14_4h_lt_70 = masks.lt("AROOND_14_4h", 70.0)
+    aroond_14_4h_lt_80 = masks.lt("AROOND_14_4h", 80.0)
+    aroond_14_4h_lt_85 = masks.lt("AROOND_14_4h", 85.0)
+    aroonu_14_gt_75 = masks.gt("AROONU_14", 75.0)
+    aroonu_14_15m_gt_0 = masks.gt("AROONU_14_15m", 0.0)
+    aroonu_14_15m_gt_10 = masks.gt("AROONU_14_15m", 10.0)
+    aroonu_14_15m_gt_20 = masks.gt("AROONU_14_15m", 20.0)
+    aroonu_14_15m_gt_40 = masks.gt("AROONU_14_15m", 40.0)
+    aroonu_14_15m_gt_50 = masks.gt("AROONU_14_15m", 50.0)
+    aroonu_14_15m_gt_60 = masks.gt("AROONU_14_15m", 60.0)
+    aroonu_14_1h_gt_0 = masks.gt("AROONU_14_1h", 0.0)
+    aroonu_14_1h_gt_10 = masks.gt("AROONU_14_1h", 10.0)
+    aroonu_14_1h_gt_20 = masks.gt("AROONU_14_1h", 20.0)
+    aroonu_14_1h_gt_30 = masks.gt("AROONU_14_1h", 30.0)
+    aroonu_14_1h_gt_40 = masks.gt("AROONU_14_1h", 40.0)
+    aroonu_14_1h_gt_60 = masks.gt("AROONU_14_1h", 60.0)
+    aroonu_14_4h_gt_0 = masks.gt("AROONU_14_4h", 0.0)
+    aroonu_14_4h_gt_10 = masks.gt("AROONU_14_4h", 10.0)
+    aroonu_14_4h_gt_20 = masks.gt("AROONU_14_4h", 20.0)
+    aroonu_14_4h_gt_30 = masks.gt("AROONU_14_4h", 30.0)
+    aroonu_14_4h_gt_50 = masks.gt("AROONU_14_4h", 50.0)
+    aroonu_14_4h_gt_70 = masks.gt("AROONU_14_4h", 70.0)
+    aroonu_14_4h_gt_80 = masks.gt("AROONU_14_4h", 80.0)
+    aroonu_14_1d_gt_0 = masks.gt("AROONU_14_1d", 0.0)
+    aroonu_14_1d_gt_10 = masks.gt("AROONU_14_1d", 10.0)
+    aroonu_14_1d_gt_20 = masks.gt("AROONU_14_1d", 20.0)
+    aroonu_14_1d_gt_30 = masks.gt("AROONU_14_1d", 30.0)
+    aroonu_14_1d_gt_50 = masks.gt("AROONU_14_1d", 50.0)
+    aroonu_14_lt_25 = masks.lt("AROONU_14", 25.0)
+    aroonu_14_lt_30 = masks.lt("AROONU_14", 30.0)
+    aroonu_14_15m_lt_20 = masks.lt("AROONU_14_15m", 20.0)
+    aroonu_14_15m_lt_25 = masks.lt("AROONU_14_15m", 25.0)
+    aroonu_14_15m_lt_30 = masks.lt("AROONU_14_15m", 30.0)
+    aroonu_14_15m_lt_40 = masks.lt("AROONU_14_15m", 40.0)
+    aroonu_14_15m_lt_50 = masks.lt("AROONU_14_15m", 50.0)
+    aroonu_14_15m_lt_60 = masks.lt("AROONU_14_15m", 60.0)
+    aroonu_14_15m_lt_70 = masks.lt("AROONU_14_15m", 70.0)
+    aroonu_14_15m_lt_75 = masks.lt("AROONU_14_15m", 75.0)
+    aroonu_14_15m_lt_80 = masks.lt("AROONU_14_15m", 80.0)
+    aroonu_14_15m_lt_85 = masks.lt("AROONU_14_15m", 85.0)
+    aroonu_14_15m_lt_90 = masks.lt("AROONU_14_15m", 90.0)
+    aroonu_14_15m_lt_100 = masks.lt("AROONU_14_15m", 100.0)
+    aroonu_14_1h_lt_20 = masks.lt("AROONU_14_1h", 20.0)
+    aroonu_14_1h_lt_25 = masks.lt("AROONU_14_1h", 25.0)
+    aroonu_14_1h_lt_30 = masks.lt("AROONU_14_1h", 30.0)
+    aroonu_14_1h_lt_40 = masks.lt("AROONU_14_1h", 40.0)
+    aroonu_14_1h_lt_50 = masks.lt("AROONU_14_1h", 50.0)
+    aroonu_14_1h_lt_60 = masks.lt("AROONU_14_1h", 60.0)
+    aroonu_14_1h_lt_70 = masks.lt("AROONU_14_1h", 70.0)
+    aroonu_14_1h_lt_75 = masks.lt("AROONU_14_1h", 75.0)
+    aroonu_14_1h_lt_80 = masks.lt("AROONU_14_1h", 80.0)
+    aroonu_14_1h_lt_85 = masks.lt("AROONU_14_1h", 85.0)
+    aroonu_14_1h_lt_90 = masks.lt("AROONU_14_1h", 90.0)
+    aroonu_14_1h_lt_100 = masks.lt("AROONU_14_1h", 100.0)
+    aroonu_14_4h_lt_20 = masks.lt("AROONU_14_4h", 20.0)
+    aroonu_14_4h_lt_30 = masks.lt("AROONU_14_4h", 30.0)
+    aroonu_14_4h_lt_40 = masks.lt("AROONU_14_4h", 40.0)
+    aroonu_14_4h_lt_50 = masks.lt("AROONU_14_4h", 50.0)
+    aroonu_14_4h_lt_60 = masks.lt("AROONU_14_4h", 60.0)
+    aroonu_14_4h_lt_70 = masks.lt("AROONU_14_4h", 70.0)
+    aroonu_14_4h_lt_75 = masks.lt("AROONU_14_4h", 75.0)
+    aroonu_14_4h_lt_80 = masks.lt("AROONU_14_4h", 80.0)
+    aroonu_14_4h_lt_85 = masks.lt("AROONU_14_4h", 85.0)
+    aroonu_14_4h_lt_90 = masks.lt("AROONU_14_4h", 90.0)
+    aroonu_14_4h_lt_100 = masks.lt("AROONU_14_4h", 100.0)
+    aroonu_14_1d_lt_30 = masks.lt("AROONU_14_1d", 30.0)
+    aroonu_14_1d_lt_40 = masks.lt("AROONU_14_1d", 40.0)
+    aroonu_14_1d_lt_50 = masks.lt("AROONU_14_1d", 50.0)
+    aroonu_14_1d_lt_60 = masks.lt("AROONU_14_1d", 60.0)
+    aroonu_14_1d_lt_70 = masks.lt("AROONU_14_1d", 70.0)
+    aroonu_14_1d_lt_75 = masks.lt("AROONU_14_1d", 75.0)
+    aroonu_14_1d_lt_80 = masks.lt("AROONU_14_1d", 80.0)
+    aroonu_14_1d_lt_85 = masks.lt("AROONU_14_1d", 85.0)
+    aroonu_14_1d_lt_90 = masks.lt("AROONU_14_1d", 90.0)
+    aroonu_14_1d_lt_100 = masks.lt("AROONU_14_1d", 100.0)
+
+    cmf_20_15m_gt_neg_0_20 = masks.gt("CMF_20_15m", -0.20)
+    cmf_20_15m_gt_neg_0_30 = masks.gt("CMF_20_15m", -0.30)
+    cmf_20_15m_gt_neg_0_35 = masks.gt("CMF_20_15m", -0.35)
+    cmf_20_15m_gt_neg_0_40 = masks.gt("CMF_20_15m", -0.40)
+    cmf_20_15m_gt_neg_0_50 = masks.gt("CMF_20_15m", -0.50)
+    cmf_20_15m_lt_0_10 = masks.lt("CMF_20_15m", 0.10)
+    cmf_20_15m_lt_0_20 = masks.lt("CMF_20_15m", 0.20)
+    cmf_20_15m_lt_0_30 = masks.lt("CMF_20_15m", 0.30)
+    cmf_20_1h_gt_neg_0_10 = masks.gt("CMF_20_1h", -0.10)
+    cmf_20_1h_gt_neg_0_20 = masks.gt("CMF_20_1h", -0.20)
+    cmf_20_1h_gt_neg_0_25 = masks.gt("CMF_20_1h", -0.25)
+    cmf_20_1h_gt_neg_0_30 = masks.gt("CMF_20_1h", -0.30)
+    cmf_20_1h_gt_neg_0_40 = masks.gt("CMF_20_1h", -0.40)
+    cmf_20_1h_lt_0_10 = masks.lt("CMF_20_1h", 0.10)
+    cmf_20_1h_lt_0_20 = masks.lt("CMF_20_1h", 0.20)
+    cmf_20_1h_lt_0_30 = masks.lt("CMF_20_1h", 0.30)
+    cmf_20_4h_gt_neg_0_0 = masks.gt("CMF_20_4h", -0.0)
+    cmf_20_4h_gt_neg_0_10 = masks.gt("CMF_20_4h", -0.10)
+    cmf_20_4h_gt_neg_0_20 = masks.gt("CMF_20_4h", -0.20)
+    cmf_20_4h_gt_neg_0_25 = masks.gt("CMF_20_4h", -0.25)
+    cmf_20_4h_gt_neg_0_30 = masks.gt("CMF_20_4h", -0.30)
+    cmf_20_4h_gt_neg_0_35 = masks.gt("CMF_20_4h", -0.35)
+    cmf_20_4h_gt_neg_0_40 = masks.gt("CMF_20_4h", -0.40)
+    cmf_20_4h_gt_neg_0_50 = masks.gt("CMF_20_4h", -0.50)
+    cmf_20_4h_lt_0_15 = masks.lt("CMF_20_4h", 0.15)
+    cmf_20_1d_gt_neg_0_0 = masks.gt("CMF_20_1d", -0.0)
+    cmf_20_1d_gt_neg_0_10 = masks.gt("CMF_20_1d", -0.10)
+    cmf_20_1d_gt_neg_0_20 = masks.gt("CMF_20_1d", -0.20)
+    cmf_20_1d_gt_neg_0_25 = masks.gt("CMF_20_1d", -0.25)
+    cmf_20_1d_gt_neg_0_30 = masks.gt("CMF_20_1d", -0.30)
+    cmf_20_1d_gt_neg_0_40 = masks.gt("CMF_20_1d", -0.40)
+    cmf_20_1d_gt_neg_0_50 = masks.gt("CMF_20_1d", -0.50)
+    cmf_20_1d_lt_0_10 = masks.lt("CMF_20_1d", 0.10)
+
+    stochrsi_k_lt_20 = masks.lt("STOCHRSIk_14_14_3_3", 20.0)
+    stochrsi_k_lt_30 = masks.lt("STOCHRSIk_14_14_3_3", 30.0)
+    stochrsi_k_gt_80 = masks.gt("STOCHRSIk_14_14_3_3", 80.0)
+    stochrsi_k_15m_gt_10 = masks.gt("STOCHRSIk_14_14_3_3_15m", 10.0)
+    stochrsi_k_15m_gt_20 = masks.gt("STOCHRSIk_14_14_3_3_15m", 20.0)
+    stochrsi_k_15m_gt_30 = masks.gt("STOCHRSIk_14_14_3_3_15m", 30.0)
+    stochrsi_k_15m_gt_40 = masks.gt("STOCHRSIk_14_14_3_3_15m", 40.0)
+    stochrsi_k_15m_gt_50 = masks.gt("STOCHRSIk_14_14_3_3_15m", 50.0)
+    stochrsi_k_15m_gt_60 = masks.gt("STOCHRSIk_14_14_3_3_15m", 60.0)
+    stochrsi_k_15m_gt_70 = masks.gt("STOCHRSIk_14_14_3_3_15m", 70.0)
+    stochrsi_k_15m_gt_80 = masks.gt("STOCHRSIk_14_14_3_3_15m", 80.0)
+    stochrsi_k_15m_gt_90 = masks.gt("STOCHRSIk_14_14_3_3_15m", 90.0)
+    stochrsi_k_4h_gt_10 = masks.gt("STOCHRSIk_14_14_3_3_4h", 10.0)
+    stochrsi_k_4h_gt_20 = masks.gt("STOCHRSIk_14_14_3_3_4h", 20.0)
+    stochrsi_k_4h_gt_30 = masks.gt("STOCHRSIk_14_14_3_3_4h", 30.0)
+    stochrsi_k_4h_gt_40 = masks.gt("STOCHRSIk_14_14_3_3_4h", 40.0)
+    stochrsi_k_4h_gt_50 = masks.gt("STOCHRSIk_14_14_3_3_4h", 50.0)
+    stochrsi_k_4h_gt_60 = masks.gt("STOCHRSIk_14_14_3_3_4h", 60.0)
+    stochrsi_k_4h_gt_70 = masks.gt("STOCHRSIk_14_14_3_3_4h", 70.0)
+    stochrsi_k_4h_gt_75 = masks.gt("STOCHRSIk_14_14_3_3_4h", 75.0)
+    stochrsi_k_4h_gt_80 = masks.gt("STOCHRSIk_14_14_3_3_4h", 80.0)
+    stochrsi_k_4h_gt_90 = masks.gt("STOCHRSIk_14_14_3_3_4h", 90.0)
+    stochrsi_k_15m_lt_20 = masks.lt("STOCHRSIk_14_14_3_3_15m", 20.0)
+    stochrsi_k_15m_lt_30 = masks.lt("STOCHRSIk_14_14_3_3_15m", 30.0)
+    stochrsi_k_15m_lt_40 = masks.lt("STOCHRSIk_14_14_3_3_15m", 40.0)
+    stochrsi_k_15m_lt_50 = masks.lt("STOCHRSIk_14_14_3_3_15m", 50.0)
+    stochrsi_k_15m_lt_60 = masks.lt("STOCHRSIk_14_14_3_3_15m", 60.0)
+    stochrsi_k_15m_lt_70 = masks.lt("STOCHRSIk_14_14_3_3_15m", 70.0)
+    stochrsi_k_15m_lt_80 = masks.lt("STOCHRSIk_14_14_3_3_15m", 80.0)
+    stochrsi_k_1h_gt_10 = masks.gt("STOCHRSIk_14_14_3_3_1h", 10.0)
+    stochrsi_k_1h_gt_20 = masks.gt("STOCHRSIk_14_14_3_3_1h", 20.0)
+    stochrsi_k_1h_gt_30 = masks.gt("STOCHRSIk_14_14_3_3_1h", 30.0)
+    stochrsi_k_1h_gt_40 = masks.gt("STOCHRSIk_14_14_3_3_1h", 40.0)
+    stochrsi_k_1h_gt_50 = masks.gt("STOCHRSIk_14_14_3_3_1h", 50.0)
+    stochrsi_k_1h_gt_60 = masks.gt("STOCHRSIk_14_14_3_3_1h", 60.0)
+    stochrsi_k_1h_gt_70 = masks.gt("STOCHRSIk_14_14_3_3_1h", 70.0)
+    stochrsi_k_1h_gt_75 = masks.gt("STOCHRSIk_14_14_3_3_1h", 75.0)
+    stochrsi_k_1h_gt_80 = masks.gt("STOCHRSIk_14_14_3_3_1h", 80.0)
+    stochrsi_k_1h_gt_90 = masks.gt("STOCHRSIk_14_14_3_3_1h", 90.0)
+    stochrsi_k_1h_lt_20 = masks.lt("STOCHRSIk_14_14_3_3_1h", 20.0)
+    stochrsi_k_1h_lt_30 = masks.lt("STOCHRSIk_14_14_3_3_1h", 30.0)
+    stochrsi_k_1h_lt_40 = masks.lt("STOCHRSIk_14_14_3_3_1h", 40.0)
+    stochrsi_k_1h_lt_50 = masks.lt("STOCHRSIk_14_14_3_3_1h", 50.0)
+    stochrsi_k_1h_lt_60 = masks.lt("STOCHRSIk_14_14_3_3_1h", 60.0)
+    stochrsi_k_1h_lt_70 = masks.lt("STOCHRSIk_14_14_3_3_1h", 70.0)
+    stochrsi_k_1h_lt_80 = masks.lt("STOCHRSIk_14_14_3_3_1h", 80.0)
+    stochrsi_k_1h_lt_90 = masks.lt("STOCHRSIk_14_14_3_3_1h", 90.0)
+    stochrsi_k_4h_lt_10 = masks.lt("STOCHRSIk_14_14_3_3_4h", 10.0)
+    stochrsi_k_4h_lt_20 = masks.lt("STOCHRSIk_14_14_3_3_4h", 20.0)
+    stochrsi_k_4h_lt_30 = masks.lt("STOCHRSIk_14_14_3_3_4h", 30.0)
+    stochrsi_k_4h_lt_40 = masks.lt("STOCHRSIk_14_14_3_3_4h", 40.0)
+    stochrsi_k_4h_lt_50 = masks.lt("STOCHRSIk_14_14_3_3_4h", 50.0)
+    stochrsi_k_4h_lt_60 = masks.lt("STOCHRSIk_14_14_3_3_4h", 60.0)
+    stochrsi_k_4h_lt_70 = masks.lt("STOCHRSIk_14_14_3_3_4h", 70.0)
+    stochrsi_k_4h_lt_80 = masks.lt("STOCHRSIk_14_14_3_3_4h", 80.0)
+    stochrsi_k_4h_lt_90 = masks.lt("STOCHRSIk_14_14_3_3_4h", 90.0)
+    stochrsi_k_1d_gt_10 = masks.gt("STOCHRSIk_14_14_3_3_1d", 10.0)
+    stochrsi_k_1d_gt_20 = masks.gt("STOCHRSIk_14_14_3_3_1d", 20.0)
+    stochrsi_k_1d_gt_30 = masks.gt("STOCHRSIk_14_14_3_3_1d", 30.0)
+    stochrsi_k_1d_gt_40 = masks.gt("STOCHRSIk_14_14_3_3_1d", 40.0)
+    stochrsi_k_1d_gt_50 = masks.gt("STOCHRSIk_14_14_3_3_1d", 50.0)
+    stochrsi_k_1d_gt_60 = masks.gt("STOCHRSIk_14_14_3_3_1d", 60.0)
+    stochrsi_k_1d_gt_70 = masks.gt("STOCHRSIk_14_14_3_3_1d", 70.0)
+    stochrsi_k_1d_lt_20 = masks.lt("STOCHRSIk_14_14_3_3_1d", 20.0)
+    stochrsi_k_1d_lt_30 = masks.lt("STOCHRSIk_14_14_3_3_1d", 30.0)
+    stochrsi_k_1d_lt_40 = masks.lt("STOCHRSIk_14_14_3_3_1d", 40.0)
+    stochrsi_k_1d_lt_50 = masks.lt("STOCHRSIk_14_14_3_3_1d", 50.0)
+    stochrsi_k_1d_lt_60 = masks.lt("STOCHRSIk_14_14_3_3_1d", 60.0)
+    stochrsi_k_1d_lt_70 = masks.lt("STOCHRSIk_14_14_3_3_1d", 70.0)
+    stochrsi_k_1d_lt_80 = masks.lt("STOCHRSIk_14_14_3_3_1d", 80.0)
+    stochrsi_k_1d_lt_90 = masks.lt("STOCHRSIk_14_14_3_3_1d", 90.0)
+
+    roc_9_1h_lt_10 = masks.lt("ROC_9_1h", 10.0)
+    roc_9_1h_gt_neg_50 = masks.gt("ROC_9_1h", -50.0)
+    roc_9_1h_gt_neg_40 = masks.gt("ROC_9_1h", -40.0)
+    roc_9_1h_gt_neg_30 = masks.gt("ROC_9_1h", -30.0)
+    roc_9_1h_gt_neg_25 = masks.gt("ROC_9_1h", -25.0)
+    roc_9_1h_gt_neg_20 = masks.gt("ROC_9_1h", -20.0)
+    roc_9_1h_gt_neg_15 = masks.gt("ROC_9_1h", -15.0)
+    roc_9_1h_gt_neg_10 = masks.gt("ROC_9_1h", -10.0)
+    roc_9_1h_lt_15 = masks.lt("ROC_9_1h", 15.0)
+    roc_9_1h_lt_20 = masks.lt("ROC_9_1h", 20.0)
+    roc_9_1h_lt_25 = masks.lt("ROC_9_1h", 25.0)
+    roc_9_1h_lt_30 = masks.lt("ROC_9_1h", 30.0)
+    roc_9_1h_lt_40 = masks.lt("ROC_9_1h", 40.0)
+    roc_9_1h_lt_50 = masks.lt("ROC_9_1h", 50.0)
+    roc_9_1h_lt_60 = masks.lt("ROC_9_1h", 60.0)
+    roc_9_1h_lt_80 = masks.lt("ROC_9_1h", 80.0)
+    roc_9_1h_lt_100 = masks.lt("ROC_9_1h", 100.0)
+    roc_9_4h_gt_neg_30 = masks.gt("ROC_9_4h", -30.0)
+    roc_9_4h_gt_neg_70 = masks.gt("ROC_9_4h", -70.0)
+    roc_9_4h_gt_neg_50 = masks.gt("ROC_9_4h", -50.0)
+    roc_9_4h_gt_neg_40 = masks.gt("ROC_9_4h", -40.0)
+    roc_9_4h_gt_neg_35 = masks.gt("ROC_9_4h", -35.0)
+    roc_9_4h_gt_neg_25 = masks.gt("ROC_9_4h", -25.0)
+    roc_9_4h_gt_neg_15 = masks.gt("ROC_9_4h", -15.0)
+    roc_9_4h_gt_neg_10 = masks.gt("ROC_9_4h", -10.0)
+    roc_9_4h_gt_neg_20 = masks.gt("ROC_9_4h", -20.0)
+    roc_9_4h_lt_5 = masks.lt("ROC_9_4h", 5.0)
+    roc_9_4h_lt_10 = masks.lt("ROC_9_4h", 10.0)
+    roc_9_4h_lt_15 = masks.lt("ROC_9_4h", 15.0)
+    roc_9_4h_lt_20 = masks.lt("ROC_9_4h", 20.0)
+    roc_9_4h_lt_25 = masks.lt("ROC_9_4h", 25.0)
+    roc_9_4h_lt_30 = masks.lt("ROC_9_4h", 30.0)
+    roc_9_4h_lt_40 = masks.lt("ROC_9_4h", 40.0)
+    roc_9_4h_lt_50 = masks.lt("ROC_9_4h", 50.0)
+    roc_9_4h_lt_60 = masks.lt("ROC_9_4h", 60.0)
+    roc_9_4h_lt_70 = masks.lt("ROC_9_4h", 70.0)
+    roc_9_4h_lt_80 = masks.lt("ROC_9_4h", 80.0)
+    roc_9_4h_lt_100 = masks.lt("ROC_9_4h", 100.0)
+    roc_9_1d_gt_neg_50 = masks.gt("ROC_9_1d", -50.0)
+    roc_9_1d_gt_neg_100 = masks.gt("ROC_9_1d", -100.0)
+    roc_9_1d_gt_neg_80 = masks.gt("ROC_9_1d", -80.0)
+    roc_9_1d_gt_neg_70 = masks.gt("ROC_9_1d", -70.0)
+    roc_9_1d_gt_neg_60 = masks.gt("ROC_9_1d", -60.0)
+    roc_9_1d_gt_neg_25 = masks.gt("ROC_9_1d", -25.0)
+    roc_9_1d_gt_neg_15 = masks.gt("ROC_9_1d", -15.0)
+    roc_9_1d_gt_neg_10 = masks.gt("ROC_9_1d", -10.0)
+    roc_9_1d_gt_neg_40 = masks.gt("ROC_9_1d", -40.0)
+    roc_9_1d_gt_neg_30 = masks.gt("ROC_9_1d", -30.0)
+    roc_9_1d_gt_neg_20 = masks.gt("ROC_9_1d", -20.0)
+    roc_9_1d_lt_10 = masks.lt("ROC_9_1d", 10.0)
+    roc_9_1d_lt_15 = masks.lt("ROC_9_1d", 15.0)
+    roc_9_1d_lt_20 = masks.lt("ROC_9_1d", 20.0)
+    roc_9_1d_lt_25 = masks.lt("ROC_9_1d", 25.0)
+    roc_9_1d_lt_30 = masks.lt("ROC_9_1d", 30.0)
+    roc_9_1d_lt_35 = masks.lt("ROC_9_1d", 35.0)
+    roc_9_1d_lt_40 = masks.lt("ROC_9_1d", 40.0)
+    roc_9_1d_lt_50 = masks.lt("ROC_9_1d", 50.0)
+    roc_9_1d_lt_60 = masks.lt("ROC_9_1d", 60.0)
+    roc_9_1d_lt_70 = masks.lt("ROC_9_1d", 70.0)
+    roc_9_1d_lt_80 = masks.lt("ROC_9_1d", 80.0)
+    roc_9_1d_lt_100 = masks.lt("ROC_9_1d", 100.0)
+    roc_9_1d_lt_150 = masks.lt("ROC_9_1d", 150.0)
+    roc_9_1d_lt_200 = masks.lt("ROC_9_1d", 200.0)
+    cci_20_change_pct_1h_gt_neg_0 = masks.gt("CCI_20_change_pct_1h", -0.0)
+    cci_20_change_pct_1h_lt_neg_0 = masks.lt("CCI_20_change_pct_1h", -0.0)
+    cci_20_change_pct_1h_lt_0 = masks.lt("CCI_20_change_pct_1h", 0.0)
+    cci_20_change_pct_4h_lt_neg_0 = masks.lt("CCI_20_change_pct_4h", -0.0)
+    cci_20_change_pct_4h_lt_0 = masks.lt("CCI_20_change_pct_4h", 0.0)
+    change_pct_1d_gt_neg_50 = masks.gt("change_pct_1d", -50.0)
+    change_pct_1d_gt_neg_30 = masks.gt("change_pct_1d", -30.0)
+    change_pct_1d_gt_neg_20 = masks.gt("change_pct_1d", -20.0)
+    change_pct_1d_gt_neg_15 = masks.gt("change_pct_1d", -15.0)
+    change_pct_1d_gt_neg_10 = masks.gt("change_pct_1d", -10.0)
+    change_pct_1d_gt_neg_5 = masks.gt("change_pct_1d", -5.0)
+    change_pct_1d_lt_10 = masks.lt("change_pct_1d", 10.0)
+    change_pct_1d_lt_15 = masks.lt("change_pct_1d", 15.0)
+    change_pct_1d_lt_25 = masks.lt("change_pct_1d", 25.0)
+    change_pct_1d_lt_30 = masks.lt("change_pct_1d", 30.0)
+    change_pct_1d_lt_40 = masks.lt("change_pct_1d", 40.0)
+    change_pct_1d_lt_50 = masks.lt("change_pct_1d", 50.0)
+    top_wick_pct_1d_lt_8 = masks.lt("top_wick_pct_1d", 8.0)
+    top_wick_pct_1d_lt_10 = masks.lt("top_wick_pct_1d", 10.0)
+    top_wick_pct_1d_lt_15 = masks.lt("top_wick_pct_1d", 15.0)
+    top_wick_pct_1d_lt_20 = masks.lt("top_wick_pct_1d", 20.0)
+    top_wick_pct_1d_lt_25 = masks.lt("top_wick_pct_1d", 25.0)
+    top_wick_pct_1d_lt_30 = masks.lt("top_wick_pct_1d", 30.0)
+    top_wick_pct_1d_lt_50 = masks.lt("top_wick_pct_1d", 50.0)
 
     is_backtest = self.dp.runmode.value in ["backtest", "hyperopt", "plot", "webserver"]
     # the number of free slots
     current_free_slots = config["max_open_trades"]
     if not is_backtest:
-      current_free_slots = config["max_open_trades"] - Trade.get_open_trade_count()
+      current_free_slots = config["max_open_trades"] - self.open_trades().count()
     # Grind mode
     pair_coin = metadata["pair"].partition("/")[0]
     num_open_long_grind_mode = 0
     is_pair_long_grind_mode = pair_coin in self.grind_mode_coins
     if not is_backtest:
-      open_trades = Trade.get_trades_proxy(is_open=True)
-      for open_trade in open_trades:
-        enter_tag = open_trade.enter_tag
-        if enter_tag is not None:
-          enter_tags = enter_tag.split()
-          if all(c in self.long_grind_mode_tags for c in enter_tags):
-            num_open_long_grind_mode += 1
+      num_open_long_grind_mode = self.open_trades().mode_count("grind")
     # Top Coins mode
     is_pair_long_top_coins_mode = pair_coin in top_coins_mode_coins
     is_pair_short_top_coins_mode = pair_coin in top_coins_mode_coins
@@ -26597,14 +27052,8 @@ class NostalgiaForInfinityX7(IStrategy):
             & (quad_s93_min_12 > np_shift(quad_s93_min_12, 12))
           )
 
-        long_entry_logic.append(df["volume"] > 0)
-        item_long_entry = _and_entry_conditions(long_entry_logic)
-        _append_entry_tag(entry_tags, item_long_entry, f"{long_entry_condition_index} ")
-        long_entry_conditions.append(item_long_entry)
-        df.loc[:, "enter_long"] = item_long_entry.astype(int)
-
-    if long_entry_conditions:
-      df.loc[:, "enter_long"] = _or_entry_conditions(long_entry_conditions).astype(int)
+        long_entry_logic.append(np_view("volume") > 0)
+        long_entry_conditions.append((expressions.all(long_entry_logic), f"{long_entry_condition_index} "))
 
     ###############################################################################################
 
@@ -30128,19 +30577,44 @@ class NostalgiaForInfinityX7(IStrategy):
           # the fact: long upper rejection wick, tiny lower wick
           short_entry_logic.append(pb_star > 0.5)
 
-        short_entry_logic.append(df["volume"] > 0)
-        item_short_entry = _and_entry_conditions(short_entry_logic)
-        _append_entry_tag(entry_tags, item_short_entry, f"{short_entry_condition_index} ")
-        short_entry_conditions.append(item_short_entry)
-        df.loc[:, "enter_short"] = item_short_entry.astype(int)
-
-    if short_entry_conditions:
-      df.loc[:, "enter_short"] = _or_entry_conditions(short_entry_conditions).astype(int)
+        short_entry_logic.append(np_view("volume") > 0)
+        short_entry_conditions.append((expressions.all(short_entry_logic), f"{short_entry_condition_index} "))
+
+    # Compute the enabled long and short conditions together, so they share their common masks
+    entry_conditions = long_entry_conditions + short_entry_conditions
+    entry_masks = expressions.evaluate([condition for condition, _ in entry_conditions])
+    long_entry_masks = entry_masks[: len(long_entry_conditions)]
+    short_entry_masks = entry_masks[len(long_entry_conditions) :]
+    entries = np.zeros(len(df), dtype=bool)
+
+    if long_entry_masks:
+      long_entries = _or_entry_conditions(long_entry_masks)
+      df.loc[:, "enter_long"] = long_entries.astype(int)
+      entries |= long_entries
+
+    if short_entry_masks:
+      short_entries = _or_entry_conditions(short_entry_masks)
+      df.loc[:, "enter_short"] = short_entries.astype(int)
+      entries |= short_entries
+
+    # The tags are rendered from the conditions bitset of the candles with an entry, in live only of the last candle,
+    # the one the entry is taken on
+    if self.dp.runmode.value in ("live", "dry_run"):
+      entry_rows = np.flatnonzero(entries[-1:]) + (len(df) - 1)
+    else:
+      entry_rows = np.flatnonzero(entries)
+    entry_tag_bits = _entry_tag_bits(entry_masks, entry_rows)
+    entry_tags = _render_entry_tags(
+      entry_tag_bits, [entry_tag for _, entry_tag in entry_conditions], entry_rows, len(df)
+    )
 
     df.loc[:, "enter_tag"] = pd.array(entry_tags, dtype="string")
+    if profiler is not None:
+      profiler.record(mark, metadata["pair"], self.timeframe, "entry_conditions")
     if debug:
       tok = time.perf_counter()
       log.debug("populate_entry_trend took a total of: %.4f seconds.", tok - tik)
+      log.debug("[%s] Entry: %s", metadata["pair"], masks.report())
     return df
 
   ###############################################################################################
@@ -32366,85 +32840,15 @@ class NostalgiaForInfinityX7(IStrategy):
     last_ema_200 = last_candle["EMA_200"]
 
     if last_close > last_ema_200:
-      if 0.01 > current_profit >= 0.001:
-        if last_rsi_14 < 10.0:
-          return True, f"exit_{mode_name}_o_0"
-      elif 0.02 > current_profit >= 0.01:
-        if last_rsi_14 < 28.0:
-          return True, f"exit_{mode_name}_o_1"
-      elif 0.03 > current_profit >= 0.02:
-        if last_rsi_14 < 30.0:
-          return True, f"exit_{mode_name}_o_2"
-      elif 0.04 > current_profit >= 0.03:
-        if last_rsi_14 < 32.0:
-          return True, f"exit_{mode_name}_o_3"
-      elif 0.05 > current_profit >= 0.04:
-        if last_rsi_14 < 34.0:
-          return True, f"exit_{mode_name}_o_4"
-      elif 0.06 > current_profit >= 0.05:
-        if last_rsi_14 < 36.0:
-          return True, f"exit_{mode_name}_o_5"
-      elif 0.07 > current_profit >= 0.06:
-        if last_rsi_14 < 38.0:
-          return True, f"exit_{mode_name}_o_6"
-      elif 0.08 > current_profit >= 0.07:
-        if last_rsi_14 < 40.0:
-          return True, f"exit_{mode_name}_o_7"
-      elif 0.09 > current_profit >= 0.08:
-        if last_rsi_14 < 42.0:
-          return True, f"exit_{mode_name}_o_8"
-      elif 0.1 > current_profit >= 0.09:
-        if last_rsi_14 < 44.0:
-          return True, f"exit_{mode_name}_o_9"
-      elif 0.12 > current_profit >= 0.1:
-        if last_rsi_14 < 46.0:
-          return True, f"exit_{mode_name}_o_10"
-      elif 0.2 > current_profit >= 0.12:
-        if last_rsi_14 < 44.0:
-          return True, f"exit_{mode_name}_o_11"
-      elif current_profit >= 0.2:
-        if last_rsi_14 < 42.0:
-          return True, f"exit_{mode_name}_o_12"
+      regime = "o"
     elif last_close < last_ema_200:
-      if 0.01 > current_profit >= 0.001:
-        if last_rsi_14 < 12.0:
-          return True, f"exit_{mode_name}_u_0"
-      elif 0.02 > current_profit >= 0.01:
-        if last_rsi_14 < 30.0:
-          return True, f"exit_{mode_name}_u_1"
-      elif 0.03 > current_profit >= 0.02:
-        if last_rsi_14 < 32.0:
-          return True, f"exit_{mode_name}_u_2"
-      elif 0.04 > current_profit >= 0.03:
-        if last_rsi_14 < 34.0:
-          return True, f"exit_{mode_name}_u_3"
-      elif 0.05 > current_profit >= 0.04:
-        if last_rsi_14 < 36.0:
-          return True, f"exit_{mode_name}_u_4"
-      elif 0.06 > current_profit >= 0.05:
-        if last_rsi_14 < 38.0:
-          return True, f"exit_{mode_name}_u_5"
-      elif 0.07 > current_profit >= 0.06:
-        if last_rsi_14 < 40.0:
-          return True, f"exit_{mode_name}_u_6"
-      elif 0.08 > current_profit >= 0.07:
-        if last_rsi_14 < 42.0:
-          return True, f"exit_{mode_name}_u_7"
-      elif 0.09 > current_profit >= 0.08:
-        if last_rsi_14 < 44.0:
-          return True, f"exit_{mode_name}_u_8"
-      elif 0.1 > current_profit >= 0.09:
-        if last_rsi_14 < 46.0:
-          return True, f"exit_{mode_name}_u_9"
-      elif 0.12 > current_profit >= 0.1:
-        if last_rsi_14 < 48.0:
-          return True, f"exit_{mode_name}_u_10"
-      elif 0.2 > current_profit >= 0.12:
-        if last_rsi_14 < 46.0:
-          return True, f"exit_{mode_name}_u_11"
-      elif current_profit >= 0.2:
-        if last_rsi_14 < 44.0:
-          return True, f"exit_{mode_name}_u_12"
+      regime = "u"
+    else:
+      return False, None
+
+    bucket = LONG_EXIT_MAIN_LADDER.candle_exit_bucket(last_candle, regime, current_profit, last_rsi_14)
+    if bucket is not None:
+      return True, f"exit_{mode_name}_{regime}_{bucket}"
 
     #  Here ends exit signal conditions for long_exit_main
 
@@ -45223,8 +45627,7 @@ class NostalgiaForInfinityX7(IStrategy):
     **kwargs,
   ):
     dp = self.dp
-    send_msg = self.dp.send_msg
-    notification_msg = self.notification_msg
+    notify = self.notify
     scale_stakes_for_min_stake = self.scale_stakes_for_min_stake
     long_grind_exit_v2 = self.long_grind_exit_v2
     stake_currency = self.config["stake_currency"]
@@ -45241,19 +45644,19 @@ class NostalgiaForInfinityX7(IStrategy):
 
     is_futures = self.is_futures_mode
     trade_leverage = trade.leverage
-    trade_get_custom_data = trade.get_custom_data
-    trade_set_custom_data = trade.set_custom_data
+    custom_data = self.trade_custom_data(trade)
+    trade_get_custom_data = custom_data.get
+    trade_set_custom_data = custom_data.set
     trade_is_short = trade.is_short
     derisk_enable = self.derisk_enable
     long_rebuy_mode_tags = self.long_rebuy_mode_tags
     long_grind_mode_tags = self.long_grind_mode_tags
 
     min_stake = self.correct_min_stake(min_stake, trade_leverage)
-    df, _ = dp.get_analyzed_dataframe(trade_pair, self.timeframe)
-    if len(df) < 2:
+    candles = self.analyzed_candles(trade_pair)
+    if len(candles) < 2:
       return None
-    last_candle = df.iloc[-1]
-    previous_candle = df.iloc[-2]
+    last_candle, previous_candle = candles
 
     exit_rate = current_rate
     filled_orders, filled_entries, filled_exits, profit_values = self.profit_or_order_snapshot(
@@ -45274,8 +45677,12 @@ class NostalgiaForInfinityX7(IStrategy):
             if ticker["bid"] is not None:
               exit_rate = ticker["bid"]
 
-    if profit_values is None:
+    # The snapshot is at current_rate, the live ticker can give another rate
+    if profit_values is None or exit_rate != current_rate:
       profit_values = self.calc_total_profit(trade, filled_entries, filled_exits, exit_rate)
+      self.cache_profit_snapshot(
+        trade, current_time, exit_rate, filled_orders, filled_entries, filled_exits, profit_values
+      )
     profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = profit_values
 
     first_filled_order = filled_orders[0]
@@ -45888,17 +46295,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="Level 1",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="Level 1",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk Level 1 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -45975,17 +46380,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="Level 2",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="Level 2",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk Level 2 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -46062,17 +46465,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="Level 3",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="Level 3",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk Level 3 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -46096,17 +46497,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="Global",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="Global",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk Global [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -46129,17 +46528,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_1_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_1_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_1_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -46160,20 +46557,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="grind_1_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_1_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="grind_1_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_1_total_amount,
           )
           log.info(
             f"Grinding exit (grind_1_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -46210,20 +46605,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_1_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_1_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_1_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_1_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_1_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_1_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_1_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_stake_profit} {stake_currency})"
@@ -46252,17 +46645,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_2_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_2_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_2_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -46283,20 +46674,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="grind_2_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_2_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="grind_2_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_2_total_amount,
           )
           log.info(
             f"Grinding exit (grind_2_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -46333,20 +46722,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_2_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_2_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_2_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_2_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_2_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_2_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_2_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_2_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_2_current_grind_stake_profit} {stake_currency})"
@@ -46375,17 +46762,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_3_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_3_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_3_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -46406,20 +46791,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="grind_3_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_3_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="grind_3_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_3_total_amount,
           )
           log.info(
             f"Grinding exit (grind_3_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -46456,20 +46839,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_3_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_3_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_3_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_3_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_3_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_3_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_3_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_3_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_3_current_grind_stake_profit} {stake_currency})"
@@ -46525,17 +46906,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_4_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_4_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_4_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -46556,20 +46935,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="grind_4_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_4_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="grind_4_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_4_total_amount,
           )
           log.info(
             f"Grinding exit (grind_4_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -46606,20 +46983,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_4_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_4_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_4_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_4_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_4_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_4_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_4_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_4_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_4_current_grind_stake_profit} {stake_currency})"
@@ -46663,17 +47038,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_5_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_5_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_5_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -46694,20 +47067,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="grind_5_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_5_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="grind_5_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_5_total_amount,
           )
           log.info(
             f"Grinding exit (grind_5_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -46744,20 +47115,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_5_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_5_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_5_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_5_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_5_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_5_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_5_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_5_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_5_current_grind_stake_profit} {stake_currency})"
@@ -46797,17 +47166,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "buyback-entry",
-          tag="buyback_1_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "buyback-entry",
+        tag="buyback_1_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Buyback entry (buyback_1_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -46837,20 +47204,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "buyback-exit",
-              tag="buyback_1_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=buyback_1_total_amount,
-            )
+          notify(
+            "buyback-exit",
+            tag="buyback_1_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=buyback_1_total_amount,
           )
           log.info(
             f"Buyback exit (buyback_1_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -46898,20 +47263,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if buyback_1_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "buyback-derisk",
-            tag="buyback_1_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=buyback_1_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-            coin_amount=buyback_1_total_amount,
-          )
+        notify(
+          "buyback-derisk",
+          tag="buyback_1_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=buyback_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+          coin_amount=buyback_1_total_amount,
         )
         log.info(
           f"Buyback de-risk (buyback_1_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({buyback_1_current_grind_stake_profit} {stake_currency})"
@@ -46951,17 +47314,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "buyback-entry",
-          tag="buyback_2_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "buyback-entry",
+        tag="buyback_2_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Buyback entry (buyback_2_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -46991,20 +47352,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "buyback-exit",
-              tag="buyback_2_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=buyback_2_total_amount,
-            )
+          notify(
+            "buyback-exit",
+            tag="buyback_2_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=buyback_2_total_amount,
           )
           log.info(
             f"Buyback exit (buyback_2_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -47052,20 +47411,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if buyback_2_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "buyback-derisk",
-            tag="buyback_2_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=buyback_2_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-            coin_amount=buyback_2_total_amount,
-          )
+        notify(
+          "buyback-derisk",
+          tag="buyback_2_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=buyback_2_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+          coin_amount=buyback_2_total_amount,
         )
         log.info(
           f"Buyback de-risk (buyback_2_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({buyback_2_current_grind_stake_profit} {stake_currency})"
@@ -47105,17 +47462,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "buyback-entry",
-          tag="buyback_3_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "buyback-entry",
+        tag="buyback_3_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Buyback entry (buyback_3_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -47145,20 +47500,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "buyback-exit",
-              tag="buyback_3_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=buyback_3_total_amount,
-            )
+          notify(
+            "buyback-exit",
+            tag="buyback_3_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=buyback_3_total_amount,
           )
           log.info(
             f"Buyback exit (buyback_3_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -47206,20 +47559,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if buyback_3_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "buyback-derisk",
-            tag="buyback_3_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=buyback_3_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-            coin_amount=buyback_3_total_amount,
-          )
+        notify(
+          "buyback-derisk",
+          tag="buyback_3_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=buyback_3_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+          coin_amount=buyback_3_total_amount,
         )
         log.info(
           f"Buyback de-risk (buyback_3_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({buyback_3_current_grind_stake_profit} {stake_currency})"
@@ -47374,6 +47725,17 @@ class NostalgiaForInfinityX7(IStrategy):
   def long_grind_entry_v2(
     self, last_candle: Series, previous_candle: Series, slice_profit: float, is_derisk: bool
   ) -> float:
+    if (last_candle["protections_long_global"] == True) and (
+      (last_candle["enter_long"] == True)
+      # on the candle part of the rules precomputed by long_grind_entry_v2_rules
+      or (LONG_GRIND_ENTRY_V2_RULES.first_rule(last_candle, slice_profit, is_derisk=is_derisk) is not None)
+    ):
+      return True
+
+    return False
+
+  def long_grind_entry_v2_rules(self, last_candle: "CandleColumns", previous_candle: "CandleColumns") -> list:
+    """The candle part of the `long_grind_entry_v2` rules, by candle, in the order of LONG_GRIND_ENTRY_V2_RULES."""
     previous_ema_26 = previous_candle["EMA_26"]
     previous_ema_12 = previous_candle["EMA_12"]
     last_bbl_20_2_0 = last_candle["BBL_20_2.0"]
@@ -47404,11 +47766,7 @@ class NostalgiaForInfinityX7(IStrategy):
     last_roc_2_4h = last_candle["ROC_2_4h"]
     last_roc_9_1h = last_candle["ROC_9_1h"]
     last_roc_9_4h = last_candle["ROC_9_4h"]
-    last_protections_long_global = last_candle["protections_long_global"]
-    last_enter_long = last_candle["enter_long"]
     last_stochrsi_k_15m = last_candle["STOCHRSIk_14_14_3_3_15m"]
-    last_stochrsi_k_1h = last_candle["STOCHRSIk_14_14_3_3_1h"]
-    last_stochrsi_k_4h = last_candle["STOCHRSIk_14_14_3_3_4h"]
     last_willr_14 = last_candle["WILLR_14"]
     last_ema_16 = last_candle["EMA_16"]
 
@@ -47435,251 +47793,246 @@ class NostalgiaForInfinityX7(IStrategy):
     last_rsi_3_15m_gt_5 = last_rsi_3_15m > 5.0
     last_roc_9_1d_gt_neg_30 = last_roc_9_1d > -30.0
 
-    if (last_protections_long_global == True) and (
-      (last_enter_long == True)
-      or (
+    return [
+      (
         (last_rsi_14 < 46.0)
-        and (last_rsi_3_gt_10)
-        and (last_rsi_3_15m_gt_15)
-        and (last_rsi_3_1h_gt_15)
-        and (last_rsi_3_4h_gt_15)
-        and (last_roc_2_1h_gt_neg_10)
-        and (last_roc_2_4h_gt_neg_10)
-        and (last_roc_2_1d_gt_neg_10)
-        and (last_roc_9_1h > -25.0)
-        and (last_roc_9_4h > -25.0)
-        and (last_roc_9_1d > -25.0)
-        # and (last_candle["ROC_9_1d"] < 40.0)
-        and (last_aroonu_14_lt_25)
-        # and (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_1h"] < 30.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_4h"] < 30.0)
-        and (last_close > (last_close_max_48 * 0.90))
-        and (last_close > (last_high_max_6_1h * 0.85))
-        and (last_close > (last_high_max_12_1h * 0.80))
-        and (last_close < (last_low_min_24_4h * 1.20))
-        and (last_close < (last_ema_16 * 0.968))
-      )
-      or (
+        & (last_rsi_3_gt_10)
+        & (last_rsi_3_15m_gt_15)
+        & (last_rsi_3_1h_gt_15)
+        & (last_rsi_3_4h_gt_15)
+        & (last_roc_2_1h_gt_neg_10)
+        & (last_roc_2_4h_gt_neg_10)
+        & (last_roc_2_1d_gt_neg_10)
+        & (last_roc_9_1h > -25.0)
+        & (last_roc_9_4h > -25.0)
+        & (last_roc_9_1d > -25.0)
+        # & (last_candle["ROC_9_1d"] < 40.0)
+        & (last_aroonu_14_lt_25)
+        # & (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        & (last_close > (last_close_max_48 * 0.90))
+        & (last_close > (last_high_max_6_1h * 0.85))
+        & (last_close > (last_high_max_12_1h * 0.80))
+        & (last_close < (last_low_min_24_4h * 1.20))
+        & (last_close < (last_ema_16 * 0.968))
+      ),
+      (
         (last_rsi_14_lt_36)
-        and (last_rsi_3_gt_5)
-        and (last_rsi_3_15m_gt_15)
-        and (last_rsi_3_1h_gt_15)
-        and (last_rsi_3_4h_gt_15)
-        # and (last_candle["RSI_3_1d"] > 15.0)
-        and (last_roc_2_1h_gt_neg_10)
-        and (last_roc_2_4h_gt_neg_10)
-        # and (last_candle["ROC_2_1d"] > -10.0)
-        and (last_roc_9_1h_gt_neg_10)
-        and (last_roc_9_4h_gt_neg_10)
-        and (last_roc_9_1d_gt_neg_30)
-        and (last_stochrsik_14_14_3_3 < 50.0)
-        and (last_ema_26 > last_ema_12)
-        and ((last_ema_26 - last_ema_12) > (last_open * 0.020))
-        and ((previous_ema_26 - previous_ema_12) > (last_open / 100.0))
-      )
-      or (
+        & (last_rsi_3_gt_5)
+        & (last_rsi_3_15m_gt_15)
+        & (last_rsi_3_1h_gt_15)
+        & (last_rsi_3_4h_gt_15)
+        # & (last_candle["RSI_3_1d"] > 15.0)
+        & (last_roc_2_1h_gt_neg_10)
+        & (last_roc_2_4h_gt_neg_10)
+        # & (last_candle["ROC_2_1d"] > -10.0)
+        & (last_roc_9_1h_gt_neg_10)
+        & (last_roc_9_4h_gt_neg_10)
+        & (last_roc_9_1d_gt_neg_30)
+        & (last_stochrsik_14_14_3_3 < 50.0)
+        & (last_ema_26 > last_ema_12)
+        & ((last_ema_26 - last_ema_12) > (last_open * 0.020))
+        & ((previous_ema_26 - previous_ema_12) > (last_open / 100.0))
+      ),
+      (
         (last_rsi_14_lt_36)
-        and (last_rsi_3_gt_10)
-        and (last_rsi_3_15m_gt_10)
-        and (last_rsi_3_1h_gt_10)
-        and (last_rsi_3_4h_gt_10)
-        and (last_rsi_3_1d_gt_10)
-        and (last_roc_2_1h_gt_neg_5)
-        and (last_roc_2_4h_gt_neg_5)
-        and (last_roc_2_1d > -5.0)
-        and (last_roc_9_1h_gt_neg_10)
-        and (last_roc_9_4h_gt_neg_10)
-        and (last_roc_9_1d > -10.0)
-        # and (last_roc_9_4h < 40.0)
-        # and (last_candle["ROC_9_1d"] < 50.0)
-        and (last_aroonu_14_15m < 25.0)
-        and (last_close > (last_close_max_48 * 0.90))
-        and (last_close > (last_high_max_6_1h * 0.85))
-        and (last_close > (last_high_max_12_1h * 0.80))
-        # and (last_close < (last_candle["low_min_24_4h"] * 1.20))
-        and (last_close < (last_ema_12 * 0.980))
-      )
-      or (
+        & (last_rsi_3_gt_10)
+        & (last_rsi_3_15m_gt_10)
+        & (last_rsi_3_1h_gt_10)
+        & (last_rsi_3_4h_gt_10)
+        & (last_rsi_3_1d_gt_10)
+        & (last_roc_2_1h_gt_neg_5)
+        & (last_roc_2_4h_gt_neg_5)
+        & (last_roc_2_1d > -5.0)
+        & (last_roc_9_1h_gt_neg_10)
+        & (last_roc_9_4h_gt_neg_10)
+        & (last_roc_9_1d > -10.0)
+        # & (last_roc_9_4h < 40.0)
+        # & (last_candle["ROC_9_1d"] < 50.0)
+        & (last_aroonu_14_15m < 25.0)
+        & (last_close > (last_close_max_48 * 0.90))
+        & (last_close > (last_high_max_6_1h * 0.85))
+        & (last_close > (last_high_max_12_1h * 0.80))
+        # & (last_close < (last_candle["low_min_24_4h"] * 1.20))
+        & (last_close < (last_ema_12 * 0.980))
+      ),
+      (
         (last_rsi_14_lt_36)
-        and (last_rsi_3_gt_10)
-        and (last_rsi_3_15m_gt_10)
-        and (last_rsi_3_1h_gt_10)
-        and (last_rsi_3_4h_gt_10)
-        and (last_rsi_3_1d_gt_10)
-        and (last_roc_2_1h_gt_neg_10)
-        and (last_roc_2_4h_gt_neg_10)
-        and (last_roc_2_1d_gt_neg_10)
-        # and (last_roc_9_1h > -10.0)
-        # and (last_roc_9_4h > -10.0)
-        # and (last_candle["ROC_9_1d"] > -10.0)
-        and (last_aroonu_14_lt_25)
-        and (last_close > (last_close_max_48 * 0.90))
-        and (last_close > (last_high_max_6_1h * 0.85))
-        and (last_close > (last_high_max_12_1h * 0.80))
-        and (last_close < (last_ema_26 * 0.962))
-        and (last_close < (last_bbl_20_2_0 * 0.999))
-      )
-      or (
+        & (last_rsi_3_gt_10)
+        & (last_rsi_3_15m_gt_10)
+        & (last_rsi_3_1h_gt_10)
+        & (last_rsi_3_4h_gt_10)
+        & (last_rsi_3_1d_gt_10)
+        & (last_roc_2_1h_gt_neg_10)
+        & (last_roc_2_4h_gt_neg_10)
+        & (last_roc_2_1d_gt_neg_10)
+        # & (last_roc_9_1h > -10.0)
+        # & (last_roc_9_4h > -10.0)
+        # & (last_candle["ROC_9_1d"] > -10.0)
+        & (last_aroonu_14_lt_25)
+        & (last_close > (last_close_max_48 * 0.90))
+        & (last_close > (last_high_max_6_1h * 0.85))
+        & (last_close > (last_high_max_12_1h * 0.80))
+        & (last_close < (last_ema_26 * 0.962))
+        & (last_close < (last_bbl_20_2_0 * 0.999))
+      ),
+      (
         (last_rsi_14 < 35.0)
-        and (last_rsi_3_gt_10)
-        and (last_rsi_3_15m_gt_10)
-        and (last_rsi_3_1h_gt_10)
-        and (last_rsi_3_4h_gt_10)
-        # and (last_candle["RSI_3_1d"] > 10.0)
-        and (last_roc_2_1h_gt_neg_10)
-        and (last_roc_2_4h_gt_neg_10)
-        and (last_roc_2_1d_gt_neg_10)
-        and (last_roc_9_1h_gt_neg_10)
-        and (last_roc_9_4h_gt_neg_10)
-        # and (last_candle["ROC_9_1d"] > -10.0)
-        and (last_aroonu_14_lt_25)
-        # and (last_candle["AROONU_14_15m"] < 25.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
-        # and (last_close > (last_candle["close_max_48"] * 0.90))
-        # and (last_close > (last_candle["high_max_6_1h"] * 0.85))
-        # and (last_close > (last_candle["high_max_12_1h"] * 0.80))
-        and (last_close < (last_low_min_12_4h * 1.25))
-        and (last_close < (last_candle["EMA_9"] * 0.968))
-        and (last_close < (last_candle["EMA_20"] * 0.980))
-      )
-      or (
+        & (last_rsi_3_gt_10)
+        & (last_rsi_3_15m_gt_10)
+        & (last_rsi_3_1h_gt_10)
+        & (last_rsi_3_4h_gt_10)
+        # & (last_candle["RSI_3_1d"] > 10.0)
+        & (last_roc_2_1h_gt_neg_10)
+        & (last_roc_2_4h_gt_neg_10)
+        & (last_roc_2_1d_gt_neg_10)
+        & (last_roc_9_1h_gt_neg_10)
+        & (last_roc_9_4h_gt_neg_10)
+        # & (last_candle["ROC_9_1d"] > -10.0)
+        & (last_aroonu_14_lt_25)
+        # & (last_candle["AROONU_14_15m"] < 25.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        # & (last_close > (last_candle["close_max_48"] * 0.90))
+        # & (last_close > (last_candle["high_max_6_1h"] * 0.85))
+        # & (last_close > (last_candle["high_max_12_1h"] * 0.80))
+        & (last_close < (last_low_min_12_4h * 1.25))
+        & (last_close < (last_candle["EMA_9"] * 0.968))
+        & (last_close < (last_candle["EMA_20"] * 0.980))
+      ),
+      (
         (last_rsi_14 > 35.0)
-        and (last_rsi_3_gt_10)
-        and (last_rsi_3 < 40.0)
-        # and (last_candle["RSI_4"] < 40.0)
-        and (last_rsi_3_15m_gt_15)
-        # and (last_rsi_3_1h > 20.0)
-        # and (last_rsi_3_4h > 20.0)
-        # and (last_candle["RSI_3_1d"] > 20.0)
-        and (last_roc_2_1h_gt_neg_5)
-        and (last_roc_2_4h_gt_neg_5)
-        # and (last_candle["ROC_2_1d"] > -5.0)
-        and (last_roc_9_1h_gt_neg_10)
-        and (last_roc_9_4h_gt_neg_10)
-        # and (last_candle["ROC_9_1d"] > -10.0)
-        and (last_aroonu_14_lt_25)
-        # and (last_candle["AROONU_14_15m"] < 25.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_1h"] < 50.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_4h"] < 50.0)
-        # and (last_close > (last_candle["close_max_48"] * 0.90))
-        # and (last_close > (last_candle["high_max_6_1h"] * 0.85))
-        # and (last_close > (last_candle["high_max_12_1h"] * 0.80))
-        and (last_candle["RSI_20"] < previous_candle["RSI_20"])
-        and (last_close < (last_candle["SMA_16"] * 0.955))
-        # and (last_close < (last_candle["EMA_20"] * 0.980))
-      )
-      or (
+        & (last_rsi_3_gt_10)
+        & (last_rsi_3 < 40.0)
+        # & (last_candle["RSI_4"] < 40.0)
+        & (last_rsi_3_15m_gt_15)
+        # & (last_rsi_3_1h > 20.0)
+        # & (last_rsi_3_4h > 20.0)
+        # & (last_candle["RSI_3_1d"] > 20.0)
+        & (last_roc_2_1h_gt_neg_5)
+        & (last_roc_2_4h_gt_neg_5)
+        # & (last_candle["ROC_2_1d"] > -5.0)
+        & (last_roc_9_1h_gt_neg_10)
+        & (last_roc_9_4h_gt_neg_10)
+        # & (last_candle["ROC_9_1d"] > -10.0)
+        & (last_aroonu_14_lt_25)
+        # & (last_candle["AROONU_14_15m"] < 25.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        # & (last_close > (last_candle["close_max_48"] * 0.90))
+        # & (last_close > (last_candle["high_max_6_1h"] * 0.85))
+        # & (last_close > (last_candle["high_max_12_1h"] * 0.80))
+        & (last_candle["RSI_20"] < previous_candle["RSI_20"])
+        & (last_close < (last_candle["SMA_16"] * 0.955))
+      ),
+      # and (last_close < (last_candle["EMA_20"] * 0.980))
+      (
         (last_rsi_3_gt_5)
-        and (last_rsi_3_15m_gt_10)
-        and (last_rsi_3_1h_gt_10)
-        and (last_rsi_3_4h_gt_10)
-        and (last_roc_2_1h_gt_neg_5)
-        and (last_roc_2_4h_gt_neg_5)
-        and (last_roc_9_1h > -5.0)
-        and (last_roc_9_4h > -5.0)
-        and (last_willr_14 < -50.0)
-        # and (last_candle["AROONU_14"] < 25.0)
-        and (last_stochrsik_14_14_3_3_lt_20)
-        and (last_candle["WILLR_84_1h"] < -70.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_1h"] < 40.0)
-        and (last_close < (last_low_min_24_4h * 1.30))
-        and (last_candle["BBB_20_2.0_1h"] > 12.0)
-        and (last_close_max_48 >= (last_close * 1.10))
-      )
-      or (
+        & (last_rsi_3_15m_gt_10)
+        & (last_rsi_3_1h_gt_10)
+        & (last_rsi_3_4h_gt_10)
+        & (last_roc_2_1h_gt_neg_5)
+        & (last_roc_2_4h_gt_neg_5)
+        & (last_roc_9_1h > -5.0)
+        & (last_roc_9_4h > -5.0)
+        & (last_willr_14 < -50.0)
+        # & (last_candle["AROONU_14"] < 25.0)
+        & (last_stochrsik_14_14_3_3_lt_20)
+        & (last_candle["WILLR_84_1h"] < -70.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        & (last_close < (last_low_min_24_4h * 1.30))
+        & (last_candle["BBB_20_2.0_1h"] > 12.0)
+        & (last_close_max_48 >= (last_close * 1.10))
+      ),
+      (
         (last_rsi_3 < 30.0)
-        and (last_rsi_3_gt_5)
-        and (last_rsi_3_15m_gt_5)
-        and (last_rsi_3_1h_gt_10)
-        and (last_rsi_3_4h_gt_10)
-        # and (last_roc_2_1h > -5.0)
-        # and (last_roc_2_4h > -5.0)
-        # and (last_roc_9_1h > -5.0)
-        # and (last_roc_9_4h > -5.0)
-        and (last_roc_9_1d_gt_neg_30)
-        # and (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
-        # and (last_close < (last_candle["low_min_24_4h"] * 1.50))
-        and (last_ema_26 > last_ema_12)
-        and ((last_ema_26 - last_ema_12) > (last_open * 0.034))
-        and ((previous_ema_26 - previous_ema_12) > (last_open / 100.0))
-      )
-      or (
+        & (last_rsi_3_gt_5)
+        & (last_rsi_3_15m_gt_5)
+        & (last_rsi_3_1h_gt_10)
+        & (last_rsi_3_4h_gt_10)
+        # & (last_roc_2_1h > -5.0)
+        # & (last_roc_2_4h > -5.0)
+        # & (last_roc_9_1h > -5.0)
+        # & (last_roc_9_4h > -5.0)
+        & (last_roc_9_1d_gt_neg_30)
+        # & (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
+        # & (last_close < (last_candle["low_min_24_4h"] * 1.50))
+        & (last_ema_26 > last_ema_12)
+        & ((last_ema_26 - last_ema_12) > (last_open * 0.034))
+        & ((previous_ema_26 - previous_ema_12) > (last_open / 100.0))
+      ),
+      (
         (last_rsi_3_gt_5)
-        and (last_rsi_3_15m > 25.0)
-        and (last_rsi_3_1h > 30.0)
-        and (last_close < (last_candle["high_max_24_4h"] * 0.90))
-        and (last_close < (last_close_max_48 * 0.90))
-        and (last_close > (last_candle["close_min_12"] * 1.08))
-      )
-      or (
+        & (last_rsi_3_15m > 25.0)
+        & (last_rsi_3_1h > 30.0)
+        & (last_close < (last_candle["high_max_24_4h"] * 0.90))
+        & (last_close < (last_close_max_48 * 0.90))
+        & (last_close > (last_candle["close_min_12"] * 1.08))
+      ),
+      (
         (last_rsi_3_gt_5)
-        and (last_rsi_3_15m_gt_5)
-        and (last_stochrsik_14_14_3_3_lt_20)
-        and (last_rsi_14 < (last_rsi_14_1h - 45.0))
-      )
-      or (
+        & (last_rsi_3_15m_gt_5)
+        & (last_stochrsik_14_14_3_3_lt_20)
+        & (last_rsi_14 < (last_rsi_14_1h - 45.0))
+      ),
+      (
         (last_rsi_3_gt_10)
-        and (last_rsi_3_15m_gt_10)
-        and (last_rsi_3_1h_gt_10)
-        and (last_rsi_3_4h_gt_10)
-        and (last_rsi_3_1d_gt_10)
-        and (last_stochrsik_14_14_3_3_lt_20)
-        and (last_close < (last_candle["SMA_30"] * 0.978))
-        and (last_close < (last_bbl_20_2_0 * 0.999))
-      )
-      or (
+        & (last_rsi_3_15m_gt_10)
+        & (last_rsi_3_1h_gt_10)
+        & (last_rsi_3_4h_gt_10)
+        & (last_rsi_3_1d_gt_10)
+        & (last_stochrsik_14_14_3_3_lt_20)
+        & (last_close < (last_candle["SMA_30"] * 0.978))
+        & (last_close < (last_bbl_20_2_0 * 0.999))
+      ),
+      (
         (last_rsi_14_lt_36)
-        and (last_rsi_3_gt_5)
-        and (last_rsi_3_15m_gt_10)
-        and (last_rsi_3_1h_gt_10)
-        and (last_rsi_3_4h_gt_10)
-        and (last_rsi_3_1d_gt_10)
-        and (last_stochrsik_14_14_3_3 < 30.0)
-        and (last_close > (last_close_max_48 * 0.85))
-        and (last_close > (last_high_max_6_1h * 0.80))
-        and (last_close > (last_high_max_12_1h * 0.75))
-        and (last_close < (last_low_min_12_4h * 1.25))
-        and (last_ema_26 > last_ema_12)
-        and ((last_ema_26 - last_ema_12) > (last_open * 0.018))
-        and ((previous_ema_26 - previous_ema_12) > (last_open / 100.0))
-      )
-      or (
+        & (last_rsi_3_gt_5)
+        & (last_rsi_3_15m_gt_10)
+        & (last_rsi_3_1h_gt_10)
+        & (last_rsi_3_4h_gt_10)
+        & (last_rsi_3_1d_gt_10)
+        & (last_stochrsik_14_14_3_3 < 30.0)
+        & (last_close > (last_close_max_48 * 0.85))
+        & (last_close > (last_high_max_6_1h * 0.80))
+        & (last_close > (last_high_max_12_1h * 0.75))
+        & (last_close < (last_low_min_12_4h * 1.25))
+        & (last_ema_26 > last_ema_12)
+        & ((last_ema_26 - last_ema_12) > (last_open * 0.018))
+        & ((previous_ema_26 - previous_ema_12) > (last_open / 100.0))
+      ),
+      (
         (last_rsi_3_gt_5)
-        and (previous_candle["SMA_9"] < previous_candle["SMA_21"])
-        and (last_candle["SMA_9"] > last_candle["SMA_21"])
-        and (last_close < (last_candle["EMA_100"] * 0.984))
-        and (last_rsi_3_1h > 20.0)
-        and (last_rsi_3_4h > 20.0)
-      )
-      or (
-        (slice_profit < -0.12)
-        and (last_rsi_3_gt_5)
-        and (last_rsi_3_15m_gt_10)
-        and (last_rsi_14 < 40.0)
-        and (last_aroonu_14_lt_25)
-        and (last_aroonu_14_15m < 30.0)
-        and (last_stochrsik_14_14_3_3_lt_20)
-        and (last_stochrsi_k_15m < 30.0)
-        and (last_rsi_14_1h < 50.0)
-        and (last_candle["RSI_14_4h"] < 50.0)
-      )
-      or (
+        & (previous_candle["SMA_9"] < previous_candle["SMA_21"])
+        & (last_candle["SMA_9"] > last_candle["SMA_21"])
+        & (last_close < (last_candle["EMA_100"] * 0.984))
+        & (last_rsi_3_1h > 20.0)
+        & (last_rsi_3_4h > 20.0)
+      ),
+      (
+        (last_rsi_3_gt_5)
+        & (last_rsi_3_15m_gt_10)
+        & (last_rsi_14 < 40.0)
+        & (last_aroonu_14_lt_25)
+        & (last_aroonu_14_15m < 30.0)
+        & (last_stochrsik_14_14_3_3_lt_20)
+        & (last_stochrsi_k_15m < 30.0)
+        & (last_rsi_14_1h < 50.0)
+        & (last_candle["RSI_14_4h"] < 50.0)
+      ),
+      (
         (last_rsi_14_lt_36)
-        and (last_rsi_3_gt_5)
-        and (last_rsi_3_1h_gt_10)
-        and (last_rsi_3_4h_gt_10)
-        and (last_close < (last_ema_12 * 0.999))
-        and (last_close < (last_bbl_20_2_0 * 0.996))
-      )
-    ):
-      return True
-
-    return False
+        & (last_rsi_3_gt_5)
+        & (last_rsi_3_1h_gt_10)
+        & (last_rsi_3_4h_gt_10)
+        & (last_close < (last_ema_12 * 0.999))
+        & (last_close < (last_bbl_20_2_0 * 0.996))
+      ),
+    ]
 
   def long_buyback_exit_v2(
     self, last_candle: Series, previous_candle: Series, slice_profit: float, is_derisk: bool
@@ -47750,8 +48103,7 @@ class NostalgiaForInfinityX7(IStrategy):
     **kwargs,
   ):
     dp = self.dp
-    send_msg = self.dp.send_msg
-    notification_msg = self.notification_msg
+    notify = self.notify
     config = self.config
     stake_currency = config["stake_currency"]
     is_futures_mode = self.is_futures_mode
@@ -47769,11 +48121,10 @@ class NostalgiaForInfinityX7(IStrategy):
       return None
 
     min_stake = self.correct_min_stake(min_stake, trade_leverage)
-    df, _ = dp.get_analyzed_dataframe(trade_pair, self.timeframe)
-    if len(df) < 2:
+    candles = self.analyzed_candles(trade_pair)
+    if len(candles) < 2:
       return None
-    last_candle = df.iloc[-1]
-    previous_candle = df.iloc[-2]
+    last_candle, previous_candle = candles
 
     exit_rate = current_rate
     filled_orders, filled_entries, filled_exits, profit_values = self.profit_or_order_snapshot(
@@ -47794,8 +48145,12 @@ class NostalgiaForInfinityX7(IStrategy):
             if ticker["bid"] is not None:
               exit_rate = ticker["bid"]
 
-    if profit_values is None:
+    # The snapshot is at current_rate, the live ticker can give another rate
+    if profit_values is None or exit_rate != current_rate:
       profit_values = self.calc_total_profit(trade, filled_entries, filled_exits, exit_rate)
+      self.cache_profit_snapshot(
+        trade, current_time, exit_rate, filled_orders, filled_entries, filled_exits, profit_values
+      )
     profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = profit_values
 
     current_stake_amount = trade_amount * exit_rate
@@ -47916,254 +48271,103 @@ class NostalgiaForInfinityX7(IStrategy):
 
     rebuy_max_sub_grinds = len(rebuy_stakes)
 
-    is_derisk_1 = False
-    is_derisk_1_found = False  # derisk_level_1 de-risk exit
-    derisk_1_order = None
-    is_derisk_2 = False
-    is_derisk_2_found = False  # derisk_level_2 de-risk exit
-    derisk_2_order = None
-    is_derisk_3 = False
-    is_derisk_3_found = False  # derisk_level_3 de-risk exit
-    derisk_3_order = None
-    is_derisk_4 = False
-    is_derisk_4_found = False  # derisk_level_4 de-risk exit
-    derisk_4_order = None
-    grind_1_sub_grind_count = 0
-    grind_1_total_amount = 0.0
-    grind_1_total_cost = 0.0
+    # The entries since the last exit of each grind ladder, kept up to date by order_filled
+    grind_ladders = self.trade_grind_ladders(trade, filled_orders)
+    custom_data = self.trade_custom_data(trade)
+    derisk_1_order, derisk_2_order, derisk_3_order, derisk_4_order = grind_ladders.derisk_orders
+    is_derisk_1 = is_derisk_1_found = derisk_1_order is not None  # derisk_level_1 de-risk exit
+    is_derisk_2 = is_derisk_2_found = derisk_2_order is not None  # derisk_level_2 de-risk exit
+    is_derisk_3 = is_derisk_3_found = derisk_3_order is not None  # derisk_level_3 de-risk exit
+    is_derisk_4 = is_derisk_4_found = derisk_4_order is not None  # derisk_level_4 de-risk exit
+    grind_1_orders, grind_1_buy_orders, grind_1_total_amount, grind_1_total_cost, grind_1_exit_order = (
+      grind_ladders.ladder("grind_1")
+    )
+    grind_1_sub_grind_count = len(grind_1_orders)
     grind_1_current_open_rate = 0.0
     grind_1_current_grind_stake = 0.0
     grind_1_current_grind_profit_stake = 0.0
     grind_1_current_grind_profit_rate = 0.0
-    grind_1_is_exit_found = False
-    grind_1_found = False
-    grind_1_buy_orders = []
-    grind_1_orders = []
+    grind_1_is_exit_found = grind_1_exit_order is not None
     grind_1_distance_ratio = 0.0
-    grind_1_exit_order = None
+    if grind_1_sub_grind_count > 0:
+      grind_1_distance_ratio = (exit_rate - grind_1_orders[0].safe_price) / grind_1_orders[0].safe_price
     grind_1_exit_distance_ratio = 0.0
-    grind_2_sub_grind_count = 0
-    grind_2_total_amount = 0.0
-    grind_2_total_cost = 0.0
+    grind_2_orders, grind_2_buy_orders, grind_2_total_amount, grind_2_total_cost, grind_2_exit_order = (
+      grind_ladders.ladder("grind_2")
+    )
+    grind_2_sub_grind_count = len(grind_2_orders)
     grind_2_current_open_rate = 0.0
     grind_2_current_grind_stake = 0.0
     grind_2_current_grind_profit_stake = 0.0
     grind_2_current_grind_profit_rate = 0.0
-    grind_2_is_exit_found = False
-    grind_2_found = False
-    grind_2_buy_orders = []
-    grind_2_orders = []
+    grind_2_is_exit_found = grind_2_exit_order is not None
     grind_2_distance_ratio = 0.0
-    grind_2_exit_order = None
+    if grind_2_sub_grind_count > 0:
+      grind_2_distance_ratio = (exit_rate - grind_2_orders[0].safe_price) / grind_2_orders[0].safe_price
     grind_2_exit_distance_ratio = 0.0
-    grind_3_sub_grind_count = 0
-    grind_3_total_amount = 0.0
-    grind_3_total_cost = 0.0
+    grind_3_orders, grind_3_buy_orders, grind_3_total_amount, grind_3_total_cost, grind_3_exit_order = (
+      grind_ladders.ladder("grind_3")
+    )
+    grind_3_sub_grind_count = len(grind_3_orders)
     grind_3_current_open_rate = 0.0
     grind_3_current_grind_stake = 0.0
     grind_3_current_grind_profit_stake = 0.0
     grind_3_current_grind_profit_rate = 0.0
-    grind_3_is_exit_found = False
-    grind_3_found = False
-    grind_3_buy_orders = []
-    grind_3_orders = []
+    grind_3_is_exit_found = grind_3_exit_order is not None
     grind_3_distance_ratio = 0.0
-    grind_3_exit_order = None
+    if grind_3_sub_grind_count > 0:
+      grind_3_distance_ratio = (exit_rate - grind_3_orders[0].safe_price) / grind_3_orders[0].safe_price
     grind_3_exit_distance_ratio = 0.0
-    grind_4_sub_grind_count = 0
-    grind_4_total_amount = 0.0
-    grind_4_total_cost = 0.0
+    grind_4_orders, grind_4_buy_orders, grind_4_total_amount, grind_4_total_cost, grind_4_exit_order = (
+      grind_ladders.ladder("grind_4")
+    )
+    grind_4_sub_grind_count = len(grind_4_orders)
     grind_4_current_open_rate = 0.0
     grind_4_current_grind_stake = 0.0
     grind_4_current_grind_profit_stake = 0.0
     grind_4_current_grind_profit_rate = 0.0
-    grind_4_is_exit_found = False
-    grind_4_found = False
-    grind_4_buy_orders = []
-    grind_4_orders = []
+    grind_4_is_exit_found = grind_4_exit_order is not None
     grind_4_distance_ratio = 0.0
-    grind_4_exit_order = None
+    if grind_4_sub_grind_count > 0:
+      grind_4_distance_ratio = (exit_rate - grind_4_orders[0].safe_price) / grind_4_orders[0].safe_price
     grind_4_exit_distance_ratio = 0.0
-    grind_5_sub_grind_count = 0
-    grind_5_total_amount = 0.0
-    grind_5_total_cost = 0.0
+    grind_5_orders, grind_5_buy_orders, grind_5_total_amount, grind_5_total_cost, grind_5_exit_order = (
+      grind_ladders.ladder("grind_5")
+    )
+    grind_5_sub_grind_count = len(grind_5_orders)
     grind_5_current_open_rate = 0.0
     grind_5_current_grind_stake = 0.0
     grind_5_current_grind_profit_stake = 0.0
     grind_5_current_grind_profit_rate = 0.0
-    grind_5_is_exit_found = False
-    grind_5_found = False
-    grind_5_buy_orders = []
-    grind_5_orders = []
+    grind_5_is_exit_found = grind_5_exit_order is not None
     grind_5_distance_ratio = 0.0
-    grind_5_exit_order = None
+    if grind_5_sub_grind_count > 0:
+      grind_5_distance_ratio = (exit_rate - grind_5_orders[0].safe_price) / grind_5_orders[0].safe_price
     grind_5_exit_distance_ratio = 0.0
-    buyback_1_sub_grind_count = 0
-    buyback_1_total_amount = 0.0
-    buyback_1_total_cost = 0.0
+    buyback_1_orders, buyback_1_buy_orders, buyback_1_total_amount, buyback_1_total_cost, buyback_1_exit_order = (
+      grind_ladders.ladder("buyback_1")
+    )
+    buyback_1_sub_grind_count = len(buyback_1_orders)
     buyback_1_current_open_rate = 0.0
     buyback_1_current_grind_stake = 0.0
     buyback_1_current_grind_stake_profit = 0.0
-    buyback_1_is_exit_found = False
-    buyback_1_found = False
-    buyback_1_buy_orders = []
-    buyback_1_orders = []
+    buyback_1_is_exit_found = buyback_1_exit_order is not None
     buyback_1_distance_ratio = 0.0
-    buyback_1_exit_order = None
+    if buyback_1_sub_grind_count > 0:
+      buyback_1_distance_ratio = (exit_rate - buyback_1_orders[0].safe_price) / buyback_1_orders[0].safe_price
     buyback_1_exit_distance_ratio = 0.0
-    rebuy_sub_grind_count = 0
-    rebuy_total_amount = 0.0
-    rebuy_total_cost = 0.0
+    rebuy_orders, rebuy_buy_orders, rebuy_total_amount, rebuy_total_cost, rebuy_exit_order = grind_ladders.ladder(
+      "rebuy"
+    )
+    rebuy_sub_grind_count = len(rebuy_orders)
     rebuy_current_open_rate = 0.0
     rebuy_current_grind_stake = 0.0
     rebuy_current_grind_stake_profit = 0.0
-    rebuy_is_exit_found = False
-    rebuy_found = False
-    rebuy_buy_orders = []
-    rebuy_orders = []
+    rebuy_is_exit_found = rebuy_exit_order is not None
     rebuy_distance_ratio = 0.0
-    rebuy_exit_order = None
+    if rebuy_sub_grind_count > 0:
+      rebuy_distance_ratio = (exit_rate - rebuy_orders[0].safe_price) / rebuy_orders[0].safe_price
     rebuy_exit_distance_ratio = 0.0
-    for order in reversed(filled_orders):
-      if (order.ft_order_side == "buy") and (order is not filled_orders[0]):
-        order_tag = ""
-        if has_order_tags:
-          if order.ft_order_tag is not None:
-            order_tag = order.ft_order_tag
-        if not grind_1_is_exit_found and order_tag == "grind_1_entry":
-          grind_1_sub_grind_count += 1
-          grind_1_total_amount += order.safe_filled
-          grind_1_total_cost += order.safe_filled * order.safe_price
-          grind_1_buy_orders.append(order.id)
-          grind_1_orders.append(order)
-          if not grind_1_found:
-            grind_1_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
-            grind_1_found = True
-        elif not grind_2_is_exit_found and order_tag == "grind_2_entry":
-          grind_2_sub_grind_count += 1
-          grind_2_total_amount += order.safe_filled
-          grind_2_total_cost += order.safe_filled * order.safe_price
-          grind_2_buy_orders.append(order.id)
-          grind_2_orders.append(order)
-          if not grind_2_found:
-            grind_2_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
-            grind_2_found = True
-        elif not grind_3_is_exit_found and order_tag == "grind_3_entry":
-          grind_3_sub_grind_count += 1
-          grind_3_total_amount += order.safe_filled
-          grind_3_total_cost += order.safe_filled * order.safe_price
-          grind_3_buy_orders.append(order.id)
-          grind_3_orders.append(order)
-          if not grind_3_found:
-            grind_3_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
-            grind_3_found = True
-        elif not grind_4_is_exit_found and order_tag == "grind_4_entry":
-          grind_4_sub_grind_count += 1
-          grind_4_total_amount += order.safe_filled
-          grind_4_total_cost += order.safe_filled * order.safe_price
-          grind_4_buy_orders.append(order.id)
-          grind_4_orders.append(order)
-          if not grind_4_found:
-            grind_4_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
-            grind_4_found = True
-        elif not grind_5_is_exit_found and order_tag == "grind_5_entry":
-          grind_5_sub_grind_count += 1
-          grind_5_total_amount += order.safe_filled
-          grind_5_total_cost += order.safe_filled * order.safe_price
-          grind_5_buy_orders.append(order.id)
-          grind_5_orders.append(order)
-          if not grind_5_found:
-            grind_5_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
-            grind_5_found = True
-        elif not buyback_1_is_exit_found and order_tag == "buyback_1_entry":
-          buyback_1_sub_grind_count += 1
-          buyback_1_total_amount += order.safe_filled
-          buyback_1_total_cost += order.safe_filled * order.safe_price
-          buyback_1_buy_orders.append(order.id)
-          buyback_1_orders.append(order)
-          if not buyback_1_found:
-            buyback_1_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
-            buyback_1_found = True
-        elif not rebuy_is_exit_found and order_tag == "rebuy_entry":
-          rebuy_sub_grind_count += 1
-          rebuy_total_amount += order.safe_filled
-          rebuy_total_cost += order.safe_filled * order.safe_price
-          rebuy_buy_orders.append(order.id)
-          rebuy_orders.append(order)
-          if not rebuy_found:
-            rebuy_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
-            rebuy_found = True
-      elif order.ft_order_side == "sell":
-        if order is filled_exits[-1] and (order.safe_remaining * exit_rate / stake_scale_leverage) > min_stake:
-          partial_sell = True
-          # break
-        order_tag = ""
-        if has_order_tags:
-          if order.ft_order_tag is not None:
-            order_tag = order.ft_order_tag.partition(" ")[0]
-        if order_tag == "derisk_level_1":
-          if not is_derisk_1_found:
-            is_derisk_1_found = True
-            is_derisk_1 = True
-            derisk_1_order = order
-        elif order_tag == "derisk_level_2":
-          if not is_derisk_2_found:
-            is_derisk_2_found = True
-            is_derisk_2 = True
-            derisk_2_order = order
-        elif order_tag == "derisk_level_3":
-          if not is_derisk_3_found:
-            is_derisk_3_found = True
-            is_derisk_3 = True
-            derisk_3_order = order
-        elif order_tag == "derisk_level_4":
-          if not is_derisk_4_found:
-            is_derisk_4_found = True
-            is_derisk_4 = True
-            derisk_4_order = order
-        elif not grind_1_is_exit_found and order_tag in ["grind_1_exit", "grind_1_derisk"]:
-          grind_1_is_exit_found = True
-          grind_1_exit_order = order
-        elif not grind_2_is_exit_found and order_tag in ["grind_2_exit", "grind_2_derisk"]:
-          grind_2_is_exit_found = True
-          grind_2_exit_order = order
-        elif not grind_3_is_exit_found and order_tag in ["grind_3_exit", "grind_3_derisk"]:
-          grind_3_is_exit_found = True
-          grind_3_exit_order = order
-        elif not grind_4_is_exit_found and order_tag in ["grind_4_exit", "grind_4_derisk"]:
-          grind_4_is_exit_found = True
-          grind_4_exit_order = order
-        elif not grind_5_is_exit_found and order_tag in ["grind_5_exit", "grind_5_derisk"]:
-          grind_5_is_exit_found = True
-          grind_5_exit_order = order
-        elif not buyback_1_is_exit_found and order_tag in ["buyback_1_exit", "buyback_1_derisk"]:
-          buyback_1_is_exit_found = True
-          buyback_1_exit_order = order
-        elif not rebuy_is_exit_found and order_tag in ["rebuy_exit", "rebuy_derisk"]:
-          rebuy_is_exit_found = True
-          rebuy_exit_order = order
-        elif order_tag == "derisk_global":
-          if not grind_1_is_exit_found:
-            grind_1_is_exit_found = True
-            grind_1_exit_order = order
-          if not grind_2_is_exit_found:
-            grind_2_is_exit_found = True
-            grind_2_exit_order = order
-          if not grind_3_is_exit_found:
-            grind_3_is_exit_found = True
-            grind_3_exit_order = order
-          if not grind_4_is_exit_found:
-            grind_4_is_exit_found = True
-            grind_4_exit_order = order
-          if not grind_5_is_exit_found:
-            grind_5_is_exit_found = True
-            grind_5_exit_order = order
-          if not buyback_1_is_exit_found:
-            buyback_1_is_exit_found = True
-            buyback_1_exit_order = order
-          if not rebuy_is_exit_found:
-            rebuy_is_exit_found = True
-            rebuy_exit_order = order
 
     if grind_1_sub_grind_count > 0:
       grind_1_current_open_rate = grind_1_total_cost / grind_1_total_amount
@@ -48240,40 +48444,25 @@ class NostalgiaForInfinityX7(IStrategy):
     is_not_trade_max_stake_v3 = current_stake_amount < (slice_amount * self.system_v3_max_stake)
     is_not_trade_max_stake_v3_1 = current_stake_amount < (slice_amount * self.system_v3_1_max_stake)
 
-    grind_1_cluster_max_profit_stake = trade.get_custom_data(key="grind_1_cluster_max_profit_stake") or 0.0
-    grind_1_cluster_max_profit_rate = trade.get_custom_data(key="grind_1_cluster_max_profit_rate") or 0.0
-    if grind_1_current_grind_profit_stake > grind_1_cluster_max_profit_stake:
-      trade.set_custom_data(key="grind_1_cluster_max_profit_stake", value=grind_1_current_grind_profit_stake)
-    if grind_1_current_grind_profit_rate > grind_1_cluster_max_profit_rate:
-      trade.set_custom_data(key="grind_1_cluster_max_profit_rate", value=grind_1_current_grind_profit_rate)
-
-    grind_2_cluster_max_profit_stake = trade.get_custom_data(key="grind_2_cluster_max_profit_stake") or 0.0
-    grind_2_cluster_max_profit_rate = trade.get_custom_data(key="grind_2_cluster_max_profit_rate") or 0.0
-    if grind_2_current_grind_profit_stake > grind_2_cluster_max_profit_stake:
-      trade.set_custom_data(key="grind_2_cluster_max_profit_stake", value=grind_2_current_grind_profit_stake)
-    if grind_2_current_grind_profit_rate > grind_2_cluster_max_profit_rate:
-      trade.set_custom_data(key="grind_2_cluster_max_profit_rate", value=grind_2_current_grind_profit_rate)
-
-    grind_3_cluster_max_profit_stake = trade.get_custom_data(key="grind_3_cluster_max_profit_stake") or 0.0
-    grind_3_cluster_max_profit_rate = trade.get_custom_data(key="grind_3_cluster_max_profit_rate") or 0.0
-    if grind_3_current_grind_profit_stake > grind_3_cluster_max_profit_stake:
-      trade.set_custom_data(key="grind_3_cluster_max_profit_stake", value=grind_3_current_grind_profit_stake)
-    if grind_3_current_grind_profit_rate > grind_3_cluster_max_profit_rate:
-      trade.set_custom_data(key="grind_3_cluster_max_profit_rate", value=grind_3_current_grind_profit_rate)
-
-    grind_4_cluster_max_profit_stake = trade.get_custom_data(key="grind_4_cluster_max_profit_stake") or 0.0
-    grind_4_cluster_max_profit_rate = trade.get_custom_data(key="grind_4_cluster_max_profit_rate") or 0.0
-    if grind_4_current_grind_profit_stake > grind_4_cluster_max_profit_stake:
-      trade.set_custom_data(key="grind_4_cluster_max_profit_stake", value=grind_4_current_grind_profit_stake)
-    if grind_4_current_grind_profit_rate > grind_4_cluster_max_profit_rate:
-      trade.set_custom_data(key="grind_4_cluster_max_profit_rate", value=grind_4_current_grind_profit_rate)
-
-    grind_5_cluster_max_profit_stake = trade.get_custom_data(key="grind_5_cluster_max_profit_stake") or 0.0
-    grind_5_cluster_max_profit_rate = trade.get_custom_data(key="grind_5_cluster_max_profit_rate") or 0.0
-    if grind_5_current_grind_profit_stake > grind_5_cluster_max_profit_stake:
-      trade.set_custom_data(key="grind_5_cluster_max_profit_stake", value=grind_5_current_grind_profit_stake)
-    if grind_5_current_grind_profit_rate > grind_5_cluster_max_profit_rate:
-      trade.set_custom_data(key="grind_5_cluster_max_profit_rate", value=grind_5_current_grind_profit_rate)
+    grind_1_cluster_max_profit_stake, grind_1_cluster_max_profit_rate = grind_ladders.update_cluster_max_profit(
+      custom_data, "grind_1", grind_1_current_grind_profit_stake, grind_1_current_grind_profit_rate
+    )
+
+    grind_2_cluster_max_profit_stake, grind_2_cluster_max_profit_rate = grind_ladders.update_cluster_max_profit(
+      custom_data, "grind_2", grind_2_current_grind_profit_stake, grind_2_current_grind_profit_rate
+    )
+
+    grind_3_cluster_max_profit_stake, grind_3_cluster_max_profit_rate = grind_ladders.update_cluster_max_profit(
+      custom_data, "grind_3", grind_3_current_grind_profit_stake, grind_3_current_grind_profit_rate
+    )
+
+    grind_4_cluster_max_profit_stake, grind_4_cluster_max_profit_rate = grind_ladders.update_cluster_max_profit(
+      custom_data, "grind_4", grind_4_current_grind_profit_stake, grind_4_current_grind_profit_rate
+    )
+
+    grind_5_cluster_max_profit_stake, grind_5_cluster_max_profit_rate = grind_ladders.update_cluster_max_profit(
+      custom_data, "grind_5", grind_5_current_grind_profit_stake, grind_5_current_grind_profit_rate
+    )
 
     is_long_extra_checks_entry = (
       grind_entry_retry_time > filled_entries[-1].order_filled_utc
@@ -48372,17 +48561,15 @@ class NostalgiaForInfinityX7(IStrategy):
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
         if send_notifications:
-          send_msg(
-            notification_msg(
-              "de-risk",
-              tag="Level 1",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-            )
+          notify(
+            "de-risk",
+            tag="Level 1",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
           )
         log.info(
           f"De-risk Level 1 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -48405,17 +48592,15 @@ class NostalgiaForInfinityX7(IStrategy):
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
         if send_notifications:
-          send_msg(
-            notification_msg(
-              "de-risk",
-              tag="Level 2",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-            )
+          notify(
+            "de-risk",
+            tag="Level 2",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
           )
         log.info(
           f"De-risk Level 2 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -48438,17 +48623,15 @@ class NostalgiaForInfinityX7(IStrategy):
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
         if send_notifications:
-          send_msg(
-            notification_msg(
-              "de-risk",
-              tag="Level 3",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-            )
+          notify(
+            "de-risk",
+            tag="Level 3",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
           )
         log.info(
           f"De-risk Level 3 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -48471,17 +48654,15 @@ class NostalgiaForInfinityX7(IStrategy):
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
         if send_notifications:
-          send_msg(
-            notification_msg(
-              "de-risk",
-              tag="Level 4",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-            )
+          notify(
+            "de-risk",
+            tag="Level 4",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
           )
         log.info(
           f"De-risk Level 4 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -48505,17 +48686,15 @@ class NostalgiaForInfinityX7(IStrategy):
       if buy_amount > max_stake:
         return None
       if send_notifications:
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="grind_1_entry",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "grinding-entry",
+          tag="grind_1_entry",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
       log.info(
         f"Grinding entry (grind_1_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Tag: {self._grind_entry_tag}"
@@ -48577,20 +48756,18 @@ class NostalgiaForInfinityX7(IStrategy):
             else profit_ratio
           )
         if send_notifications:
-          send_msg(
-            notification_msg(
-              "grinding-derisk",
-              tag="grind_1_derisk",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_1_current_grind_profit_stake,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_1_total_amount,
-            )
+          notify(
+            "grinding-derisk",
+            tag="grind_1_derisk",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_1_current_grind_profit_stake,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_1_total_amount,
           )
         log.info(
           f"Grinding de-risk (grind_1_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_1_total_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_profit_stake:{stake_fmt}} {stake_currency})"
@@ -48620,17 +48797,15 @@ class NostalgiaForInfinityX7(IStrategy):
       if buy_amount > max_stake:
         return None
       if send_notifications:
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="grind_2_entry",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "grinding-entry",
+          tag="grind_2_entry",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
       log.info(
         f"Grinding entry (grind_2_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Tag: {self._grind_entry_tag}"
@@ -48692,20 +48867,18 @@ class NostalgiaForInfinityX7(IStrategy):
             else profit_ratio
           )
         if send_notifications:
-          send_msg(
-            notification_msg(
-              "grinding-derisk",
-              tag="grind_2_derisk",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_2_current_grind_profit_stake,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_2_total_amount,
-            )
+          notify(
+            "grinding-derisk",
+            tag="grind_2_derisk",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_2_current_grind_profit_stake,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_2_total_amount,
           )
         log.info(
           f"Grinding de-risk (grind_2_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_2_total_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_2_current_grind_profit_stake:{stake_fmt}} {stake_currency})"
@@ -48735,17 +48908,15 @@ class NostalgiaForInfinityX7(IStrategy):
       if buy_amount > max_stake:
         return None
       if send_notifications:
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="grind_3_entry",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "grinding-entry",
+          tag="grind_3_entry",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
       log.info(
         f"Grinding entry (grind_3_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Tag: {self._grind_entry_tag}"
@@ -48807,20 +48978,18 @@ class NostalgiaForInfinityX7(IStrategy):
             else profit_ratio
           )
         if send_notifications:
-          send_msg(
-            notification_msg(
-              "grinding-derisk",
-              tag="grind_3_derisk",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_3_current_grind_profit_stake,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_3_total_amount,
-            )
+          notify(
+            "grinding-derisk",
+            tag="grind_3_derisk",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_3_current_grind_profit_stake,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_3_total_amount,
           )
         log.info(
           f"Grinding de-risk (grind_3_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_3_total_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_3_current_grind_profit_stake:{stake_fmt}} {stake_currency})"
@@ -48866,17 +49035,15 @@ class NostalgiaForInfinityX7(IStrategy):
       if buy_amount > max_stake:
         return None
       if send_notifications:
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="grind_4_entry",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "grinding-entry",
+          tag="grind_4_entry",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
       log.info(
         f"Grinding entry (grind_4_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Tag: {self._grind_entry_tag}"
@@ -48938,20 +49105,18 @@ class NostalgiaForInfinityX7(IStrategy):
             else profit_ratio
           )
         if send_notifications:
-          send_msg(
-            notification_msg(
-              "grinding-derisk",
-              tag="grind_4_derisk",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_4_current_grind_profit_stake,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_4_total_amount,
-            )
+          notify(
+            "grinding-derisk",
+            tag="grind_4_derisk",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_4_current_grind_profit_stake,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_4_total_amount,
           )
         log.info(
           f"Grinding de-risk (grind_4_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_4_total_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_4_current_grind_profit_stake:{stake_fmt}} {stake_currency})"
@@ -49000,17 +49165,15 @@ class NostalgiaForInfinityX7(IStrategy):
       if buy_amount > max_stake:
         return None
       if send_notifications:
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="grind_5_entry",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "grinding-entry",
+          tag="grind_5_entry",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
       log.info(
         f"Grinding entry (grind_5_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Tag: {self._grind_entry_tag}"
@@ -49072,20 +49235,18 @@ class NostalgiaForInfinityX7(IStrategy):
             else profit_ratio
           )
         if send_notifications:
-          send_msg(
-            notification_msg(
-              "grinding-derisk",
-              tag="grind_5_derisk",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_5_current_grind_profit_stake,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_5_total_amount,
-            )
+          notify(
+            "grinding-derisk",
+            tag="grind_5_derisk",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_5_current_grind_profit_stake,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_5_total_amount,
           )
         log.info(
           f"Grinding de-risk (grind_5_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_5_total_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_5_current_grind_profit_stake:{stake_fmt}} {stake_currency})"
@@ -49137,17 +49298,15 @@ class NostalgiaForInfinityX7(IStrategy):
       if buy_amount > max_stake:
         return None
       if send_notifications:
-        send_msg(
-          notification_msg(
-            "buyback-entry",
-            tag="buyback_1_entry",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "buyback-entry",
+          tag="buyback_1_entry",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
       log.info(
         f"Buyback entry (buyback_1_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -49238,20 +49397,18 @@ class NostalgiaForInfinityX7(IStrategy):
             else profit_ratio
           )
         if send_notifications:
-          send_msg(
-            notification_msg(
-              "buyback-derisk",
-              tag="buyback_1_derisk",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=buyback_1_current_grind_stake_profit,
-              grind_profit_pct=grind_profit,
-              coin_amount=buyback_1_total_amount,
-            )
+          notify(
+            "buyback-derisk",
+            tag="buyback_1_derisk",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=buyback_1_current_grind_stake_profit,
+            grind_profit_pct=grind_profit,
+            coin_amount=buyback_1_total_amount,
           )
         log.info(
           f"Buyback de-risk (buyback_1_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {buyback_1_total_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({buyback_1_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -49281,17 +49438,15 @@ class NostalgiaForInfinityX7(IStrategy):
       if buy_amount > max_stake:
         return None
       if send_notifications:
-        send_msg(
-          notification_msg(
-            "rebuy",
-            tag="rebuy_entry",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "rebuy",
+          tag="rebuy_entry",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
       log.info(
         f"Rebuy (rebuy_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -49320,6 +49475,17 @@ class NostalgiaForInfinityX7(IStrategy):
       self._grind_entry_tag = "g0"
       return True
 
+    # g1 to g27, on the candle part of the rules precomputed by long_grind_entry_v3_rules
+    tag = LONG_GRIND_ENTRY_V3_RULES.first_rule(last_candle, slice_profit, slice_profit_entry, is_derisk)
+    if tag is not None:
+      self._grind_entry_tag = tag
+      return True
+
+    self._grind_entry_tag = ""
+    return False
+
+  def long_grind_entry_v3_rules(self, last_candle: "CandleColumns", previous_candle: "CandleColumns") -> list:
+    """The candle part of the `long_grind_entry_v3` rules, by candle, in the order of LONG_GRIND_ENTRY_V3_RULES."""
     last_close = last_candle["close"]
     last_open = last_candle["open"]
     last_close_min_12 = last_candle["close_min_12"]
@@ -49374,533 +49540,477 @@ class NostalgiaForInfinityX7(IStrategy):
     prev_ema_12 = previous_candle["EMA_12"]
     prev_ema_26 = previous_candle["EMA_26"]
 
-    # g1 — AROONU dip + EMA_16 drop
-    if (
-      (last_rsi_3 > 10.0)
-      and (last_rsi_3_15m > 15.0)
-      and (last_rsi_3_1h > 15.0)
-      and (last_rsi_3_4h > 15.0)
-      and (last_rsi_14 < 45.0)
-      and (last_aroonu_14 < 25.0)
-      and (last_aroonu_14_4h < 100.0)
-      and (last_roc_9_1h < 20.0)
-      and (last_close > (last_close_max_48 * 0.90))
-      and (last_close < (last_low_min_24_4h * 1.60))
-      and (last_close < (last_ema_16 * 0.975))
-      and ((last_rsi_3_1h > 35.0) or (last_aroonu_14_1h < 100.0))
-      and ((last_aroonu_14_1h < 100.0) or (last_aroonu_14_1d < 100.0))
-      and ((last_aroonu_14_1d < 100.0) or (last_stochrsi_k_1h < 90.0))
-    ):
-      self._grind_entry_tag = "g1"
-      return True
-    # g2 — EMA_26 > EMA_12 divergence + BBL
-    if (
-      (last_rsi_3 > 5.0)
-      and (last_rsi_3_15m > 10.0)
-      and (last_rsi_3_1h > 15.0)
-      and (last_rsi_3_4h > 15.0)
-      and (last_rsi_14 < 30.0)
-      and (last_stochrsi_k < 30.0)
-      and (last_ema_26 > last_ema_12)
-      and ((last_ema_26 - last_ema_12) > (last_open * 0.020))
-      and ((prev_ema_26 - prev_ema_12) > (last_open / 100.0))
-      and (last_close < (last_bbl_20 * 1.010))
-    ):
-      self._grind_entry_tag = "g2"
-      return True
-    # g3 — AROONU_15m dip + EMA_12 drop
-    if (
-      (last_rsi_3 > 10.0)
-      and (last_rsi_3_15m > 10.0)
-      and (last_rsi_3_1h > 10.0)
-      and (last_rsi_3_4h > 15.0)
-      and (last_rsi_14 < 35.0)
-      and (last_aroonu_14_15m < 25.0)
-      and (last_stochrsi_k_15m < 70.0)
-      and (last_stochrsi_k_1h < 90.0)
-      and (last_roc_9_1h > -15.0)
-      and (last_roc_9_4h > -15.0)
-      and (last_close > (last_close_max_48 * 0.85))
-      and (last_close < (last_ema_12 * 0.980))
-      and ((last_rsi_3_1h > 20.0) or (last_rsi_3_1d > 20.0))
-      and ((last_rsi_3_1h > 20.0) or (last_stochrsi_k_1d < 70.0))
-      and ((last_rsi_3_1h > 25.0) or (last_stochrsi_k_1h < 70.0))
-      and ((last_rsi_3_4h > 30.0) or (last_stochrsi_k_4h < 60.0))
-    ):
-      self._grind_entry_tag = "g3"
-      return True
-    # g4 — multi-TF RSI + EMA_26 + BBL
-    if (
-      (last_rsi_3 > 10.0)
-      and (last_rsi_3_15m > 10.0)
-      and (last_rsi_3_1h > 10.0)
-      and (last_rsi_3_4h > 10.0)
-      and (last_rsi_3_1d > 10.0)
-      and (last_rsi_14 < 35.0)
-      and (last_aroonu_14 < 25.0)
-      and (last_roc_9_1h > -20.0)
-      and (last_roc_9_4h > -20.0)
-      # and (last_close > (last_close_max_48 * 0.90))
-      and (last_close < (last_ema_26 * 0.970))
-      and (last_close < (last_bbl_20 * 0.999))
-    ):
-      self._grind_entry_tag = "g4"
-      return True
-    # g5 — deep dip + EMA_9/20
-    if (
-      (last_rsi_3 > 10.0)
-      and (last_rsi_3_15m > 10.0)
-      and (last_rsi_3_1h > 15.0)
-      and (last_rsi_3_4h > 15.0)
-      and (last_rsi_14 < 35.0)
-      and (last_aroonu_14 < 30.0)
-      and (last_roc_9_4h > -20.0)
-      and (last_close > (last_high_max_24_1h * 0.80))
-      and (last_close < (last_low_min_12_4h * 1.50))
-      and (last_close < (last_ema_9 * 0.975))
-      and (last_close < (last_ema_20 * 0.970))
-    ):
-      self._grind_entry_tag = "g5"
-      return True
-    # g6 — RSI_20 falling + SMA_16 drop
-    if (
-      (last_rsi_3 > 5.0)
-      and (last_rsi_3 < 40.0)
-      and (last_rsi_3_15m > 15.0)
-      and (last_rsi_14 > 35.0)
-      and (last_roc_9_1h > -20.0)
-      and (last_roc_9_4h > -20.0)
-      and (last_aroonu_14 < 25.0)
-      and (last_close < (last_low_min_12_4h * 1.60))
-      and (last_rsi_20 < prev_rsi_20)
-      and (last_close < (last_sma_16 * 0.960))
-      and ((last_aroonu_14_1d < 100.0) or (last_roc_9_1d < 50.0))
-    ):
-      self._grind_entry_tag = "g6"
-      return True
-    # g7 — WILLR deep + BBB wide
-    if (
-      (last_rsi_3 > 5.0)
-      and (last_rsi_3_15m > 20.0)
-      and (last_rsi_3_1h > 20.0)
-      and (last_rsi_3_4h > 20.0)
-      and (last_willr_14 < -50.0)
-      and (last_willr_84_1h < -70.0)
-      and (last_stochrsi_k < 30.0)
-      and (last_stochrsi_k_1h < 90.0)
-      and (last_roc_9_1h > -10.0)
-      and (last_roc_9_1h < 20.0)
-      and (last_roc_9_4h > -10.0)
-      and (last_close < (last_low_min_24_4h * 1.50))
-      and (last_bbands_20_1h > 12.0)
-      and (last_close_max_48 >= (last_close * 1.10))
-    ):
-      self._grind_entry_tag = "g7"
-      return True
-    # g8 — EMA_26/12 gap wide + low_min_24_1h
-    if (
-      (last_rsi_3 < 30.0)
-      and (last_rsi_3 > 5.0)
-      and (last_rsi_3_15m > 10.0)
-      and (last_rsi_3_1h > 10.0)
-      and (last_rsi_3_4h > 10.0)
-      and (last_roc_9_1h > -10.0)
-      and (last_roc_9_4h > -25.0)
-      # and (last_close < (last_candle["low_min_24_1h"] * 1.30))
-      and (last_ema_26 > last_ema_12)
-      and ((last_ema_26 - last_ema_12) > (last_open * 0.030))
-      and ((prev_ema_26 - prev_ema_12) > (last_open / 100.0))
-    ):
-      self._grind_entry_tag = "g8"
-      return True
-    # g9 — pullback recovery
-    if (
-      (last_rsi_3 > 5.0)
-      and (last_rsi_3_15m > 15.0)
-      and (last_rsi_3_1h > 20.0)
-      and (last_rsi_3_4h > 20.0)
-      and (last_stochrsi_k < 50.0)
-      and (last_close < (last_close_max_48 * 0.90))
-      and (last_close > (last_close_min_12 * 1.03))
-    ):
-      self._grind_entry_tag = "g9"
-      return True
-    # g10 — RSI_14 divergence vs 1h
-    if (
-      (last_rsi_3 > 5.0)
-      and (last_rsi_3_15m > 20.0)
-      and (last_stochrsi_k < 20.0)
-      and (last_rsi_14 < (last_rsi_14_1h - 45.0))
-    ):
-      self._grind_entry_tag = "g10"
-      return True
-    # g11 — multi-TF RSI + SMA_30 + BBL
-    if (
-      (last_rsi_3 > 5.0)
-      and (last_rsi_3_15m > 10.0)
-      and (last_rsi_3_1h > 10.0)
-      and (last_cmf_20 > 0.0)
-      and (last_close < (last_sma_30 * 0.965))
-      and (last_close < (last_bbl_20 * 1.000))
-    ):
-      self._grind_entry_tag = "g11"
-      return True
-    # g12 — EMA_26/12 divergence + close_max_48
-    if (
-      (last_rsi_3 > 5.0)
-      and (last_rsi_3_15m > 10.0)
-      and (last_rsi_3_1h > 10.0)
-      and (last_stochrsi_k < 30.0)
-      and (last_close > (last_close_max_48 * 0.90))
-      and (last_close < (last_low_min_12_4h * 1.60))
-      and (last_ema_26 > last_ema_12)
-      and ((last_ema_26 - last_ema_12) > (last_open * 0.025))
-      and ((prev_ema_26 - prev_ema_12) > (last_open / 100.0))
-    ):
-      self._grind_entry_tag = "g12"
-      return True
-    # g13 — SMA_9 cross SMA_21 + EMA_100 drop
-    if (
-      (last_rsi_3 > 5.0)
-      and (last_rsi_3_1h > 20.0)
-      and (last_rsi_14_1h > 40.0)
-      and (last_stochrsi_k_15m < 80.0)
-      and (last_roc_9_1h > -15.0)
-      and (last_roc_9_4h > -15.0)
-      and (prev_sma_9 < prev_sma_21)
-      and (last_sma_9 > last_sma_21)
-      and (last_close < (last_ema_100 * 0.975))
-      and ((last_rsi_3_4h > 40.0) or (last_roc_9_4h < 30.0))
-    ):
-      self._grind_entry_tag = "g13"
-      return True
-    # g14 — SMA_9 cross SMA_21 + 4h uptrend (trend follower)
-    if (
-      (last_rsi_3 > 5.0)
-      and (last_aroonu_14_15m < 50.0)
-      and (last_stochrsi_k < 40.0)
-      and (last_stochrsi_k_15m < 70.0)
-      and (prev_sma_9 < prev_sma_21)
-      and (last_sma_9 > last_sma_21)
-      and (last_ema_12_4h > last_ema_200_4h)
-      and (last_close > (last_close_max_48 * 0.90))
-      and ((last_rsi_3_1h > 30.0) or (last_stochrsi_k_1h < 70.0))
-      and ((last_rsi_3_1h > 40.0) or (last_aroonu_14_1h < 80.0))
-      and ((last_rsi_3_1d > 25.0) or (last_stochrsi_k_1h < 80.0))
-      and ((last_stochrsi_k_1h < 80.0) or (last_stochrsi_k_1d < 90.0))
-    ):
-      self._grind_entry_tag = "g14"
-      return True
-    # g15 — deep loss recovery (slice_profit < -0.16)
-    if (
-      (slice_profit < -0.16)
-      and (last_rsi_3 > 5.0)
-      and (last_rsi_3_15m > 10.0)
-      and (last_rsi_14 < 40.0)
-      and (last_aroonu_14 < 25.0)
-      and (last_aroonu_14_15m < 30.0)
-      and (last_stochrsi_k < 30.0)
-      and (last_stochrsi_k_15m < 30.0)
-      and ((last_rsi_3_1h > 30.0) or (last_stochrsi_k_1h < 80.0))
-      and ((last_rsi_3_4h > 30.0) or (last_stochrsi_k_4h < 80.0))
-      and ((last_rsi_3_1d > 30.0) or (last_stochrsi_k_1d < 80.0))
-    ):
-      self._grind_entry_tag = "g15"
-      return True
-    # g16 — EMA_12 drop + BBL
-    if (
-      (last_rsi_3 > 8.0)
-      and (last_rsi_3_15m > 15.0)
-      and (last_rsi_3_1h > 15.0)
-      and (last_rsi_3_4h > 15.0)
-      and (last_rsi_14 < 35.0)
-      and (last_close < (last_ema_12 * 0.965))
-      and (last_close < (last_bbl_20 * 0.999))
-    ):
-      self._grind_entry_tag = "g16"
-      return True
-    # g17 — StochRSI + EMA_20 drop
-    if (
-      (last_rsi_3 > 15.0)
-      and (last_rsi_3_15m > 15.0)
-      and (last_rsi_3_1h > 15.0)
-      and (last_rsi_3_4h > 15.0)
-      and (last_rsi_14 < 30.0)
-      and (last_stochrsi_k < 30.0)
-      and (last_close < (last_ema_20 * 0.975))
-      and ((last_aroonu_14_4h < 100.0) or (last_aroonu_14_1d < 100.0))
-    ):
-      self._grind_entry_tag = "g17"
-      return True
-    # g18 — moderate loss recovery (slice_profit < -0.10)
-    if (
-      (slice_profit < -0.10)
-      and (last_rsi_3 > 5.0)
-      and (last_rsi_3_15m > 15.0)
-      and (last_rsi_3_1h > 20.0)
-      and (last_rsi_3_4h > 20.0)
-      and (last_rsi_14 < 40.0)
-      and (last_close < (last_ema_26 * 0.970))
-      and (last_close < (last_bbl_20 * 0.999))
-    ):
-      self._grind_entry_tag = "g18"
-      return True
-    # g19 — EMA_26/12 wide gap (slice_profit < -0.06)
-    if (
-      (slice_profit < -0.06)
-      and (last_rsi_3 < 30.0)
-      and (last_rsi_3 > 5.0)
-      and (last_rsi_3_15m > 10.0)
-      and (last_ema_26 > last_ema_12)
-      and ((last_ema_26 - last_ema_12) > (last_open * 0.035))
-      and ((prev_ema_26 - prev_ema_12) > (last_open / 100.0))
-    ):
-      self._grind_entry_tag = "g19"
-      return True
-    # AROONU 4h uptrend pullback recovery
-    if (
-      (last_rsi_3 > 10.0)
-      and (last_rsi_3_15m > 15.0)
-      and (last_rsi_3_1h > 20.0)
-      and (last_rsi_14 < 42.0)
-      and (last_rsi_14_4h > 50.0)
-      and (last_aroonu_14 < 30.0)
-      and (last_aroonu_14_4h > 50.0)
-      and (last_roc_9_1d > -15.0)
-      and (last_ema_50_4h > last_ema_100_4h)
-      and (last_close < (last_close_max_48 * 0.95))
-      and ((last_rsi_3_15m > 20.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_rsi_3_1h > 30.0) or (last_roc_9_4h < 30.0) or (last_roc_9_1d < 30.0))
-      and ((last_rsi_3_1h > 50.0) or (last_roc_9_1d < 60.0))
-      and ((last_rsi_3_4h > 40.0) or (last_aroonu_14_4h < 90.0))
-      and ((last_rsi_3_4h > 45.0) or (last_aroonu_14_4h < 100.0))
-      and ((last_rsi_3_4h > 60.0) or (last_roc_9_4h < 40.0))
-      and ((last_aroonu_14_4h < 100.0) or (last_stochrsi_k_1d < 80.0))
-      and ((last_aroonu_14_4h < 100.0) or (last_aroonu_14_1d < 100.0))
-      and ((last_stochrsi_k_4h < 90.0) or (last_roc_9_4h < 30.0))
-    ):
-      self._grind_entry_tag = "g20"
-      return True
-    if (
-      (slice_profit_entry < -0.02)
-      and (last_rsi_3 > 10.0)
-      and (last_rsi_3_15m > 15.0)
-      and (last_rsi_14 < 35.0)
-      and (last_aroonu_14_15m < 50.0)
-      and (last_close < (last_ema_20 * 0.955))
-    ):
-      self._grind_entry_tag = "g21"
-      return True
-    # g22 — early recovery rebuild: reclaiming off the low BEFORE the 4h trend confirms (g14 needs
-    #        EMA_12_4h > EMA_200_4h and fires too late for a deep-derisk bounce). Anti-fake-rise gating via
-    #        multi-TF RSI recovery + reclaim off the 4h low + not-extended. NOTE: slice_profit_entry gate
-    #        removed — it self-defeats in recovery (last grind buy is in profit); underwater-scope TBD.
-    if (
-      (last_rsi_3 > 30.0)
-      and (last_rsi_3_15m > 30.0)
-      and (last_rsi_14 > 45.0)
-      and (last_rsi_14_1h > 45.0)
-      and (last_roc_9_1h > 0.0)
-      and (last_roc_9_4h > -10.0)
-      # anti-parabolic: even at a formed bottom, a parabolic 4h overshoot reverses (dead-cat).
-      # cross-coin (SFP/CELR/DYDX/APE): cuts 17 severe at ~1% good cost within recovery-starts.
-      and (last_roc_9_4h < 25.0)
-      # recovery-started gate: only rebuild once the 4h bottom is IN (not still making new lows).
-      # g22's job is the recovery rebuild — NOT entering mid-dump (that's g1..g21). AROOND high =
-      # a fresh 4h low was just made = still dumping; require it low = bottom formed = recovery start.
-      and (last_aroonu_14_4h < 50.0)
-      # aggressive risk-free: g22 fires ONLY deep below the 4h 200-EMA (fresh recovery zone). The
-      # near/above-EMA overextended-bounce zone is where dead-cats live AND where g22's late-recovery
-      # adds sit — we sacrifice those wins on purpose, because g23 (extended-continuation, ~0.2% severe)
-      # backstops the real recoveries above. So g22 stays clean, g23 captures the continuation.
-      and (last_close < last_ema_200_4h)
-      and (last_close > (last_low_min_12_4h * 1.10))
-      and (last_close > (last_ema_20 * 0.97))
-      and (last_close < (last_ema_20 * 1.02))
-      and ((last_rsi_3_1h > 30.0) or (last_stochrsi_k_1d < 80.0))
-      and ((last_rsi_3_1h > 35.0) or (last_aroonu_14_1d < 100.0))
-      and ((last_rsi_3_4h > 50.0) or (last_aroonu_14_1h < 100.0))
-      and ((last_rsi_3_1d > 10.0) or (last_aroonu_14_1d < 70.0))
-      and ((last_rsi_3_1d > 10.0) or (last_stochrsi_k_4h < 70.0))
-      and ((last_rsi_3_1d > 40.0) or (last_stochrsi_k_1h < 80.0))
-      and ((last_rsi_3_1d > 40.0) or (last_stochrsi_k_4h < 80.0))
-      and ((last_rsi_3_1d > 45.0) or (last_aroonu_14_1h < 100.0))
-      and ((last_rsi_3_1d > 45.0) or (last_aroonu_14_4h < 100.0))
-      and ((last_rsi_3_1d > 45.0) or (last_stochrsi_k_1h < 90.0))
-      and ((last_rsi_3_1d > 45.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_rsi_3_1d > 65.0) or (last_aroonu_14_1h < 70.0) or (last_aroonu_14_1d < 90.0))
-      and ((last_aroonu_14_15m < 80.0) or (last_stochrsi_k_15m < 80.0))
-      and ((last_aroonu_14_15m < 80.0) or (last_aroonu_14_1h < 100.0))
-      and ((last_aroonu_14_15m < 100.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_roc_9_1d > -20.0) or (last_aroonu_14_4h < 100.0))
-      and ((last_roc_9_1d > -20.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_roc_9_1d > -30.0) or (last_stochrsi_k_1h < 90.0))
-    ):
-      self._grind_entry_tag = "g22"
-      return True
-    # g23 — pump-continuation scalp: extended zone ABOVE g22's EMA_20*1.02 cap. Only rides a CONFIRMED
-    # continuation (price already advancing past the reclaim), so dead-cats (which roll over before
-    # reaching the extended zone) are structurally avoided. Complements g22: g22 = early recovery-start
-    # (ambiguous zone, dead-cat risk trimmed by P1), g23 = confirmed continuation (clean, ~0.2% severe).
-    if (
-      (last_rsi_3 > 30.0)
-      and (last_rsi_3_15m > 30.0)
-      and (last_rsi_14 > 50.0)
-      and (last_rsi_14_1h > 50.0)
-      and (last_roc_9_1h > 0.0)
-      and (last_roc_9_4h > 0.0)
-      # anti-parabolic blow-off + anti-exhaustion top
-      and (last_roc_9_4h < 25.0)
-      and ((last_stochrsi_k < 97.0) or (last_rsi_14 < 80.0))
-      and (last_close > (last_low_min_12_4h * 1.10))
-      # extended zone: above g22's 1.02*EMA cap = continuation confirmed, not a reclaim
-      and (last_close >= (last_ema_20 * 1.02))
-      and (last_close < (last_ema_20 * 1.12))
-      and ((last_rsi_3_1h > 45.0) or (last_aroonu_14_4h < 80.0))
-      and ((last_rsi_3_4h > 40.0) or (last_stochrsi_k_15m < 90.0))
-      and ((last_rsi_3_4h > 50.0) or (last_aroonu_14_4h < 70.0))
-      and ((last_rsi_3_1d > 15.0) or (last_stochrsi_k_1h < 80.0))
-      and ((last_rsi_3_1d > 30.0) or (last_aroonu_14_1h < 100.0))
-      and ((last_rsi_3_1d > 30.0) or (last_aroonu_14_4h < 100.0))
-      and ((last_rsi_3_1d > 50.0) or (last_stochrsi_k_1h < 80.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_rsi_3_1d > 55.0) or (last_aroonu_14_15m < 100.0) or (last_stochrsi_k_15m < 90.0))
-      and ((last_aroonu_14_15m < 100.0) or (last_aroonu_14_1h < 100.0))
-      and ((last_aroonu_14_15m < 100.0) or (last_aroonu_14_4h < 100.0))
-      and ((last_aroonu_14_15m < 100.0) or (last_aroonu_14_1d < 100.0))
-      and ((last_aroonu_14_15m < 100.0) or (last_stochrsi_k_15m < 90.0) or (last_stochrsi_k_1d < 80.0))
-      and ((last_aroonu_14_15m < 100.0) or (last_stochrsi_k_1h < 80.0))
-      and ((last_aroonu_14_15m < 100.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_aroonu_14_1h < 100.0) or (last_aroonu_14_4h < 100.0))
-      and ((last_aroonu_14_4h < 70.0) or (last_roc_9_1d < 50.0))
-      and ((last_aroonu_14_4h < 100.0) or (last_stochrsi_k_1h < 90.0))
-      and ((last_aroonu_14_4h < 100.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_aroonu_14_1d < 100.0) or (last_stochrsi_k_15m < 90.0))
-      and ((last_stochrsi_k_15m < 80.0) or (last_stochrsi_k_1h < 90.0))
-      and ((last_stochrsi_k_15m < 90.0) or (last_aroonu_14_1h < 100.0))
-      and ((last_stochrsi_k_15m < 90.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_stochrsi_k_1h < 90.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_stochrsi_k_1h < 90.0) or (last_stochrsi_k_4h < 90.0))
-    ):
-      self._grind_entry_tag = "g23"
-      return True
-    # g24 — trend-pullback continuation add: the zone ABOVE the 4h 200-EMA that g22 explicitly sacrifices.
-    if (
-      # momentum healthy on the pullback: RSI holds up (a real reversal cracks RSI hard)
-      (last_rsi_3 > 20.0)
-      and (last_rsi_3_15m > 20.0)
-      and (last_rsi_14 > 40.0)
-      # trend intact + this is a PULLBACK not a reversal: 4h still rising, 1h not in freefall
-      and (last_roc_9_1h > -10.0)
-      and (last_roc_9_4h > 0.0)
-      and (last_roc_9_4h < 25.0)  # anti-parabolic blow-off top
-      # bull scope-gate: confirmed 4h uptrend + price above the 200-EMA regime (complements g22's <200EMA)
-      and (last_ema_12_4h > last_ema_200_4h)
-      and (last_close > last_ema_200_4h)
-      # shallow pullback to the short EMA — buy the dip WITHIN the trend, never the top nor a deep dump
-      and (last_close < (last_ema_20 * 1.01))
-      and (last_close > (last_ema_20 * 0.94))
-      and ((last_rsi_3_15m > 40.0) or (last_stochrsi_k_15m < 70.0))
-      and ((last_rsi_3_1h > 15.0) or (last_aroonu_14_4h < 70.0))
-      and ((last_rsi_3_1h > 25.0) or (last_rsi_3_1d > 45.0) or (last_aroonu_14_1d < 70.0))
-      and ((last_rsi_3_1h > 25.0) or (last_aroonu_14_1h < 80.0))
-      and ((last_rsi_3_1h > 30.0) or (last_stochrsi_k_1d < 90.0) or (last_roc_9_1d < 10.0))
-      and ((last_rsi_3_1h > 35.0) or (last_stochrsi_k_1d < 90.0) or (last_roc_9_1d < 20.0))
-      and ((last_rsi_3_1h > 40.0) or (last_aroonu_14_4h < 100.0))
-      and ((last_rsi_3_1h > 40.0) or (last_stochrsi_k_1d < 80.0) or (last_roc_9_1d < 50.0))
-      and ((last_rsi_3_1h > 35.0) or (last_rsi_3_4h > 50.0) or (last_stochrsi_k_4h < 80.0))
-      and ((last_rsi_3_1h > 40.0) or (last_rsi_3_4h > 55.0) or (last_aroonu_14_4h < 90.0))
-      and ((last_rsi_3_1h > 60.0) or (last_stochrsi_k_1h < 60.0) or (last_stochrsi_k_1d < 90.0))
-      and ((last_rsi_3_1h > 65.0) or (last_aroonu_14_1h < 70.0) or (last_aroonu_14_1d < 90.0))
-      and ((last_rsi_3_4h > 25.0) or (last_roc_9_1d < 30.0))
-      and ((last_rsi_3_4h > 45.0) or (last_aroonu_14_4h < 70.0))
-      and ((last_rsi_3_4h > 50.0) or (last_stochrsi_k_4h < 80.0))
-      and ((last_rsi_3_1d > 35.0) or (last_stochrsi_k_15m < 90.0))
-      and ((last_rsi_3_1d > 35.0) or (last_stochrsi_k_1h < 90.0))
-      and ((last_rsi_3_1d > 35.0) or (last_stochrsi_k_4h < 80.0))
-      and ((last_rsi_14_1h < 70.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_aroonu_14_15m < 90.0) or (last_aroonu_14_1h < 100.0) or (last_stochrsi_k_1h < 80.0))
-      and ((last_aroonu_14_15m < 100.0) or (last_aroonu_14_1h < 100.0))
-      and ((last_aroonu_14_15m < 100.0) or (last_aroonu_14_4h < 100.0))
-      and ((last_aroonu_14_15m < 100.0) or (last_stochrsi_k_1h < 90.0))
-      and ((last_aroonu_14_15m < 100.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_aroonu_14_15m < 100.0) or (last_stochrsi_k_1d < 80.0))
-      and ((last_aroonu_14_1h < 100.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_aroonu_14_1h < 100.0) or (last_stochrsi_k_1d < 90.0))
-      and ((last_aroonu_14_4h < 80.0) or (last_aroonu_14_1d < 100.0) or (last_roc_9_1d < 20.0))
-      and ((last_aroonu_14_4h < 90.0) or (last_roc_9_1d < 30.0))
-      and ((last_aroonu_14_4h < 100.0) or (last_aroonu_14_1d < 100.0))
-      and ((last_aroonu_14_4h < 100.0) or (last_stochrsi_k_1h < 90.0))
-      and ((last_aroonu_14_4h < 100.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_aroonu_14_1d < 100.0) or (last_stochrsi_k_15m < 90.0))
-      and ((last_aroonu_14_1d < 100.0) or (last_stochrsi_k_1h < 90.0))
-      and ((last_aroonu_14_1d < 100.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_aroonu_14_1d < 100.0) or (last_roc_9_4h < 15.0) or (last_roc_9_1d < 50.0))
-      # do not buy an overbought top on the bounce
-      and ((last_stochrsi_k < 90.0) or (last_rsi_14 < 70.0))
-      and ((last_stochrsi_k_15m < 90.0) or (last_stochrsi_k_1h < 90.0))
-      and ((last_stochrsi_k_15m < 90.0) or (last_stochrsi_k_1d < 90.0))
-      and ((last_stochrsi_k_1h < 80.0) or (last_stochrsi_k_1d < 90.0))
-      and ((last_stochrsi_k_1h < 80.0) or (last_roc_9_1d > -20.0))
-      and ((last_stochrsi_k_1h < 90.0) or (last_roc_9_4h < 15.0))
-      and ((last_stochrsi_k_4h < 90.0) or (last_roc_9_4h < 15.0))
-      and ((last_stochrsi_k_4h < 90.0) or (last_roc_9_1d > -15.0))
-      and ((last_stochrsi_k_1d < 90.0) or (last_roc_9_4h < 20.0))
-    ):
-      self._grind_entry_tag = "g24"
-      return True
-    if (
-      (last_rsi_3 > 15.0)
-      and (last_rsi_3_15m > 15.0)
-      and (last_rsi_14 > 40.0)
-      and (last_rsi_14_1h > 40.0)
-      # the coil signature: 1h momentum negative-to-flat under a flat price
-      and (last_roc_9_1h > -15.0)
-      and (last_roc_9_1h < 2.0)
-      and (last_close > (last_ema_20 * 0.98))
-      and (last_close < (last_ema_20 * 1.02))
-      # squeeze integrity: regime still broken, 4h reclaim HELD, not dripping to new lows
-      and (last_close < last_ema_200_4h)
-      and (last_close > (last_low_min_12_4h * 1.10))
-      and (last_close > (last_close_min_12 * 1.005))
-      # general protections first
-      and ((last_rsi_3_15m > 20.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_rsi_3_1h > 15.0) or (last_aroonu_14_4h < 70.0))
-      and ((last_rsi_3_1h > 20.0) or (last_stochrsi_k_1h < 80.0))
-      and ((last_rsi_3_1h > 20.0) or (last_stochrsi_k_4h < 80.0))
-      and ((last_rsi_3_1h > 25.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_rsi_3_1h > 35.0) or (last_aroonu_14_1h < 70.0))
-      and ((last_rsi_3_1h > 45.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_rsi_3_4h > 35.0) or (last_stochrsi_k_4h < 70.0))
-      and ((last_rsi_3_4h > 40.0) or (last_aroonu_14_4h < 70.0))
-      and ((last_rsi_3_4h > 65.0) or (last_aroonu_14_1h < 70.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_rsi_3_4h > 65.0) or (last_aroonu_14_4h < 80.0) or (last_stochrsi_k_4h < 70.0))
-      and ((last_rsi_3_1d > 10.0) or (last_aroonu_14_1h < 90.0))
-      and ((last_rsi_3_1d > 10.0) or (last_aroonu_14_1h < 90.0))
-      and ((last_rsi_3_1d > 10.0) or (last_stochrsi_k_1h < 80.0))
-      and ((last_rsi_3_1d > 10.0) or (last_stochrsi_k_4h < 70.0))
-      and ((last_rsi_3_1d > 20.0) or (last_aroonu_14_1d < 90.0))
-      and ((last_rsi_3_1d > 30.0) or (last_aroonu_14_15m < 100.0))
-      and ((last_rsi_3_1d > 30.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_aroonu_14_15m < 80.0) or (last_stochrsi_k_15m < 70.0))
-      and ((last_aroonu_14_15m < 80.0) or (last_aroonu_14_1h < 100.0))
-      and ((last_aroonu_14_15m < 100.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_aroonu_14_1h < 100.0) or (last_aroonu_14_1d < 100.0))
-      and ((last_aroonu_14_4h < 70.0) or (last_roc_9_1d < 50.0))
-      and ((last_aroonu_14_4h < 90.0) or (last_stochrsi_k_4h < 90.0))
-      and ((last_aroonu_14_4h < 90.0) or (last_roc_9_4h < 10.0))
-      and ((last_stochrsi_k_1h < 70.0) or (last_stochrsi_k_4h < 80.0))
-      and ((last_stochrsi_k_1h < 90.0) or (last_roc_9_4h > -20.0))
-      and ((last_roc_9_1d > -40.0) or (last_aroonu_14_1h < 90.0))
-      and ((last_roc_9_1d > -40.0) or (last_stochrsi_k_1h < 80.0))
-      and ((last_roc_9_1d > -25.0) or (last_stochrsi_k_15m < 90.0))
-      and ((last_roc_9_1d > -25.0) or (last_aroonu_14_4h < 80.0))
-      and ((last_roc_9_1d > -15.0) or (last_stochrsi_k_4h < 80.0))
-    ):
-      self._grind_entry_tag = "g27"
-      return True
-
-    self._grind_entry_tag = ""
-    return False
+    return [
+      # g1 — AROONU dip + EMA_16 drop
+      (
+        (last_rsi_3 > 10.0)
+        & (last_rsi_3_15m > 15.0)
+        & (last_rsi_3_1h > 15.0)
+        & (last_rsi_3_4h > 15.0)
+        & (last_rsi_14 < 45.0)
+        & (last_aroonu_14 < 25.0)
+        & (last_aroonu_14_4h < 100.0)
+        & (last_roc_9_1h < 20.0)
+        & (last_close > (last_close_max_48 * 0.90))
+        & (last_close < (last_low_min_24_4h * 1.60))
+        & (last_close < (last_ema_16 * 0.975))
+        & ((last_rsi_3_1h > 35.0) | (last_aroonu_14_1h < 100.0))
+        & ((last_aroonu_14_1h < 100.0) | (last_aroonu_14_1d < 100.0))
+        & ((last_aroonu_14_1d < 100.0) | (last_stochrsi_k_1h < 90.0))
+      ),
+      # g2 — EMA_26 > EMA_12 divergence + BBL
+      (
+        (last_rsi_3 > 5.0)
+        & (last_rsi_3_15m > 10.0)
+        & (last_rsi_3_1h > 15.0)
+        & (last_rsi_3_4h > 15.0)
+        & (last_rsi_14 < 30.0)
+        & (last_stochrsi_k < 30.0)
+        & (last_ema_26 > last_ema_12)
+        & ((last_ema_26 - last_ema_12) > (last_open * 0.020))
+        & ((prev_ema_26 - prev_ema_12) > (last_open / 100.0))
+        & (last_close < (last_bbl_20 * 1.010))
+      ),
+      # g3 — AROONU_15m dip + EMA_12 drop
+      (
+        (last_rsi_3 > 10.0)
+        & (last_rsi_3_15m > 10.0)
+        & (last_rsi_3_1h > 10.0)
+        & (last_rsi_3_4h > 15.0)
+        & (last_rsi_14 < 35.0)
+        & (last_aroonu_14_15m < 25.0)
+        & (last_stochrsi_k_15m < 70.0)
+        & (last_stochrsi_k_1h < 90.0)
+        & (last_roc_9_1h > -15.0)
+        & (last_roc_9_4h > -15.0)
+        & (last_close > (last_close_max_48 * 0.85))
+        & (last_close < (last_ema_12 * 0.980))
+        & ((last_rsi_3_1h > 20.0) | (last_rsi_3_1d > 20.0))
+        & ((last_rsi_3_1h > 20.0) | (last_stochrsi_k_1d < 70.0))
+        & ((last_rsi_3_1h > 25.0) | (last_stochrsi_k_1h < 70.0))
+        & ((last_rsi_3_4h > 30.0) | (last_stochrsi_k_4h < 60.0))
+      ),
+      # g4 — multi-TF RSI + EMA_26 + BBL
+      (
+        (last_rsi_3 > 10.0)
+        & (last_rsi_3_15m > 10.0)
+        & (last_rsi_3_1h > 10.0)
+        & (last_rsi_3_4h > 10.0)
+        & (last_rsi_3_1d > 10.0)
+        & (last_rsi_14 < 35.0)
+        & (last_aroonu_14 < 25.0)
+        & (last_roc_9_1h > -20.0)
+        & (last_roc_9_4h > -20.0)
+        # & (last_close > (last_close_max_48 * 0.90))
+        & (last_close < (last_ema_26 * 0.970))
+        & (last_close < (last_bbl_20 * 0.999))
+      ),
+      # g5 — deep dip + EMA_9/20
+      (
+        (last_rsi_3 > 10.0)
+        & (last_rsi_3_15m > 10.0)
+        & (last_rsi_3_1h > 15.0)
+        & (last_rsi_3_4h > 15.0)
+        & (last_rsi_14 < 35.0)
+        & (last_aroonu_14 < 30.0)
+        & (last_roc_9_4h > -20.0)
+        & (last_close > (last_high_max_24_1h * 0.80))
+        & (last_close < (last_low_min_12_4h * 1.50))
+        & (last_close < (last_ema_9 * 0.975))
+        & (last_close < (last_ema_20 * 0.970))
+      ),
+      # g6 — RSI_20 falling + SMA_16 drop
+      (
+        (last_rsi_3 > 5.0)
+        & (last_rsi_3 < 40.0)
+        & (last_rsi_3_15m > 15.0)
+        & (last_rsi_14 > 35.0)
+        & (last_roc_9_1h > -20.0)
+        & (last_roc_9_4h > -20.0)
+        & (last_aroonu_14 < 25.0)
+        & (last_close < (last_low_min_12_4h * 1.60))
+        & (last_rsi_20 < prev_rsi_20)
+        & (last_close < (last_sma_16 * 0.960))
+        & ((last_aroonu_14_1d < 100.0) | (last_roc_9_1d < 50.0))
+      ),
+      # g7 — WILLR deep + BBB wide
+      (
+        (last_rsi_3 > 5.0)
+        & (last_rsi_3_15m > 20.0)
+        & (last_rsi_3_1h > 20.0)
+        & (last_rsi_3_4h > 20.0)
+        & (last_willr_14 < -50.0)
+        & (last_willr_84_1h < -70.0)
+        & (last_stochrsi_k < 30.0)
+        & (last_stochrsi_k_1h < 90.0)
+        & (last_roc_9_1h > -10.0)
+        & (last_roc_9_1h < 20.0)
+        & (last_roc_9_4h > -10.0)
+        & (last_close < (last_low_min_24_4h * 1.50))
+        & (last_bbands_20_1h > 12.0)
+        & (last_close_max_48 >= (last_close * 1.10))
+      ),
+      # g8 — EMA_26/12 gap wide + low_min_24_1h
+      (
+        (last_rsi_3 < 30.0)
+        & (last_rsi_3 > 5.0)
+        & (last_rsi_3_15m > 10.0)
+        & (last_rsi_3_1h > 10.0)
+        & (last_rsi_3_4h > 10.0)
+        & (last_roc_9_1h > -10.0)
+        & (last_roc_9_4h > -25.0)
+        # & (last_close < (last_candle["low_min_24_1h"] * 1.30))
+        & (last_ema_26 > last_ema_12)
+        & ((last_ema_26 - last_ema_12) > (last_open * 0.030))
+        & ((prev_ema_26 - prev_ema_12) > (last_open / 100.0))
+      ),
+      # g9 — pullback recovery
+      (
+        (last_rsi_3 > 5.0)
+        & (last_rsi_3_15m > 15.0)
+        & (last_rsi_3_1h > 20.0)
+        & (last_rsi_3_4h > 20.0)
+        & (last_stochrsi_k < 50.0)
+        & (last_close < (last_close_max_48 * 0.90))
+        & (last_close > (last_close_min_12 * 1.03))
+      ),
+      # g10 — RSI_14 divergence vs 1h
+      (
+        (last_rsi_3 > 5.0)
+        & (last_rsi_3_15m > 20.0)
+        & (last_stochrsi_k < 20.0)
+        & (last_rsi_14 < (last_rsi_14_1h - 45.0))
+      ),
+      # g11 — multi-TF RSI + SMA_30 + BBL
+      (
+        (last_rsi_3 > 5.0)
+        & (last_rsi_3_15m > 10.0)
+        & (last_rsi_3_1h > 10.0)
+        & (last_cmf_20 > 0.0)
+        & (last_close < (last_sma_30 * 0.965))
+        & (last_close < (last_bbl_20 * 1.000))
+      ),
+      # g12 — EMA_26/12 divergence + close_max_48
+      (
+        (last_rsi_3 > 5.0)
+        & (last_rsi_3_15m > 10.0)
+        & (last_rsi_3_1h > 10.0)
+        & (last_stochrsi_k < 30.0)
+        & (last_close > (last_close_max_48 * 0.90))
+        & (last_close < (last_low_min_12_4h * 1.60))
+        & (last_ema_26 > last_ema_12)
+        & ((last_ema_26 - last_ema_12) > (last_open * 0.025))
+        & ((prev_ema_26 - prev_ema_12) > (last_open / 100.0))
+      ),
+      # g13 — SMA_9 cross SMA_21 + EMA_100 drop
+      (
+        (last_rsi_3 > 5.0)
+        & (last_rsi_3_1h > 20.0)
+        & (last_rsi_14_1h > 40.0)
+        & (last_stochrsi_k_15m < 80.0)
+        & (last_roc_9_1h > -15.0)
+        & (last_roc_9_4h > -15.0)
+        & (prev_sma_9 < prev_sma_21)
+        & (last_sma_9 > last_sma_21)
+        & (last_close < (last_ema_100 * 0.975))
+        & ((last_rsi_3_4h > 40.0) | (last_roc_9_4h < 30.0))
+      ),
+      # g14 — SMA_9 cross SMA_21 + 4h uptrend (trend follower)
+      (
+        (last_rsi_3 > 5.0)
+        & (last_aroonu_14_15m < 50.0)
+        & (last_stochrsi_k < 40.0)
+        & (last_stochrsi_k_15m < 70.0)
+        & (prev_sma_9 < prev_sma_21)
+        & (last_sma_9 > last_sma_21)
+        & (last_ema_12_4h > last_ema_200_4h)
+        & (last_close > (last_close_max_48 * 0.90))
+        & ((last_rsi_3_1h > 30.0) | (last_stochrsi_k_1h < 70.0))
+        & ((last_rsi_3_1h > 40.0) | (last_aroonu_14_1h < 80.0))
+        & ((last_rsi_3_1d > 25.0) | (last_stochrsi_k_1h < 80.0))
+        & ((last_stochrsi_k_1h < 80.0) | (last_stochrsi_k_1d < 90.0))
+      ),
+      # g15 — deep loss recovery (slice_profit < -0.16)
+      (
+        (last_rsi_3 > 5.0)
+        & (last_rsi_3_15m > 10.0)
+        & (last_rsi_14 < 40.0)
+        & (last_aroonu_14 < 25.0)
+        & (last_aroonu_14_15m < 30.0)
+        & (last_stochrsi_k < 30.0)
+        & (last_stochrsi_k_15m < 30.0)
+        & ((last_rsi_3_1h > 30.0) | (last_stochrsi_k_1h < 80.0))
+        & ((last_rsi_3_4h > 30.0) | (last_stochrsi_k_4h < 80.0))
+        & ((last_rsi_3_1d > 30.0) | (last_stochrsi_k_1d < 80.0))
+      ),
+      # g16 — EMA_12 drop + BBL
+      (
+        (last_rsi_3 > 8.0)
+        & (last_rsi_3_15m > 15.0)
+        & (last_rsi_3_1h > 15.0)
+        & (last_rsi_3_4h > 15.0)
+        & (last_rsi_14 < 35.0)
+        & (last_close < (last_ema_12 * 0.965))
+        & (last_close < (last_bbl_20 * 0.999))
+      ),
+      # g17 — StochRSI + EMA_20 drop
+      (
+        (last_rsi_3 > 15.0)
+        & (last_rsi_3_15m > 15.0)
+        & (last_rsi_3_1h > 15.0)
+        & (last_rsi_3_4h > 15.0)
+        & (last_rsi_14 < 30.0)
+        & (last_stochrsi_k < 30.0)
+        & (last_close < (last_ema_20 * 0.975))
+        & ((last_aroonu_14_4h < 100.0) | (last_aroonu_14_1d < 100.0))
+      ),
+      # g18 — moderate loss recovery (slice_profit < -0.10)
+      (
+        (last_rsi_3 > 5.0)
+        & (last_rsi_3_15m > 15.0)
+        & (last_rsi_3_1h > 20.0)
+        & (last_rsi_3_4h > 20.0)
+        & (last_rsi_14 < 40.0)
+        & (last_close < (last_ema_26 * 0.970))
+        & (last_close < (last_bbl_20 * 0.999))
+      ),
+      # g19 — EMA_26/12 wide gap (slice_profit < -0.06)
+      (
+        (last_rsi_3 < 30.0)
+        & (last_rsi_3 > 5.0)
+        & (last_rsi_3_15m > 10.0)
+        & (last_ema_26 > last_ema_12)
+        & ((last_ema_26 - last_ema_12) > (last_open * 0.035))
+        & ((prev_ema_26 - prev_ema_12) > (last_open / 100.0))
+      ),
+      # AROONU 4h uptrend pullback recovery
+      (
+        (last_rsi_3 > 10.0)
+        & (last_rsi_3_15m > 15.0)
+        & (last_rsi_3_1h > 20.0)
+        & (last_rsi_14 < 42.0)
+        & (last_rsi_14_4h > 50.0)
+        & (last_aroonu_14 < 30.0)
+        & (last_aroonu_14_4h > 50.0)
+        & (last_roc_9_1d > -15.0)
+        & (last_ema_50_4h > last_ema_100_4h)
+        & (last_close < (last_close_max_48 * 0.95))
+        & ((last_rsi_3_15m > 20.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_rsi_3_1h > 30.0) | (last_roc_9_4h < 30.0) | (last_roc_9_1d < 30.0))
+        & ((last_rsi_3_1h > 50.0) | (last_roc_9_1d < 60.0))
+        & ((last_rsi_3_4h > 40.0) | (last_aroonu_14_4h < 90.0))
+        & ((last_rsi_3_4h > 45.0) | (last_aroonu_14_4h < 100.0))
+        & ((last_rsi_3_4h > 60.0) | (last_roc_9_4h < 40.0))
+        & ((last_aroonu_14_4h < 100.0) | (last_stochrsi_k_1d < 80.0))
+        & ((last_aroonu_14_4h < 100.0) | (last_aroonu_14_1d < 100.0))
+        & ((last_stochrsi_k_4h < 90.0) | (last_roc_9_4h < 30.0))
+      ),
+      (
+        (last_rsi_3 > 10.0)
+        & (last_rsi_3_15m > 15.0)
+        & (last_rsi_14 < 35.0)
+        & (last_aroonu_14_15m < 50.0)
+        & (last_close < (last_ema_20 * 0.955))
+      ),
+      # g22 — early recovery rebuild: reclaiming off the low BEFORE the 4h trend confirms (g14 needs
+      #        EMA_12_4h > EMA_200_4h and fires too late for a deep-derisk bounce). Anti-fake-rise gating via
+      #        multi-TF RSI recovery + reclaim off the 4h low + not-extended. NOTE: slice_profit_entry gate
+      #        removed — it self-defeats in recovery (last grind buy is in profit); underwater-scope TBD.
+      (
+        (last_rsi_3 > 30.0)
+        & (last_rsi_3_15m > 30.0)
+        & (last_rsi_14 > 45.0)
+        & (last_rsi_14_1h > 45.0)
+        & (last_roc_9_1h > 0.0)
+        & (last_roc_9_4h > -10.0)
+        # anti-parabolic: even at a formed bottom, a parabolic 4h overshoot reverses (dead-cat).
+        # cross-coin (SFP/CELR/DYDX/APE): cuts 17 severe at ~1% good cost within recovery-starts.
+        & (last_roc_9_4h < 25.0)
+        # recovery-started gate: only rebuild once the 4h bottom is IN (not still making new lows).
+        # g22's job is the recovery rebuild — NOT entering mid-dump (that's g1..g21). AROOND high =
+        # a fresh 4h low was just made = still dumping; require it low = bottom formed = recovery start.
+        & (last_aroonu_14_4h < 50.0)
+        # aggressive risk-free: g22 fires ONLY deep below the 4h 200-EMA (fresh recovery zone). The
+        # near/above-EMA overextended-bounce zone is where dead-cats live AND where g22's late-recovery
+        # adds sit — we sacrifice those wins on purpose, because g23 (extended-continuation, ~0.2% severe)
+        # backstops the real recoveries above. So g22 stays clean, g23 captures the continuation.
+        & (last_close < last_ema_200_4h)
+        & (last_close > (last_low_min_12_4h * 1.10))
+        & (last_close > (last_ema_20 * 0.97))
+        & (last_close < (last_ema_20 * 1.02))
+        & ((last_rsi_3_1h > 30.0) | (last_stochrsi_k_1d < 80.0))
+        & ((last_rsi_3_1h > 35.0) | (last_aroonu_14_1d < 100.0))
+        & ((last_rsi_3_4h > 50.0) | (last_aroonu_14_1h < 100.0))
+        & ((last_rsi_3_1d > 10.0) | (last_aroonu_14_1d < 70.0))
+        & ((last_rsi_3_1d > 10.0) | (last_stochrsi_k_4h < 70.0))
+        & ((last_rsi_3_1d > 40.0) | (last_stochrsi_k_1h < 80.0))
+        & ((last_rsi_3_1d > 40.0) | (last_stochrsi_k_4h < 80.0))
+        & ((last_rsi_3_1d > 45.0) | (last_aroonu_14_1h < 100.0))
+        & ((last_rsi_3_1d > 45.0) | (last_aroonu_14_4h < 100.0))
+        & ((last_rsi_3_1d > 45.0) | (last_stochrsi_k_1h < 90.0))
+        & ((last_rsi_3_1d > 45.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_rsi_3_1d > 65.0) | (last_aroonu_14_1h < 70.0) | (last_aroonu_14_1d < 90.0))
+        & ((last_aroonu_14_15m < 80.0) | (last_stochrsi_k_15m < 80.0))
+        & ((last_aroonu_14_15m < 80.0) | (last_aroonu_14_1h < 100.0))
+        & ((last_aroonu_14_15m < 100.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_roc_9_1d > -20.0) | (last_aroonu_14_4h < 100.0))
+        & ((last_roc_9_1d > -20.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_roc_9_1d > -30.0) | (last_stochrsi_k_1h < 90.0))
+      ),
+      # g23 — pump-continuation scalp: extended zone ABOVE g22's EMA_20*1.02 cap. Only rides a CONFIRMED
+      # continuation (price already advancing past the reclaim), so dead-cats (which roll over before
+      # reaching the extended zone) are structurally avoided. Complements g22: g22 = early recovery-start
+      # (ambiguous zone, dead-cat risk trimmed by P1), g23 = confirmed continuation (clean, ~0.2% severe).
+      (
+        (last_rsi_3 > 30.0)
+        & (last_rsi_3_15m > 30.0)
+        & (last_rsi_14 > 50.0)
+        & (last_rsi_14_1h > 50.0)
+        & (last_roc_9_1h > 0.0)
+        & (last_roc_9_4h > 0.0)
+        # anti-parabolic blow-off + anti-exhaustion top
+        & (last_roc_9_4h < 25.0)
+        & ((last_stochrsi_k < 97.0) | (last_rsi_14 < 80.0))
+        & (last_close > (last_low_min_12_4h * 1.10))
+        # extended zone: above g22's 1.02*EMA cap = continuation confirmed, not a reclaim
+        & (last_close >= (last_ema_20 * 1.02))
+        & (last_close < (last_ema_20 * 1.12))
+        & ((last_rsi_3_1h > 45.0) | (last_aroonu_14_4h < 80.0))
+        & ((last_rsi_3_4h > 40.0) | (last_stochrsi_k_15m < 90.0))
+        & ((last_rsi_3_4h > 50.0) | (last_aroonu_14_4h < 70.0))
+        & ((last_rsi_3_1d > 15.0) | (last_stochrsi_k_1h < 80.0))
+        & ((last_rsi_3_1d > 30.0) | (last_aroonu_14_1h < 100.0))
+        & ((last_rsi_3_1d > 30.0) | (last_aroonu_14_4h < 100.0))
+        & ((last_rsi_3_1d > 50.0) | (last_stochrsi_k_1h < 80.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_rsi_3_1d > 55.0) | (last_aroonu_14_15m < 100.0) | (last_stochrsi_k_15m < 90.0))
+        & ((last_aroonu_14_15m < 100.0) | (last_aroonu_14_1h < 100.0))
+        & ((last_aroonu_14_15m < 100.0) | (last_aroonu_14_4h < 100.0))
+        & ((last_aroonu_14_15m < 100.0) | (last_aroonu_14_1d < 100.0))
+        & ((last_aroonu_14_15m < 100.0) | (last_stochrsi_k_15m < 90.0) | (last_stochrsi_k_1d < 80.0))
+        & ((last_aroonu_14_15m < 100.0) | (last_stochrsi_k_1h < 80.0))
+        & ((last_aroonu_14_15m < 100.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_aroonu_14_1h < 100.0) | (last_aroonu_14_4h < 100.0))
+        & ((last_aroonu_14_4h < 70.0) | (last_roc_9_1d < 50.0))
+        & ((last_aroonu_14_4h < 100.0) | (last_stochrsi_k_1h < 90.0))
+        & ((last_aroonu_14_4h < 100.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_aroonu_14_1d < 100.0) | (last_stochrsi_k_15m < 90.0))
+        & ((last_stochrsi_k_15m < 80.0) | (last_stochrsi_k_1h < 90.0))
+        & ((last_stochrsi_k_15m < 90.0) | (last_aroonu_14_1h < 100.0))
+        & ((last_stochrsi_k_15m < 90.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_stochrsi_k_1h < 90.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_stochrsi_k_1h < 90.0) | (last_stochrsi_k_4h < 90.0))
+      ),
+      # g24 — trend-pullback continuation add: the zone ABOVE the 4h 200-EMA that g22 explicitly sacrifices.
+      (
+        (last_rsi_3 > 20.0)
+        & (last_rsi_3_15m > 20.0)
+        & (last_rsi_14 > 40.0)
+        # trend intact + this is a PULLBACK not a reversal: 4h still rising, 1h not in freefall
+        & (last_roc_9_1h > -10.0)
+        & (last_roc_9_4h > 0.0)
+        & (last_roc_9_4h < 25.0)  # anti-parabolic blow-off top
+        # bull scope-gate: confirmed 4h uptrend + price above the 200-EMA regime (complements g22's <200EMA)
+        & (last_ema_12_4h > last_ema_200_4h)
+        & (last_close > last_ema_200_4h)
+        # shallow pullback to the short EMA — buy the dip WITHIN the trend, never the top nor a deep dump
+        & (last_close < (last_ema_20 * 1.01))
+        & (last_close > (last_ema_20 * 0.94))
+        & ((last_rsi_3_15m > 40.0) | (last_stochrsi_k_15m < 70.0))
+        & ((last_rsi_3_1h > 15.0) | (last_aroonu_14_4h < 70.0))
+        & ((last_rsi_3_1h > 25.0) | (last_rsi_3_1d > 45.0) | (last_aroonu_14_1d < 70.0))
+        & ((last_rsi_3_1h > 25.0) | (last_aroonu_14_1h < 80.0))
+        & ((last_rsi_3_1h > 30.0) | (last_stochrsi_k_1d < 90.0) | (last_roc_9_1d < 10.0))
+        & ((last_rsi_3_1h > 35.0) | (last_stochrsi_k_1d < 90.0) | (last_roc_9_1d < 20.0))
+        & ((last_rsi_3_1h > 40.0) | (last_aroonu_14_4h < 100.0))
+        & ((last_rsi_3_1h > 40.0) | (last_stochrsi_k_1d < 80.0) | (last_roc_9_1d < 50.0))
+        & ((last_rsi_3_1h > 35.0) | (last_rsi_3_4h > 50.0) | (last_stochrsi_k_4h < 80.0))
+        & ((last_rsi_3_1h > 40.0) | (last_rsi_3_4h > 55.0) | (last_aroonu_14_4h < 90.0))
+        & ((last_rsi_3_1h > 60.0) | (last_stochrsi_k_1h < 60.0) | (last_stochrsi_k_1d < 90.0))
+        & ((last_rsi_3_1h > 65.0) | (last_aroonu_14_1h < 70.0) | (last_aroonu_14_1d < 90.0))
+        & ((last_rsi_3_4h > 25.0) | (last_roc_9_1d < 30.0))
+        & ((last_rsi_3_4h > 45.0) | (last_aroonu_14_4h < 70.0))
+        & ((last_rsi_3_4h > 50.0) | (last_stochrsi_k_4h < 80.0))
+        & ((last_rsi_3_1d > 35.0) | (last_stochrsi_k_15m < 90.0))
+        & ((last_rsi_3_1d > 35.0) | (last_stochrsi_k_1h < 90.0))
+        & ((last_rsi_3_1d > 35.0) | (last_stochrsi_k_4h < 80.0))
+        & ((last_rsi_14_1h < 70.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_aroonu_14_15m < 90.0) | (last_aroonu_14_1h < 100.0) | (last_stochrsi_k_1h < 80.0))
+        & ((last_aroonu_14_15m < 100.0) | (last_aroonu_14_1h < 100.0))
+        & ((last_aroonu_14_15m < 100.0) | (last_aroonu_14_4h < 100.0))
+        & ((last_aroonu_14_15m < 100.0) | (last_stochrsi_k_1h < 90.0))
+        & ((last_aroonu_14_15m < 100.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_aroonu_14_15m < 100.0) | (last_stochrsi_k_1d < 80.0))
+        & ((last_aroonu_14_1h < 100.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_aroonu_14_1h < 100.0) | (last_stochrsi_k_1d < 90.0))
+        & ((last_aroonu_14_4h < 80.0) | (last_aroonu_14_1d < 100.0) | (last_roc_9_1d < 20.0))
+        & ((last_aroonu_14_4h < 90.0) | (last_roc_9_1d < 30.0))
+        & ((last_aroonu_14_4h < 100.0) | (last_aroonu_14_1d < 100.0))
+        & ((last_aroonu_14_4h < 100.0) | (last_stochrsi_k_1h < 90.0))
+        & ((last_aroonu_14_4h < 100.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_aroonu_14_1d < 100.0) | (last_stochrsi_k_15m < 90.0))
+        & ((last_aroonu_14_1d < 100.0) | (last_stochrsi_k_1h < 90.0))
+        & ((last_aroonu_14_1d < 100.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_aroonu_14_1d < 100.0) | (last_roc_9_4h < 15.0) | (last_roc_9_1d < 50.0))
+        # do not buy an overbought top on the bounce
+        & ((last_stochrsi_k < 90.0) | (last_rsi_14 < 70.0))
+        & ((last_stochrsi_k_15m < 90.0) | (last_stochrsi_k_1h < 90.0))
+        & ((last_stochrsi_k_15m < 90.0) | (last_stochrsi_k_1d < 90.0))
+        & ((last_stochrsi_k_1h < 80.0) | (last_stochrsi_k_1d < 90.0))
+        & ((last_stochrsi_k_1h < 80.0) | (last_roc_9_1d > -20.0))
+        & ((last_stochrsi_k_1h < 90.0) | (last_roc_9_4h < 15.0))
+        & ((last_stochrsi_k_4h < 90.0) | (last_roc_9_4h < 15.0))
+        & ((last_stochrsi_k_4h < 90.0) | (last_roc_9_1d > -15.0))
+        & ((last_stochrsi_k_1d < 90.0) | (last_roc_9_4h < 20.0))
+      ),
+      (
+        (last_rsi_3 > 15.0)
+        & (last_rsi_3_15m > 15.0)
+        & (last_rsi_14 > 40.0)
+        & (last_rsi_14_1h > 40.0)
+        # the coil signature: 1h momentum negative-to-flat under a flat price
+        & (last_roc_9_1h > -15.0)
+        & (last_roc_9_1h < 2.0)
+        & (last_close > (last_ema_20 * 0.98))
+        & (last_close < (last_ema_20 * 1.02))
+        # squeeze integrity: regime still broken, 4h reclaim HELD, not dripping to new lows
+        & (last_close < last_ema_200_4h)
+        & (last_close > (last_low_min_12_4h * 1.10))
+        & (last_close > (last_close_min_12 * 1.005))
+        # general protections first
+        & ((last_rsi_3_15m > 20.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_rsi_3_1h > 15.0) | (last_aroonu_14_4h < 70.0))
+        & ((last_rsi_3_1h > 20.0) | (last_stochrsi_k_1h < 80.0))
+        & ((last_rsi_3_1h > 20.0) | (last_stochrsi_k_4h < 80.0))
+        & ((last_rsi_3_1h > 25.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_rsi_3_1h > 35.0) | (last_aroonu_14_1h < 70.0))
+        & ((last_rsi_3_1h > 45.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_rsi_3_4h > 35.0) | (last_stochrsi_k_4h < 70.0))
+        & ((last_rsi_3_4h > 40.0) | (last_aroonu_14_4h < 70.0))
+        & ((last_rsi_3_4h > 65.0) | (last_aroonu_14_1h < 70.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_rsi_3_4h > 65.0) | (last_aroonu_14_4h < 80.0) | (last_stochrsi_k_4h < 70.0))
+        & ((last_rsi_3_1d > 10.0) | (last_aroonu_14_1h < 90.0))
+        & ((last_rsi_3_1d > 10.0) | (last_aroonu_14_1h < 90.0))
+        & ((last_rsi_3_1d > 10.0) | (last_stochrsi_k_1h < 80.0))
+        & ((last_rsi_3_1d > 10.0) | (last_stochrsi_k_4h < 70.0))
+        & ((last_rsi_3_1d > 20.0) | (last_aroonu_14_1d < 90.0))
+        & ((last_rsi_3_1d > 30.0) | (last_aroonu_14_15m < 100.0))
+        & ((last_rsi_3_1d > 30.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_aroonu_14_15m < 80.0) | (last_stochrsi_k_15m < 70.0))
+        & ((last_aroonu_14_15m < 80.0) | (last_aroonu_14_1h < 100.0))
+        & ((last_aroonu_14_15m < 100.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_aroonu_14_1h < 100.0) | (last_aroonu_14_1d < 100.0))
+        & ((last_aroonu_14_4h < 70.0) | (last_roc_9_1d < 50.0))
+        & ((last_aroonu_14_4h < 90.0) | (last_stochrsi_k_4h < 90.0))
+        & ((last_aroonu_14_4h < 90.0) | (last_roc_9_4h < 10.0))
+        & ((last_stochrsi_k_1h < 70.0) | (last_stochrsi_k_4h < 80.0))
+        & ((last_stochrsi_k_1h < 90.0) | (last_roc_9_4h > -20.0))
+        & ((last_roc_9_1d > -40.0) | (last_aroonu_14_1h < 90.0))
+        & ((last_roc_9_1d > -40.0) | (last_stochrsi_k_1h < 80.0))
+        & ((last_roc_9_1d > -25.0) | (last_stochrsi_k_15m < 90.0))
+        & ((last_roc_9_1d > -25.0) | (last_aroonu_14_4h < 80.0))
+        & ((last_roc_9_1d > -15.0) | (last_stochrsi_k_4h < 80.0))
+      ),
+    ]
 
   def long_buyback_entry_v3(
     self, last_candle: Series, previous_candle: Series, slice_profit: float, is_derisk: bool
@@ -50014,20 +50124,18 @@ class NostalgiaForInfinityX7(IStrategy):
         exit_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
       ft_exit_amount = exit_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if exit_amount > min_stake and ft_exit_amount > min_stake:
-        self.dp.send_msg(
-          self.notification_msg(
-            "grinding-exit",
-            tag=name,
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=exit_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit_stake,
-            grind_profit_pct=grind_profit_rate,
-            coin_amount=grind_total_amount,
-          )
+        self.notify(
+          "grinding-exit",
+          tag=name,
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=exit_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit_stake,
+          grind_profit_pct=grind_profit_rate,
+          coin_amount=grind_total_amount,
         )
         log.info(
           f"Grinding exit ({name}) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {exit_amount:{stake_fmt}} | Coin amount: {grind_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit_rate * 100.0):.2f}% ({grind_profit_stake:{stake_fmt}} {stake_currency})"
@@ -50057,8 +50165,7 @@ class NostalgiaForInfinityX7(IStrategy):
     **kwargs,
   ):
     dp = self.dp
-    send_msg = self.dp.send_msg
-    notification_msg = self.notification_msg
+    notify = self.notify
     scale_stakes_for_min_stake = self.scale_stakes_for_min_stake
     stake_currency = self.config["stake_currency"]
     trade_pair = trade.pair
@@ -50081,11 +50188,10 @@ class NostalgiaForInfinityX7(IStrategy):
     trade_leverage = trade.leverage
 
     min_stake = self.correct_min_stake(min_stake, trade_leverage)
-    df, _ = dp.get_analyzed_dataframe(trade_pair, self.timeframe)
-    if len(df) < 2:
+    candles = self.analyzed_candles(trade_pair)
+    if len(candles) < 2:
       return None
-    last_candle = df.iloc[-1]
-    previous_candle = df.iloc[-2]
+    last_candle, previous_candle = candles
 
     exit_rate = current_rate
     filled_orders, filled_entries, filled_exits, profit_values = self.profit_or_order_snapshot(
@@ -50116,8 +50222,12 @@ class NostalgiaForInfinityX7(IStrategy):
             if ticker["bid"] is not None:
               exit_rate = ticker["bid"]
 
-    if profit_values is None:
+    # The snapshot is at current_rate, the live ticker can give another rate
+    if profit_values is None or exit_rate != current_rate:
       profit_values = self.calc_total_profit(trade, filled_entries, filled_exits, exit_rate)
+      self.cache_profit_snapshot(
+        trade, current_time, exit_rate, filled_orders, filled_entries, filled_exits, profit_values
+      )
     profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = profit_values
 
     slice_amount = first_filled_entry.safe_filled * first_filled_entry.safe_price
@@ -50688,13 +50798,21 @@ class NostalgiaForInfinityX7(IStrategy):
         sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
-        send_msg(
-          f"Exit (remaining) [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {order.safe_remaining} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
-        )
         order_tag = "p"
         if has_order_tags:
           if order.ft_order_tag is not None:
             order_tag = order.ft_order_tag
+        notify(
+          "partial-exit",
+          tag=order_tag,
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          coin_amount=order.safe_remaining,
+        )
         if has_order_tags:
           return -ft_sell_amount, order_tag
         else:
@@ -50732,20 +50850,18 @@ class NostalgiaForInfinityX7(IStrategy):
           if sell_amount > min_stake and ft_sell_amount > min_stake:
             grind_profit = (exit_rate - first_entry.safe_price) / first_entry.safe_price
             coin_amount = sell_amount / exit_rate
-            send_msg(
-              notification_msg(
-                "grinding-exit",
-                tag="gm0",
-                pair=trade_pair,
-                rate=exit_rate,
-                stake_amount=sell_amount,
-                profit_stake=profit_stake,
-                profit_ratio=profit_ratio,
-                stake_currency=stake_currency,
-                grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-                grind_profit_pct=grind_profit,
-                coin_amount=coin_amount,
-              )
+            notify(
+              "grinding-exit",
+              tag="gm0",
+              pair=trade_pair,
+              rate=exit_rate,
+              stake_amount=sell_amount,
+              profit_stake=profit_stake,
+              profit_ratio=profit_ratio,
+              stake_currency=stake_currency,
+              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+              grind_profit_pct=grind_profit,
+              coin_amount=coin_amount,
             )
             log.info(
               f"Grinding exit (gm0) [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {coin_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -50773,20 +50889,18 @@ class NostalgiaForInfinityX7(IStrategy):
           if sell_amount > min_stake and ft_sell_amount > min_stake:
             grind_profit = (exit_rate - first_entry.safe_price) / first_entry.safe_price
             coin_amount = sell_amount / exit_rate
-            send_msg(
-              notification_msg(
-                "grinding-derisk",
-                tag="gmd0",
-                pair=trade_pair,
-                rate=exit_rate,
-                stake_amount=sell_amount,
-                profit_stake=profit_stake,
-                profit_ratio=profit_ratio,
-                stake_currency=stake_currency,
-                grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-                grind_profit_pct=grind_profit,
-                coin_amount=coin_amount,
-              )
+            notify(
+              "grinding-derisk",
+              tag="gmd0",
+              pair=trade_pair,
+              rate=exit_rate,
+              stake_amount=sell_amount,
+              profit_stake=profit_stake,
+              profit_ratio=profit_ratio,
+              stake_currency=stake_currency,
+              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+              grind_profit_pct=grind_profit,
+              coin_amount=coin_amount,
             )
             log.info(
               f"Grinding de-risk (gmd0) [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {coin_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -50843,19 +50957,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_1_derisk_1_sub_grind_count > 0:
           grind_profit = (exit_rate - grind_1_derisk_1_current_open_rate) / grind_1_derisk_1_current_open_rate
           grind_profit_stake = grind_1_derisk_1_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="dl1",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_1_derisk_1_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="dl1",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_1_derisk_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (dl1) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_derisk_1_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -50875,20 +50987,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="dl1",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_1_derisk_1_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="dl1",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_1_derisk_1_total_amount,
           )
           log.info(
             f"Grinding exit (dl1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_1_derisk_1_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -50926,20 +51036,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_1_derisk_1_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="ddl1",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_1_derisk_1_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="ddl1",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_1_derisk_1_total_amount,
         )
         log.info(
           f"Grinding stop exit (ddl1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_1_derisk_1_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -50990,19 +51098,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_2_derisk_1_sub_grind_count > 0:
           grind_profit = (exit_rate - grind_2_derisk_1_current_open_rate) / grind_2_derisk_1_current_open_rate
           grind_profit_stake = grind_2_derisk_1_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="dl2",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_2_derisk_1_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="dl2",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_2_derisk_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (dl2) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_2_derisk_1_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -51022,20 +51128,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="dl2",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_2_derisk_1_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="dl2",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_2_derisk_1_total_amount,
           )
           log.info(
             f"Grinding exit (dl2) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_2_derisk_1_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -51073,20 +51177,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_2_derisk_1_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="ddl2",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_2_derisk_1_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="ddl2",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_2_derisk_1_total_amount,
         )
         log.info(
           f"Grinding stop exit (ddl2) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_2_derisk_1_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -51129,19 +51231,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_1_sub_grind_count > 0:
           grind_profit = (exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
           grind_profit_stake = grind_1_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="gd1",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_1_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="gd1",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (gd1) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -51170,19 +51270,17 @@ class NostalgiaForInfinityX7(IStrategy):
       if grind_1_sub_grind_count > 0:
         grind_profit = (exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
         grind_profit_stake = grind_1_current_grind_stake_profit
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="gd1",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-          grind_profit_stake=grind_1_current_grind_stake_profit,
-          grind_profit_pct=grind_profit,
-        )
+      notify(
+        "grinding-entry",
+        tag="gd1",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
+        grind_profit_stake=grind_1_current_grind_stake_profit,
+        grind_profit_pct=grind_profit,
       )
       log.info(
         f"Grinding entry (gd1) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -51202,20 +51300,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="gd1",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_1_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="gd1",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_1_total_amount,
           )
           log.info(
             f"Grinding exit (gd1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -51252,20 +51348,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_1_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="dd1",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_1_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="dd1",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_1_total_amount,
         )
         log.info(
           f"Grinding stop exit (dd1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -51308,19 +51402,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_2_sub_grind_count > 0:
           grind_profit = (exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate
           grind_profit_stake = grind_2_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="gd2",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_2_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="gd2",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_2_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (gd2) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_2_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -51340,20 +51432,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="gd2",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_2_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="gd2",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_2_total_amount,
           )
           log.info(
             f"Grinding exit (gd2) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -51390,20 +51480,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_2_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="dd2",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_2_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="dd2",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_2_total_amount,
         )
         log.info(
           f"Grinding stop exit (dd2) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -51446,19 +51534,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_3_sub_grind_count > 0:
           grind_profit = (exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate
           grind_profit_stake = grind_3_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="gd3",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_3_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="gd3",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_3_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (gd3) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_3_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -51478,20 +51564,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="gd3",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_3_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="gd3",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_3_total_amount,
           )
           log.info(
             f"Grinding exit (gd3) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -51528,20 +51612,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_3_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="dd3",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_3_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="dd3",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_3_total_amount,
         )
         log.info(
           f"Grinding stop exit (dd3) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -51584,19 +51666,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_4_sub_grind_count > 0:
           grind_profit = (exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate
           grind_profit_stake = grind_4_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="gd4",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_4_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="gd4",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_4_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (gd4) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_4_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -51616,20 +51696,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="gd4",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_4_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="gd4",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_4_total_amount,
           )
           log.info(
             f"Grinding exit (gd4) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -51666,20 +51744,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_4_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="dd4",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_4_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="dd4",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_4_total_amount,
         )
         log.info(
           f"Grinding stop exit (dd4) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -51697,7 +51773,7 @@ class NostalgiaForInfinityX7(IStrategy):
       and (slice_profit_entry < -0.12)
       and (trade.liquidation_price is not None)
       and (current_rate < trade.liquidation_price * 1.20)
-      and (trade.get_custom_data(key="gd5_liquidation_rescue_used") is None)
+      and (self.trade_custom_data(trade).get(key="gd5_liquidation_rescue_used") is None)
     )
 
     # Grinding 5
@@ -51721,7 +51797,7 @@ class NostalgiaForInfinityX7(IStrategy):
         and is_not_trade_max_stake
       ):
         if gd5_liquidation_rescue_eligible:
-          trade.set_custom_data(key="gd5_liquidation_rescue_used", value=True)
+          self.trade_custom_data(trade).set(key="gd5_liquidation_rescue_used", value=True)
 
         buy_amount = slice_amount * grind_5_stakes[grind_5_sub_grind_count] / stake_scale_leverage
         if buy_amount < (min_stake * 1.5):
@@ -51733,19 +51809,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_5_sub_grind_count > 0:
           grind_profit = (exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate
           grind_profit_stake = grind_5_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="gd5",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_5_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="gd5",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_5_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (gd5) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_5_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -51765,20 +51839,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="gd5",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_5_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="gd5",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_5_total_amount,
           )
           log.info(
             f"Grinding exit (gd5) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -51815,20 +51887,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_5_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="dd5",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_5_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="dd5",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_5_total_amount,
         )
         log.info(
           f"Grinding stop exit (dd5) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -51871,19 +51941,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_6_sub_grind_count > 0:
           grind_profit = (exit_rate - grind_6_current_open_rate) / grind_6_current_open_rate
           grind_profit_stake = grind_6_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="gd6",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_6_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="gd6",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_6_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (gd6) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_6_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -51903,20 +51971,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="gd6",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_6_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="gd6",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_6_total_amount,
           )
           log.info(
             f"Grinding exit (gd6) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_6_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -51953,20 +52019,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_6_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="dd6",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_6_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="dd6",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_6_total_amount,
         )
         log.info(
           f"Grinding stop exit (dd6) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_6_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -52016,19 +52080,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if derisk_1_sub_grind_count > 0:
           grind_profit = (exit_rate - derisk_1_current_open_rate) / derisk_1_current_open_rate
           grind_profit_stake = derisk_1_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "re-entry",
-            tag="d1",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=derisk_1_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "re-entry",
+          tag="d1",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=derisk_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Re-entry (d1) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({derisk_1_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -52058,17 +52120,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="d1",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="d1",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk (d1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -52144,6 +52204,23 @@ class NostalgiaForInfinityX7(IStrategy):
   def long_grind_entry(
     self, last_candle: Series, previous_candle: Series, slice_profit: float, is_derisk: bool
   ) -> float:
+    if (
+      (last_candle["protections_long_global"] == True)
+      and (last_candle["protections_long_rebuy"] == True)
+      and (last_candle["global_protections_long_pump"] == True)
+      and (last_candle["global_protections_long_dump"] == True)
+      and (
+        (last_candle["enter_long"] == True)
+        # the other rules, on their candle part precomputed by long_grind_entry_rules
+        or (LONG_GRIND_ENTRY_RULES.first_rule(last_candle, slice_profit, is_derisk=is_derisk) is not None)
+      )
+    ):
+      return True
+
+    return False
+
+  def long_grind_entry_rules(self, last_candle: "CandleColumns", previous_candle: "CandleColumns") -> list:
+    """The candle part of the `long_grind_entry` rules, by candle, in the order of LONG_GRIND_ENTRY_RULES."""
     last_aroonu_14 = last_candle["AROONU_14"]
     last_aroonu_14_15m = last_candle["AROONU_14_15m"]
     last_rsi_14_1h = last_candle["RSI_14_1h"]
@@ -52175,93 +52252,77 @@ class NostalgiaForInfinityX7(IStrategy):
     last_aroonu_14_15m_lt_25 = last_aroonu_14_15m < 25.0
     last_aroonu_14_lt_25 = last_aroonu_14 < 25.0
 
-    if (
-      (last_candle["protections_long_global"] == True)
-      and (last_candle["protections_long_rebuy"] == True)
-      and (last_candle["global_protections_long_pump"] == True)
-      and (last_candle["global_protections_long_dump"] == True)
-      and (
-        (last_candle["enter_long"] == True)
-        or (
-          (last_rsi_14_lt_36)
-          and (last_rsi_3 > 10.0)
-          and (last_rsi_3_15m_gt_10)
-          and (last_aroonu_14_lt_25)
-          and (last_stochrsi_k_1h < 70.0)
-          and (last_stochrsi_k_4h < 70.0)
-          and (last_close < (last_candle["EMA_16"] * 0.980))
-        )
-        or (
-          (last_rsi_14_lt_36)
-          and (last_rsi_3_15m > 5.0)
-          and (last_rsi_3_1h > 5.0)
-          and (last_rsi_3_4h > 5.0)
-          and (last_ema_26 > last_ema_12)
-          and ((last_ema_26 - last_ema_12) > (last_open * 0.030))
-          and ((previous_ema_26 - previous_ema_12) > (last_open / 100.0))
-        )
-        or (
-          (last_rsi_14_lt_36)
-          and (last_rsi_3 > 5.0)
-          and (last_rsi_3_15m_gt_10)
-          and (last_rsi_3_1h_gt_10)
-          and (last_rsi_3_4h_gt_10)
-          and (last_ema_26 > last_ema_12)
-          and ((last_ema_26 - last_ema_12) > (last_open * 0.020))
-          and ((previous_ema_26 - previous_ema_12) > (last_open / 100.0))
-        )
-        or (
-          (last_rsi_14_lt_36)
-          and (last_rsi_3 > 16.0)
-          and (last_aroonu_14_15m_lt_25)
-          and (last_close < (last_ema_12 * 0.984))
-        )
-        or (
-          (last_rsi_14_lt_36)
-          and (last_rsi_3_15m_gt_10)
-          and (last_rsi_3_1h_gt_10)
-          and (last_rsi_3_4h_gt_10)
-          and (last_candle["AROONU_14_1h"] > last_candle["AROOND_14_1h"])
-          and (last_candle["AROONU_14_4h"] > last_candle["AROOND_14_4h"])
-          and (last_close < (last_ema_26 * 0.978))
-          and (last_close < (last_candle["BBL_20_2.0"] * 0.999))
-        )
-        or (
-          (last_rsi_14_lt_36)
-          and (last_rsi_3_1h_gt_20)
-          and (last_rsi_3_4h_gt_20)
-          and (last_rsi_14_1h_lt_80)
-          and (last_rsi_14_4h_lt_60)
-          and (last_aroonu_14 > last_candle["AROOND_14"])
-          and (previous_candle["AROONU_14"] < previous_candle["AROOND_14"])
-        )
-        or (
-          (last_rsi_14_lt_36)
-          and (last_rsi_3_15m > 15.0)
-          and (last_rsi_3_1h_gt_20)
-          and (last_rsi_3_4h_gt_20)
-          and (last_rsi_14_1h_lt_80)
-          and (last_rsi_14_4h_lt_60)
-          and (last_candle["KST_10_15_20_30_10_10_10_15"] > last_candle["KSTs_9"])
-          and (previous_candle["KST_10_15_20_30_10_10_10_15"] < previous_candle["KSTs_9"])
-        )
-        or (
-          is_derisk
-          and (last_rsi_3 > 20.0)
-          and (last_rsi_3_15m > 20.0)
-          and (last_rsi_3_1h_gt_20)
-          and (last_rsi_3_4h_gt_20)
-          and (last_rsi_14_lt_36)
-          and (last_aroonu_14_lt_25)
-          and (last_aroonu_14_15m_lt_25)
-          and (last_candle["STOCHRSIk_14_14_3_3_15m"] < 50.0)
-          and (last_close < (last_candle["EMA_20"] * 0.980))
-        )
-      )
-    ):
-      return True
-
-    return False
+    return [
+      (
+        (last_rsi_14_lt_36)
+        & (last_rsi_3 > 10.0)
+        & (last_rsi_3_15m_gt_10)
+        & (last_aroonu_14_lt_25)
+        & (last_stochrsi_k_1h < 70.0)
+        & (last_stochrsi_k_4h < 70.0)
+        & (last_close < (last_candle["EMA_16"] * 0.980))
+      ),
+      (
+        (last_rsi_14_lt_36)
+        & (last_rsi_3_15m > 5.0)
+        & (last_rsi_3_1h > 5.0)
+        & (last_rsi_3_4h > 5.0)
+        & (last_ema_26 > last_ema_12)
+        & ((last_ema_26 - last_ema_12) > (last_open * 0.030))
+        & ((previous_ema_26 - previous_ema_12) > (last_open / 100.0))
+      ),
+      (
+        (last_rsi_14_lt_36)
+        & (last_rsi_3 > 5.0)
+        & (last_rsi_3_15m_gt_10)
+        & (last_rsi_3_1h_gt_10)
+        & (last_rsi_3_4h_gt_10)
+        & (last_ema_26 > last_ema_12)
+        & ((last_ema_26 - last_ema_12) > (last_open * 0.020))
+        & ((previous_ema_26 - previous_ema_12) > (last_open / 100.0))
+      ),
+      ((last_rsi_14_lt_36) & (last_rsi_3 > 16.0) & (last_aroonu_14_15m_lt_25) & (last_close < (last_ema_12 * 0.984))),
+      (
+        (last_rsi_14_lt_36)
+        & (last_rsi_3_15m_gt_10)
+        & (last_rsi_3_1h_gt_10)
+        & (last_rsi_3_4h_gt_10)
+        & (last_candle["AROONU_14_1h"] > last_candle["AROOND_14_1h"])
+        & (last_candle["AROONU_14_4h"] > last_candle["AROOND_14_4h"])
+        & (last_close < (last_ema_26 * 0.978))
+        & (last_close < (last_candle["BBL_20_2.0"] * 0.999))
+      ),
+      (
+        (last_rsi_14_lt_36)
+        & (last_rsi_3_1h_gt_20)
+        & (last_rsi_3_4h_gt_20)
+        & (last_rsi_14_1h_lt_80)
+        & (last_rsi_14_4h_lt_60)
+        & (last_aroonu_14 > last_candle["AROOND_14"])
+        & (previous_candle["AROONU_14"] < previous_candle["AROOND_14"])
+      ),
+      (
+        (last_rsi_14_lt_36)
+        & (last_rsi_3_15m > 15.0)
+        & (last_rsi_3_1h_gt_20)
+        & (last_rsi_3_4h_gt_20)
+        & (last_rsi_14_1h_lt_80)
+        & (last_rsi_14_4h_lt_60)
+        & (last_candle["KST_10_15_20_30_10_10_10_15"] > last_candle["KSTs_9"])
+        & (previous_candle["KST_10_15_20_30_10_10_10_15"] < previous_candle["KSTs_9"])
+      ),
+      (
+        (last_rsi_3 > 20.0)
+        & (last_rsi_3_15m > 20.0)
+        & (last_rsi_3_1h_gt_20)
+        & (last_rsi_3_4h_gt_20)
+        & (last_rsi_14_lt_36)
+        & (last_aroonu_14_lt_25)
+        & (last_aroonu_14_15m_lt_25)
+        & (last_candle["STOCHRSIk_14_14_3_3_15m"] < 50.0)
+        & (last_close < (last_candle["EMA_20"] * 0.980))
+      ),
+    ]
 
   # Long Grinding Adjust Trade Position No De-Risk
   # ---------------------------------------------------------------------------------------------
@@ -52296,8 +52357,7 @@ class NostalgiaForInfinityX7(IStrategy):
     **kwargs,
   ) -> tuple[Optional[float], str, bool]:
     dp = self.dp
-    send_msg = self.dp.send_msg
-    notification_msg = self.notification_msg
+    notify = self.notify
     scale_stakes_for_min_stake = self.scale_stakes_for_min_stake
     stake_currency = self.config["stake_currency"]
     trade_pair = trade.pair
@@ -52762,13 +52822,21 @@ class NostalgiaForInfinityX7(IStrategy):
         sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
-        send_msg(
-          f"Exit (remaining) [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {order.safe_remaining} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
-        )
         order_tag = "p"
         if has_order_tags:
           if order.ft_order_tag is not None:
             order_tag = order.ft_order_tag
+        notify(
+          "partial-exit",
+          tag=order_tag,
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          coin_amount=order.safe_remaining,
+        )
         return -ft_sell_amount, order_tag, is_derisk
 
     is_long_grind_entry = self.long_grind_entry(last_candle, previous_candle, slice_profit, False)
@@ -52793,17 +52861,15 @@ class NostalgiaForInfinityX7(IStrategy):
           buy_amount = min_stake * 1.5
         if buy_amount > max_stake:
           return None, "", is_derisk
-        send_msg(
-          notification_msg(
-            "rebuy",
-            tag="r",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "rebuy",
+          tag="r",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"Rebuy (r) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -52839,19 +52905,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_1_sub_grind_count > 0:
           grind_profit = (exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
           grind_profit_stake = grind_1_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="g1",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_1_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="g1",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (g1) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_stake_profit} {stake_currency})"
@@ -52876,19 +52940,17 @@ class NostalgiaForInfinityX7(IStrategy):
       if grind_1_sub_grind_count > 0:
         grind_profit = (exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
         grind_profit_stake = grind_1_current_grind_stake_profit
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="g1",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-          grind_profit_stake=grind_1_current_grind_stake_profit,
-          grind_profit_pct=grind_profit,
-        )
+      notify(
+        "grinding-entry",
+        tag="g1",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
+        grind_profit_stake=grind_1_current_grind_stake_profit,
+        grind_profit_pct=grind_profit,
       )
       log.info(
         f"Grinding entry (g1) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_stake_profit} {stake_currency})"
@@ -52905,20 +52967,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="g1",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_1_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="g1",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_1_total_amount,
           )
           log.info(
             f"Grinding exit (g1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -52950,20 +53010,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_1_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="sg1",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_1_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="sg1",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_1_total_amount,
         )
         log.info(
           f"Grinding stop exit (sg1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -53001,19 +53059,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_2_sub_grind_count > 0:
           grind_profit = (exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate
           grind_profit_stake = grind_2_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="g2",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_2_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="g2",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_2_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (g2) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_2_current_grind_stake_profit} {stake_currency})"
@@ -53030,20 +53086,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="g2",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_2_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="g2",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_2_total_amount,
           )
           log.info(
             f"Grinding exit (g2) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -53075,20 +53129,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_2_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="sg2",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_2_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="sg2",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_2_total_amount,
         )
         log.info(
           f"Grinding stop exit (sg2) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -53126,19 +53178,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_3_sub_grind_count > 0:
           grind_profit = (exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate
           grind_profit_stake = grind_3_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="g3",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_3_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="g3",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_3_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (g3) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_3_current_grind_stake_profit} {stake_currency})"
@@ -53155,20 +53205,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="g3",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_3_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="g3",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_3_total_amount,
           )
           log.info(
             f"Grinding exit (g3) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -53200,20 +53248,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_3_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="sg3",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_3_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="sg3",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_3_total_amount,
         )
         log.info(
           f"Grinding stop exit (sg3) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -53251,19 +53297,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_4_sub_grind_count > 0:
           grind_profit = (exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate
           grind_profit_stake = grind_4_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="g4",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_4_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="g4",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_4_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (g4) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_4_current_grind_stake_profit} {stake_currency})"
@@ -53280,20 +53324,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="g4",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_4_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="g4",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_4_total_amount,
           )
           log.info(
             f"Grinding exit (g4) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -53325,20 +53367,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_4_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="sg4",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_4_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="sg4",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_4_total_amount,
         )
         log.info(
           f"Grinding stop exit (sg4) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -53376,19 +53416,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_5_sub_grind_count > 0:
           grind_profit = (exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate
           grind_profit_stake = grind_5_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="g5",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_5_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="g5",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_5_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (g5) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_5_current_grind_stake_profit} {stake_currency})"
@@ -53405,20 +53443,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="g5",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_5_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="g5",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_5_total_amount,
           )
           log.info(
             f"Grinding exit (g5) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -53450,20 +53486,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_5_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="sg5",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_5_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="sg5",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_5_total_amount,
         )
         log.info(
           f"Grinding stop exit (sg5) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -53501,19 +53535,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_6_sub_grind_count > 0:
           grind_profit = (exit_rate - grind_6_current_open_rate) / grind_6_current_open_rate
           grind_profit_stake = grind_6_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="g6",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_6_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="g6",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_6_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (g6) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_6_current_grind_stake_profit} {stake_currency})"
@@ -53530,20 +53562,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="g6",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_6_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="g6",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_6_total_amount,
           )
           log.info(
             f"Grinding exit (g6) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_6_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -53575,20 +53605,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_6_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="sg6",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_6_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="sg6",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_6_total_amount,
         )
         log.info(
           f"Grinding stop exit (sg6) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_6_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -53619,17 +53647,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="d",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="d",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -53661,17 +53687,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="d1",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="d1",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk (d1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -53712,11 +53736,10 @@ class NostalgiaForInfinityX7(IStrategy):
       return None
 
     max_stake /= trade_leverage
-    df, _ = dp.get_analyzed_dataframe(trade_pair, self.timeframe)
-    if len(df) < 2:
+    candles = self.analyzed_candles(trade_pair)
+    if len(candles) < 2:
       return None
-    last_candle = df.iloc[-1]
-    previous_candle = df.iloc[-2]
+    last_candle, previous_candle = candles
 
     exit_rate = current_rate
     filled_orders, filled_entries, filled_exits, profit_values = self.profit_or_order_snapshot(
@@ -53763,8 +53786,12 @@ class NostalgiaForInfinityX7(IStrategy):
             if ticker["bid"] is not None:
               exit_rate = ticker["bid"]
 
-    if profit_values is None:
+    # The snapshot is at current_rate, the live ticker can give another rate
+    if profit_values is None or exit_rate != current_rate:
       profit_values = self.calc_total_profit(trade, filled_entries, filled_exits, exit_rate)
+      self.cache_profit_snapshot(
+        trade, current_time, exit_rate, filled_orders, filled_entries, filled_exits, profit_values
+      )
     profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = profit_values
 
     slice_amount = filled_entries[0].safe_filled * filled_entries[0].safe_price
@@ -53832,17 +53859,15 @@ class NostalgiaForInfinityX7(IStrategy):
           buy_amount = min_stake * 1.5
         if buy_amount > max_stake:
           return None
-        dp.send_msg(
-          self.notification_msg(
-            "rebuy",
-            tag="r",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=config["stake_currency"],
-          )
+        self.notify(
+          "rebuy",
+          tag="r",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=config["stake_currency"],
         )
         log.info(
           f"Rebuy (r) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -53863,13 +53888,14 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade.stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        dp.send_msg(
-          f"❌​​ ​**Rebuy De-risk:** `Level 3`\n"
-          f"🪙​ **Pair:** `{trade_pair}`\n"
-          f"〽️​ **Rate:** `{exit_rate}`\n"
-          f"💰 **Stake amount:** `{sell_amount}`\n"
-          f"💵​ **Profit (stake):** `{profit_stake}`\n"
-          f"💸 **Profit (percent):** `{(profit_ratio * 100.0):.2f}%`"
+        self.notify(
+          "rebuy-derisk",
+          tag="Level 3",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
         )
         log.info(
           f"Rebuy De-risk Level 3 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -53911,11 +53937,10 @@ class NostalgiaForInfinityX7(IStrategy):
 
     min_stake = self.correct_min_stake(min_stake, trade_leverage)
     max_stake /= trade_leverage
-    df, _ = dp.get_analyzed_dataframe(trade_pair, self.timeframe)
-    if len(df) < 2:
+    candles = self.analyzed_candles(trade_pair)
+    if len(candles) < 2:
       return None
-    last_candle = df.iloc[-1]
-    previous_candle = df.iloc[-2]
+    last_candle, previous_candle = candles
 
     exit_rate = current_rate
     filled_orders, filled_entries, filled_exits, profit_values = self.profit_or_order_snapshot(
@@ -53962,8 +53987,12 @@ class NostalgiaForInfinityX7(IStrategy):
             if ticker["bid"] is not None:
               exit_rate = ticker["bid"]
 
-    if profit_values is None:
+    # The snapshot is at current_rate, the live ticker can give another rate
+    if profit_values is None or exit_rate != current_rate:
       profit_values = self.calc_total_profit(trade, filled_entries, filled_exits, exit_rate)
+      self.cache_profit_snapshot(
+        trade, current_time, exit_rate, filled_orders, filled_entries, filled_exits, profit_values
+      )
     profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = profit_values
 
     slice_amount = filled_entries[0].safe_filled * filled_entries[0].safe_price
@@ -54024,17 +54053,15 @@ class NostalgiaForInfinityX7(IStrategy):
           buy_amount = min_stake * 1.5
         if buy_amount > max_stake:
           return None
-        dp.send_msg(
-          self.notification_msg(
-            "rebuy",
-            tag="r",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=self.config["stake_currency"],
-          )
+        self.notify(
+          "rebuy",
+          tag="r",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
         )
         log.info(
           f"Rebuy (r) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -54056,13 +54083,14 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade.stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        dp.send_msg(
-          f"❌​​ ​**Rebuy De-risk:** `Level 3`\n"
-          f"🪙​ **Pair:** `{trade_pair}`\n"
-          f"〽️​ **Rate:** `{exit_rate}`\n"
-          f"💰 **Stake amount:** `{sell_amount:{stake_fmt}}`\n"
-          f"💵​ **Profit (stake):** `{profit_stake:{stake_fmt}}`\n"
-          f"💸 **Profit (percent):** `{(profit_ratio * 100.0):.2f}%`"
+        self.notify(
+          "rebuy-derisk",
+          tag="Level 3",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
         )
         log.info(
           f"Rebuy De-risk Level 3 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -56368,85 +56396,15 @@ class NostalgiaForInfinityX7(IStrategy):
     last_ema_200 = last_candle["EMA_200"]
 
     if last_close < last_ema_200:
-      if 0.01 > current_profit >= 0.001:
-        if last_rsi_14 > 90.0:
-          return True, f"exit_{mode_name}_o_0"
-      elif 0.02 > current_profit >= 0.01:
-        if last_rsi_14 > 72.0:
-          return True, f"exit_{mode_name}_o_1"
-      elif 0.03 > current_profit >= 0.02:
-        if last_rsi_14 > 70.0:
-          return True, f"exit_{mode_name}_o_2"
-      elif 0.04 > current_profit >= 0.03:
-        if last_rsi_14 > 68.0:
-          return True, f"exit_{mode_name}_o_3"
-      elif 0.05 > current_profit >= 0.04:
-        if last_rsi_14 > 66.0:
-          return True, f"exit_{mode_name}_o_4"
-      elif 0.06 > current_profit >= 0.05:
-        if last_rsi_14 > 64.0:
-          return True, f"exit_{mode_name}_o_5"
-      elif 0.07 > current_profit >= 0.06:
-        if last_rsi_14 > 62.0:
-          return True, f"exit_{mode_name}_o_6"
-      elif 0.08 > current_profit >= 0.07:
-        if last_rsi_14 > 60.0:
-          return True, f"exit_{mode_name}_o_7"
-      elif 0.09 > current_profit >= 0.08:
-        if last_rsi_14 > 58.0:
-          return True, f"exit_{mode_name}_o_8"
-      elif 0.1 > current_profit >= 0.09:
-        if last_rsi_14 > 56.0:
-          return True, f"exit_{mode_name}_o_9"
-      elif 0.12 > current_profit >= 0.1:
-        if last_rsi_14 > 54.0:
-          return True, f"exit_{mode_name}_o_10"
-      elif 0.2 > current_profit >= 0.12:
-        if last_rsi_14 > 56.0:
-          return True, f"exit_{mode_name}_o_11"
-      elif current_profit >= 0.2:
-        if last_rsi_14 > 58.0:
-          return True, f"exit_{mode_name}_o_12"
+      regime = "o"
     elif last_close > last_ema_200:
-      if 0.01 > current_profit >= 0.001:
-        if last_rsi_14 > 88.0:
-          return True, f"exit_{mode_name}_u_0"
-      elif 0.02 > current_profit >= 0.01:
-        if last_rsi_14 > 70.0:
-          return True, f"exit_{mode_name}_u_1"
-      elif 0.03 > current_profit >= 0.02:
-        if last_rsi_14 > 68.0:
-          return True, f"exit_{mode_name}_u_2"
-      elif 0.04 > current_profit >= 0.03:
-        if last_rsi_14 > 66.0:
-          return True, f"exit_{mode_name}_u_3"
-      elif 0.05 > current_profit >= 0.04:
-        if last_rsi_14 > 64.0:
-          return True, f"exit_{mode_name}_u_4"
-      elif 0.06 > current_profit >= 0.05:
-        if last_rsi_14 > 62.0:
-          return True, f"exit_{mode_name}_u_5"
-      elif 0.07 > current_profit >= 0.06:
-        if last_rsi_14 > 60.0:
-          return True, f"exit_{mode_name}_u_6"
-      elif 0.08 > current_profit >= 0.07:
-        if last_rsi_14 > 58.0:
-          return True, f"exit_{mode_name}_u_7"
-      elif 0.09 > current_profit >= 0.08:
-        if last_rsi_14 > 56.0:
-          return True, f"exit_{mode_name}_u_8"
-      elif 0.1 > current_profit >= 0.09:
-        if last_rsi_14 > 54.0:
-          return True, f"exit_{mode_name}_u_9"
-      elif 0.12 > current_profit >= 0.1:
-        if last_rsi_14 > 52.0:
-          return True, f"exit_{mode_name}_u_10"
-      elif 0.2 > current_profit >= 0.12:
-        if last_rsi_14 > 54.0:
-          return True, f"exit_{mode_name}_u_11"
-      elif current_profit >= 0.2:
-        if last_rsi_14 > 56.0:
-          return True, f"exit_{mode_name}_u_12"
+      regime = "u"
+    else:
+      return False, None
+
+    bucket = SHORT_EXIT_MAIN_LADDER.candle_exit_bucket(last_candle, regime, current_profit, last_rsi_14)
+    if bucket is not None:
+      return True, f"exit_{mode_name}_{regime}_{bucket}"
 
     #  Here ends exit signal conditions for short_exit_main
 
@@ -68938,8 +68896,7 @@ class NostalgiaForInfinityX7(IStrategy):
     **kwargs,
   ):
     dp = self.dp
-    send_msg = self.dp.send_msg
-    notification_msg = self.notification_msg
+    notify = self.notify
     scale_stakes_for_min_stake = self.scale_stakes_for_min_stake
     short_grind_exit_v2 = self.short_grind_exit_v2
     stake_currency = self.config["stake_currency"]
@@ -68956,19 +68913,19 @@ class NostalgiaForInfinityX7(IStrategy):
 
     is_futures = self.is_futures_mode
     trade_leverage = trade.leverage
-    trade_get_custom_data = trade.get_custom_data
-    trade_set_custom_data = trade.set_custom_data
+    custom_data = self.trade_custom_data(trade)
+    trade_get_custom_data = custom_data.get
+    trade_set_custom_data = custom_data.set
     trade_is_short = trade.is_short
     derisk_enable = self.derisk_enable
     short_rebuy_mode_tags = self.short_rebuy_mode_tags
     short_grind_mode_tags = self.short_grind_mode_tags
 
     min_stake = self.correct_min_stake(min_stake, trade_leverage)
-    df, _ = dp.get_analyzed_dataframe(trade_pair, self.timeframe)
-    if len(df) < 2:
+    candles = self.analyzed_candles(trade_pair)
+    if len(candles) < 2:
       return None
-    last_candle = df.iloc[-1]
-    previous_candle = df.iloc[-2]
+    last_candle, previous_candle = candles
 
     exit_rate = current_rate
     filled_orders, filled_entries, filled_exits, profit_values = self.profit_or_order_snapshot(
@@ -68989,8 +68946,12 @@ class NostalgiaForInfinityX7(IStrategy):
             if ticker["bid"] is not None:
               exit_rate = ticker["bid"]
 
-    if profit_values is None:
+    # The snapshot is at current_rate, the live ticker can give another rate
+    if profit_values is None or exit_rate != current_rate:
       profit_values = self.calc_total_profit(trade, filled_entries, filled_exits, exit_rate)
+      self.cache_profit_snapshot(
+        trade, current_time, exit_rate, filled_orders, filled_entries, filled_exits, profit_values
+      )
     profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = profit_values
 
     first_filled_order = filled_orders[0]
@@ -69595,17 +69556,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="Level 1",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="Level 1",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk Level 1 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -69682,17 +69641,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="Level 2",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="Level 2",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk Level 2 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -69769,17 +69726,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="Level 3",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="Level 3",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk Level 3 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -69803,17 +69758,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="Global",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="Global",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk Global [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -69836,17 +69789,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_1_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_1_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_1_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -69867,20 +69818,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="grind_1_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_1_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="grind_1_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_1_total_amount,
           )
           log.info(
             f"Grinding exit (grind_1_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -69917,20 +69866,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_1_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_1_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_1_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_1_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_1_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_1_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -69959,17 +69906,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_2_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_2_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_2_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -69990,20 +69935,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="grind_2_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_2_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="grind_2_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_2_total_amount,
           )
           log.info(
             f"Grinding exit (grind_2_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -70040,20 +69983,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_2_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_2_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_2_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_2_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_2_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_2_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -70082,17 +70023,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_3_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_3_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_3_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -70113,20 +70052,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="grind_3_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_3_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="grind_3_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_3_total_amount,
           )
           log.info(
             f"Grinding exit (grind_3_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -70163,20 +70100,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_3_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_3_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_3_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_3_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_3_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_3_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -70220,17 +70155,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_4_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_4_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_4_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -70251,20 +70184,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="grind_4_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_4_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="grind_4_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_4_total_amount,
           )
           log.info(
             f"Grinding exit (grind_4_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -70301,20 +70232,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_4_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_4_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_4_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_4_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_4_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_4_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -70358,17 +70287,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_5_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_5_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_5_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -70389,20 +70316,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="grind_5_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_5_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="grind_5_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_5_total_amount,
           )
           log.info(
             f"Grinding exit (grind_5_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -70439,20 +70364,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_5_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_5_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_5_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_5_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_5_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_5_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -70492,17 +70415,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "buyback-entry",
-          tag="buyback_1_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "buyback-entry",
+        tag="buyback_1_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Buyback entry (buyback_1_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -70532,20 +70453,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "buyback-exit",
-              tag="buyback_1_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=buyback_1_total_amount,
-            )
+          notify(
+            "buyback-exit",
+            tag="buyback_1_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=buyback_1_total_amount,
           )
           log.info(
             f"Buyback exit (buyback_1_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -70593,18 +70512,16 @@ class NostalgiaForInfinityX7(IStrategy):
             if buyback_1_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "buyback-derisk",
-            tag="buyback_1_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            coin_amount=buyback_1_total_amount,
-          )
+        notify(
+          "buyback-derisk",
+          tag="buyback_1_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          coin_amount=buyback_1_total_amount,
         )
         log.info(
           f"Buyback de-risk (buyback_1_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -70644,17 +70561,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "buyback-entry",
-          tag="buyback_2_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "buyback-entry",
+        tag="buyback_2_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Buyback entry (buyback_2_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -70684,20 +70599,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "buyback-exit",
-              tag="buyback_2_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=buyback_2_total_amount,
-            )
+          notify(
+            "buyback-exit",
+            tag="buyback_2_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=buyback_2_total_amount,
           )
           log.info(
             f"Buyback exit (buyback_2_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -70745,18 +70658,16 @@ class NostalgiaForInfinityX7(IStrategy):
             if buyback_2_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "buyback-derisk",
-            tag="buyback_2_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            coin_amount=buyback_2_total_amount,
-          )
+        notify(
+          "buyback-derisk",
+          tag="buyback_2_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          coin_amount=buyback_2_total_amount,
         )
         log.info(
           f"Buyback de-risk (buyback_2_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -70796,17 +70707,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "buyback-entry",
-          tag="buyback_3_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "buyback-entry",
+        tag="buyback_3_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Buyback entry (buyback_3_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -70836,20 +70745,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "buyback-exit",
-              tag="buyback_3_exit",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=buyback_3_total_amount,
-            )
+          notify(
+            "buyback-exit",
+            tag="buyback_3_exit",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=buyback_3_total_amount,
           )
           log.info(
             f"Buyback exit (buyback_3_exit) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -70897,18 +70804,16 @@ class NostalgiaForInfinityX7(IStrategy):
             if buyback_3_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "buyback-derisk",
-            tag="buyback_3_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            coin_amount=buyback_3_total_amount,
-          )
+        notify(
+          "buyback-derisk",
+          tag="buyback_3_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          coin_amount=buyback_3_total_amount,
         )
         log.info(
           f"Buyback de-risk (buyback_3_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -71064,6 +70969,17 @@ class NostalgiaForInfinityX7(IStrategy):
   def short_grind_entry_v2(
     self, last_candle: Series, previous_candle: Series, slice_profit: float, is_derisk: bool
   ) -> float:
+    if (last_candle["protections_short_global"] == True) and (
+      (last_candle["enter_short"] == True)
+      # on the candle part of the rules precomputed by short_grind_entry_v2_rules
+      or (SHORT_GRIND_ENTRY_V2_RULES.first_rule(last_candle, slice_profit, is_derisk=is_derisk) is not None)
+    ):
+      return True
+
+    return False
+
+  def short_grind_entry_v2_rules(self, last_candle: "CandleColumns", previous_candle: "CandleColumns") -> list:
+    """The candle part of the `short_grind_entry_v2` rules, by candle, in the order of SHORT_GRIND_ENTRY_V2_RULES."""
     previous_ema_12 = previous_candle["EMA_12"]
     previous_ema_26 = previous_candle["EMA_26"]
     last_aroond_14_15m = last_candle["AROOND_14_15m"]
@@ -71094,11 +71010,7 @@ class NostalgiaForInfinityX7(IStrategy):
     last_roc_2_4h = last_candle["ROC_2_4h"]
     last_roc_9_1h = last_candle["ROC_9_1h"]
     last_roc_9_4h = last_candle["ROC_9_4h"]
-    last_protections_short_global = last_candle["protections_short_global"]
-    last_enter_short = last_candle["enter_short"]
     last_stochrsi_k_15m = last_candle["STOCHRSIk_14_14_3_3_15m"]
-    last_stochrsi_k_1h = last_candle["STOCHRSIk_14_14_3_3_1h"]
-    last_stochrsi_k_4h = last_candle["STOCHRSIk_14_14_3_3_4h"]
     last_low_min_24_4h = last_candle["low_min_24_4h"]
     last_ema_16 = last_candle["EMA_16"]
 
@@ -71126,251 +71038,246 @@ class NostalgiaForInfinityX7(IStrategy):
     last_rsi_14_gt_65 = last_rsi_14 > 65.0
     last_roc_9_1d_lt_30 = last_roc_9_1d < 30.0
 
-    if (last_protections_short_global == True) and (
-      (last_enter_short == True)
-      or (
+    return [
+      (
         (last_rsi_14 > 54.0)
-        and (last_rsi_3_lt_90)
-        and (last_rsi_3_15m_lt_85)
-        and (last_rsi_3_1h_lt_85)
-        and (last_rsi_3_4h_lt_85)
-        and (last_roc_2_1h_lt_10)
-        and (last_roc_2_4h_lt_10)
-        and (last_roc_2_1d_lt_10)
-        and (last_roc_9_1h < 25.0)
-        and (last_roc_9_4h < 25.0)
-        and (last_roc_9_1d < 25.0)
-        # and (last_candle["ROC_9_1d"] < 40.0)
-        and (last_aroond_14_lt_25)
-        # and (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_1h"] < 30.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_4h"] < 30.0)
-        and (last_close < (last_close_min_48 * 1.10))
-        and (last_close < (last_low_min_6_1h * 1.18))
-        and (last_close < (last_low_min_12_1h * 1.25))
-        and (last_close > (last_high_max_24_4h * 0.85))
-        and (last_close > (last_ema_16 * 1.032))
-      )
-      or (
+        & (last_rsi_3_lt_90)
+        & (last_rsi_3_15m_lt_85)
+        & (last_rsi_3_1h_lt_85)
+        & (last_rsi_3_4h_lt_85)
+        & (last_roc_2_1h_lt_10)
+        & (last_roc_2_4h_lt_10)
+        & (last_roc_2_1d_lt_10)
+        & (last_roc_9_1h < 25.0)
+        & (last_roc_9_4h < 25.0)
+        & (last_roc_9_1d < 25.0)
+        # & (last_candle["ROC_9_1d"] < 40.0)
+        & (last_aroond_14_lt_25)
+        # & (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        & (last_close < (last_close_min_48 * 1.10))
+        & (last_close < (last_low_min_6_1h * 1.18))
+        & (last_close < (last_low_min_12_1h * 1.25))
+        & (last_close > (last_high_max_24_4h * 0.85))
+        & (last_close > (last_ema_16 * 1.032))
+      ),
+      (
         (last_rsi_14_gt_64)
-        and (last_rsi_3_lt_95)
-        and (last_rsi_3_15m_lt_85)
-        and (last_rsi_3_1h_lt_85)
-        and (last_rsi_3_4h_lt_85)
-        # and (last_candle["RSI_3_1d"] > 15.0)
-        and (last_roc_2_1h_lt_10)
-        and (last_roc_2_4h_lt_10)
-        # and (last_candle["ROC_2_1d"] > -10.0)
-        and (last_roc_9_1h_lt_10)
-        and (last_roc_9_4h_lt_10)
-        and (last_roc_9_1d_lt_30)
-        and (last_stochrsik_14_14_3_3 > 50.0)
-        and (last_ema_12 > last_ema_26)
-        and ((last_ema_12 - last_ema_26) > (last_open * 0.020))
-        and ((previous_ema_12 - previous_ema_26) > (last_open / 100.0))
-      )
-      or (
+        & (last_rsi_3_lt_95)
+        & (last_rsi_3_15m_lt_85)
+        & (last_rsi_3_1h_lt_85)
+        & (last_rsi_3_4h_lt_85)
+        # & (last_candle["RSI_3_1d"] > 15.0)
+        & (last_roc_2_1h_lt_10)
+        & (last_roc_2_4h_lt_10)
+        # & (last_candle["ROC_2_1d"] > -10.0)
+        & (last_roc_9_1h_lt_10)
+        & (last_roc_9_4h_lt_10)
+        & (last_roc_9_1d_lt_30)
+        & (last_stochrsik_14_14_3_3 > 50.0)
+        & (last_ema_12 > last_ema_26)
+        & ((last_ema_12 - last_ema_26) > (last_open * 0.020))
+        & ((previous_ema_12 - previous_ema_26) > (last_open / 100.0))
+      ),
+      (
         (last_rsi_14_gt_64)
-        and (last_rsi_3_lt_90)
-        and (last_rsi_3_15m_lt_90)
-        and (last_rsi_3_1h_lt_90)
-        and (last_rsi_3_4h_lt_90)
-        and (last_rsi_3_1d_lt_90)
-        and (last_roc_2_1h_lt_5)
-        and (last_roc_2_4h_lt_5)
-        and (last_roc_2_1d < 5.0)
-        and (last_roc_9_1h_lt_10)
-        and (last_roc_9_4h_lt_10)
-        and (last_roc_9_1d < 10.0)
-        # and (last_roc_9_4h < 40.0)
-        # and (last_candle["ROC_9_1d"] < 50.0)
-        and (last_aroond_14_15m < 25.0)
-        and (last_close < (last_close_min_48 * 1.10))
-        and (last_close < (last_low_min_6_1h * 1.18))
-        and (last_close < (last_low_min_12_1h * 1.25))
-        # and (last_close < (last_candle["low_min_24_4h"] * 1.20))
-        and (last_close > (last_ema_12 * 1.020))
-      )
-      or (
+        & (last_rsi_3_lt_90)
+        & (last_rsi_3_15m_lt_90)
+        & (last_rsi_3_1h_lt_90)
+        & (last_rsi_3_4h_lt_90)
+        & (last_rsi_3_1d_lt_90)
+        & (last_roc_2_1h_lt_5)
+        & (last_roc_2_4h_lt_5)
+        & (last_roc_2_1d < 5.0)
+        & (last_roc_9_1h_lt_10)
+        & (last_roc_9_4h_lt_10)
+        & (last_roc_9_1d < 10.0)
+        # & (last_roc_9_4h < 40.0)
+        # & (last_candle["ROC_9_1d"] < 50.0)
+        & (last_aroond_14_15m < 25.0)
+        & (last_close < (last_close_min_48 * 1.10))
+        & (last_close < (last_low_min_6_1h * 1.18))
+        & (last_close < (last_low_min_12_1h * 1.25))
+        # & (last_close < (last_candle["low_min_24_4h"] * 1.20))
+        & (last_close > (last_ema_12 * 1.020))
+      ),
+      (
         (last_rsi_14_gt_64)
-        and (last_rsi_3_lt_90)
-        and (last_rsi_3_15m_lt_90)
-        and (last_rsi_3_1h_lt_90)
-        and (last_rsi_3_4h_lt_90)
-        and (last_rsi_3_1d_lt_90)
-        and (last_roc_2_1h_lt_10)
-        and (last_roc_2_4h_lt_10)
-        and (last_roc_2_1d_lt_10)
-        # and (last_roc_9_1h > -10.0)
-        # and (last_roc_9_4h > -10.0)
-        # and (last_candle["ROC_9_1d"] > -10.0)
-        and (last_aroond_14_lt_25)
-        and (last_close < (last_close_min_48 * 1.10))
-        and (last_close < (last_low_min_6_1h * 1.18))
-        and (last_close < (last_low_min_12_1h * 1.25))
-        and (last_close > (last_ema_26 * 1.038))
-        and (last_close > (last_bbu_20_2_0 * 1.0))
-      )
-      or (
+        & (last_rsi_3_lt_90)
+        & (last_rsi_3_15m_lt_90)
+        & (last_rsi_3_1h_lt_90)
+        & (last_rsi_3_4h_lt_90)
+        & (last_rsi_3_1d_lt_90)
+        & (last_roc_2_1h_lt_10)
+        & (last_roc_2_4h_lt_10)
+        & (last_roc_2_1d_lt_10)
+        # & (last_roc_9_1h > -10.0)
+        # & (last_roc_9_4h > -10.0)
+        # & (last_candle["ROC_9_1d"] > -10.0)
+        & (last_aroond_14_lt_25)
+        & (last_close < (last_close_min_48 * 1.10))
+        & (last_close < (last_low_min_6_1h * 1.18))
+        & (last_close < (last_low_min_12_1h * 1.25))
+        & (last_close > (last_ema_26 * 1.038))
+        & (last_close > (last_bbu_20_2_0 * 1.0))
+      ),
+      (
         (last_rsi_14_gt_65)
-        and (last_rsi_3_lt_90)
-        and (last_rsi_3_15m_lt_90)
-        and (last_rsi_3_1h_lt_90)
-        and (last_rsi_3_4h_lt_90)
-        # and (last_candle["RSI_3_1d"] > 10.0)
-        and (last_roc_2_1h_lt_10)
-        and (last_roc_2_4h_lt_10)
-        and (last_roc_2_1d_lt_10)
-        and (last_roc_9_1h_lt_10)
-        and (last_roc_9_4h_lt_10)
-        # and (last_candle["ROC_9_1d"] > -10.0)
-        and (last_aroond_14_lt_25)
-        # and (last_candle["AROONU_14_15m"] < 25.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
-        # and (last_close > (last_candle["close_max_48"] * 0.90))
-        # and (last_close < (last_candle["low_min_6_1h"] * 1.18))
-        # and (last_close < (last_candle["low_min_12_1h"] * 1.25))
-        and (last_close > (last_high_max_12_4h * 0.80))
-        and (last_close > (last_candle["EMA_9"] * 1.032))
-        and (last_close > (last_candle["EMA_20"] * 1.020))
-      )
-      or (
+        & (last_rsi_3_lt_90)
+        & (last_rsi_3_15m_lt_90)
+        & (last_rsi_3_1h_lt_90)
+        & (last_rsi_3_4h_lt_90)
+        # & (last_candle["RSI_3_1d"] > 10.0)
+        & (last_roc_2_1h_lt_10)
+        & (last_roc_2_4h_lt_10)
+        & (last_roc_2_1d_lt_10)
+        & (last_roc_9_1h_lt_10)
+        & (last_roc_9_4h_lt_10)
+        # & (last_candle["ROC_9_1d"] > -10.0)
+        & (last_aroond_14_lt_25)
+        # & (last_candle["AROONU_14_15m"] < 25.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        # & (last_close > (last_candle["close_max_48"] * 0.90))
+        # & (last_close < (last_candle["low_min_6_1h"] * 1.18))
+        # & (last_close < (last_candle["low_min_12_1h"] * 1.25))
+        & (last_close > (last_high_max_12_4h * 0.80))
+        & (last_close > (last_candle["EMA_9"] * 1.032))
+        & (last_close > (last_candle["EMA_20"] * 1.020))
+      ),
+      (
         (last_rsi_14_gt_65)
-        and (last_rsi_3_lt_90)
-        and (last_rsi_3 > 60.0)
-        # and (last_candle["RSI_4"] < 40.0)
-        and (last_rsi_3_15m_lt_85)
-        # and (last_rsi_3_1h > 20.0)
-        # and (last_rsi_3_4h > 20.0)
-        # and (last_candle["RSI_3_1d"] > 20.0)
-        and (last_roc_2_1h_lt_5)
-        and (last_roc_2_4h_lt_5)
-        # and (last_candle["ROC_2_1d"] > -5.0)
-        and (last_roc_9_1h_lt_10)
-        and (last_roc_9_4h_lt_10)
-        # and (last_candle["ROC_9_1d"] > -10.0)
-        and (last_aroond_14_lt_25)
-        # and (last_candle["AROONU_14_15m"] < 25.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_1h"] < 50.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_4h"] < 50.0)
-        # and (last_close > (last_candle["close_max_48"] * 0.90))
-        # and (last_close < (last_candle["low_min_6_1h"] * 1.18))
-        # and (last_close < (last_candle["low_min_12_1h"] * 1.25))
-        and (last_candle["RSI_20"] > previous_candle["RSI_20"])
-        and (last_close > (last_candle["SMA_16"] * 1.045))
-        # and (last_close < (last_candle["EMA_20"] * 0.980))
-      )
-      or (
+        & (last_rsi_3_lt_90)
+        & (last_rsi_3 > 60.0)
+        # & (last_candle["RSI_4"] < 40.0)
+        & (last_rsi_3_15m_lt_85)
+        # & (last_rsi_3_1h > 20.0)
+        # & (last_rsi_3_4h > 20.0)
+        # & (last_candle["RSI_3_1d"] > 20.0)
+        & (last_roc_2_1h_lt_5)
+        & (last_roc_2_4h_lt_5)
+        # & (last_candle["ROC_2_1d"] > -5.0)
+        & (last_roc_9_1h_lt_10)
+        & (last_roc_9_4h_lt_10)
+        # & (last_candle["ROC_9_1d"] > -10.0)
+        & (last_aroond_14_lt_25)
+        # & (last_candle["AROONU_14_15m"] < 25.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        # & (last_close > (last_candle["close_max_48"] * 0.90))
+        # & (last_close < (last_candle["low_min_6_1h"] * 1.18))
+        # & (last_close < (last_candle["low_min_12_1h"] * 1.25))
+        & (last_candle["RSI_20"] > previous_candle["RSI_20"])
+        & (last_close > (last_candle["SMA_16"] * 1.045))
+      ),
+      # and (last_close < (last_candle["EMA_20"] * 0.980))
+      (
         (last_rsi_3_lt_95)
-        and (last_rsi_3_15m_lt_90)
-        and (last_rsi_3_1h_lt_90)
-        and (last_rsi_3_4h_lt_90)
-        and (last_roc_2_1h_lt_5)
-        and (last_roc_2_4h_lt_5)
-        and (last_roc_9_1h < 5.0)
-        and (last_roc_9_4h < 5.0)
-        and (last_candle["WILLR_14"] > -50.0)
-        # and (last_candle["AROONU_14"] < 25.0)
-        and (last_stochrsik_14_14_3_3_gt_80)
-        and (last_candle["WILLR_84_1h"] > -30.0)
-        # and (last_candle["STOCHRSIk_14_14_3_3_1h"] < 40.0)
-        and (last_close < (last_high_max_24_4h * 0.77))
-        and (last_candle["BBB_20_2.0_1h"] > 12.0)
-        and (last_close_min_48 <= (last_close * 0.90))
-      )
-      or (
+        & (last_rsi_3_15m_lt_90)
+        & (last_rsi_3_1h_lt_90)
+        & (last_rsi_3_4h_lt_90)
+        & (last_roc_2_1h_lt_5)
+        & (last_roc_2_4h_lt_5)
+        & (last_roc_9_1h < 5.0)
+        & (last_roc_9_4h < 5.0)
+        & (last_candle["WILLR_14"] > -50.0)
+        # & (last_candle["AROONU_14"] < 25.0)
+        & (last_stochrsik_14_14_3_3_gt_80)
+        & (last_candle["WILLR_84_1h"] > -30.0)
+        # & (last_candle["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        & (last_close < (last_high_max_24_4h * 0.77))
+        & (last_candle["BBB_20_2.0_1h"] > 12.0)
+        & (last_close_min_48 <= (last_close * 0.90))
+      ),
+      (
         (last_rsi_3 > 70.0)
-        and (last_rsi_3_lt_95)
-        and (last_rsi_3_15m_lt_95)
-        and (last_rsi_3_1h_lt_90)
-        and (last_rsi_3_4h_lt_90)
-        # and (last_roc_2_1h > -5.0)
-        # and (last_roc_2_4h > -5.0)
-        # and (last_roc_9_1h > -5.0)
-        # and (last_roc_9_4h > -5.0)
-        and (last_roc_9_1d_lt_30)
-        # and (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
-        # and (last_close < (last_candle["low_min_24_4h"] * 1.50))
-        and (last_ema_12 > last_ema_26)
-        and ((last_ema_12 - last_ema_26) > (last_open * 0.034))
-        and ((previous_ema_12 - previous_ema_26) > (last_open / 100.0))
-      )
-      or (
+        & (last_rsi_3_lt_95)
+        & (last_rsi_3_15m_lt_95)
+        & (last_rsi_3_1h_lt_90)
+        & (last_rsi_3_4h_lt_90)
+        # & (last_roc_2_1h > -5.0)
+        # & (last_roc_2_4h > -5.0)
+        # & (last_roc_9_1h > -5.0)
+        # & (last_roc_9_4h > -5.0)
+        & (last_roc_9_1d_lt_30)
+        # & (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
+        # & (last_close < (last_candle["low_min_24_4h"] * 1.50))
+        & (last_ema_12 > last_ema_26)
+        & ((last_ema_12 - last_ema_26) > (last_open * 0.034))
+        & ((previous_ema_12 - previous_ema_26) > (last_open / 100.0))
+      ),
+      (
         (last_rsi_3_lt_95)
-        and (last_rsi_3_15m < 75.0)
-        and (last_rsi_3_1h < 70.0)
-        and (last_close > (last_low_min_24_4h * 1.10))
-        and (last_close > (last_close_min_48 * 1.10))
-        and (last_close < (last_candle["close_max_12"] * 0.92))
-      )
-      or (
+        & (last_rsi_3_15m < 75.0)
+        & (last_rsi_3_1h < 70.0)
+        & (last_close > (last_low_min_24_4h * 1.10))
+        & (last_close > (last_close_min_48 * 1.10))
+        & (last_close < (last_candle["close_max_12"] * 0.92))
+      ),
+      (
         (last_rsi_3_lt_95)
-        and (last_rsi_3_15m_lt_95)
-        and (last_stochrsik_14_14_3_3_gt_80)
-        and (last_rsi_14 > (last_rsi_14_1h + 45.0))
-      )
-      or (
+        & (last_rsi_3_15m_lt_95)
+        & (last_stochrsik_14_14_3_3_gt_80)
+        & (last_rsi_14 > (last_rsi_14_1h + 45.0))
+      ),
+      (
         (last_rsi_3_lt_90)
-        and (last_rsi_3_15m_lt_90)
-        and (last_rsi_3_1h_lt_90)
-        and (last_rsi_3_4h_lt_90)
-        and (last_rsi_3_1d_lt_90)
-        and (last_stochrsik_14_14_3_3_gt_80)
-        and (last_close > (last_candle["SMA_30"] * 1.022))
-        and (last_close > (last_bbu_20_2_0 * 1.0))
-      )
-      or (
+        & (last_rsi_3_15m_lt_90)
+        & (last_rsi_3_1h_lt_90)
+        & (last_rsi_3_4h_lt_90)
+        & (last_rsi_3_1d_lt_90)
+        & (last_stochrsik_14_14_3_3_gt_80)
+        & (last_close > (last_candle["SMA_30"] * 1.022))
+        & (last_close > (last_bbu_20_2_0 * 1.0))
+      ),
+      (
         (last_rsi_14_gt_64)
-        and (last_rsi_3_lt_95)
-        and (last_rsi_3_15m_lt_90)
-        and (last_rsi_3_1h_lt_90)
-        and (last_rsi_3_4h_lt_90)
-        and (last_rsi_3_1d_lt_90)
-        and (last_stochrsik_14_14_3_3 > 70.0)
-        and (last_close < (last_close_min_48 * 1.15))
-        and (last_close < (last_low_min_6_1h * 1.20))
-        and (last_close < (last_low_min_12_1h * 1.33))
-        and (last_close > (last_high_max_12_4h * 0.75))
-        and (last_ema_12 > last_ema_26)
-        and ((last_ema_12 - last_ema_26) > (last_open * 0.018))
-        and ((previous_ema_12 - previous_ema_26) > (last_open / 100.0))
-      )
-      or (
+        & (last_rsi_3_lt_95)
+        & (last_rsi_3_15m_lt_90)
+        & (last_rsi_3_1h_lt_90)
+        & (last_rsi_3_4h_lt_90)
+        & (last_rsi_3_1d_lt_90)
+        & (last_stochrsik_14_14_3_3 > 70.0)
+        & (last_close < (last_close_min_48 * 1.15))
+        & (last_close < (last_low_min_6_1h * 1.20))
+        & (last_close < (last_low_min_12_1h * 1.33))
+        & (last_close > (last_high_max_12_4h * 0.75))
+        & (last_ema_12 > last_ema_26)
+        & ((last_ema_12 - last_ema_26) > (last_open * 0.018))
+        & ((previous_ema_12 - previous_ema_26) > (last_open / 100.0))
+      ),
+      (
         (last_rsi_3_lt_95)
-        and (previous_candle["SMA_9"] > previous_candle["SMA_21"])
-        and (last_candle["SMA_9"] < last_candle["SMA_21"])
-        and (last_close > (last_candle["EMA_100"] * 1.016))
-        and (last_rsi_3_1h < 80.0)
-        and (last_rsi_3_4h < 80.0)
-      )
-      or (
-        (slice_profit > 0.12)
-        and (last_rsi_3_lt_95)
-        and (last_rsi_3_15m_lt_90)
-        and (last_rsi_14 > 60.0)
-        and (last_aroond_14_lt_25)
-        and (last_aroond_14_15m < 30.0)
-        and (last_stochrsik_14_14_3_3_gt_80)
-        and (last_stochrsi_k_15m > 70.0)
-        and (last_rsi_14_1h > 50.0)
-        and (last_candle["RSI_14_4h"] > 50.0)
-      )
-      or (
+        & (previous_candle["SMA_9"] > previous_candle["SMA_21"])
+        & (last_candle["SMA_9"] < last_candle["SMA_21"])
+        & (last_close > (last_candle["EMA_100"] * 1.016))
+        & (last_rsi_3_1h < 80.0)
+        & (last_rsi_3_4h < 80.0)
+      ),
+      (
+        (last_rsi_3_lt_95)
+        & (last_rsi_3_15m_lt_90)
+        & (last_rsi_14 > 60.0)
+        & (last_aroond_14_lt_25)
+        & (last_aroond_14_15m < 30.0)
+        & (last_stochrsik_14_14_3_3_gt_80)
+        & (last_stochrsi_k_15m > 70.0)
+        & (last_rsi_14_1h > 50.0)
+        & (last_candle["RSI_14_4h"] > 50.0)
+      ),
+      (
         (last_rsi_14_gt_64)
-        and (last_rsi_3_lt_95)
-        and (last_rsi_3_1h_lt_90)
-        and (last_rsi_3_4h_lt_90)
-        and (last_close > (last_ema_12 * 1.001))
-        and (last_close > (last_candle["BBL_20_2.0"] * 1.004))
-      )
-    ):
-      return True
-
-    return False
+        & (last_rsi_3_lt_95)
+        & (last_rsi_3_1h_lt_90)
+        & (last_rsi_3_4h_lt_90)
+        & (last_close > (last_ema_12 * 1.001))
+        & (last_close > (last_candle["BBL_20_2.0"] * 1.004))
+      ),
+    ]
 
   def short_buyback_exit_v2(
     self, last_candle: Series, previous_candle: Series, slice_profit: float, is_derisk: bool
@@ -71500,20 +71407,18 @@ class NostalgiaForInfinityX7(IStrategy):
         exit_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
       ft_exit_amount = exit_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
       if exit_amount > min_stake and ft_exit_amount > min_stake:
-        self.dp.send_msg(
-          self.notification_msg(
-            "grinding-exit",
-            tag=name,
-            pair=trade.pair,
-            rate=exit_rate,
-            stake_amount=exit_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=self.config["stake_currency"],
-            grind_profit_stake=grind_profit_stake,
-            grind_profit_pct=profit,
-            coin_amount=grind_total_amount,
-          )
+        self.notify(
+          "grinding-exit",
+          tag=name,
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=exit_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit_stake,
+          grind_profit_pct=profit,
+          coin_amount=grind_total_amount,
         )
         log.info(
           f"Grinding exit ({name}) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {exit_amount:{stake_fmt}} | Coin amount: {grind_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(profit * 100.0):.2f}% ({grind_profit_stake:{stake_fmt}} {self.config['stake_currency']})"
@@ -71543,8 +71448,7 @@ class NostalgiaForInfinityX7(IStrategy):
     **kwargs,
   ):
     dp = self.dp
-    send_msg = self.dp.send_msg
-    notification_msg = self.notification_msg
+    notify = self.notify
     config = self.config
     stake_currency = config["stake_currency"]
     is_futures_mode = self.is_futures_mode
@@ -71562,11 +71466,10 @@ class NostalgiaForInfinityX7(IStrategy):
       return None
 
     min_stake = self.correct_min_stake(min_stake, trade_leverage)
-    df, _ = dp.get_analyzed_dataframe(trade_pair, self.timeframe)
-    if len(df) < 2:
+    candles = self.analyzed_candles(trade_pair)
+    if len(candles) < 2:
       return None
-    last_candle = df.iloc[-1]
-    previous_candle = df.iloc[-2]
+    last_candle, previous_candle = candles
 
     exit_rate = current_rate
     filled_orders, filled_entries, filled_exits, profit_values = self.profit_or_order_snapshot(
@@ -71587,8 +71490,12 @@ class NostalgiaForInfinityX7(IStrategy):
             if ticker["bid"] is not None:
               exit_rate = ticker["bid"]
 
-    if profit_values is None:
+    # The snapshot is at current_rate, the live ticker can give another rate
+    if profit_values is None or exit_rate != current_rate:
       profit_values = self.calc_total_profit(trade, filled_entries, filled_exits, exit_rate)
+      self.cache_profit_snapshot(
+        trade, current_time, exit_rate, filled_orders, filled_entries, filled_exits, profit_values
+      )
     profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = profit_values
 
     current_stake_amount = trade_amount * exit_rate
@@ -71728,218 +71635,90 @@ class NostalgiaForInfinityX7(IStrategy):
       self.system_v3_1_rebuy_thresholds_futures if is_futures_mode else self.system_v3_1_rebuy_thresholds_spot
     )
 
-    is_derisk_1 = False
-    is_derisk_1_found = False  # derisk_level_1 de-risk exit
-    derisk_1_order = None
-    is_derisk_2 = False
-    is_derisk_2_found = False  # derisk_level_2 de-risk exit
-    derisk_2_order = None
-    is_derisk_3 = False
-    is_derisk_3_found = False  # derisk_level_3 de-risk exit
-    derisk_3_order = None
-    grind_1_sub_grind_count = 0
-    grind_1_total_amount = 0.0
-    grind_1_total_cost = 0.0
+    # The entries since the last exit of each grind ladder, kept up to date by order_filled
+    grind_ladders = self.trade_grind_ladders(trade, filled_orders)
+    custom_data = self.trade_custom_data(trade)
+    derisk_1_order, derisk_2_order, derisk_3_order = grind_ladders.derisk_orders[:3]
+    is_derisk_1 = is_derisk_1_found = derisk_1_order is not None  # derisk_level_1 de-risk exit
+    is_derisk_2 = is_derisk_2_found = derisk_2_order is not None  # derisk_level_2 de-risk exit
+    is_derisk_3 = is_derisk_3_found = derisk_3_order is not None  # derisk_level_3 de-risk exit
+    grind_1_orders, grind_1_buy_orders, grind_1_total_amount, grind_1_total_cost, grind_1_exit_order = (
+      grind_ladders.ladder("grind_1")
+    )
+    grind_1_sub_grind_count = len(grind_1_orders)
     grind_1_current_open_rate = 0.0
     grind_1_current_grind_stake = 0.0
     grind_1_current_grind_profit_stake = 0.0
     grind_1_current_grind_profit_rate = 0.0
-    grind_1_is_exit_found = False
-    grind_1_found = False
-    grind_1_buy_orders = []
-    grind_1_orders = []
+    grind_1_is_exit_found = grind_1_exit_order is not None
     grind_1_distance_ratio = 0.0
-    grind_1_exit_order = None
+    if grind_1_sub_grind_count > 0:
+      grind_1_distance_ratio = (exit_rate - grind_1_orders[0].safe_price) / grind_1_orders[0].safe_price
     grind_1_exit_distance_ratio = 0.0
-    grind_2_sub_grind_count = 0
-    grind_2_total_amount = 0.0
-    grind_2_total_cost = 0.0
+    grind_2_orders, grind_2_buy_orders, grind_2_total_amount, grind_2_total_cost, grind_2_exit_order = (
+      grind_ladders.ladder("grind_2")
+    )
+    grind_2_sub_grind_count = len(grind_2_orders)
     grind_2_current_open_rate = 0.0
     grind_2_current_grind_stake = 0.0
     grind_2_current_grind_profit_stake = 0.0
     grind_2_current_grind_profit_rate = 0.0
-    grind_2_is_exit_found = False
-    grind_2_found = False
-    grind_2_buy_orders = []
-    grind_2_orders = []
+    grind_2_is_exit_found = grind_2_exit_order is not None
     grind_2_distance_ratio = 0.0
-    grind_2_exit_order = None
+    if grind_2_sub_grind_count > 0:
+      grind_2_distance_ratio = (exit_rate - grind_2_orders[0].safe_price) / grind_2_orders[0].safe_price
     grind_2_exit_distance_ratio = 0.0
-    grind_3_sub_grind_count = 0
-    grind_3_total_amount = 0.0
-    grind_3_total_cost = 0.0
+    grind_3_orders, grind_3_buy_orders, grind_3_total_amount, grind_3_total_cost, grind_3_exit_order = (
+      grind_ladders.ladder("grind_3")
+    )
+    grind_3_sub_grind_count = len(grind_3_orders)
     grind_3_current_open_rate = 0.0
     grind_3_current_grind_stake = 0.0
     grind_3_current_grind_profit_stake = 0.0
     grind_3_current_grind_profit_rate = 0.0
-    grind_3_is_exit_found = False
-    grind_3_found = False
-    grind_3_buy_orders = []
-    grind_3_orders = []
+    grind_3_is_exit_found = grind_3_exit_order is not None
     grind_3_distance_ratio = 0.0
-    grind_3_exit_order = None
+    if grind_3_sub_grind_count > 0:
+      grind_3_distance_ratio = (exit_rate - grind_3_orders[0].safe_price) / grind_3_orders[0].safe_price
     grind_3_exit_distance_ratio = 0.0
-    grind_4_sub_grind_count = 0
-    grind_4_total_amount = 0.0
-    grind_4_total_cost = 0.0
+    grind_4_orders, grind_4_buy_orders, grind_4_total_amount, grind_4_total_cost, grind_4_exit_order = (
+      grind_ladders.ladder("grind_4")
+    )
+    grind_4_sub_grind_count = len(grind_4_orders)
     grind_4_current_open_rate = 0.0
     grind_4_current_grind_stake = 0.0
     grind_4_current_grind_profit_stake = 0.0
     grind_4_current_grind_profit_rate = 0.0
-    grind_4_is_exit_found = False
-    grind_4_found = False
-    grind_4_buy_orders = []
-    grind_4_orders = []
+    grind_4_is_exit_found = grind_4_exit_order is not None
     grind_4_distance_ratio = 0.0
-    grind_4_exit_order = None
+    if grind_4_sub_grind_count > 0:
+      grind_4_distance_ratio = (exit_rate - grind_4_orders[0].safe_price) / grind_4_orders[0].safe_price
     grind_4_exit_distance_ratio = 0.0
-    grind_5_sub_grind_count = 0
-    grind_5_total_amount = 0.0
-    grind_5_total_cost = 0.0
+    grind_5_orders, grind_5_buy_orders, grind_5_total_amount, grind_5_total_cost, grind_5_exit_order = (
+      grind_ladders.ladder("grind_5")
+    )
+    grind_5_sub_grind_count = len(grind_5_orders)
     grind_5_current_open_rate = 0.0
     grind_5_current_grind_stake = 0.0
     grind_5_current_grind_profit_stake = 0.0
     grind_5_current_grind_profit_rate = 0.0
-    grind_5_is_exit_found = False
-    grind_5_found = False
-    grind_5_buy_orders = []
-    grind_5_orders = []
+    grind_5_is_exit_found = grind_5_exit_order is not None
     grind_5_distance_ratio = 0.0
-    grind_5_exit_order = None
+    if grind_5_sub_grind_count > 0:
+      grind_5_distance_ratio = (exit_rate - grind_5_orders[0].safe_price) / grind_5_orders[0].safe_price
     grind_5_exit_distance_ratio = 0.0
-    rebuy_sub_grind_count = 0
-    rebuy_total_amount = 0.0
-    rebuy_total_cost = 0.0
+    rebuy_orders, rebuy_buy_orders, rebuy_total_amount, rebuy_total_cost, rebuy_exit_order = grind_ladders.ladder(
+      "rebuy"
+    )
+    rebuy_sub_grind_count = len(rebuy_orders)
     rebuy_current_open_rate = 0.0
     rebuy_current_grind_stake = 0.0
     rebuy_current_grind_stake_profit = 0.0
-    rebuy_is_exit_found = False
-    rebuy_found = False
-    rebuy_buy_orders = []
-    rebuy_orders = []
+    rebuy_is_exit_found = rebuy_exit_order is not None
     rebuy_distance_ratio = 0.0
-    rebuy_exit_order = None
+    if rebuy_sub_grind_count > 0:
+      rebuy_distance_ratio = (exit_rate - rebuy_orders[0].safe_price) / rebuy_orders[0].safe_price
     rebuy_exit_distance_ratio = 0.0
-    for order in reversed(filled_orders):
-      if (order.ft_order_side == "sell") and (order is not filled_orders[0]):
-        order_tag = ""
-        if has_order_tags:
-          if order.ft_order_tag is not None:
-            order_tag = order.ft_order_tag
-        if not grind_1_is_exit_found and order_tag == "grind_1_entry":
-          grind_1_sub_grind_count += 1
-          grind_1_total_amount += order.safe_filled
-          grind_1_total_cost += order.safe_filled * order.safe_price
-          grind_1_buy_orders.append(order.id)
-          grind_1_orders.append(order)
-          if not grind_1_found:
-            grind_1_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
-            grind_1_found = True
-        elif not grind_2_is_exit_found and order_tag == "grind_2_entry":
-          grind_2_sub_grind_count += 1
-          grind_2_total_amount += order.safe_filled
-          grind_2_total_cost += order.safe_filled * order.safe_price
-          grind_2_buy_orders.append(order.id)
-          grind_2_orders.append(order)
-          if not grind_2_found:
-            grind_2_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
-            grind_2_found = True
-        elif not grind_3_is_exit_found and order_tag == "grind_3_entry":
-          grind_3_sub_grind_count += 1
-          grind_3_total_amount += order.safe_filled
-          grind_3_total_cost += order.safe_filled * order.safe_price
-          grind_3_buy_orders.append(order.id)
-          grind_3_orders.append(order)
-          if not grind_3_found:
-            grind_3_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
-            grind_3_found = True
-        elif not grind_4_is_exit_found and order_tag == "grind_4_entry":
-          grind_4_sub_grind_count += 1
-          grind_4_total_amount += order.safe_filled
-          grind_4_total_cost += order.safe_filled * order.safe_price
-          grind_4_buy_orders.append(order.id)
-          grind_4_orders.append(order)
-          if not grind_4_found:
-            grind_4_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
-            grind_4_found = True
-        elif not grind_5_is_exit_found and order_tag == "grind_5_entry":
-          grind_5_sub_grind_count += 1
-          grind_5_total_amount += order.safe_filled
-          grind_5_total_cost += order.safe_filled * order.safe_price
-          grind_5_buy_orders.append(order.id)
-          grind_5_orders.append(order)
-          if not grind_5_found:
-            grind_5_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
-            grind_5_found = True
-        elif not rebuy_is_exit_found and order_tag == "rebuy_entry":
-          rebuy_sub_grind_count += 1
-          rebuy_total_amount += order.safe_filled
-          rebuy_total_cost += order.safe_filled * order.safe_price
-          rebuy_buy_orders.append(order.id)
-          rebuy_orders.append(order)
-          if not rebuy_found:
-            rebuy_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
-            rebuy_found = True
-      elif order.ft_order_side == "buy":
-        if order is filled_exits[-1] and (order.safe_remaining * exit_rate / stake_scale_leverage) > min_stake:
-          partial_sell = True
-          # break
-        order_tag = ""
-        if has_order_tags:
-          if order.ft_order_tag is not None:
-            order_tag = order.ft_order_tag.partition(" ")[0]
-        if order_tag == "derisk_level_1":
-          if not is_derisk_1_found:
-            is_derisk_1_found = True
-            is_derisk_1 = True
-            derisk_1_order = order
-        elif order_tag == "derisk_level_2":
-          if not is_derisk_2_found:
-            is_derisk_2_found = True
-            is_derisk_2 = True
-            derisk_2_order = order
-        elif order_tag == "derisk_level_3":
-          if not is_derisk_3_found:
-            is_derisk_3_found = True
-            is_derisk_3 = True
-            derisk_3_order = order
-        elif not grind_1_is_exit_found and order_tag in ["grind_1_exit", "grind_1_derisk"]:
-          grind_1_is_exit_found = True
-          grind_1_exit_order = order
-        elif not grind_2_is_exit_found and order_tag in ["grind_2_exit", "grind_2_derisk"]:
-          grind_2_is_exit_found = True
-          grind_2_exit_order = order
-        elif not grind_3_is_exit_found and order_tag in ["grind_3_exit", "grind_3_derisk"]:
-          grind_3_is_exit_found = True
-          grind_3_exit_order = order
-        elif not grind_4_is_exit_found and order_tag in ["grind_4_exit", "grind_4_derisk"]:
-          grind_4_is_exit_found = True
-          grind_4_exit_order = order
-        elif not grind_5_is_exit_found and order_tag in ["grind_5_exit", "grind_5_derisk"]:
-          grind_5_is_exit_found = True
-          grind_5_exit_order = order
-        elif not rebuy_is_exit_found and order_tag in ["rebuy_exit", "rebuy_derisk"]:
-          rebuy_is_exit_found = True
-          rebuy_exit_order = order
-        elif order_tag == "derisk_global":
-          if not grind_1_is_exit_found:
-            grind_1_is_exit_found = True
-            grind_1_exit_order = order
-          if not grind_2_is_exit_found:
-            grind_2_is_exit_found = True
-            grind_2_exit_order = order
-          if not grind_3_is_exit_found:
-            grind_3_is_exit_found = True
-            grind_3_exit_order = order
-          if not grind_4_is_exit_found:
-            grind_4_is_exit_found = True
-            grind_4_exit_order = order
-          if not grind_5_is_exit_found:
-            grind_5_is_exit_found = True
-            grind_5_exit_order = order
-          if not rebuy_is_exit_found:
-            rebuy_is_exit_found = True
-            rebuy_exit_order = order
 
     if grind_1_sub_grind_count > 0:
       grind_1_current_open_rate = grind_1_total_cost / grind_1_total_amount
@@ -72006,40 +71785,25 @@ class NostalgiaForInfinityX7(IStrategy):
     is_not_trade_max_stake_v3 = current_stake_amount < (slice_amount * self.system_v3_max_stake)
     is_not_trade_max_stake_v3_1 = current_stake_amount < (slice_amount * self.system_v3_1_max_stake)
 
-    grind_1_cluster_max_profit_stake = trade.get_custom_data(key="grind_1_cluster_max_profit_stake") or 0.0
-    grind_1_cluster_max_profit_rate = trade.get_custom_data(key="grind_1_cluster_max_profit_rate") or 0.0
-    if grind_1_current_grind_profit_stake > grind_1_cluster_max_profit_stake:
-      trade.set_custom_data(key="grind_1_cluster_max_profit_stake", value=grind_1_current_grind_profit_stake)
-    if grind_1_current_grind_profit_rate < grind_1_cluster_max_profit_rate:
-      trade.set_custom_data(key="grind_1_cluster_max_profit_rate", value=grind_1_current_grind_profit_rate)
-
-    grind_2_cluster_max_profit_stake = trade.get_custom_data(key="grind_2_cluster_max_profit_stake") or 0.0
-    grind_2_cluster_max_profit_rate = trade.get_custom_data(key="grind_2_cluster_max_profit_rate") or 0.0
-    if grind_2_current_grind_profit_stake > grind_2_cluster_max_profit_stake:
-      trade.set_custom_data(key="grind_2_cluster_max_profit_stake", value=grind_2_current_grind_profit_stake)
-    if grind_2_current_grind_profit_rate < grind_2_cluster_max_profit_rate:
-      trade.set_custom_data(key="grind_2_cluster_max_profit_rate", value=grind_2_current_grind_profit_rate)
-
-    grind_3_cluster_max_profit_stake = trade.get_custom_data(key="grind_3_cluster_max_profit_stake") or 0.0
-    grind_3_cluster_max_profit_rate = trade.get_custom_data(key="grind_3_cluster_max_profit_rate") or 0.0
-    if grind_3_current_grind_profit_stake > grind_3_cluster_max_profit_stake:
-      trade.set_custom_data(key="grind_3_cluster_max_profit_stake", value=grind_3_current_grind_profit_stake)
-    if grind_3_current_grind_profit_rate < grind_3_cluster_max_profit_rate:
-      trade.set_custom_data(key="grind_3_cluster_max_profit_rate", value=grind_3_current_grind_profit_rate)
-
-    grind_4_cluster_max_profit_stake = trade.get_custom_data(key="grind_4_cluster_max_profit_stake") or 0.0
-    grind_4_cluster_max_profit_rate = trade.get_custom_data(key="grind_4_cluster_max_profit_rate") or 0.0
-    if grind_4_current_grind_profit_stake > grind_4_cluster_max_profit_stake:
-      trade.set_custom_data(key="grind_4_cluster_max_profit_stake", value=grind_4_current_grind_profit_stake)
-    if grind_4_current_grind_profit_rate < grind_4_cluster_max_profit_rate:
-      trade.set_custom_data(key="grind_4_cluster_max_profit_rate", value=grind_4_current_grind_profit_rate)
-
-    grind_5_cluster_max_profit_stake = trade.get_custom_data(key="grind_5_cluster_max_profit_stake") or 0.0
-    grind_5_cluster_max_profit_rate = trade.get_custom_data(key="grind_5_cluster_max_profit_rate") or 0.0
-    if grind_5_current_grind_profit_stake > grind_5_cluster_max_profit_stake:
-      trade.set_custom_data(key="grind_5_cluster_max_profit_stake", value=grind_5_current_grind_profit_stake)
-    if grind_5_current_grind_profit_rate < grind_5_cluster_max_profit_rate:
-      trade.set_custom_data(key="grind_5_cluster_max_profit_rate", value=grind_5_current_grind_profit_rate)
+    grind_1_cluster_max_profit_stake, grind_1_cluster_max_profit_rate = grind_ladders.update_cluster_max_profit(
+      custom_data, "grind_1", grind_1_current_grind_profit_stake, grind_1_current_grind_profit_rate
+    )
+
+    grind_2_cluster_max_profit_stake, grind_2_cluster_max_profit_rate = grind_ladders.update_cluster_max_profit(
+      custom_data, "grind_2", grind_2_current_grind_profit_stake, grind_2_current_grind_profit_rate
+    )
+
+    grind_3_cluster_max_profit_stake, grind_3_cluster_max_profit_rate = grind_ladders.update_cluster_max_profit(
+      custom_data, "grind_3", grind_3_current_grind_profit_stake, grind_3_current_grind_profit_rate
+    )
+
+    grind_4_cluster_max_profit_stake, grind_4_cluster_max_profit_rate = grind_ladders.update_cluster_max_profit(
+      custom_data, "grind_4", grind_4_current_grind_profit_stake, grind_4_current_grind_profit_rate
+    )
+
+    grind_5_cluster_max_profit_stake, grind_5_cluster_max_profit_rate = grind_ladders.update_cluster_max_profit(
+      custom_data, "grind_5", grind_5_current_grind_profit_stake, grind_5_current_grind_profit_rate
+    )
 
     is_short_extra_checks_entry = (
       grind_entry_retry_time > filled_entries[-1].order_filled_utc
@@ -72111,17 +71875,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="Level 1",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="Level 1",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk Level 1 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -72180,17 +71942,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="Level 2",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="Level 2",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk Level 2 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -72249,17 +72009,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="Level 3",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="Level 3",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk Level 3 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -72282,17 +72040,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_1_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_1_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_1_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Tag: {self._grind_entry_tag}"
@@ -72353,20 +72109,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_1_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_1_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_1_current_grind_profit_stake,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_1_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_1_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_1_current_grind_profit_stake,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_1_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_1_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_profit_stake:{stake_fmt}} {stake_currency})"
@@ -72395,17 +72149,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_2_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_2_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_2_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Tag: {self._grind_entry_tag}"
@@ -72466,20 +72218,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_2_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_2_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_2_current_grind_profit_stake,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_2_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_2_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_2_current_grind_profit_stake,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_2_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_2_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_2_current_grind_profit_stake:{stake_fmt}} {stake_currency})"
@@ -72508,17 +72258,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_3_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_3_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_3_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Tag: {self._grind_entry_tag}"
@@ -72579,20 +72327,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_3_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_3_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_3_current_grind_profit_stake,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_3_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_3_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_3_current_grind_profit_stake,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_3_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_3_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_3_current_grind_profit_stake:{stake_fmt}} {stake_currency})"
@@ -72637,17 +72383,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_4_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_4_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_4_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Tag: {self._grind_entry_tag}"
@@ -72708,20 +72452,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_4_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_4_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_4_current_grind_profit_stake,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_4_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_4_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_4_current_grind_profit_stake,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_4_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_4_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_4_current_grind_profit_stake:{stake_fmt}} {stake_currency})"
@@ -72769,17 +72511,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="grind_5_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "grinding-entry",
+        tag="grind_5_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Grinding entry (grind_5_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Tag: {self._grind_entry_tag}"
@@ -72840,20 +72580,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_5_is_exit_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-derisk",
-            tag="grind_5_derisk",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_5_current_grind_profit_stake,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_5_total_amount,
-          )
+        notify(
+          "grinding-derisk",
+          tag="grind_5_derisk",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_5_current_grind_profit_stake,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_5_total_amount,
         )
         log.info(
           f"Grinding de-risk (grind_5_derisk) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_5_current_grind_profit_stake:{stake_fmt}} {stake_currency})"
@@ -72882,17 +72620,15 @@ class NostalgiaForInfinityX7(IStrategy):
         buy_amount = min_stake * 1.5
       if buy_amount > max_stake:
         return None
-      send_msg(
-        notification_msg(
-          "rebuy",
-          tag="rebuy_entry",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-        )
+      notify(
+        "rebuy",
+        tag="rebuy_entry",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
       )
       log.info(
         f"Rebuy (rebuy_entry) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -72907,6 +72643,24 @@ class NostalgiaForInfinityX7(IStrategy):
   def short_grind_entry_v3(
     self, last_candle: Series, previous_candle: Series, slice_profit: float, is_derisk: bool
   ) -> float:
+    if last_candle["protections_short_global"] != True:
+      return False
+    # g0 — signal entry
+    if last_candle["enter_short"] == True:
+      self._grind_entry_tag = "g0"
+      return True
+
+    # g1 to g27, on the candle part of the rules precomputed by short_grind_entry_v3_rules
+    tag = SHORT_GRIND_ENTRY_V3_RULES.first_rule(last_candle, slice_profit, is_derisk=is_derisk)
+    if tag is not None:
+      self._grind_entry_tag = tag
+      return True
+
+    self._grind_entry_tag = ""
+    return False
+
+  def short_grind_entry_v3_rules(self, last_candle: "CandleColumns", previous_candle: "CandleColumns") -> list:
+    """The candle part of the `short_grind_entry_v3` rules, by candle, in the order of SHORT_GRIND_ENTRY_V3_RULES."""
     last_close = last_candle["close"]
     last_open = last_candle["open"]
     last_close_max_12 = last_candle["close_max_12"]
@@ -72961,540 +72715,476 @@ class NostalgiaForInfinityX7(IStrategy):
     prev_ema_12 = previous_candle["EMA_12"]
     prev_ema_26 = previous_candle["EMA_26"]
 
-    if last_candle["protections_short_global"] != True:
-      return False
-    # g0 — signal entry
-    if last_candle["enter_short"] == True:
-      self._grind_entry_tag = "g0"
-      return True
-    # g1 — AROONU rally + EMA_16 rise (mirror long g1)
-    if (
-      (last_rsi_3 < 90.0)
-      and (last_rsi_3_15m < 85.0)
-      and (last_rsi_3_1h < 85.0)
-      and (last_rsi_3_4h < 85.0)
-      and (last_rsi_14 > 55.0)
-      and (last_aroonu_14 > 75.0)
-      and (last_aroonu_14_4h > 0.0)
-      and (last_roc_9_1h > -20.0)
-      and (last_close < (last_close_min_48 * 1.10))
-      and (last_close > (last_high_max_24_4h * 0.40))
-      and (last_close > (last_ema_16 * 1.025))
-      and ((last_rsi_3_1h < 65.0) or (last_aroonu_14_1h > 0.0))
-      and ((last_aroonu_14_1h > 0.0) or (last_aroonu_14_1d > 0.0))
-      and ((last_aroonu_14_1d > 0.0) or (last_stochrsi_k_1h > 10.0))
-    ):
-      self._grind_entry_tag = "g1"
-      return True
-    # g2 — EMA_12 > EMA_26 divergence + BBU (mirror long g2)
-    if (
-      (last_rsi_3 < 95.0)
-      and (last_rsi_3_15m < 90.0)
-      and (last_rsi_3_1h < 85.0)
-      and (last_rsi_3_4h < 85.0)
-      and (last_rsi_14 > 70.0)
-      and (last_stochrsi_k > 70.0)
-      and (last_ema_12 > last_ema_26)
-      and ((last_ema_12 - last_ema_26) > (last_open * 0.020))
-      and ((prev_ema_12 - prev_ema_26) > (last_open / 100.0))
-      and (last_close > (last_bbu * 0.990))
-    ):
-      self._grind_entry_tag = "g2"
-      return True
-    # g3 — AROONU_15m rally + EMA_12 rise (mirror long g3)
-    if (
-      (last_rsi_3 < 90.0)
-      and (last_rsi_3_15m < 90.0)
-      and (last_rsi_3_1h < 90.0)
-      and (last_rsi_3_4h < 85.0)
-      and (last_rsi_14 > 65.0)
-      and (last_aroonu_14_15m > 75.0)
-      and (last_stochrsi_k_15m > 30.0)
-      and (last_stochrsi_k_1h > 10.0)
-      and (last_roc_9_1h < 15.0)
-      and (last_roc_9_4h < 15.0)
-      and (last_close < (last_close_min_48 * 1.15))
-      and (last_close > (last_ema_12 * 1.020))
-      and ((last_rsi_3_1h < 80.0) or (last_rsi_3_1d < 80.0))
-      and ((last_rsi_3_1h < 80.0) or (last_stochrsi_k_1d > 30.0))
-      and ((last_rsi_3_1h < 75.0) or (last_stochrsi_k_1h > 30.0))
-      and ((last_rsi_3_4h < 70.0) or (last_stochrsi_k_4h > 40.0))
-    ):
-      self._grind_entry_tag = "g3"
-      return True
-    # g4 — multi-TF RSI + EMA_26 + BBU (mirror long g4)
-    if (
-      (last_rsi_3 < 90.0)
-      and (last_rsi_3_15m < 90.0)
-      and (last_rsi_3_1h < 90.0)
-      and (last_rsi_3_4h < 90.0)
-      and (last_rsi_3_1d < 90.0)
-      and (last_rsi_14 > 65.0)
-      and (last_aroonu_14 > 75.0)
-      and (last_roc_9_1h < 20.0)
-      and (last_roc_9_4h < 20.0)
-      # and (last_close < (last_close_min_48 * 1.10))
-      and (last_close > (last_ema_26 * 1.030))
-      and (last_close > (last_bbu * 1.001))
-    ):
-      self._grind_entry_tag = "g4"
-      return True
-    # g5 — rally top + EMA_9/20 (mirror long g5)
-    if (
-      (last_rsi_3 < 90.0)
-      and (last_rsi_3_15m < 90.0)
-      and (last_rsi_3_1h < 85.0)
-      and (last_rsi_3_4h < 85.0)
-      and (last_rsi_14 > 65.0)
-      and (last_aroonu_14 > 70.0)
-      and (last_roc_9_4h < 20.0)
-      and (last_close < (last_low_min_24_1h * 1.20))
-      and (last_close > (last_high_max_12_4h * 0.50))
-      and (last_close > (last_ema_9 * 1.025))
-      and (last_close > (last_ema_20 * 1.030))
-    ):
-      self._grind_entry_tag = "g5"
-      return True
-    # g6 — RSI_20 rising + SMA_16 rise (mirror long g6)
-    if (
-      (last_rsi_3 < 95.0)
-      and (last_rsi_3 > 60.0)
-      and (last_rsi_3_15m < 85.0)
-      and (last_rsi_14 < 65.0)
-      and (last_roc_9_1h < 20.0)
-      and (last_roc_9_4h < 20.0)
-      and (last_aroonu_14 > 75.0)
-      and (last_close > (last_high_max_12_4h * 0.40))
-      and (last_rsi_20 > prev_rsi_20)
-      and (last_close > (last_sma_16 * 1.040))
-      and ((last_aroonu_14_1d > 0.0) or (last_roc_9_1d > -50.0))
-    ):
-      self._grind_entry_tag = "g6"
-      return True
-    # g7 — WILLR overbought + BBB wide (mirror long g7)
-    if (
-      (last_rsi_3 < 95.0)
-      and (last_rsi_3_15m < 80.0)
-      and (last_rsi_3_1h < 80.0)
-      and (last_rsi_3_4h < 80.0)
-      and (last_willr_14 > -50.0)
-      and (last_willr_84_1h > -30.0)
-      and (last_stochrsi_k > 70.0)
-      and (last_stochrsi_k_1h > 10.0)
-      and (last_roc_9_1h < 10.0)
-      and (last_roc_9_1h > -20.0)
-      and (last_roc_9_4h < 10.0)
-      and (last_close > (last_high_max_24_4h * 0.50))
-      and (last_bbb_1h > 12.0)
-      and (last_close_min_48 <= (last_close * 0.90))
-    ):
-      self._grind_entry_tag = "g7"
-      return True
-    # g8 — EMA_12/26 gap wide + high_max_24_1h (mirror long g8)
-    if (
-      (last_rsi_3 > 70.0)
-      and (last_rsi_3 < 95.0)
-      and (last_rsi_3_15m < 90.0)
-      and (last_rsi_3_1h < 90.0)
-      and (last_rsi_3_4h < 90.0)
-      and (last_roc_9_1h < 10.0)
-      and (last_roc_9_4h < 25.0)
-      # and (last_close > (last_candle["high_max_24_1h"] * 0.70))
-      and (last_ema_12 > last_ema_26)
-      and ((last_ema_12 - last_ema_26) > (last_open * 0.030))
-      and ((prev_ema_12 - prev_ema_26) > (last_open / 100.0))
-    ):
-      self._grind_entry_tag = "g8"
-      return True
-    # g9 — pullback fade (mirror long g9)
-    if (
-      (last_rsi_3 < 95.0)
-      and (last_rsi_3_15m < 85.0)
-      and (last_rsi_3_1h < 80.0)
-      and (last_rsi_3_4h < 80.0)
-      and (last_stochrsi_k > 50.0)
-      and (last_close > (last_close_min_48 * 1.10))
-      and (last_close < (last_close_max_12 * 0.97))
-    ):
-      self._grind_entry_tag = "g9"
-      return True
-    # g10 — RSI_14 divergence vs 1h (mirror long g10)
-    if (
-      (last_rsi_3 < 95.0)
-      and (last_rsi_3_15m < 80.0)
-      and (last_stochrsi_k > 80.0)
-      and (last_rsi_14 > (last_rsi_14_1h + 45.0))
-    ):
-      self._grind_entry_tag = "g10"
-      return True
-    # g11 — multi-TF RSI + SMA_30 + BBU (mirror long g11)
-    if (
-      (last_rsi_3 < 95.0)
-      and (last_rsi_3_15m < 90.0)
-      and (last_rsi_3_1h < 90.0)
-      and (last_cmf_20 < 0.0)
-      and (last_close > (last_sma_30 * 1.035))
-      and (last_close > (last_bbu * 1.000))
-    ):
-      self._grind_entry_tag = "g11"
-      return True
-    # g12 — EMA_12/26 divergence + close_min_48 (mirror long g12)
-    if (
-      (last_rsi_3 < 95.0)
-      and (last_rsi_3_15m < 90.0)
-      and (last_rsi_3_1h < 90.0)
-      and (last_stochrsi_k > 70.0)
-      and (last_close < (last_close_min_48 * 1.10))
-      and (last_close > (last_high_max_12_4h * 0.40))
-      and (last_ema_12 > last_ema_26)
-      and ((last_ema_12 - last_ema_26) > (last_open * 0.025))
-      and ((prev_ema_12 - prev_ema_26) > (last_open / 100.0))
-    ):
-      self._grind_entry_tag = "g12"
-      return True
-    # g13 — SMA_9 cross SMA_21 down + EMA_100 rise (mirror long g13)
-    if (
-      (last_rsi_3 < 95.0)
-      and (last_rsi_3_1h < 80.0)
-      and (last_rsi_14_1h < 60.0)
-      and (last_stochrsi_k_15m > 20.0)
-      and (last_roc_9_1h < 15.0)
-      and (last_roc_9_4h < 15.0)
-      and (prev_sma_9 > prev_sma_21)
-      and (last_sma_9 < last_sma_21)
-      and (last_close > (last_ema_100 * 1.025))
-      and ((last_rsi_3_4h < 60.0) or (last_roc_9_4h > -30.0))
-    ):
-      self._grind_entry_tag = "g13"
-      return True
-    # g14 — SMA_9 cross down + 4h downtrend (trend follower) (mirror long g14)
-    if (
-      (last_rsi_3 < 95.0)
-      and (last_aroonu_14_15m > 50.0)
-      and (last_stochrsi_k > 60.0)
-      and (last_stochrsi_k_15m > 30.0)
-      and (prev_sma_9 > prev_sma_21)
-      and (last_sma_9 < last_sma_21)
-      and (last_ema_12_4h < last_ema_200_4h)
-      and (last_close < (last_close_min_48 * 1.10))
-      and ((last_rsi_3_1h < 70.0) or (last_stochrsi_k_1h > 30.0))
-      and ((last_rsi_3_1h < 60.0) or (last_aroonu_14_1h > 20.0))
-      and ((last_rsi_3_1d < 75.0) or (last_stochrsi_k_1h > 20.0))
-      and ((last_stochrsi_k_1h > 20.0) or (last_stochrsi_k_1d > 10.0))
-    ):
-      self._grind_entry_tag = "g14"
-      return True
-    # g15 — deep loss recovery (slice_profit < -0.16) (mirror long g15)
-    if (
-      (slice_profit < -0.16)
-      and (last_rsi_3 < 95.0)
-      and (last_rsi_3_15m < 90.0)
-      and (last_rsi_14 > 60.0)
-      and (last_aroonu_14 > 75.0)
-      and (last_aroonu_14_15m > 70.0)
-      and (last_stochrsi_k > 70.0)
-      and (last_stochrsi_k_15m > 70.0)
-      and ((last_rsi_3_1h < 70.0) or (last_stochrsi_k_1h > 20.0))
-      and ((last_rsi_3_4h < 70.0) or (last_stochrsi_k_4h > 20.0))
-      and ((last_rsi_3_1d < 70.0) or (last_stochrsi_k_1d > 20.0))
-    ):
-      self._grind_entry_tag = "g15"
-      return True
-    # g16 — EMA_12 rise + BBU (mirror long g16)
-    if (
-      (last_rsi_3 < 92.0)
-      and (last_rsi_3_15m < 85.0)
-      and (last_rsi_3_1h < 85.0)
-      and (last_rsi_3_4h < 85.0)
-      and (last_rsi_14 > 65.0)
-      and (last_close > (last_ema_12 * 1.035))
-      and (last_close > (last_bbu * 1.001))
-    ):
-      self._grind_entry_tag = "g16"
-      return True
-    # g17 — StochRSI + EMA_20 rise (mirror long g17)
-    if (
-      (last_rsi_3 < 85.0)
-      and (last_rsi_3_15m < 85.0)
-      and (last_rsi_3_1h < 85.0)
-      and (last_rsi_3_4h < 85.0)
-      and (last_rsi_14 > 70.0)
-      and (last_stochrsi_k > 70.0)
-      and (last_close > (last_ema_20 * 1.025))
-      and ((last_aroonu_14_4h > 0.0) or (last_aroonu_14_1d > 0.0))
-    ):
-      self._grind_entry_tag = "g17"
-      return True
-    # g18 — moderate loss recovery (slice_profit < -0.10) (mirror long g18)
-    if (
-      (slice_profit < -0.10)
-      and (last_rsi_3 < 95.0)
-      and (last_rsi_3_15m < 85.0)
-      and (last_rsi_3_1h < 80.0)
-      and (last_rsi_3_4h < 80.0)
-      and (last_rsi_14 > 60.0)
-      and (last_close > (last_ema_26 * 1.030))
-      and (last_close > (last_bbu * 1.001))
-    ):
-      self._grind_entry_tag = "g18"
-      return True
-    # g19 — EMA_12/26 wide gap (slice_profit < -0.06) (mirror long g19)
-    if (
-      (slice_profit < -0.06)
-      and (last_rsi_3 > 70.0)
-      and (last_rsi_3 < 95.0)
-      and (last_rsi_3_15m < 90.0)
-      and (last_ema_12 > last_ema_26)
-      and ((last_ema_12 - last_ema_26) > (last_open * 0.035))
-      and ((prev_ema_12 - prev_ema_26) > (last_open / 100.0))
-    ):
-      self._grind_entry_tag = "g19"
-      return True
-    # g20 — AROONU 4h downtrend bounce fade (mirror long g20)
-    if (
-      (last_rsi_3 < 90.0)
-      and (last_rsi_3_15m < 85.0)
-      and (last_rsi_3_1h < 80.0)
-      and (last_rsi_14 > 58.0)
-      and (last_rsi_14_4h < 50.0)
-      and (last_aroonu_14 > 70.0)
-      and (last_aroonu_14_4h < 50.0)
-      and (last_roc_9_1d < 15.0)
-      and (last_ema_50_4h < last_ema_100_4h)
-      and (last_close > (last_close_min_48 * 1.05))
-      and ((last_rsi_3_15m < 80.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_rsi_3_1h < 70.0) or (last_roc_9_4h > -30.0) or (last_roc_9_1d > -30.0))
-      and ((last_rsi_3_1h < 50.0) or (last_roc_9_1d > -60.0))
-      and ((last_rsi_3_4h < 60.0) or (last_aroonu_14_4h > 10.0))
-      and ((last_rsi_3_4h < 55.0) or (last_aroonu_14_4h > 0.0))
-      and ((last_rsi_3_4h < 40.0) or (last_roc_9_4h > -40.0))
-      and ((last_aroonu_14_4h > 0.0) or (last_stochrsi_k_1d > 20.0))
-      and ((last_aroonu_14_4h > 0.0) or (last_aroonu_14_1d > 0.0))
-      and ((last_stochrsi_k_4h > 10.0) or (last_roc_9_4h > -30.0))
-    ):
-      self._grind_entry_tag = "g20"
-      return True
-    # g21 — EMA_20 rise (slice_profit < -0.02) (mirror long g21)
-    if (
-      (slice_profit < -0.02)
-      and (last_rsi_3 < 90.0)
-      and (last_rsi_3_15m < 85.0)
-      and (last_rsi_14 > 65.0)
-      and (last_aroonu_14_15m > 50.0)
-      and (last_close > (last_ema_20 * 1.045))
-    ):
-      self._grind_entry_tag = "g21"
-      return True
-    # g22 — early breakdown rebuild: rejecting off the high BEFORE the 4h trend confirms (g14 needs
-    #        EMA_12_4h < EMA_200_4h and fires too late for a deep-derisk rejection). Anti-fake-drop gating via
-    #        multi-TF RSI weakness + rejection off the 4h high + not-extended. (mirror long g22)
-    if (
-      (last_rsi_3 < 70.0)
-      and (last_rsi_3_15m < 70.0)
-      and (last_rsi_14 < 55.0)
-      and (last_rsi_14_1h < 55.0)
-      and (last_roc_9_1h < 0.0)
-      and (last_roc_9_4h < 10.0)
-      # anti-capitulation: even at a formed top, a capitulative 4h overshoot reverses (dead-bounce).
-      and (last_roc_9_4h > -25.0)
-      # breakdown-started gate: only rebuild once the 4h top is IN (not still making new highs).
-      # AROONU high = a fresh 4h high was just made = still pumping; require it high = top formed.
-      and (last_aroonu_14_4h > 50.0)
-      # aggressive risk-free: g22 fires ONLY well above the 4h 200-EMA (fresh breakdown zone). The
-      # near/below-EMA overextended-drop zone is where dead-bounces live — g23 (extended-continuation)
-      # backstops the real breakdowns below. So g22 stays clean, g23 captures the continuation.
-      and (last_close > last_ema_200_4h)
-      and (last_close < (last_high_max_12_4h * 0.90))
-      and (last_close < (last_ema_20 * 1.03))
-      and (last_close > (last_ema_20 * 0.98))
-      and ((last_rsi_3_1h < 70.0) or (last_stochrsi_k_1d > 20.0))
-      and ((last_rsi_3_1h < 65.0) or (last_aroonu_14_1d > 0.0))
-      and ((last_rsi_3_4h < 50.0) or (last_aroonu_14_1h > 0.0))
-      and ((last_rsi_3_1d < 90.0) or (last_aroonu_14_1d > 30.0))
-      and ((last_rsi_3_1d < 90.0) or (last_stochrsi_k_4h > 30.0))
-      and ((last_rsi_3_1d < 60.0) or (last_stochrsi_k_1h > 20.0))
-      and ((last_rsi_3_1d < 60.0) or (last_stochrsi_k_4h > 20.0))
-      and ((last_rsi_3_1d < 55.0) or (last_aroonu_14_1h > 0.0))
-      and ((last_rsi_3_1d < 55.0) or (last_aroonu_14_4h > 0.0))
-      and ((last_rsi_3_1d < 55.0) or (last_stochrsi_k_1h > 10.0))
-      and ((last_rsi_3_1d < 55.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_rsi_3_1d < 35.0) or (last_aroonu_14_1h > 30.0) or (last_aroonu_14_1d > 10.0))
-      and ((last_aroonu_14_15m > 20.0) or (last_stochrsi_k_15m > 20.0))
-      and ((last_aroonu_14_15m > 20.0) or (last_aroonu_14_1h > 0.0))
-      and ((last_aroonu_14_15m > 0.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_roc_9_1d < 20.0) or (last_aroonu_14_4h > 0.0))
-      and ((last_roc_9_1d < 20.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_roc_9_1d < 30.0) or (last_stochrsi_k_1h > 10.0))
-    ):
-      self._grind_entry_tag = "g22"
-      return True
-    # g23 — breakdown-continuation scalp: extended zone BELOW g22's EMA_20*0.98 cap. Only rides a CONFIRMED
-    # continuation (price already declining past the rejection), so dead-bounces (which roll over before
-    # reaching the extended zone) are structurally avoided. Complements g22: g22 = early breakdown-start,
-    # g23 = confirmed continuation. (mirror long g23)
-    if (
-      (last_rsi_3 < 70.0)
-      and (last_rsi_3_15m < 70.0)
-      and (last_rsi_14 < 50.0)
-      and (last_rsi_14_1h < 50.0)
-      and (last_roc_9_1h < 0.0)
-      and (last_roc_9_4h < 0.0)
-      # anti-capitulation blow-off + anti-exhaustion bottom
-      and (last_roc_9_4h > -25.0)
-      and ((last_stochrsi_k > 3.0) or (last_rsi_14 > 20.0))
-      and (last_close < (last_high_max_12_4h * 0.90))
-      # extended zone: below g22's 0.98*EMA cap = continuation confirmed, not a rejection
-      and (last_close <= (last_ema_20 * 0.98))
-      and (last_close > (last_ema_20 * 0.88))
-      and ((last_rsi_3_1h < 55.0) or (last_aroonu_14_4h > 20.0))
-      and ((last_rsi_3_4h < 60.0) or (last_stochrsi_k_15m > 10.0))
-      and ((last_rsi_3_4h < 50.0) or (last_aroonu_14_4h > 30.0))
-      and ((last_rsi_3_1d < 85.0) or (last_stochrsi_k_1h > 20.0))
-      and ((last_rsi_3_1d < 70.0) or (last_aroonu_14_1h > 0.0))
-      and ((last_rsi_3_1d < 70.0) or (last_aroonu_14_4h > 0.0))
-      and ((last_rsi_3_1d < 50.0) or (last_stochrsi_k_1h > 20.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_rsi_3_1d < 45.0) or (last_aroonu_14_15m > 0.0) or (last_stochrsi_k_15m > 10.0))
-      and ((last_aroonu_14_15m > 0.0) or (last_aroonu_14_1h > 0.0))
-      and ((last_aroonu_14_15m > 0.0) or (last_aroonu_14_4h > 0.0))
-      and ((last_aroonu_14_15m > 0.0) or (last_aroonu_14_1d > 0.0))
-      and ((last_aroonu_14_15m > 0.0) or (last_stochrsi_k_15m > 10.0) or (last_stochrsi_k_1d > 20.0))
-      and ((last_aroonu_14_15m > 0.0) or (last_stochrsi_k_1h > 20.0))
-      and ((last_aroonu_14_15m > 0.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_aroonu_14_1h > 0.0) or (last_aroonu_14_4h > 0.0))
-      and ((last_aroonu_14_4h > 30.0) or (last_roc_9_1d > -50.0))
-      and ((last_aroonu_14_4h > 0.0) or (last_stochrsi_k_1h > 10.0))
-      and ((last_aroonu_14_4h > 0.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_aroonu_14_1d > 0.0) or (last_stochrsi_k_15m > 10.0))
-      and ((last_stochrsi_k_15m > 20.0) or (last_stochrsi_k_1h > 10.0))
-      and ((last_stochrsi_k_15m > 10.0) or (last_aroonu_14_1h > 0.0))
-      and ((last_stochrsi_k_15m > 10.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_stochrsi_k_1h > 10.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_stochrsi_k_1h > 10.0) or (last_stochrsi_k_4h > 10.0))
-    ):
-      self._grind_entry_tag = "g23"
-      return True
-
-    # g24 — downtrend-bounce continuation add: the zone BELOW the 4h 200-EMA that g22 explicitly sacrifices.
-    # (mirror long g24)
-    if (
-      # momentum healthy on the bounce: RSI holds down (a real reversal spikes RSI hard)
-      (last_rsi_3 < 80.0)
-      and (last_rsi_3_15m < 80.0)
-      and (last_rsi_14 < 60.0)
-      # trend intact + this is a BOUNCE not a reversal: 4h still falling, 1h not in melt-up
-      and (last_roc_9_1h < 10.0)
-      and (last_roc_9_4h < 0.0)
-      and (last_roc_9_4h > -25.0)  # anti-capitulation blow-off bottom
-      # bear scope-gate: confirmed 4h downtrend + price below the 200-EMA regime (complements g22's >200EMA)
-      and (last_ema_12_4h < last_ema_200_4h)
-      and (last_close < last_ema_200_4h)
-      # shallow bounce to the short EMA — short the bounce WITHIN the trend, never the bottom nor a deep dump
-      and (last_close > (last_ema_20 * 0.99))
-      and (last_close < (last_ema_20 * 1.06))
-      and ((last_rsi_3_15m < 60.0) or (last_stochrsi_k_15m > 30.0))
-      and ((last_rsi_3_1h < 85.0) or (last_aroonu_14_4h > 30.0))
-      and ((last_rsi_3_1h < 75.0) or (last_rsi_3_1d < 55.0) or (last_aroonu_14_1d > 30.0))
-      and ((last_rsi_3_1h < 75.0) or (last_aroonu_14_1h > 20.0))
-      and ((last_rsi_3_1h < 70.0) or (last_stochrsi_k_1d > 10.0) or (last_roc_9_1d > -10.0))
-      and ((last_rsi_3_1h < 65.0) or (last_stochrsi_k_1d > 10.0) or (last_roc_9_1d > -20.0))
-      and ((last_rsi_3_1h < 60.0) or (last_aroonu_14_4h > 0.0))
-      and ((last_rsi_3_1h < 60.0) or (last_stochrsi_k_1d > 20.0) or (last_roc_9_1d > -50.0))
-      and ((last_rsi_3_1h < 65.0) or (last_rsi_3_4h < 50.0) or (last_stochrsi_k_4h > 20.0))
-      and ((last_rsi_3_1h < 60.0) or (last_rsi_3_4h < 45.0) or (last_aroonu_14_4h > 10.0))
-      and ((last_rsi_3_1h < 40.0) or (last_stochrsi_k_1h > 40.0) or (last_stochrsi_k_1d > 10.0))
-      and ((last_rsi_3_1h < 35.0) or (last_aroonu_14_1h > 30.0) or (last_aroonu_14_1d > 10.0))
-      and ((last_rsi_3_4h < 75.0) or (last_roc_9_1d > -30.0))
-      and ((last_rsi_3_4h < 55.0) or (last_aroonu_14_4h > 30.0))
-      and ((last_rsi_3_4h < 50.0) or (last_stochrsi_k_4h > 20.0))
-      and ((last_rsi_3_1d < 65.0) or (last_stochrsi_k_15m > 10.0))
-      and ((last_rsi_3_1d < 65.0) or (last_stochrsi_k_1h > 10.0))
-      and ((last_rsi_3_1d < 65.0) or (last_stochrsi_k_4h > 20.0))
-      and ((last_rsi_14_1h > 30.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_aroonu_14_15m > 10.0) or (last_aroonu_14_1h > 0.0) or (last_stochrsi_k_1h > 20.0))
-      and ((last_aroonu_14_15m > 0.0) or (last_aroonu_14_1h > 0.0))
-      and ((last_aroonu_14_15m > 0.0) or (last_aroonu_14_4h > 0.0))
-      and ((last_aroonu_14_15m > 0.0) or (last_stochrsi_k_1h > 10.0))
-      and ((last_aroonu_14_15m > 0.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_aroonu_14_15m > 0.0) or (last_stochrsi_k_1d > 20.0))
-      and ((last_aroonu_14_1h > 0.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_aroonu_14_1h > 0.0) or (last_stochrsi_k_1d > 10.0))
-      and ((last_aroonu_14_4h > 20.0) or (last_aroonu_14_1d > 0.0) or (last_roc_9_1d > -20.0))
-      and ((last_aroonu_14_4h > 10.0) or (last_roc_9_1d > -30.0))
-      and ((last_aroonu_14_4h > 0.0) or (last_aroonu_14_1d > 0.0))
-      and ((last_aroonu_14_4h > 0.0) or (last_stochrsi_k_1h > 10.0))
-      and ((last_aroonu_14_4h > 0.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_aroonu_14_1d > 0.0) or (last_stochrsi_k_15m > 10.0))
-      and ((last_aroonu_14_1d > 0.0) or (last_stochrsi_k_1h > 10.0))
-      and ((last_aroonu_14_1d > 0.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_aroonu_14_1d > 0.0) or (last_roc_9_4h > -15.0) or (last_roc_9_1d > -50.0))
-      # do not short an oversold bottom on the bounce
-      and ((last_stochrsi_k > 10.0) or (last_rsi_14 > 30.0))
-      and ((last_stochrsi_k_15m > 10.0) or (last_stochrsi_k_1h > 10.0))
-      and ((last_stochrsi_k_15m > 10.0) or (last_stochrsi_k_1d > 10.0))
-      and ((last_stochrsi_k_1h > 20.0) or (last_stochrsi_k_1d > 10.0))
-      and ((last_stochrsi_k_1h > 20.0) or (last_roc_9_1d < 20.0))
-      and ((last_stochrsi_k_1h > 10.0) or (last_roc_9_4h > -15.0))
-      and ((last_stochrsi_k_4h > 10.0) or (last_roc_9_4h > -15.0))
-      and ((last_stochrsi_k_4h > 10.0) or (last_roc_9_1d < 15.0))
-      and ((last_stochrsi_k_1d > 10.0) or (last_roc_9_4h > -20.0))
-    ):
-      self._grind_entry_tag = "g24"
-      return True
-
-    # g27 — coil (mirror of long g27)
-    if (
-      (last_rsi_3 < 85.0)
-      and (last_rsi_3_15m < 85.0)
-      and (last_rsi_14 < 60.0)
-      and (last_rsi_14_1h < 60.0)
-      # the coil signature: 1h momentum negative-to-flat under a flat price
-      and (last_roc_9_1h < 15.0)
-      and (last_roc_9_1h > -2.0)
-      and (last_close < (last_ema_20 * 1.0200))
-      and (last_close > (last_ema_20 * 0.9800))
-      # squeeze integrity: regime still broken, 4h reclaim HELD, not dripping to new lows
-      and (last_close > last_ema_200_4h)
-      and (last_close < (last_high_max_12_4h * 0.9000))
-      and (last_close < (last_close_max_12 * 0.9950))
-      # general protections first
-      and ((last_rsi_3_15m < 80.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_rsi_3_1h < 85.0) or (last_aroonu_14_4h > 30.0))
-      and ((last_rsi_3_1h < 80.0) or (last_stochrsi_k_1h > 20.0))
-      and ((last_rsi_3_1h < 80.0) or (last_stochrsi_k_4h > 20.0))
-      and ((last_rsi_3_1h < 75.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_rsi_3_1h < 65.0) or (last_aroonu_14_1h > 30.0))
-      and ((last_rsi_3_1h < 55.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_rsi_3_4h < 65.0) or (last_stochrsi_k_4h > 30.0))
-      and ((last_rsi_3_4h < 60.0) or (last_aroonu_14_4h > 30.0))
-      and ((last_rsi_3_4h < 35.0) or (last_aroonu_14_1h > 30.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_rsi_3_4h < 35.0) or (last_aroonu_14_4h > 20.0) or (last_stochrsi_k_4h > 30.0))
-      and ((last_rsi_3_1d < 90.0) or (last_aroonu_14_1h > 10.0))
-      and ((last_rsi_3_1d < 90.0) or (last_aroonu_14_1h > 10.0))
-      and ((last_rsi_3_1d < 90.0) or (last_stochrsi_k_1h > 20.0))
-      and ((last_rsi_3_1d < 90.0) or (last_stochrsi_k_4h > 30.0))
-      and ((last_rsi_3_1d < 80.0) or (last_aroonu_14_1d > 10.0))
-      and ((last_rsi_3_1d < 70.0) or (last_aroonu_14_15m > 0.0))
-      and ((last_rsi_3_1d < 70.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_aroonu_14_15m > 20.0) or (last_stochrsi_k_15m > 30.0))
-      and ((last_aroonu_14_15m > 20.0) or (last_aroonu_14_1h > 0.0))
-      and ((last_aroonu_14_15m > 0.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_aroonu_14_1h > 0.0) or (last_aroonu_14_1d > 0.0))
-      and ((last_aroonu_14_4h > 30.0) or (last_roc_9_1d > -50.0))
-      and ((last_aroonu_14_4h > 10.0) or (last_stochrsi_k_4h > 10.0))
-      and ((last_aroonu_14_4h > 10.0) or (last_roc_9_4h > -10.0))
-      and ((last_stochrsi_k_1h > 30.0) or (last_stochrsi_k_4h > 20.0))
-      and ((last_stochrsi_k_1h > 10.0) or (last_roc_9_4h < 20.0))
-      and ((last_roc_9_1d < 40.0) or (last_aroonu_14_1h > 10.0))
-      and ((last_roc_9_1d < 40.0) or (last_stochrsi_k_1h > 20.0))
-      and ((last_roc_9_1d < 25.0) or (last_stochrsi_k_15m > 10.0))
-      and ((last_roc_9_1d < 25.0) or (last_aroonu_14_4h > 20.0))
-      and ((last_roc_9_1d < 15.0) or (last_stochrsi_k_4h > 20.0))
-    ):
-      self._grind_entry_tag = "g27"
-      return True
-
-    self._grind_entry_tag = ""
-    return False
+    return [
+      # g1 — AROONU rally + EMA_16 rise (mirror long g1)
+      (
+        (last_rsi_3 < 90.0)
+        & (last_rsi_3_15m < 85.0)
+        & (last_rsi_3_1h < 85.0)
+        & (last_rsi_3_4h < 85.0)
+        & (last_rsi_14 > 55.0)
+        & (last_aroonu_14 > 75.0)
+        & (last_aroonu_14_4h > 0.0)
+        & (last_roc_9_1h > -20.0)
+        & (last_close < (last_close_min_48 * 1.10))
+        & (last_close > (last_high_max_24_4h * 0.40))
+        & (last_close > (last_ema_16 * 1.025))
+        & ((last_rsi_3_1h < 65.0) | (last_aroonu_14_1h > 0.0))
+        & ((last_aroonu_14_1h > 0.0) | (last_aroonu_14_1d > 0.0))
+        & ((last_aroonu_14_1d > 0.0) | (last_stochrsi_k_1h > 10.0))
+      ),
+      # g2 — EMA_12 > EMA_26 divergence + BBU (mirror long g2)
+      (
+        (last_rsi_3 < 95.0)
+        & (last_rsi_3_15m < 90.0)
+        & (last_rsi_3_1h < 85.0)
+        & (last_rsi_3_4h < 85.0)
+        & (last_rsi_14 > 70.0)
+        & (last_stochrsi_k > 70.0)
+        & (last_ema_12 > last_ema_26)
+        & ((last_ema_12 - last_ema_26) > (last_open * 0.020))
+        & ((prev_ema_12 - prev_ema_26) > (last_open / 100.0))
+        & (last_close > (last_bbu * 0.990))
+      ),
+      # g3 — AROONU_15m rally + EMA_12 rise (mirror long g3)
+      (
+        (last_rsi_3 < 90.0)
+        & (last_rsi_3_15m < 90.0)
+        & (last_rsi_3_1h < 90.0)
+        & (last_rsi_3_4h < 85.0)
+        & (last_rsi_14 > 65.0)
+        & (last_aroonu_14_15m > 75.0)
+        & (last_stochrsi_k_15m > 30.0)
+        & (last_stochrsi_k_1h > 10.0)
+        & (last_roc_9_1h < 15.0)
+        & (last_roc_9_4h < 15.0)
+        & (last_close < (last_close_min_48 * 1.15))
+        & (last_close > (last_ema_12 * 1.020))
+        & ((last_rsi_3_1h < 80.0) | (last_rsi_3_1d < 80.0))
+        & ((last_rsi_3_1h < 80.0) | (last_stochrsi_k_1d > 30.0))
+        & ((last_rsi_3_1h < 75.0) | (last_stochrsi_k_1h > 30.0))
+        & ((last_rsi_3_4h < 70.0) | (last_stochrsi_k_4h > 40.0))
+      ),
+      # g4 — multi-TF RSI + EMA_26 + BBU (mirror long g4)
+      (
+        (last_rsi_3 < 90.0)
+        & (last_rsi_3_15m < 90.0)
+        & (last_rsi_3_1h < 90.0)
+        & (last_rsi_3_4h < 90.0)
+        & (last_rsi_3_1d < 90.0)
+        & (last_rsi_14 > 65.0)
+        & (last_aroonu_14 > 75.0)
+        & (last_roc_9_1h < 20.0)
+        & (last_roc_9_4h < 20.0)
+        # & (last_close < (last_close_min_48 * 1.10))
+        & (last_close > (last_ema_26 * 1.030))
+        & (last_close > (last_bbu * 1.001))
+      ),
+      # g5 — rally top + EMA_9/20 (mirror long g5)
+      (
+        (last_rsi_3 < 90.0)
+        & (last_rsi_3_15m < 90.0)
+        & (last_rsi_3_1h < 85.0)
+        & (last_rsi_3_4h < 85.0)
+        & (last_rsi_14 > 65.0)
+        & (last_aroonu_14 > 70.0)
+        & (last_roc_9_4h < 20.0)
+        & (last_close < (last_low_min_24_1h * 1.20))
+        & (last_close > (last_high_max_12_4h * 0.50))
+        & (last_close > (last_ema_9 * 1.025))
+        & (last_close > (last_ema_20 * 1.030))
+      ),
+      # g6 — RSI_20 rising + SMA_16 rise (mirror long g6)
+      (
+        (last_rsi_3 < 95.0)
+        & (last_rsi_3 > 60.0)
+        & (last_rsi_3_15m < 85.0)
+        & (last_rsi_14 < 65.0)
+        & (last_roc_9_1h < 20.0)
+        & (last_roc_9_4h < 20.0)
+        & (last_aroonu_14 > 75.0)
+        & (last_close > (last_high_max_12_4h * 0.40))
+        & (last_rsi_20 > prev_rsi_20)
+        & (last_close > (last_sma_16 * 1.040))
+        & ((last_aroonu_14_1d > 0.0) | (last_roc_9_1d > -50.0))
+      ),
+      # g7 — WILLR overbought + BBB wide (mirror long g7)
+      (
+        (last_rsi_3 < 95.0)
+        & (last_rsi_3_15m < 80.0)
+        & (last_rsi_3_1h < 80.0)
+        & (last_rsi_3_4h < 80.0)
+        & (last_willr_14 > -50.0)
+        & (last_willr_84_1h > -30.0)
+        & (last_stochrsi_k > 70.0)
+        & (last_stochrsi_k_1h > 10.0)
+        & (last_roc_9_1h < 10.0)
+        & (last_roc_9_1h > -20.0)
+        & (last_roc_9_4h < 10.0)
+        & (last_close > (last_high_max_24_4h * 0.50))
+        & (last_bbb_1h > 12.0)
+        & (last_close_min_48 <= (last_close * 0.90))
+      ),
+      # g8 — EMA_12/26 gap wide + high_max_24_1h (mirror long g8)
+      (
+        (last_rsi_3 > 70.0)
+        & (last_rsi_3 < 95.0)
+        & (last_rsi_3_15m < 90.0)
+        & (last_rsi_3_1h < 90.0)
+        & (last_rsi_3_4h < 90.0)
+        & (last_roc_9_1h < 10.0)
+        & (last_roc_9_4h < 25.0)
+        # & (last_close > (last_candle["high_max_24_1h"] * 0.70))
+        & (last_ema_12 > last_ema_26)
+        & ((last_ema_12 - last_ema_26) > (last_open * 0.030))
+        & ((prev_ema_12 - prev_ema_26) > (last_open / 100.0))
+      ),
+      # g9 — pullback fade (mirror long g9)
+      (
+        (last_rsi_3 < 95.0)
+        & (last_rsi_3_15m < 85.0)
+        & (last_rsi_3_1h < 80.0)
+        & (last_rsi_3_4h < 80.0)
+        & (last_stochrsi_k > 50.0)
+        & (last_close > (last_close_min_48 * 1.10))
+        & (last_close < (last_close_max_12 * 0.97))
+      ),
+      # g10 — RSI_14 divergence vs 1h (mirror long g10)
+      (
+        (last_rsi_3 < 95.0)
+        & (last_rsi_3_15m < 80.0)
+        & (last_stochrsi_k > 80.0)
+        & (last_rsi_14 > (last_rsi_14_1h + 45.0))
+      ),
+      # g11 — multi-TF RSI + SMA_30 + BBU (mirror long g11)
+      (
+        (last_rsi_3 < 95.0)
+        & (last_rsi_3_15m < 90.0)
+        & (last_rsi_3_1h < 90.0)
+        & (last_cmf_20 < 0.0)
+        & (last_close > (last_sma_30 * 1.035))
+        & (last_close > (last_bbu * 1.000))
+      ),
+      # g12 — EMA_12/26 divergence + close_min_48 (mirror long g12)
+      (
+        (last_rsi_3 < 95.0)
+        & (last_rsi_3_15m < 90.0)
+        & (last_rsi_3_1h < 90.0)
+        & (last_stochrsi_k > 70.0)
+        & (last_close < (last_close_min_48 * 1.10))
+        & (last_close > (last_high_max_12_4h * 0.40))
+        & (last_ema_12 > last_ema_26)
+        & ((last_ema_12 - last_ema_26) > (last_open * 0.025))
+        & ((prev_ema_12 - prev_ema_26) > (last_open / 100.0))
+      ),
+      # g13 — SMA_9 cross SMA_21 down + EMA_100 rise (mirror long g13)
+      (
+        (last_rsi_3 < 95.0)
+        & (last_rsi_3_1h < 80.0)
+        & (last_rsi_14_1h < 60.0)
+        & (last_stochrsi_k_15m > 20.0)
+        & (last_roc_9_1h < 15.0)
+        & (last_roc_9_4h < 15.0)
+        & (prev_sma_9 > prev_sma_21)
+        & (last_sma_9 < last_sma_21)
+        & (last_close > (last_ema_100 * 1.025))
+        & ((last_rsi_3_4h < 60.0) | (last_roc_9_4h > -30.0))
+      ),
+      # g14 — SMA_9 cross down + 4h downtrend (trend follower) (mirror long g14)
+      (
+        (last_rsi_3 < 95.0)
+        & (last_aroonu_14_15m > 50.0)
+        & (last_stochrsi_k > 60.0)
+        & (last_stochrsi_k_15m > 30.0)
+        & (prev_sma_9 > prev_sma_21)
+        & (last_sma_9 < last_sma_21)
+        & (last_ema_12_4h < last_ema_200_4h)
+        & (last_close < (last_close_min_48 * 1.10))
+        & ((last_rsi_3_1h < 70.0) | (last_stochrsi_k_1h > 30.0))
+        & ((last_rsi_3_1h < 60.0) | (last_aroonu_14_1h > 20.0))
+        & ((last_rsi_3_1d < 75.0) | (last_stochrsi_k_1h > 20.0))
+        & ((last_stochrsi_k_1h > 20.0) | (last_stochrsi_k_1d > 10.0))
+      ),
+      # g15 — deep loss recovery (slice_profit < -0.16) (mirror long g15)
+      (
+        (last_rsi_3 < 95.0)
+        & (last_rsi_3_15m < 90.0)
+        & (last_rsi_14 > 60.0)
+        & (last_aroonu_14 > 75.0)
+        & (last_aroonu_14_15m > 70.0)
+        & (last_stochrsi_k > 70.0)
+        & (last_stochrsi_k_15m > 70.0)
+        & ((last_rsi_3_1h < 70.0) | (last_stochrsi_k_1h > 20.0))
+        & ((last_rsi_3_4h < 70.0) | (last_stochrsi_k_4h > 20.0))
+        & ((last_rsi_3_1d < 70.0) | (last_stochrsi_k_1d > 20.0))
+      ),
+      # g16 — EMA_12 rise + BBU (mirror long g16)
+      (
+        (last_rsi_3 < 92.0)
+        & (last_rsi_3_15m < 85.0)
+        & (last_rsi_3_1h < 85.0)
+        & (last_rsi_3_4h < 85.0)
+        & (last_rsi_14 > 65.0)
+        & (last_close > (last_ema_12 * 1.035))
+        & (last_close > (last_bbu * 1.001))
+      ),
+      # g17 — StochRSI + EMA_20 rise (mirror long g17)
+      (
+        (last_rsi_3 < 85.0)
+        & (last_rsi_3_15m < 85.0)
+        & (last_rsi_3_1h < 85.0)
+        & (last_rsi_3_4h < 85.0)
+        & (last_rsi_14 > 70.0)
+        & (last_stochrsi_k > 70.0)
+        & (last_close > (last_ema_20 * 1.025))
+        & ((last_aroonu_14_4h > 0.0) | (last_aroonu_14_1d > 0.0))
+      ),
+      # g18 — moderate loss recovery (slice_profit < -0.10) (mirror long g18)
+      (
+        (last_rsi_3 < 95.0)
+        & (last_rsi_3_15m < 85.0)
+        & (last_rsi_3_1h < 80.0)
+        & (last_rsi_3_4h < 80.0)
+        & (last_rsi_14 > 60.0)
+        & (last_close > (last_ema_26 * 1.030))
+        & (last_close > (last_bbu * 1.001))
+      ),
+      # g19 — EMA_12/26 wide gap (slice_profit < -0.06) (mirror long g19)
+      (
+        (last_rsi_3 > 70.0)
+        & (last_rsi_3 < 95.0)
+        & (last_rsi_3_15m < 90.0)
+        & (last_ema_12 > last_ema_26)
+        & ((last_ema_12 - last_ema_26) > (last_open * 0.035))
+        & ((prev_ema_12 - prev_ema_26) > (last_open / 100.0))
+      ),
+      # g20 — AROONU 4h downtrend bounce fade (mirror long g20)
+      (
+        (last_rsi_3 < 90.0)
+        & (last_rsi_3_15m < 85.0)
+        & (last_rsi_3_1h < 80.0)
+        & (last_rsi_14 > 58.0)
+        & (last_rsi_14_4h < 50.0)
+        & (last_aroonu_14 > 70.0)
+        & (last_aroonu_14_4h < 50.0)
+        & (last_roc_9_1d < 15.0)
+        & (last_ema_50_4h < last_ema_100_4h)
+        & (last_close > (last_close_min_48 * 1.05))
+        & ((last_rsi_3_15m < 80.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_rsi_3_1h < 70.0) | (last_roc_9_4h > -30.0) | (last_roc_9_1d > -30.0))
+        & ((last_rsi_3_1h < 50.0) | (last_roc_9_1d > -60.0))
+        & ((last_rsi_3_4h < 60.0) | (last_aroonu_14_4h > 10.0))
+        & ((last_rsi_3_4h < 55.0) | (last_aroonu_14_4h > 0.0))
+        & ((last_rsi_3_4h < 40.0) | (last_roc_9_4h > -40.0))
+        & ((last_aroonu_14_4h > 0.0) | (last_stochrsi_k_1d > 20.0))
+        & ((last_aroonu_14_4h > 0.0) | (last_aroonu_14_1d > 0.0))
+        & ((last_stochrsi_k_4h > 10.0) | (last_roc_9_4h > -30.0))
+      ),
+      # g21 — EMA_20 rise (slice_profit < -0.02) (mirror long g21)
+      (
+        (last_rsi_3 < 90.0)
+        & (last_rsi_3_15m < 85.0)
+        & (last_rsi_14 > 65.0)
+        & (last_aroonu_14_15m > 50.0)
+        & (last_close > (last_ema_20 * 1.045))
+      ),
+      # g22 — early breakdown rebuild: rejecting off the high BEFORE the 4h trend confirms (g14 needs
+      #        EMA_12_4h < EMA_200_4h and fires too late for a deep-derisk rejection). Anti-fake-drop gating via
+      #        multi-TF RSI weakness + rejection off the 4h high + not-extended. (mirror long g22)
+      (
+        (last_rsi_3 < 70.0)
+        & (last_rsi_3_15m < 70.0)
+        & (last_rsi_14 < 55.0)
+        & (last_rsi_14_1h < 55.0)
+        & (last_roc_9_1h < 0.0)
+        & (last_roc_9_4h < 10.0)
+        # anti-capitulation: even at a formed top, a capitulative 4h overshoot reverses (dead-bounce).
+        & (last_roc_9_4h > -25.0)
+        # breakdown-started gate: only rebuild once the 4h top is IN (not still making new highs).
+        # AROONU high = a fresh 4h high was just made = still pumping; require it high = top formed.
+        & (last_aroonu_14_4h > 50.0)
+        # aggressive risk-free: g22 fires ONLY well above the 4h 200-EMA (fresh breakdown zone). The
+        # near/below-EMA overextended-drop zone is where dead-bounces live — g23 (extended-continuation)
+        # backstops the real breakdowns below. So g22 stays clean, g23 captures the continuation.
+        & (last_close > last_ema_200_4h)
+        & (last_close < (last_high_max_12_4h * 0.90))
+        & (last_close < (last_ema_20 * 1.03))
+        & (last_close > (last_ema_20 * 0.98))
+        & ((last_rsi_3_1h < 70.0) | (last_stochrsi_k_1d > 20.0))
+        & ((last_rsi_3_1h < 65.0) | (last_aroonu_14_1d > 0.0))
+        & ((last_rsi_3_4h < 50.0) | (last_aroonu_14_1h > 0.0))
+        & ((last_rsi_3_1d < 90.0) | (last_aroonu_14_1d > 30.0))
+        & ((last_rsi_3_1d < 90.0) | (last_stochrsi_k_4h > 30.0))
+        & ((last_rsi_3_1d < 60.0) | (last_stochrsi_k_1h > 20.0))
+        & ((last_rsi_3_1d < 60.0) | (last_stochrsi_k_4h > 20.0))
+        & ((last_rsi_3_1d < 55.0) | (last_aroonu_14_1h > 0.0))
+        & ((last_rsi_3_1d < 55.0) | (last_aroonu_14_4h > 0.0))
+        & ((last_rsi_3_1d < 55.0) | (last_stochrsi_k_1h > 10.0))
+        & ((last_rsi_3_1d < 55.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_rsi_3_1d < 35.0) | (last_aroonu_14_1h > 30.0) | (last_aroonu_14_1d > 10.0))
+        & ((last_aroonu_14_15m > 20.0) | (last_stochrsi_k_15m > 20.0))
+        & ((last_aroonu_14_15m > 20.0) | (last_aroonu_14_1h > 0.0))
+        & ((last_aroonu_14_15m > 0.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_roc_9_1d < 20.0) | (last_aroonu_14_4h > 0.0))
+        & ((last_roc_9_1d < 20.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_roc_9_1d < 30.0) | (last_stochrsi_k_1h > 10.0))
+      ),
+      # g23 — breakdown-continuation scalp: extended zone BELOW g22's EMA_20*0.98 cap. Only rides a CONFIRMED
+      # continuation (price already declining past the rejection), so dead-bounces (which roll over before
+      # reaching the extended zone) are structurally avoided. Complements g22: g22 = early breakdown-start,
+      # g23 = confirmed continuation. (mirror long g23)
+      (
+        (last_rsi_3 < 70.0)
+        & (last_rsi_3_15m < 70.0)
+        & (last_rsi_14 < 50.0)
+        & (last_rsi_14_1h < 50.0)
+        & (last_roc_9_1h < 0.0)
+        & (last_roc_9_4h < 0.0)
+        # anti-capitulation blow-off + anti-exhaustion bottom
+        & (last_roc_9_4h > -25.0)
+        & ((last_stochrsi_k > 3.0) | (last_rsi_14 > 20.0))
+        & (last_close < (last_high_max_12_4h * 0.90))
+        # extended zone: below g22's 0.98*EMA cap = continuation confirmed, not a rejection
+        & (last_close <= (last_ema_20 * 0.98))
+        & (last_close > (last_ema_20 * 0.88))
+        & ((last_rsi_3_1h < 55.0) | (last_aroonu_14_4h > 20.0))
+        & ((last_rsi_3_4h < 60.0) | (last_stochrsi_k_15m > 10.0))
+        & ((last_rsi_3_4h < 50.0) | (last_aroonu_14_4h > 30.0))
+        & ((last_rsi_3_1d < 85.0) | (last_stochrsi_k_1h > 20.0))
+        & ((last_rsi_3_1d < 70.0) | (last_aroonu_14_1h > 0.0))
+        & ((last_rsi_3_1d < 70.0) | (last_aroonu_14_4h > 0.0))
+        & ((last_rsi_3_1d < 50.0) | (last_stochrsi_k_1h > 20.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_rsi_3_1d < 45.0) | (last_aroonu_14_15m > 0.0) | (last_stochrsi_k_15m > 10.0))
+        & ((last_aroonu_14_15m > 0.0) | (last_aroonu_14_1h > 0.0))
+        & ((last_aroonu_14_15m > 0.0) | (last_aroonu_14_4h > 0.0))
+        & ((last_aroonu_14_15m > 0.0) | (last_aroonu_14_1d > 0.0))
+        & ((last_aroonu_14_15m > 0.0) | (last_stochrsi_k_15m > 10.0) | (last_stochrsi_k_1d > 20.0))
+        & ((last_aroonu_14_15m > 0.0) | (last_stochrsi_k_1h > 20.0))
+        & ((last_aroonu_14_15m > 0.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_aroonu_14_1h > 0.0) | (last_aroonu_14_4h > 0.0))
+        & ((last_aroonu_14_4h > 30.0) | (last_roc_9_1d > -50.0))
+        & ((last_aroonu_14_4h > 0.0) | (last_stochrsi_k_1h > 10.0))
+        & ((last_aroonu_14_4h > 0.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_aroonu_14_1d > 0.0) | (last_stochrsi_k_15m > 10.0))
+        & ((last_stochrsi_k_15m > 20.0) | (last_stochrsi_k_1h > 10.0))
+        & ((last_stochrsi_k_15m > 10.0) | (last_aroonu_14_1h > 0.0))
+        & ((last_stochrsi_k_15m > 10.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_stochrsi_k_1h > 10.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_stochrsi_k_1h > 10.0) | (last_stochrsi_k_4h > 10.0))
+      ),
+      # g24 — downtrend-bounce continuation add: the zone BELOW the 4h 200-EMA that g22 explicitly sacrifices.
+      # (mirror long g24)
+      (
+        (last_rsi_3 < 80.0)
+        & (last_rsi_3_15m < 80.0)
+        & (last_rsi_14 < 60.0)
+        # trend intact + this is a BOUNCE not a reversal: 4h still falling, 1h not in melt-up
+        & (last_roc_9_1h < 10.0)
+        & (last_roc_9_4h < 0.0)
+        & (last_roc_9_4h > -25.0)  # anti-capitulation blow-off bottom
+        # bear scope-gate: confirmed 4h downtrend + price below the 200-EMA regime (complements g22's >200EMA)
+        & (last_ema_12_4h < last_ema_200_4h)
+        & (last_close < last_ema_200_4h)
+        # shallow bounce to the short EMA — short the bounce WITHIN the trend, never the bottom nor a deep dump
+        & (last_close > (last_ema_20 * 0.99))
+        & (last_close < (last_ema_20 * 1.06))
+        & ((last_rsi_3_15m < 60.0) | (last_stochrsi_k_15m > 30.0))
+        & ((last_rsi_3_1h < 85.0) | (last_aroonu_14_4h > 30.0))
+        & ((last_rsi_3_1h < 75.0) | (last_rsi_3_1d < 55.0) | (last_aroonu_14_1d > 30.0))
+        & ((last_rsi_3_1h < 75.0) | (last_aroonu_14_1h > 20.0))
+        & ((last_rsi_3_1h < 70.0) | (last_stochrsi_k_1d > 10.0) | (last_roc_9_1d > -10.0))
+        & ((last_rsi_3_1h < 65.0) | (last_stochrsi_k_1d > 10.0) | (last_roc_9_1d > -20.0))
+        & ((last_rsi_3_1h < 60.0) | (last_aroonu_14_4h > 0.0))
+        & ((last_rsi_3_1h < 60.0) | (last_stochrsi_k_1d > 20.0) | (last_roc_9_1d > -50.0))
+        & ((last_rsi_3_1h < 65.0) | (last_rsi_3_4h < 50.0) | (last_stochrsi_k_4h > 20.0))
+        & ((last_rsi_3_1h < 60.0) | (last_rsi_3_4h < 45.0) | (last_aroonu_14_4h > 10.0))
+        & ((last_rsi_3_1h < 40.0) | (last_stochrsi_k_1h > 40.0) | (last_stochrsi_k_1d > 10.0))
+        & ((last_rsi_3_1h < 35.0) | (last_aroonu_14_1h > 30.0) | (last_aroonu_14_1d > 10.0))
+        & ((last_rsi_3_4h < 75.0) | (last_roc_9_1d > -30.0))
+        & ((last_rsi_3_4h < 55.0) | (last_aroonu_14_4h > 30.0))
+        & ((last_rsi_3_4h < 50.0) | (last_stochrsi_k_4h > 20.0))
+        & ((last_rsi_3_1d < 65.0) | (last_stochrsi_k_15m > 10.0))
+        & ((last_rsi_3_1d < 65.0) | (last_stochrsi_k_1h > 10.0))
+        & ((last_rsi_3_1d < 65.0) | (last_stochrsi_k_4h > 20.0))
+        & ((last_rsi_14_1h > 30.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_aroonu_14_15m > 10.0) | (last_aroonu_14_1h > 0.0) | (last_stochrsi_k_1h > 20.0))
+        & ((last_aroonu_14_15m > 0.0) | (last_aroonu_14_1h > 0.0))
+        & ((last_aroonu_14_15m > 0.0) | (last_aroonu_14_4h > 0.0))
+        & ((last_aroonu_14_15m > 0.0) | (last_stochrsi_k_1h > 10.0))
+        & ((last_aroonu_14_15m > 0.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_aroonu_14_15m > 0.0) | (last_stochrsi_k_1d > 20.0))
+        & ((last_aroonu_14_1h > 0.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_aroonu_14_1h > 0.0) | (last_stochrsi_k_1d > 10.0))
+        & ((last_aroonu_14_4h > 20.0) | (last_aroonu_14_1d > 0.0) | (last_roc_9_1d > -20.0))
+        & ((last_aroonu_14_4h > 10.0) | (last_roc_9_1d > -30.0))
+        & ((last_aroonu_14_4h > 0.0) | (last_aroonu_14_1d > 0.0))
+        & ((last_aroonu_14_4h > 0.0) | (last_stochrsi_k_1h > 10.0))
+        & ((last_aroonu_14_4h > 0.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_aroonu_14_1d > 0.0) | (last_stochrsi_k_15m > 10.0))
+        & ((last_aroonu_14_1d > 0.0) | (last_stochrsi_k_1h > 10.0))
+        & ((last_aroonu_14_1d > 0.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_aroonu_14_1d > 0.0) | (last_roc_9_4h > -15.0) | (last_roc_9_1d > -50.0))
+        # do not short an oversold bottom on the bounce
+        & ((last_stochrsi_k > 10.0) | (last_rsi_14 > 30.0))
+        & ((last_stochrsi_k_15m > 10.0) | (last_stochrsi_k_1h > 10.0))
+        & ((last_stochrsi_k_15m > 10.0) | (last_stochrsi_k_1d > 10.0))
+        & ((last_stochrsi_k_1h > 20.0) | (last_stochrsi_k_1d > 10.0))
+        & ((last_stochrsi_k_1h > 20.0) | (last_roc_9_1d < 20.0))
+        & ((last_stochrsi_k_1h > 10.0) | (last_roc_9_4h > -15.0))
+        & ((last_stochrsi_k_4h > 10.0) | (last_roc_9_4h > -15.0))
+        & ((last_stochrsi_k_4h > 10.0) | (last_roc_9_1d < 15.0))
+        & ((last_stochrsi_k_1d > 10.0) | (last_roc_9_4h > -20.0))
+      ),
+      # g27 — coil (mirror of long g27)
+      (
+        (last_rsi_3 < 85.0)
+        & (last_rsi_3_15m < 85.0)
+        & (last_rsi_14 < 60.0)
+        & (last_rsi_14_1h < 60.0)
+        # the coil signature: 1h momentum negative-to-flat under a flat price
+        & (last_roc_9_1h < 15.0)
+        & (last_roc_9_1h > -2.0)
+        & (last_close < (last_ema_20 * 1.0200))
+        & (last_close > (last_ema_20 * 0.9800))
+        # squeeze integrity: regime still broken, 4h reclaim HELD, not dripping to new lows
+        & (last_close > last_ema_200_4h)
+        & (last_close < (last_high_max_12_4h * 0.9000))
+        & (last_close < (last_close_max_12 * 0.9950))
+        # general protections first
+        & ((last_rsi_3_15m < 80.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_rsi_3_1h < 85.0) | (last_aroonu_14_4h > 30.0))
+        & ((last_rsi_3_1h < 80.0) | (last_stochrsi_k_1h > 20.0))
+        & ((last_rsi_3_1h < 80.0) | (last_stochrsi_k_4h > 20.0))
+        & ((last_rsi_3_1h < 75.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_rsi_3_1h < 65.0) | (last_aroonu_14_1h > 30.0))
+        & ((last_rsi_3_1h < 55.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_rsi_3_4h < 65.0) | (last_stochrsi_k_4h > 30.0))
+        & ((last_rsi_3_4h < 60.0) | (last_aroonu_14_4h > 30.0))
+        & ((last_rsi_3_4h < 35.0) | (last_aroonu_14_1h > 30.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_rsi_3_4h < 35.0) | (last_aroonu_14_4h > 20.0) | (last_stochrsi_k_4h > 30.0))
+        & ((last_rsi_3_1d < 90.0) | (last_aroonu_14_1h > 10.0))
+        & ((last_rsi_3_1d < 90.0) | (last_aroonu_14_1h > 10.0))
+        & ((last_rsi_3_1d < 90.0) | (last_stochrsi_k_1h > 20.0))
+        & ((last_rsi_3_1d < 90.0) | (last_stochrsi_k_4h > 30.0))
+        & ((last_rsi_3_1d < 80.0) | (last_aroonu_14_1d > 10.0))
+        & ((last_rsi_3_1d < 70.0) | (last_aroonu_14_15m > 0.0))
+        & ((last_rsi_3_1d < 70.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_aroonu_14_15m > 20.0) | (last_stochrsi_k_15m > 30.0))
+        & ((last_aroonu_14_15m > 20.0) | (last_aroonu_14_1h > 0.0))
+        & ((last_aroonu_14_15m > 0.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_aroonu_14_1h > 0.0) | (last_aroonu_14_1d > 0.0))
+        & ((last_aroonu_14_4h > 30.0) | (last_roc_9_1d > -50.0))
+        & ((last_aroonu_14_4h > 10.0) | (last_stochrsi_k_4h > 10.0))
+        & ((last_aroonu_14_4h > 10.0) | (last_roc_9_4h > -10.0))
+        & ((last_stochrsi_k_1h > 30.0) | (last_stochrsi_k_4h > 20.0))
+        & ((last_stochrsi_k_1h > 10.0) | (last_roc_9_4h < 20.0))
+        & ((last_roc_9_1d < 40.0) | (last_aroonu_14_1h > 10.0))
+        & ((last_roc_9_1d < 40.0) | (last_stochrsi_k_1h > 20.0))
+        & ((last_roc_9_1d < 25.0) | (last_stochrsi_k_15m > 10.0))
+        & ((last_roc_9_1d < 25.0) | (last_aroonu_14_4h > 20.0))
+        & ((last_roc_9_1d < 15.0) | (last_stochrsi_k_4h > 20.0))
+      ),
+    ]
 
   def short_rebuy_entry_v3(
     self, last_candle: Series, previous_candle: Series, slice_profit: float, is_derisk: bool
@@ -73531,8 +73221,7 @@ class NostalgiaForInfinityX7(IStrategy):
     **kwargs,
   ):
     dp = self.dp
-    send_msg = self.dp.send_msg
-    notification_msg = self.notification_msg
+    notify = self.notify
     scale_stakes_for_min_stake = self.scale_stakes_for_min_stake
     stake_currency = self.config["stake_currency"]
     trade_pair = trade.pair
@@ -73555,11 +73244,10 @@ class NostalgiaForInfinityX7(IStrategy):
     trade_leverage = trade.leverage
 
     min_stake = self.correct_min_stake(min_stake, trade_leverage)
-    df, _ = dp.get_analyzed_dataframe(trade_pair, self.timeframe)
-    if len(df) < 2:
+    candles = self.analyzed_candles(trade_pair)
+    if len(candles) < 2:
       return None
-    last_candle = df.iloc[-1]
-    previous_candle = df.iloc[-2]
+    last_candle, previous_candle = candles
 
     exit_rate = current_rate
     filled_orders, filled_entries, filled_exits, profit_values = self.profit_or_order_snapshot(
@@ -73590,8 +73278,12 @@ class NostalgiaForInfinityX7(IStrategy):
             if ticker["bid"] is not None:
               exit_rate = ticker["bid"]
 
-    if profit_values is None:
+    # The snapshot is at current_rate, the live ticker can give another rate
+    if profit_values is None or exit_rate != current_rate:
       profit_values = self.calc_total_profit(trade, filled_entries, filled_exits, exit_rate)
+      self.cache_profit_snapshot(
+        trade, current_time, exit_rate, filled_orders, filled_entries, filled_exits, profit_values
+      )
     profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = profit_values
 
     slice_amount = first_filled_entry.safe_filled * first_filled_entry.safe_price
@@ -74162,13 +73854,21 @@ class NostalgiaForInfinityX7(IStrategy):
         sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
-        send_msg(
-          f"Exit (remaining) [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {order.safe_remaining} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
-        )
         order_tag = "p"
         if has_order_tags:
           if order.ft_order_tag is not None:
             order_tag = order.ft_order_tag
+        notify(
+          "partial-exit",
+          tag=order_tag,
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          coin_amount=order.safe_remaining,
+        )
         if has_order_tags:
           return -ft_sell_amount, order_tag
         else:
@@ -74206,20 +73906,18 @@ class NostalgiaForInfinityX7(IStrategy):
           if sell_amount > min_stake and ft_sell_amount > min_stake:
             grind_profit = -(exit_rate - first_entry.safe_price) / first_entry.safe_price
             coin_amount = sell_amount / exit_rate
-            send_msg(
-              notification_msg(
-                "grinding-exit",
-                tag="gm0",
-                pair=trade_pair,
-                rate=exit_rate,
-                stake_amount=sell_amount,
-                profit_stake=profit_stake,
-                profit_ratio=profit_ratio,
-                stake_currency=stake_currency,
-                grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-                grind_profit_pct=grind_profit,
-                coin_amount=coin_amount,
-              )
+            notify(
+              "grinding-exit",
+              tag="gm0",
+              pair=trade_pair,
+              rate=exit_rate,
+              stake_amount=sell_amount,
+              profit_stake=profit_stake,
+              profit_ratio=profit_ratio,
+              stake_currency=stake_currency,
+              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+              grind_profit_pct=grind_profit,
+              coin_amount=coin_amount,
             )
             log.info(
               f"Grinding exit (gm0) [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {coin_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -74247,20 +73945,18 @@ class NostalgiaForInfinityX7(IStrategy):
           if sell_amount > min_stake and ft_sell_amount > min_stake:
             grind_profit = -(exit_rate - first_entry.safe_price) / first_entry.safe_price
             coin_amount = sell_amount / exit_rate
-            send_msg(
-              notification_msg(
-                "grinding-derisk",
-                tag="gmd0",
-                pair=trade_pair,
-                rate=exit_rate,
-                stake_amount=sell_amount,
-                profit_stake=profit_stake,
-                profit_ratio=profit_ratio,
-                stake_currency=stake_currency,
-                grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-                grind_profit_pct=grind_profit,
-                coin_amount=coin_amount,
-              )
+            notify(
+              "grinding-derisk",
+              tag="gmd0",
+              pair=trade_pair,
+              rate=exit_rate,
+              stake_amount=sell_amount,
+              profit_stake=profit_stake,
+              profit_ratio=profit_ratio,
+              stake_currency=stake_currency,
+              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+              grind_profit_pct=grind_profit,
+              coin_amount=coin_amount,
             )
             log.info(
               f"Grinding de-risk (gmd0) [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {coin_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -74313,19 +74009,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_1_derisk_1_sub_grind_count > 0:
           grind_profit = -(exit_rate - grind_1_derisk_1_current_open_rate) / grind_1_derisk_1_current_open_rate
           grind_profit_stake = grind_1_derisk_1_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="dl1",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_1_derisk_1_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="dl1",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_1_derisk_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (dl1) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_derisk_1_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -74345,20 +74039,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="dl1",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_1_derisk_1_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="dl1",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_1_derisk_1_total_amount,
           )
           log.info(
             f"Grinding exit (dl1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_1_derisk_1_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -74396,20 +74088,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_1_derisk_1_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="ddl1",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_1_derisk_1_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="ddl1",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_1_derisk_1_total_amount,
         )
         log.info(
           f"Grinding stop exit (ddl1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_1_derisk_1_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -74458,19 +74148,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_2_derisk_1_sub_grind_count > 0:
           grind_profit = -(exit_rate - grind_2_derisk_1_current_open_rate) / grind_2_derisk_1_current_open_rate
           grind_profit_stake = grind_2_derisk_1_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="dl2",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_2_derisk_1_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="dl2",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_2_derisk_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (dl2) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_2_derisk_1_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -74490,20 +74178,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="dl2",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_2_derisk_1_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="dl2",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_2_derisk_1_total_amount,
           )
           log.info(
             f"Grinding exit (dl2) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_2_derisk_1_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -74541,20 +74227,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_2_derisk_1_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="ddl2",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_2_derisk_1_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="ddl2",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_2_derisk_1_total_amount,
         )
         log.info(
           f"Grinding stop exit (ddl2) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_2_derisk_1_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -74595,19 +74279,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_1_sub_grind_count > 0:
           grind_profit = -(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
           grind_profit_stake = grind_1_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="gd1",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_1_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="gd1",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (gd1) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -74636,19 +74318,17 @@ class NostalgiaForInfinityX7(IStrategy):
       if grind_1_sub_grind_count > 0:
         grind_profit = -(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
         grind_profit_stake = grind_1_current_grind_stake_profit
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="gd1",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-          grind_profit_stake=grind_1_current_grind_stake_profit,
-          grind_profit_pct=grind_profit,
-        )
+      notify(
+        "grinding-entry",
+        tag="gd1",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
+        grind_profit_stake=grind_1_current_grind_stake_profit,
+        grind_profit_pct=grind_profit,
       )
       log.info(
         f"Grinding entry (gd1) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -74668,20 +74348,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="gd1",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_1_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="gd1",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_1_total_amount,
           )
           log.info(
             f"Grinding exit (gd1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -74718,20 +74396,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_1_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="dd1",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_1_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="dd1",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_1_total_amount,
         )
         log.info(
           f"Grinding stop exit (dd1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -74772,19 +74448,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_2_sub_grind_count > 0:
           grind_profit = -(exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate
           grind_profit_stake = grind_2_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="gd2",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_2_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="gd2",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_2_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (gd2) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_2_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -74804,20 +74478,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="gd2",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_2_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="gd2",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_2_total_amount,
           )
           log.info(
             f"Grinding exit (gd2) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -74854,20 +74526,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_2_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="dd2",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_2_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="dd2",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_2_total_amount,
         )
         log.info(
           f"Grinding stop exit (dd2) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -74908,19 +74578,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_3_sub_grind_count > 0:
           grind_profit = -(exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate
           grind_profit_stake = grind_3_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="gd3",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_3_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="gd3",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_3_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (gd3) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_3_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -74940,20 +74608,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="gd3",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_3_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="gd3",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_3_total_amount,
           )
           log.info(
             f"Grinding exit (gd3) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -74990,20 +74656,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_3_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="dd3",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_3_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="dd3",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_3_total_amount,
         )
         log.info(
           f"Grinding stop exit (dd3) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -75044,19 +74708,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_4_sub_grind_count > 0:
           grind_profit = -(exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate
           grind_profit_stake = grind_4_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="gd4",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_4_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="gd4",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_4_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (gd4) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_4_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -75076,20 +74738,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="gd4",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_4_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="gd4",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_4_total_amount,
           )
           log.info(
             f"Grinding exit (gd4) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -75126,20 +74786,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_4_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="dd4",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_4_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="dd4",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_4_total_amount,
         )
         log.info(
           f"Grinding stop exit (dd4) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -75157,7 +74815,7 @@ class NostalgiaForInfinityX7(IStrategy):
       and (slice_profit_entry > 0.12)
       and (trade.liquidation_price is not None)
       and (current_rate > trade.liquidation_price * 0.80)
-      and (trade.get_custom_data(key="gd5_liquidation_rescue_used") is None)
+      and (self.trade_custom_data(trade).get(key="gd5_liquidation_rescue_used") is None)
     )
 
     # Grinding 5
@@ -75179,7 +74837,7 @@ class NostalgiaForInfinityX7(IStrategy):
         and is_not_trade_max_stake
       ):
         if gd5_liquidation_rescue_eligible:
-          trade.set_custom_data(key="gd5_liquidation_rescue_used", value=True)
+          self.trade_custom_data(trade).set(key="gd5_liquidation_rescue_used", value=True)
 
         buy_amount = slice_amount * grind_5_stakes[grind_5_sub_grind_count] / stake_scale_leverage
         if buy_amount < (min_stake * 1.5):
@@ -75191,19 +74849,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_5_sub_grind_count > 0:
           grind_profit = -(exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate
           grind_profit_stake = grind_5_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="gd5",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_5_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="gd5",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_5_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (gd5) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_5_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -75223,20 +74879,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="gd5",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_5_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="gd5",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_5_total_amount,
           )
           log.info(
             f"Grinding exit (gd5) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -75273,20 +74927,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_5_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="dd5",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_5_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="dd5",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_5_total_amount,
         )
         log.info(
           f"Grinding stop exit (dd5) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -75327,19 +74979,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_6_sub_grind_count > 0:
           grind_profit = -(exit_rate - grind_6_current_open_rate) / grind_6_current_open_rate
           grind_profit_stake = grind_6_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="gd6",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_6_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="gd6",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_6_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (gd6) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_6_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -75359,20 +75009,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="gd6",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_6_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="gd6",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_6_total_amount,
           )
           log.info(
             f"Grinding exit (gd6) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_6_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage:{stake_fmt}} {stake_currency})"
@@ -75409,20 +75057,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_6_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="dd6",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_6_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="dd6",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_6_total_amount,
         )
         log.info(
           f"Grinding stop exit (dd6) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Coin amount: {grind_6_total_amount} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -75470,19 +75116,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if derisk_1_sub_grind_count > 0:
           grind_profit = -(exit_rate - derisk_1_current_open_rate) / derisk_1_current_open_rate
           grind_profit_stake = derisk_1_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "re-entry",
-            tag="d1",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=derisk_1_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "re-entry",
+          tag="d1",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=derisk_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Re-entry (d1) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({derisk_1_current_grind_stake_profit:{stake_fmt}} {stake_currency})"
@@ -75512,17 +75156,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="d1",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="d1",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk (d1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -75536,6 +75178,23 @@ class NostalgiaForInfinityX7(IStrategy):
   def short_grind_entry(
     self, last_candle: Series, previous_candle: Series, slice_profit: float, is_derisk: bool
   ) -> float:
+    if (
+      (last_candle["protections_short_global"] == True)
+      and (last_candle["protections_short_rebuy"] == True)
+      and (last_candle["global_protections_short_pump"] == True)
+      and (last_candle["global_protections_short_dump"] == True)
+      and (
+        (last_candle["enter_short"] == True)
+        # the other rules, on their candle part precomputed by short_grind_entry_rules
+        or (SHORT_GRIND_ENTRY_RULES.first_rule(last_candle, slice_profit, is_derisk=is_derisk) is not None)
+      )
+    ):
+      return True
+
+    return False
+
+  def short_grind_entry_rules(self, last_candle: "CandleColumns", previous_candle: "CandleColumns") -> list:
+    """The candle part of the `short_grind_entry` rules, by candle, in the order of SHORT_GRIND_ENTRY_RULES."""
     last_aroond_14 = last_candle["AROOND_14"]
     last_aroond_14_15m = last_candle["AROOND_14_15m"]
     last_rsi_14_1h = last_candle["RSI_14_1h"]
@@ -75565,93 +75224,77 @@ class NostalgiaForInfinityX7(IStrategy):
     last_aroond_14_15m_lt_25 = last_aroond_14_15m < 25.0
     last_aroond_14_lt_25 = last_aroond_14 < 25.0
 
-    if (
-      (last_candle["protections_short_global"] == True)
-      and (last_candle["protections_short_rebuy"] == True)
-      and (last_candle["global_protections_short_pump"] == True)
-      and (last_candle["global_protections_short_dump"] == True)
-      and (
-        (last_candle["enter_short"] == True)
-        or (
-          (last_rsi_14_gt_64)
-          and (last_rsi_3 < 90.0)
-          and (last_rsi_3_15m_lt_90)
-          and (last_aroond_14_lt_25)
-          and (last_candle["STOCHRSIk_14_14_3_3_1h"] > 30.0)
-          and (last_candle["STOCHRSIk_14_14_3_3_4h"] > 30.0)
-          and (last_close > (last_candle["EMA_16"] * 1.020))
-        )
-        or (
-          (last_rsi_14_gt_64)
-          and (last_rsi_3_15m < 95.0)
-          and (last_rsi_3_1h < 95.0)
-          and (last_rsi_3_4h < 95.0)
-          and (last_ema_12 > last_ema_26)
-          and ((last_ema_12 - last_ema_26) > (last_open * 0.030))
-          and ((previous_ema_12 - previous_ema_26) > (last_open / 100.0))
-        )
-        or (
-          (last_rsi_14_gt_64)
-          and (last_rsi_3 < 95.0)
-          and (last_rsi_3_15m_lt_90)
-          and (last_rsi_3_1h_lt_90)
-          and (last_rsi_3_4h_lt_90)
-          and (last_ema_12 > last_ema_26)
-          and ((last_ema_12 - last_ema_26) > (last_open * 0.020))
-          and ((previous_ema_12 - previous_ema_26) > (last_open / 100.0))
-        )
-        or (
-          (last_rsi_14_gt_64)
-          and (last_rsi_3 < 84.0)
-          and (last_aroond_14_15m_lt_25)
-          and (last_close > (last_ema_12 * 1.016))
-        )
-        or (
-          (last_rsi_14_gt_64)
-          and (last_rsi_3_15m_lt_90)
-          and (last_rsi_3_1h_lt_90)
-          and (last_rsi_3_4h_lt_90)
-          and (last_candle["AROONU_14_1h"] < last_candle["AROOND_14_1h"])
-          and (last_candle["AROONU_14_4h"] < last_candle["AROOND_14_4h"])
-          and (last_close > (last_ema_26 * 1.022))
-          and (last_close > (last_candle["BBL_20_2.0"] * 1.001))
-        )
-        or (
-          (last_rsi_14_gt_64)
-          and (last_rsi_3_1h_lt_80)
-          and (last_rsi_3_4h_lt_80)
-          and (last_rsi_14_1h_gt_20)
-          and (last_rsi_14_4h_gt_40)
-          and (last_candle["AROONU_14"] < last_aroond_14)
-          and (previous_candle["AROONU_14"] > previous_candle["AROOND_14"])
-        )
-        or (
-          (last_rsi_14_gt_64)
-          and (last_rsi_3_15m < 85.0)
-          and (last_rsi_3_1h_lt_80)
-          and (last_rsi_3_4h_lt_80)
-          and (last_rsi_14_1h_gt_20)
-          and (last_rsi_14_4h_gt_40)
-          and (last_candle["KST_10_15_20_30_10_10_10_15"] < last_candle["KSTs_9"])
-          and (previous_candle["KST_10_15_20_30_10_10_10_15"] > previous_candle["KSTs_9"])
-        )
-        or (
-          is_derisk
-          and (last_rsi_3 < 80.0)
-          and (last_rsi_3_15m < 80.0)
-          and (last_rsi_3_1h_lt_80)
-          and (last_rsi_3_4h_lt_80)
-          and (last_rsi_14_gt_64)
-          and (last_aroond_14_lt_25)
-          and (last_aroond_14_15m_lt_25)
-          and (last_candle["STOCHRSIk_14_14_3_3_15m"] > 50.0)
-          and (last_close > (last_candle["EMA_20"] * 1.020))
-        )
-      )
-    ):
-      return True
-
-    return False
+    return [
+      (
+        (last_rsi_14_gt_64)
+        & (last_rsi_3 < 90.0)
+        & (last_rsi_3_15m_lt_90)
+        & (last_aroond_14_lt_25)
+        & (last_candle["STOCHRSIk_14_14_3_3_1h"] > 30.0)
+        & (last_candle["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        & (last_close > (last_candle["EMA_16"] * 1.020))
+      ),
+      (
+        (last_rsi_14_gt_64)
+        & (last_rsi_3_15m < 95.0)
+        & (last_rsi_3_1h < 95.0)
+        & (last_rsi_3_4h < 95.0)
+        & (last_ema_12 > last_ema_26)
+        & ((last_ema_12 - last_ema_26) > (last_open * 0.030))
+        & ((previous_ema_12 - previous_ema_26) > (last_open / 100.0))
+      ),
+      (
+        (last_rsi_14_gt_64)
+        & (last_rsi_3 < 95.0)
+        & (last_rsi_3_15m_lt_90)
+        & (last_rsi_3_1h_lt_90)
+        & (last_rsi_3_4h_lt_90)
+        & (last_ema_12 > last_ema_26)
+        & ((last_ema_12 - last_ema_26) > (last_open * 0.020))
+        & ((previous_ema_12 - previous_ema_26) > (last_open / 100.0))
+      ),
+      ((last_rsi_14_gt_64) & (last_rsi_3 < 84.0) & (last_aroond_14_15m_lt_25) & (last_close > (last_ema_12 * 1.016))),
+      (
+        (last_rsi_14_gt_64)
+        & (last_rsi_3_15m_lt_90)
+        & (last_rsi_3_1h_lt_90)
+        & (last_rsi_3_4h_lt_90)
+        & (last_candle["AROONU_14_1h"] < last_candle["AROOND_14_1h"])
+        & (last_candle["AROONU_14_4h"] < last_candle["AROOND_14_4h"])
+        & (last_close > (last_ema_26 * 1.022))
+        & (last_close > (last_candle["BBL_20_2.0"] * 1.001))
+      ),
+      (
+        (last_rsi_14_gt_64)
+        & (last_rsi_3_1h_lt_80)
+        & (last_rsi_3_4h_lt_80)
+        & (last_rsi_14_1h_gt_20)
+        & (last_rsi_14_4h_gt_40)
+        & (last_candle["AROONU_14"] < last_aroond_14)
+        & (previous_candle["AROONU_14"] > previous_candle["AROOND_14"])
+      ),
+      (
+        (last_rsi_14_gt_64)
+        & (last_rsi_3_15m < 85.0)
+        & (last_rsi_3_1h_lt_80)
+        & (last_rsi_3_4h_lt_80)
+        & (last_rsi_14_1h_gt_20)
+        & (last_rsi_14_4h_gt_40)
+        & (last_candle["KST_10_15_20_30_10_10_10_15"] < last_candle["KSTs_9"])
+        & (previous_candle["KST_10_15_20_30_10_10_10_15"] > previous_candle["KSTs_9"])
+      ),
+      (
+        (last_rsi_3 < 80.0)
+        & (last_rsi_3_15m < 80.0)
+        & (last_rsi_3_1h_lt_80)
+        & (last_rsi_3_4h_lt_80)
+        & (last_rsi_14_gt_64)
+        & (last_aroond_14_lt_25)
+        & (last_aroond_14_15m_lt_25)
+        & (last_candle["STOCHRSIk_14_14_3_3_15m"] > 50.0)
+        & (last_close > (last_candle["EMA_20"] * 1.020))
+      ),
+    ]
 
   # Short Grinding Adjust Trade Position No De-Risk
   # ---------------------------------------------------------------------------------------------
@@ -75686,8 +75329,7 @@ class NostalgiaForInfinityX7(IStrategy):
     **kwargs,
   ) -> tuple[Optional[float], str, bool]:
     dp = self.dp
-    send_msg = self.dp.send_msg
-    notification_msg = self.notification_msg
+    notify = self.notify
     scale_stakes_for_min_stake = self.scale_stakes_for_min_stake
     stake_currency = self.config["stake_currency"]
     trade_pair = trade.pair
@@ -76152,13 +75794,21 @@ class NostalgiaForInfinityX7(IStrategy):
         sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
-        send_msg(
-          f"Exit (remaining) [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {order.safe_remaining} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
-        )
         order_tag = "p"
         if has_order_tags:
           if order.ft_order_tag is not None:
             order_tag = order.ft_order_tag
+        notify(
+          "partial-exit",
+          tag=order_tag,
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          coin_amount=order.safe_remaining,
+        )
         return -ft_sell_amount, order_tag, is_derisk
 
     is_short_grind_entry = self.short_grind_entry(last_candle, previous_candle, slice_profit, False)
@@ -76183,17 +75833,15 @@ class NostalgiaForInfinityX7(IStrategy):
           buy_amount = min_stake * 1.5
         if buy_amount > max_stake:
           return None, "", is_derisk
-        send_msg(
-          notification_msg(
-            "rebuy",
-            tag="r",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "rebuy",
+          tag="r",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"Rebuy (r) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -76229,19 +75877,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_1_sub_grind_count > 0:
           grind_profit = -(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
           grind_profit_stake = grind_1_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="g1",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_1_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="g1",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (g1) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_stake_profit} {stake_currency})"
@@ -76266,19 +75912,17 @@ class NostalgiaForInfinityX7(IStrategy):
       if grind_1_sub_grind_count > 0:
         grind_profit = -(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
         grind_profit_stake = grind_1_current_grind_stake_profit
-      send_msg(
-        notification_msg(
-          "grinding-entry",
-          tag="g1",
-          pair=trade_pair,
-          rate=current_rate,
-          stake_amount=buy_amount,
-          profit_stake=profit_stake,
-          profit_ratio=profit_ratio,
-          stake_currency=stake_currency,
-          grind_profit_stake=grind_1_current_grind_stake_profit,
-          grind_profit_pct=grind_profit,
-        )
+      notify(
+        "grinding-entry",
+        tag="g1",
+        pair=trade_pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=stake_currency,
+        grind_profit_stake=grind_1_current_grind_stake_profit,
+        grind_profit_pct=grind_profit,
       )
       log.info(
         f"Grinding entry (g1) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_stake_profit} {stake_currency})"
@@ -76295,20 +75939,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="g1",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_1_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="g1",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_1_total_amount,
           )
           log.info(
             f"Grinding exit (g1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -76340,20 +75982,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_1_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="sg1",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_1_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="sg1",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_1_total_amount,
         )
         log.info(
           f"Grinding stop exit (sg1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -76391,19 +76031,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_2_sub_grind_count > 0:
           grind_profit = -(exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate
           grind_profit_stake = grind_2_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="g2",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_2_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="g2",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_2_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (g2) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_2_current_grind_stake_profit} {stake_currency})"
@@ -76420,20 +76058,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="g2",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_2_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="g2",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_2_total_amount,
           )
           log.info(
             f"Grinding exit (g2) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -76465,20 +76101,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_2_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="sg2",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_2_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="sg2",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_2_total_amount,
         )
         log.info(
           f"Grinding stop exit (sg2) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -76516,19 +76150,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_3_sub_grind_count > 0:
           grind_profit = -(exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate
           grind_profit_stake = grind_3_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="g3",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_3_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="g3",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_3_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (g3) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_3_current_grind_stake_profit} {stake_currency})"
@@ -76545,20 +76177,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="g3",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_3_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="g3",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_3_total_amount,
           )
           log.info(
             f"Grinding exit (g3) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -76590,20 +76220,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_3_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="sg3",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_3_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="sg3",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_3_total_amount,
         )
         log.info(
           f"Grinding stop exit (sg3) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -76641,19 +76269,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_4_sub_grind_count > 0:
           grind_profit = -(exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate
           grind_profit_stake = grind_4_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="g4",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_4_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="g4",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_4_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (g4) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_4_current_grind_stake_profit} {stake_currency})"
@@ -76670,20 +76296,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="g4",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_4_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="g4",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_4_total_amount,
           )
           log.info(
             f"Grinding exit (g4) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -76715,20 +76339,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_4_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="sg4",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_4_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="sg4",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_4_total_amount,
         )
         log.info(
           f"Grinding stop exit (sg4) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -76766,19 +76388,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_5_sub_grind_count > 0:
           grind_profit = -(exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate
           grind_profit_stake = grind_5_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="g5",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_5_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="g5",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_5_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (g5) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_5_current_grind_stake_profit} {stake_currency})"
@@ -76795,20 +76415,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="g5",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_5_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="g5",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_5_total_amount,
           )
           log.info(
             f"Grinding exit (g5) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -76840,20 +76458,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_5_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="sg5",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_5_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="sg5",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_5_total_amount,
         )
         log.info(
           f"Grinding stop exit (sg5) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -76891,19 +76507,17 @@ class NostalgiaForInfinityX7(IStrategy):
         if grind_6_sub_grind_count > 0:
           grind_profit = -(exit_rate - grind_6_current_open_rate) / grind_6_current_open_rate
           grind_profit_stake = grind_6_current_grind_stake_profit
-        send_msg(
-          notification_msg(
-            "grinding-entry",
-            tag="g6",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_6_current_grind_stake_profit,
-            grind_profit_pct=grind_profit,
-          )
+        notify(
+          "grinding-entry",
+          tag="g6",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_6_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
         )
         log.info(
           f"Grinding entry (g6) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_6_current_grind_stake_profit} {stake_currency})"
@@ -76920,20 +76534,18 @@ class NostalgiaForInfinityX7(IStrategy):
           sell_amount = (trade_amount * exit_rate / trade_leverage) - (min_stake * 1.55)
         ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
         if sell_amount > min_stake and ft_sell_amount > min_stake:
-          send_msg(
-            notification_msg(
-              "grinding-exit",
-              tag="g6",
-              pair=trade_pair,
-              rate=exit_rate,
-              stake_amount=sell_amount,
-              profit_stake=profit_stake,
-              profit_ratio=profit_ratio,
-              stake_currency=stake_currency,
-              grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-              grind_profit_pct=grind_profit,
-              coin_amount=grind_6_total_amount,
-            )
+          notify(
+            "grinding-exit",
+            tag="g6",
+            pair=trade_pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=stake_currency,
+            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_6_total_amount,
           )
           log.info(
             f"Grinding exit (g6) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_6_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade_leverage} {stake_currency})"
@@ -76965,20 +76577,18 @@ class NostalgiaForInfinityX7(IStrategy):
             if grind_6_is_sell_found
             else profit_ratio
           )
-        send_msg(
-          notification_msg(
-            "grinding-stop",
-            tag="sg6",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-            grind_profit_stake=grind_profit * sell_amount * trade_leverage,
-            grind_profit_pct=grind_profit,
-            coin_amount=grind_6_total_amount,
-          )
+        notify(
+          "grinding-stop",
+          tag="sg6",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
+          grind_profit_stake=grind_profit * sell_amount * trade_leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_6_total_amount,
         )
         log.info(
           f"Grinding stop exit (sg6) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_6_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
@@ -77009,17 +76619,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="d",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="d",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -77051,17 +76659,15 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade_stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        send_msg(
-          notification_msg(
-            "de-risk",
-            tag="d1",
-            pair=trade_pair,
-            rate=exit_rate,
-            stake_amount=sell_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=stake_currency,
-          )
+        notify(
+          "de-risk",
+          tag="d1",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=stake_currency,
         )
         log.info(
           f"De-risk (d1) [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -77102,11 +76708,10 @@ class NostalgiaForInfinityX7(IStrategy):
       return None
 
     max_stake /= trade_leverage
-    df, _ = dp.get_analyzed_dataframe(trade_pair, self.timeframe)
-    if len(df) < 2:
+    candles = self.analyzed_candles(trade_pair)
+    if len(candles) < 2:
       return None
-    last_candle = df.iloc[-1]
-    previous_candle = df.iloc[-2]
+    last_candle, previous_candle = candles
 
     exit_rate = current_rate
     filled_orders, filled_entries, filled_exits, profit_values = self.profit_or_order_snapshot(
@@ -77153,8 +76758,12 @@ class NostalgiaForInfinityX7(IStrategy):
             if ticker["bid"] is not None:
               exit_rate = ticker["bid"]
 
-    if profit_values is None:
+    # The snapshot is at current_rate, the live ticker can give another rate
+    if profit_values is None or exit_rate != current_rate:
       profit_values = self.calc_total_profit(trade, filled_entries, filled_exits, exit_rate)
+      self.cache_profit_snapshot(
+        trade, current_time, exit_rate, filled_orders, filled_entries, filled_exits, profit_values
+      )
     profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = profit_values
 
     slice_amount = filled_entries[0].safe_filled * filled_entries[0].safe_price
@@ -77212,17 +76821,15 @@ class NostalgiaForInfinityX7(IStrategy):
           buy_amount = min_stake * 1.5
         if buy_amount > max_stake:
           return None
-        dp.send_msg(
-          self.notification_msg(
-            "rebuy",
-            tag="r",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=config["stake_currency"],
-          )
+        self.notify(
+          "rebuy",
+          tag="r",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=config["stake_currency"],
         )
         log.info(
           f"Rebuy (r) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -77243,13 +76850,14 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade.stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        dp.send_msg(
-          f"❌​​ ​**Rebuy De-risk:** `Level 3`\n"
-          f"🪙​ **Pair:** `{trade_pair}`\n"
-          f"〽️​ **Rate:** `{exit_rate}`\n"
-          f"💰 **Stake amount:** `{sell_amount}`\n"
-          f"💵​ **Profit (stake):** `{profit_stake}`\n"
-          f"💸 **Profit (percent):** `{(profit_ratio * 100.0):.2f}%`"
+        self.notify(
+          "rebuy-derisk",
+          tag="Level 3",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
         )
         log.info(
           f"Rebuy De-risk Level 3 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -77291,11 +76899,10 @@ class NostalgiaForInfinityX7(IStrategy):
 
     min_stake = self.correct_min_stake(min_stake, trade_leverage)
     max_stake /= trade_leverage
-    df, _ = dp.get_analyzed_dataframe(trade_pair, self.timeframe)
-    if len(df) < 2:
+    candles = self.analyzed_candles(trade_pair)
+    if len(candles) < 2:
       return None
-    last_candle = df.iloc[-1]
-    previous_candle = df.iloc[-2]
+    last_candle, previous_candle = candles
 
     exit_rate = current_rate
     filled_orders, filled_entries, filled_exits, profit_values = self.profit_or_order_snapshot(
@@ -77342,8 +76949,12 @@ class NostalgiaForInfinityX7(IStrategy):
             if ticker["bid"] is not None:
               exit_rate = ticker["bid"]
 
-    if profit_values is None:
+    # The snapshot is at current_rate, the live ticker can give another rate
+    if profit_values is None or exit_rate != current_rate:
       profit_values = self.calc_total_profit(trade, filled_entries, filled_exits, exit_rate)
+      self.cache_profit_snapshot(
+        trade, current_time, exit_rate, filled_orders, filled_entries, filled_exits, profit_values
+      )
     profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = profit_values
 
     slice_amount = filled_entries[0].safe_filled * filled_entries[0].safe_price
@@ -77404,17 +77015,15 @@ class NostalgiaForInfinityX7(IStrategy):
           buy_amount = min_stake * 1.5
         if buy_amount > max_stake:
           return None
-        dp.send_msg(
-          self.notification_msg(
-            "rebuy",
-            tag="r",
-            pair=trade_pair,
-            rate=current_rate,
-            stake_amount=buy_amount,
-            profit_stake=profit_stake,
-            profit_ratio=profit_ratio,
-            stake_currency=self.config["stake_currency"],
-          )
+        self.notify(
+          "rebuy",
+          tag="r",
+          pair=trade_pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
         )
         log.info(
           f"Rebuy (r) [{current_time}] [{trade_pair}] | Rate: {current_rate} | Stake amount: {buy_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -77436,13 +77045,14 @@ class NostalgiaForInfinityX7(IStrategy):
       ft_sell_amount = sell_amount * trade_leverage * (trade.stake_amount / trade_amount) / exit_rate
       if sell_amount > min_stake and ft_sell_amount > min_stake:
         grind_profit = 0.0
-        dp.send_msg(
-          f"❌​​ ​**Rebuy De-risk:** `Level 3`\n"
-          f"🪙​ **Pair:** `{trade_pair}`\n"
-          f"〽️​ **Rate:** `{exit_rate}`\n"
-          f"💰 **Stake amount:** `{sell_amount:{stake_fmt}}`\n"
-          f"💵​ **Profit (stake):** `{profit_stake:{stake_fmt}}`\n"
-          f"💸 **Profit (percent):** `{(profit_ratio * 100.0):.2f}%`"
+        self.notify(
+          "rebuy-derisk",
+          tag="Level 3",
+          pair=trade_pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
         )
         log.info(
           f"Rebuy De-risk Level 3 [{current_time}] [{trade_pair}] | Rate: {exit_rate} | Stake amount: {sell_amount:{stake_fmt}} | Profit (stake): {profit_stake:{stake_fmt}} | Profit: {(profit_ratio * 100.0):.2f}%"
@@ -77633,6 +77243,9 @@ def top_percent_change(self, df: DataFrame, length: int) -> float:
     return (df_open.rolling(length).max() - df_close) / df_close
 
 
+_BOOL_DTYPE = np.dtype(bool)
+
+
 def _is_entry_bool_scalar(condition) -> bool:
   return isinstance(condition, (bool, np.bool_))
 
@@ -77681,12 +77294,132 @@ def _or_entry_conditions(conditions):
   return np.logical_or.reduce(arrays)
 
 
-def _append_entry_tag(entry_tags, mask, tag: str) -> None:
-  if _is_entry_bool_scalar(mask):
-    if mask:
-      entry_tags[:] = entry_tags + tag
-    return
-  entry_tags[mask] = entry_tags[mask] + tag
+def _entry_tag_bits(masks: list, rows: np.ndarray) -> np.ndarray:
+  # Conditions x rows bitset, the condition i is the bit i % 64 of the word i // 64 of each row
+  bits = np.zeros(((len(masks) + 63) // 64, len(rows)), dtype=np.uint64)
+  for index, mask in enumerate(masks):
+    word = bits[index // 64]
+    bit = np.uint64(1 << (index % 64))
+    if _is_entry_bool_scalar(mask):
+      if mask:
+        word |= bit
+    else:
+      word[mask[rows]] |= bit
+  return bits
+
+
+def _render_entry_tags(bits: np.ndarray, tags: list, rows: np.ndarray, num_rows: int) -> np.ndarray:
+  # The tags of the conditions set on the given rows, in the conditions order, the other rows have no tag
+  entry_tags = np.full(num_rows, "", dtype=object)
+  rendered = np.full(len(rows), "", dtype=object)
+  for index, tag in enumerate(tags):
+    has_tag = (bits[index // 64] & np.uint64(1 << (index % 64))) != 0
+    if has_tag.any():
+      rendered[has_tag] = rendered[has_tag] + tag
+  entry_tags[rows] = rendered
+  return entry_tags
+
+
+def _entry_expression_operator(func):
+  def method(self, other):
+    expressions = self.expressions
+    return expressions.node((func, self.id, expressions.key(other)), func, (self, other))
+
+  return method
+
+
+def _entry_expression_reflected_operator(func):
+  def method(self, other):
+    expressions = self.expressions
+    return expressions.node((func, expressions.key(other), self.id), func, (other, self))
+
+  return method
+
+
+def _entry_expression_unary_operator(func):
+  def method(self):
+    return self.expressions.node((func, self.id), func, (self,))
+
+  return method
+
+
+# Merge Informative Frames
+# ---------------------------------------------------------------------------------------------
+def merge_informative_frames(dataframe: DataFrame, informatives: list, timeframe: str) -> DataFrame:
+  """
+  Merge a list of (informative frame, informative timeframe, drop date) into the base frame in a single pass.
+
+  Same result as chaining `merge_informative_pair(..., ffill=False)` for each informative frame (dropping the
+  `date_<tf>` column when asked) and forward-filling the merged columns afterwards. The base to informative row
+  mapping is computed once per timeframe, the float columns of all the timeframes are gathered (already
+  forward-filled) into one preallocated block and everything is concatenated to the base frame once.
+  """
+  dataframe = dataframe.reset_index(drop=True)
+  minutes = timeframe_to_minutes(timeframe)
+  base_dates = pd.DatetimeIndex(dataframe["date"]).as_unit("ns").asi8
+
+  merges = []
+  num_float_columns = 0
+  for informative, timeframe_inf, drop_date in informatives:
+    minutes_inf = timeframe_to_minutes(timeframe_inf)
+    if minutes_inf < minutes:
+      raise ValueError(
+        "Tried to merge a faster timeframe to a slower timeframe."
+        "This would create new rows, and can throw off your regular indicators."
+      )
+    merge_dates = pd.DatetimeIndex(informative["date"]).as_unit("ns").asi8 + (minutes_inf - minutes) * 60_000_000_000
+    if len(merge_dates) > 1 and not (np.diff(merge_dates) > 0).all():
+      # Duplicated candles fan out the rows of a regular merge, leave those to freqtrade
+      num_base_columns = len(dataframe.columns)
+      for frame, frame_timeframe, frame_drop_date in informatives:
+        dataframe = merge_informative_pair(dataframe, frame, timeframe, frame_timeframe, ffill=False)
+        if frame_drop_date:
+          dataframe = dataframe.drop(columns=f"date_{frame_timeframe}", errors="ignore")
+      merged_columns = dataframe.columns[num_base_columns:]
+      dataframe[merged_columns] = dataframe[merged_columns].ffill()
+      return dataframe
+    positions = np.minimum(np.searchsorted(merge_dates, base_dates), max(len(merge_dates) - 1, 0))
+    matched = merge_dates[positions] == base_dates if len(merge_dates) else np.zeros(len(base_dates), dtype=bool)
+    # Rows of the informative frame in the order they get merged, and for every base row the last merged one
+    merged_rows = positions[matched]
+    fill_index = np.cumsum(matched) - 1
+    columns = [column for column in informative.columns if not (drop_date and column == "date")]
+    float_columns = [column for column in columns if informative[column].dtype == np.float64]
+    merges.append((informative, timeframe_inf, columns, float_columns, num_float_columns, merged_rows, fill_index))
+    num_float_columns += len(float_columns)
+
+  # Column major, so every slice of the block is a contiguous pandas block
+  block = np.empty((num_float_columns, len(base_dates)), dtype=np.float64)
+  pieces = [dataframe]
+  for informative, timeframe_inf, columns, float_columns, start, merged_rows, fill_index in merges:
+    if float_columns:
+      values = informative[float_columns].to_numpy(dtype=np.float64)[merged_rows]
+      # Forward-fill along the merged rows, the trailing NaN row is picked by the base rows before the first merge
+      valid = ~np.isnan(values)
+      last_valid = np.where(valid, np.arange(len(values))[:, None], 0)
+      np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+      values = np.vstack((values[last_valid, np.arange(len(float_columns))], np.full(len(float_columns), np.nan)))
+      np.take(np.ascontiguousarray(values.T), fill_index, axis=1, out=block[start : start + len(float_columns)])
+    float_positions = {column: start + position for position, column in enumerate(float_columns)}
+    # Keep the column order of the chained merges
+    run = []
+    for column in columns + [None]:
+      is_float = column in float_positions
+      if run and (column is None or is_float != (run[0] in float_positions)):
+        names = [f"{name}_{timeframe_inf}" for name in run]
+        if run[0] in float_positions:
+          piece = DataFrame(block[float_positions[run[0]] : float_positions[run[-1]] + 1].T, columns=names, copy=False)
+        else:
+          labels = np.append(merged_rows, -1)[fill_index]
+          piece = informative[run].reset_index(drop=True).reindex(labels).ffill()
+          piece = piece.set_axis(names, axis=1).set_axis(dataframe.index, axis=0)
+        pieces.append(piece)
+        run = []
+      run.append(column)
+
+  if len(pieces) == 1:
+    return dataframe
+  return pd.concat(pieces, axis=1)
 
 
 # +---------------------------------------------------------------------------+
@@ -77697,15 +77430,30 @@ def _append_entry_tag(entry_tags, mask, tag: str) -> None:
 # Cache Class
 # ---------------------------------------------------------------------------------------------
 class Cache:
-  def __init__(self, path):
+  """
+  A dict kept in a JSON file.
+
+  Changes made through `set` and `remove` are tracked by key and written by `flush` at most every
+  `write_interval` seconds, or right away by `save`. The file is replaced atomically. With `journal`, each change
+  is also appended to a side journal file until the next write, and replayed on load.
+  """
+
+  def __init__(self, path, write_interval=0.0, journal=False):
     self.path = path
+    self.journal_path = path.with_name(path.name + ".journal")
+    self.journal = journal
+    self.write_interval = write_interval
     self.data = {}
+    self.dirty = set()
     self._mtime = None
-    self._previous_data = {}
+    # The file that failed to parse is reported once, until it changes again
+    self._failed_mtime = None
+    self._last_write = None
     try:
       self.load()
     except FileNotFoundError:
       pass
+    self._replay_journal()
 
   @staticmethod
   def rapidjson_load_kwargs():
@@ -77716,16 +77464,57 @@ class Cache:
     return {"number_mode": rapidjson.NM_NATIVE}
 
   def load(self):
-    if not self._mtime or self.path.stat().st_mtime_ns != self._mtime:
+    mtimes = (self._mtime, self._failed_mtime)
+    if not any(mtimes) or self.path.stat().st_mtime_ns not in mtimes:
       self._load()
 
+  def set(self, key, value):
+    self.data[key] = value
+    self._changed(key, {"key": key, "value": value})
+
+  def remove(self, key):
+    if self.data.pop(key, None) is not None:
+      self._changed(key, {"key": key, "removed": True})
+
+  def flush(self):
+    """Write the changes if the last write is at least `write_interval` seconds old."""
+    if self.dirty and (self._last_write is None or time.monotonic() - self._last_write >= self.write_interval):
+      self._save()
+
   def save(self):
-    if self.data != self._previous_data:
+    if self.dirty:
       self._save()
 
   def process_loaded_data(self, data):
     return data
 
+  def _changed(self, key, change):
+    self.dirty.add(key)
+    if self.journal:
+      with self.journal_path.open("a") as wfh:
+        wfh.write(rapidjson.dumps(change, **self.rapidjson_dump_kwargs()) + "\n")
+
+  def _replay_journal(self):
+    try:
+      with self.journal_path.open("r") as rfh:
+        lines = rfh.readlines()
+    except FileNotFoundError:
+      return
+    data = self.data
+    for line in lines:
+      try:
+        change = rapidjson.loads(line, **self.rapidjson_load_kwargs())
+      except rapidjson.JSONDecodeError:
+        # The last change of a crash can be cut short
+        log.warning("Skipping a partial change in %s", self.journal_path)
+        continue
+      key = change["key"]
+      if change.get("removed"):
+        data.pop(key, None)
+      else:
+        data[key] = change["value"]
+      self.dirty.add(key)
+
   def _load(self):
     # This method only exists to simplify unit testing
     cache_path = self.path
@@ -77737,20 +77526,26 @@ class Cache:
         data = rapidjson.load(rfh, **rapidjson_load_kwargs())
       except rapidjson.JSONDecodeError as exc:
         log.error("Failed to load JSON from %s: %s", cache_path, exc)
+        self._failed_mtime = os.fstat(rfh.fileno()).st_mtime_ns
       else:
         self.data = process_loaded_data(data)
-        self._previous_data = copy.deepcopy(self.data)
         self._mtime = cache_path.stat().st_mtime_ns
 
   def _save(self):
     # This method only exists to simplify unit testing
     cache_path = self.path
-    cache_data = self.data
-    rapidjson_dump_kwargs = self.rapidjson_dump_kwargs
+    temp_path = cache_path.with_name(cache_path.name + ".tmp")
 
-    rapidjson.dump(cache_data, cache_path.open("w"), **rapidjson_dump_kwargs())
-    self._mtime = cache_path.stat().st_mtime
-    self._previous_data = copy.deepcopy(cache_data)
+    with temp_path.open("w") as wfh:
+      rapidjson.dump(self.data, wfh, **self.rapidjson_dump_kwargs())
+      wfh.flush()
+      os.fsync(wfh.fileno())
+    os.replace(temp_path, cache_path)
+    self._mtime = cache_path.stat().st_mtime_ns
+    self._last_write = time.monotonic()
+    self.dirty.clear()
+    # Written with the file, the journal starts over
+    self.journal_path.unlink(missing_ok=True)
 
 
 class HoldsCache(Cache):
@@ -77773,6 +77568,7 @@ class HoldsCache(Cache):
     raise RuntimeError("The holds cache does not allow programatical save")
 
   def process_loaded_data(self, data):
+    """Validated holds, the open trades they apply to are logged by the strategy."""
     cache_path = self.path
 
     trade_ids = data.get("trade_ids")
@@ -77781,10 +77577,6 @@ class HoldsCache(Cache):
     if not trade_ids and not trade_pairs:
       return data
 
-    open_trades = {}
-    for trade in Trade.get_trades_proxy(is_open=True):
-      open_trades[trade.id] = open_trades[trade.pair] = trade
-
     r_trade_ids = {}
     if trade_ids:
       if isinstance(trade_ids, dict):
@@ -77800,20 +77592,7 @@ class HoldsCache(Cache):
               trade_id,
               cache_path,
             )
-          if trade_id in open_trades:
-            formatted_profit_ratio = f"{profit_ratio * 100}%"
-            log.warning(
-              "The trade %s is configured to HOLD until the profit ratio of %s is met",
-              open_trades[trade_id],
-              formatted_profit_ratio,
-            )
-            r_trade_ids[trade_id] = profit_ratio
-          else:
-            log.warning(
-              "The trade_id(%s) is no longer open. Please remove it from 'trade_ids' in %s",
-              trade_id,
-              cache_path,
-            )
+          r_trade_ids[trade_id] = profit_ratio
       else:
         # Initial Syntax
         profit_ratio = data.get("profit_ratio")
@@ -77822,24 +77601,11 @@ class HoldsCache(Cache):
             log.error("The 'profit_ratio' config value(%s) in %s is not a float", profit_ratio, cache_path)
         else:
           profit_ratio = 0.005
-        formatted_profit_ratio = f"{profit_ratio * 100}%"
         for trade_id in trade_ids:
           if not isinstance(trade_id, int):
             log.error("The trade_id(%s) defined under 'trade_ids' in %s is not an integer", trade_id, cache_path)
             continue
-          if trade_id in open_trades:
-            log.warning(
-              "The trade %s is configured to HOLD until the profit ratio of %s is met",
-              open_trades[trade_id],
-              formatted_profit_ratio,
-            )
-            r_trade_ids[trade_id] = profit_ratio
-          else:
-            log.warning(
-              "The trade_id(%s) is no longer open. Please remove it from 'trade_ids' in %s",
-              trade_id,
-              cache_path,
-            )
+          r_trade_ids[trade_id] = profit_ratio
 
     r_trade_pairs = {}
     if trade_pairs:
@@ -77862,19 +77628,6 @@ class HoldsCache(Cache):
             trade_pair,
             cache_path,
           )
-        formatted_profit_ratio = f"{profit_ratio * 100}%"
-        if trade_pair in open_trades:
-          log.warning(
-            "The trade %s is configured to HOLD until the profit ratio of %s is met",
-            open_trades[trade_pair],
-            formatted_profit_ratio,
-          )
-        else:
-          log.warning(
-            "The trade pair %s is configured to HOLD until the profit ratio of %s is met",
-            trade_pair,
-            formatted_profit_ratio,
-          )
         r_trade_pairs[trade_pair] = profit_ratio
 
     r_data = {}
@@ -77894,3 +77647,1876 @@ class HoldsCache(Cache):
         pass
       _data[key] = value
     return _data
+
+
+# Hold Trades Class
+# ---------------------------------------------------------------------------------------------
+class HoldTrades:
+  """The profit ratios to hold the trades until, by trade id and by pair. Never changed once made."""
+
+  __slots__ = ("trade_ids", "trade_pairs", "version")
+
+  def __init__(self, data: dict, version: int):
+    self.trade_ids = MappingProxyType(dict(data.get("trade_ids") or {}))
+    self.trade_pairs = MappingProxyType(dict(data.get("trade_pairs") or {}))
+    self.version = version
+
+
+# Hold Trades Watcher Class
+# ---------------------------------------------------------------------------------------------
+class HoldTradesWatcher:
+  """
+  Reloads the holds file on a background thread once it changes, checked every `interval` seconds.
+
+  Each valid file is published as a new HoldTrades, swapped in with a single assignment, so the bot loop never
+  waits on the file. A file that can't be read or parsed keeps the previous holds.
+  """
+
+  def __init__(self, find_path, interval: float = 5.0):
+    self.find_path = find_path
+    self.interval = interval
+    self.path = None
+    self.cache = None
+    self.hold_trades = HoldTrades({}, 0)
+    self._stop_event = threading.Event()
+    self._thread = None
+
+  def start(self) -> None:
+    if self._thread is None:
+      self._thread = threading.Thread(target=self._run, name="nfi-hold-trades", daemon=True)
+      self._thread.start()
+
+  def stop(self) -> None:
+    self._stop_event.set()
+    if self._thread is not None:
+      self._thread.join(timeout=self.interval)
+      self._thread = None
+
+  def _run(self) -> None:
+    while not self._stop_event.wait(self.interval):
+      self.reload()
+
+  def reload(self) -> None:
+    try:
+      cache = self.cache
+      if cache is None:
+        path = self.find_path()
+        if not path:
+          return
+        log.warning("Loading hold support data from %s", path)
+        cache = HoldsCache(path)
+        self.path = path
+        self.cache = cache
+      else:
+        mtime = cache._mtime
+        cache.load()
+        if cache._mtime == mtime:
+          return
+      self.hold_trades = HoldTrades(cache.data, self.hold_trades.version + 1)
+    except Exception as exc:
+      log.error("Failed to reload the holds file %s, keeping the previous holds: %s", self.path, exc)
+
+
+# Top Of Book Cache Class
+# ---------------------------------------------------------------------------------------------
+class TopOfBookCache:
+  """
+  Best bid and ask by pair, reused for `ttl` seconds.
+
+  `prefetch` fills it from the tickers of several pairs in one exchange call, the tickers older than `ttl` are left
+  out. The pairs missing then are read from the order book. An entry is as old as the exchange timestamp of its
+  ticker or order book, the time it was fetched when there is none. `exchange_calls` counts the calls made, and
+  `calls_saved` the order book reads served from the cache instead.
+
+  The DataProvider only reads the ticker of one pair, so `prefetch` uses its private `_exchange`. When that is
+  missing or has no `get_tickers` (a freqtrade change), or the exchange has no fetchTickers, the prefetch is
+  turned off with a warning, and the order book reads are done one pair at a time.
+  """
+
+  def __init__(self, ttl: float):
+    self.ttl = ttl
+    self.entries = {}
+    self.exchange_calls = 0
+    self.calls_saved = 0
+    self.prefetch_enabled = True
+
+  def _tickers_exchange(self, dp):
+    exchange = getattr(dp, "_exchange", None)
+    if exchange is None or not callable(getattr(exchange, "get_tickers", None)):
+      reason = "the DataProvider has no exchange with get_tickers"
+    elif not exchange.exchange_has("fetchTickers"):
+      reason = "the exchange has no fetchTickers"
+    else:
+      return exchange
+    log.warning("Top of book prefetch unavailable, %s, reading the order books one pair at a time.", reason)
+    self.prefetch_enabled = False
+    return None
+
+  def _fresh(self, pair: str, now: float) -> bool:
+    entry = self.entries.get(pair)
+    return entry is not None and now - entry[0] < self.ttl
+
+  @staticmethod
+  def _stamp(data: dict, now: float) -> float:
+    timestamp = data.get("timestamp")
+    return now if timestamp is None else min(timestamp / 1000.0, now)
+
+  def prefetch(self, dp, pairs: list) -> None:
+    if not self.prefetch_enabled:
+      return
+    now = time.time()
+    pairs = [pair for pair in pairs if not self._fresh(pair, now)]
+    if not pairs:
+      return
+    exchange = self._tickers_exchange(dp)
+    if exchange is None:
+      return
+
+    self.exchange_calls += 1
+    try:
+      tickers = exchange.get_tickers(symbols=pairs)
+    except Exception as exc:
+      log.debug("Failed to prefetch the tickers of %s: %s", pairs, exc)
+      return
+    for pair in pairs:
+      ticker = tickers.get(pair)
+      if not ticker or ticker.get("bid") is None or ticker.get("ask") is None:
+        continue
+      stamp = self._stamp(ticker, now)
+      if now - stamp < self.ttl:
+        self.entries[pair] = (stamp, ticker["bid"], ticker["ask"])
+    log.debug("Top of book cache: %s", self.report())
+
+  def get(self, dp, pair: str) -> tuple:
+    now = time.time()
+    if self._fresh(pair, now):
+      self.calls_saved += 1
+      _, bid, ask = self.entries[pair]
+      return bid, ask
+
+    self.exchange_calls += 1
+    ob = dp.orderbook(pair, 1)
+    bid = ob["bids"][0][0]
+    ask = ob["asks"][0][0]
+    self.entries[pair] = (self._stamp(ob, now), bid, ask)
+    return bid, ask
+
+  def report(self) -> str:
+    return f"{len(self.entries)} pairs, {self.exchange_calls} exchange calls, {self.calls_saved} calls saved"
+
+
+# Informative Cache Class
+# ---------------------------------------------------------------------------------------------
+class InformativeCache:
+  """
+  Computed informative frames keyed by (pair, timeframe).
+
+  An entry stays valid while the source frame it was computed from has the same length and the same first and
+  last candle. Past `max_entries`, the least recently used entries are dropped.
+  """
+
+  def __init__(self, max_entries=None):
+    self.max_entries = max_entries
+    self.entries = OrderedDict()
+    self.hits = 0
+    self.misses = 0
+
+  @staticmethod
+  def source_key(source: DataFrame):
+    if source.empty:
+      return None
+    dates = source["date"]
+    return (len(dates), dates.iat[0], dates.iat[-1])
+
+  def get(self, key, source_key):
+    entry = self.entries.get(key)
+    if entry is not None and entry[0] == source_key:
+      self.entries.move_to_end(key)
+      self.hits += 1
+      return entry[1]
+    self.misses += 1
+    return None
+
+  def set(self, key, source_key, frame):
+    entries = self.entries
+    entries[key] = (source_key, frame)
+    entries.move_to_end(key)
+    if self.max_entries is not None:
+      while len(entries) > self.max_entries:
+        entries.popitem(last=False)
+
+
+# Indicator Worker Pool Class
+# ---------------------------------------------------------------------------------------------
+class IndicatorWorkerPool:
+  """
+  Persistent worker processes for the informative indicator blocks (`num_cores_indicators_calc`).
+
+  The workers are forked from the bot when the strategy is created, before the bot starts any thread, so they
+  inherit the strategy instance and nothing but plain tuples goes through the queues. The source frames and the
+  computed frames are passed as raw column arrays in shared memory. The results are collected in submission
+  order, so they don't depend on which worker ran a task.
+  """
+
+  # Seconds between the checks that the workers are still running
+  poll_interval = 1.0
+  # Seconds without any result before the workers are considered stuck
+  timeout = 60.0
+
+  def __init__(self, strategy, num_workers):
+    context = multiprocessing.get_context("fork")
+    # Share the resource tracker with the workers, the shared memory blocks are unlinked by the bot
+    resource_tracker.ensure_running()
+    self.tasks = context.Queue()
+    self.results = context.Queue()
+    self.processes = []
+    for _ in range(num_workers):
+      process = context.Process(target=self.worker, args=(strategy, self.tasks, self.results), daemon=True)
+      process.start()
+      self.processes.append(process)
+    log.info("Started %s indicator workers.", num_workers)
+
+  @staticmethod
+  def worker(strategy, tasks, results):
+    while True:
+      task = tasks.get()
+      if task is None:
+        return
+      task_id, source_type, pair, timeframe, descriptor = task
+      try:
+        source = IndicatorWorkerPool.read_frame(descriptor, pd.RangeIndex(descriptor[1]))
+        frame = strategy.informative_task(source_type, pair, timeframe, source)
+        shm, descriptor = IndicatorWorkerPool.write_frame(frame)
+        shm.close()
+        results.put((task_id, True, descriptor))
+      except Exception as exc:
+        results.put((task_id, False, f"{type(exc).__name__}: {exc}"))
+
+  def compute(self, tasks):
+    """
+    Compute the merge-ready frames for a list of (source type, pair, timeframe, source) tasks.
+    Failed tasks are returned as None, so the caller can compute them serially. Raises TypeError when a source or
+    a computed frame has a column the shared memory blocks can't hold.
+    """
+    shms = []
+    frames = [None] * len(tasks)
+    dtype_error = None
+    try:
+      # All the sources are written before any task is sent, so an unsupported source leaves no task running
+      descriptors = []
+      for _, _, _, source in tasks:
+        shm, descriptor = self.write_frame(source)
+        shms.append(shm)
+        descriptors.append(descriptor)
+      for task_id, ((source_type, pair, timeframe, _), descriptor) in enumerate(zip(tasks, descriptors, strict=True)):
+        self.tasks.put((task_id, source_type, pair, timeframe, descriptor))
+      for _ in tasks:
+        task_id, is_ok, payload = self.next_result()
+        if not is_ok:
+          if payload.startswith("TypeError:"):
+            dtype_error = payload
+            continue
+          log.warning("Indicator worker failed on %s %s: %s", tasks[task_id][2], tasks[task_id][1], payload)
+          continue
+        frames[task_id] = self.read_frame(payload, tasks[task_id][3].index, unlink=True)
+    finally:
+      for shm in shms:
+        shm.close()
+        shm.unlink()
+    if dtype_error is not None:
+      raise TypeError(dtype_error)
+    return frames
+
+  def next_result(self):
+    waited = 0.0
+    while True:
+      try:
+        return self.results.get(timeout=self.poll_interval)
+      except queue.Empty:
+        waited += self.poll_interval
+        if not all(process.is_alive() for process in self.processes):
+          raise ChildProcessError("An indicator worker exited") from None
+        if waited >= self.timeout:
+          raise
+
+  def close(self):
+    for _ in self.processes:
+      self.tasks.put(None)
+    for process in self.processes:
+      process.join(timeout=1.0)
+      if process.is_alive():
+        process.terminate()
+        process.join(timeout=1.0)
+    self.processes = []
+    self.drain()
+
+  def drain(self):
+    """
+    Unlink the shared memory blocks of the results nobody is going to read, left by an aborted compute.
+    """
+    while True:
+      try:
+        _, is_ok, payload = self.results.get_nowait()
+      except (queue.Empty, OSError, EOFError):
+        return
+      if not is_ok:
+        continue
+      try:
+        shm = SharedMemory(name=payload[0])
+      except FileNotFoundError:
+        continue
+      shm.close()
+      shm.unlink()
+
+  @staticmethod
+  def write_frame(frame: DataFrame):
+    """
+    Copy the columns of a frame into a new shared memory block.
+    Returns the block and a picklable (name, rows, columns) descriptor.
+    """
+    columns = []
+    arrays = []
+    offset = 0
+    for name in frame.columns:
+      series = frame[name]
+      dtype = series.dtype
+      if isinstance(dtype, pd.DatetimeTZDtype):
+        values = series.array.asi8
+        columns.append((name, "datetimetz", f"{dtype.unit}|{dtype.tz}", offset))
+      elif isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        values = series.to_numpy()
+        columns.append((name, "numpy", dtype.str, offset))
+      else:
+        raise TypeError(f"Column {name} has an unsupported dtype: {dtype}")
+      arrays.append(values)
+      offset += -(-values.nbytes // 8) * 8
+    shm = SharedMemory(create=True, size=max(offset, 1))
+    for (_, _, _, column_offset), values in zip(columns, arrays, strict=True):
+      np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf, offset=column_offset)[:] = values
+    return shm, (shm.name, len(frame), tuple(columns))
+
+  @staticmethod
+  def read_frame(descriptor, index, unlink=False) -> DataFrame:
+    name, rows, columns = descriptor
+    shm = SharedMemory(name=name)
+    try:
+      data = {}
+      for column, kind, dtype, offset in columns:
+        if kind == "datetimetz":
+          unit, tz = dtype.split("|")
+          values = np.ndarray((rows,), dtype=np.int64, buffer=shm.buf, offset=offset).copy()
+          data[column] = pd.Series(values.view(f"datetime64[{unit}]"), index=index).dt.tz_localize(tz)
+        else:
+          data[column] = np.ndarray((rows,), dtype=np.dtype(dtype), buffer=shm.buf, offset=offset).copy()
+      return DataFrame(data, index=index)
+    finally:
+      shm.close()
+      if unlink:
+        shm.unlink()
+
+
+# Entry Expressions Class
+# ---------------------------------------------------------------------------------------------
+class EntryExpressions:
+  """
+  Lazy evaluation of the entry conditions of populate_entry_trend.
+
+  The indicator columns are EntryExpression terms, so the comparison masks and the conditions built from them
+  with the usual operators form an expression graph instead of arrays. Equal sub-expressions are the same node,
+  so a mask shared by several conditions is computed once. Only the nodes reachable from the enabled signals are
+  computed and the AND/OR chains are reduced in place. The terms of an AND go from the smallest to the largest,
+  and once few rows are left the next terms are only computed on these rows. A shared value is dropped after its
+  last use.
+
+  When not lazy the columns are the numpy arrays and everything is computed right away, as before.
+  """
+
+  # Compute the next terms of an AND on the rows left once these are less than 1 / rows_ratio of the rows
+  rows_ratio = 4
+  # The functions computing each row from the same row of their arguments
+  elementwise_funcs = frozenset(
+    (
+      operator.lt,
+      operator.le,
+      operator.gt,
+      operator.ge,
+      operator.eq,
+      operator.ne,
+      operator.add,
+      operator.sub,
+      operator.mul,
+      operator.truediv,
+      operator.and_,
+      operator.or_,
+      operator.neg,
+      operator.abs,
+      operator.invert,
+    )
+  )
+
+  def __init__(self, df: DataFrame, np_shift, is_lazy: bool = True):
+    self.df = df
+    self.size = len(df)
+    self.np_shift = np_shift
+    self.is_lazy = is_lazy
+    self.nodes = {}
+
+  @staticmethod
+  def key(value):
+    value_type = type(value)
+    if value_type is EntryExpression:
+      return value.id
+    if value_type in (bool, int, str) or (value_type is float and value != 0.0):
+      return (value_type, value)
+    if value_type is float or isinstance(value, np.generic):
+      # Tell -0.0 from 0.0
+      return (value_type, repr(value))
+    # Arrays and other objects are kept alive by the node using them, so their id can't be reused meanwhile
+    return (object, id(value))
+
+  def node(self, key: tuple, func, args: tuple) -> "EntryExpression":
+    node = self.nodes.get(key)
+    if node is None:
+      size = 1
+      for arg in args:
+        if type(arg) is EntryExpression:
+          size += arg.size
+          arg.uses += 1
+      node = EntryExpression(self, len(self.nodes), func, args, size)
+      self.nodes[key] = node
+    return node
+
+  def apply(self, func, *args) -> "EntryExpression":
+    if not self.is_lazy:
+      return func(*args)
+    return self.node((func, *[self.key(arg) for arg in args]), func, args)
+
+  def column_values(self, name: str):
+    return self.df[name].to_numpy(copy=False)
+
+  def column(self, name: str) -> "EntryExpression":
+    return self.apply(self.column_values, name)
+
+  def shift(self, values, periods: int) -> "EntryExpression":
+    return self.apply(self.np_shift, values, periods)
+
+  @staticmethod
+  def divide_values(numerator, denominator):
+    return np.divide(numerator, denominator, out=np.full_like(denominator, np.nan), where=denominator != 0)
+
+  def divide(self, numerator, denominator) -> "EntryExpression":
+    """numerator / denominator, NaN where the denominator is 0."""
+    return self.apply(self.divide_values, numerator, denominator)
+
+  @staticmethod
+  def all_values(*conditions):
+    return _and_entry_conditions(conditions)
+
+  def all(self, conditions: list) -> "EntryExpression":
+    """The AND of a list of conditions, same as _and_entry_conditions."""
+    return self.apply(self.all_values, *conditions)
+
+  def value(self, expression):
+    return self.evaluate([expression])[0]
+
+  def evaluate(self, expressions: list) -> list:
+    """Compute a list of expressions, sharing the values of their common nodes."""
+    # The uses left of the nodes computed so far, a value is dropped after its last use
+    uses = {}
+    for expression in expressions:
+      if type(expression) is EntryExpression:
+        uses[expression.id] = uses.get(expression.id, expression.uses) + 1
+    values = {}
+    return [
+      self.evaluate_node(expression, values, uses) if type(expression) is EntryExpression else expression
+      for expression in expressions
+    ]
+
+  def evaluate_node(self, node, values: dict, uses: dict):
+    node_id = node.id
+    if node_id in values:
+      value = values[node_id]
+    else:
+      func = node.func
+      if func is operator.and_ or func is operator.or_:
+        value = self.reduce_node(node, values, uses)
+      elif func is self.all_values:
+        value = self.reduce_all(node, values, uses)
+      else:
+        value = func(
+          *[self.evaluate_node(arg, values, uses) if type(arg) is EntryExpression else arg for arg in node.args]
+        )
+    remaining = uses.get(node_id, node.uses) - 1
+    uses[node_id] = remaining
+    if remaining > 0:
+      values[node_id] = value
+    elif node_id in values:
+      del values[node_id]
+    return value
+
+  def flatten_node(self, node, operands: list, values: dict, uses: dict) -> None:
+    func = node.func
+    for arg in node.args:
+      if (
+        type(arg) is EntryExpression and arg.func is func and uses.get(arg.id, arg.uses) == 1 and arg.id not in values
+      ):
+        uses[arg.id] = 0
+        self.flatten_node(arg, operands, values, uses)
+      else:
+        operands.append(arg)
+
+  def reduce_node(self, node, values: dict, uses: dict):
+    """
+    AND/OR of a chain of the same operator (a & b & c ...), flattened over the nodes that aren't used anywhere
+    else. Boolean arrays are reduced in place. The order doesn't change an AND, so it's computed like the
+    conditions of a signal (see reduce_all).
+    """
+    func = node.func
+    is_and = func is operator.and_
+    logical_func = np.logical_and if is_and else np.logical_or
+    operands = []
+    self.flatten_node(node, operands, values, uses)
+    if is_and:
+      operands.sort(key=lambda operand: self.condition_cost(operand, values))
+    value = None
+    is_owned = False
+    rows = None
+    rows_values = {}
+    for operand in operands:
+      if rows is not None:
+        operand = self.evaluate_rows(operand, rows, rows_values, values, uses)
+      elif type(operand) is EntryExpression:
+        operand = self.evaluate_node(operand, values, uses)
+      if value is None:
+        value = operand
+      elif (
+        type(value) is np.ndarray
+        and type(operand) is np.ndarray
+        and value.dtype is _BOOL_DTYPE
+        and operand.dtype is _BOOL_DTYPE
+        and value.shape == operand.shape
+      ):
+        # The first result is a new array, the next ones are written into it
+        value = logical_func(value, operand, out=value if is_owned else None)
+        is_owned = True
+      else:
+        value = func(value, operand)
+        is_owned = False
+      if (
+        is_and
+        and rows is None
+        and type(value) is np.ndarray
+        and value.dtype is _BOOL_DTYPE
+        and value.shape == (self.size,)
+      ):
+        rows_left = np.count_nonzero(value)
+        if rows_left * self.rows_ratio < self.size:
+          rows = np.flatnonzero(value)
+          value = np.ones(rows_left, dtype=bool)
+          is_owned = True
+    if rows is not None:
+      # The other rows are False (or 0) & anything
+      rows_value = np.asarray(value)
+      value = np.zeros(self.size, dtype=rows_value.dtype)
+      value[rows] = rows_value
+    return value
+
+  @staticmethod
+  def condition_cost(condition, values: dict) -> int:
+    if type(condition) is not EntryExpression or condition.id in values:
+      return 0
+    return condition.size
+
+  def reduce_all(self, node, values: dict, uses: dict):
+    """Same result as _and_entry_conditions, computed like an AND chain and stopping once no row is left."""
+    value = None
+    is_owned = False
+    has_false = False
+    rows = None
+    rows_values = {}
+    # The order doesn't change the AND, so the known values and the smallest conditions go first and the large ones
+    # (the protections) last, on the rows left by the others
+    for condition in sorted(node.args, key=lambda condition: self.condition_cost(condition, values)):
+      if rows is not None:
+        condition = self.evaluate_rows(condition, rows, rows_values, values, uses)
+      elif type(condition) is EntryExpression:
+        condition = self.evaluate_node(condition, values, uses)
+      if _is_entry_bool_scalar(condition):
+        if not condition:
+          has_false = True
+        continue
+      condition = _entry_bool_array(condition)
+      if value is None:
+        value = condition
+      else:
+        value = np.logical_and(value, condition, out=value if is_owned else None)
+        is_owned = True
+      if has_false:
+        break
+      rows_left = np.count_nonzero(value)
+      if rows_left == 0:
+        break
+      if rows is None and rows_left * self.rows_ratio < self.size:
+        rows = np.flatnonzero(value)
+        value = np.ones(rows_left, dtype=bool)
+        is_owned = True
+    if value is None:
+      return not has_false
+    if has_false:
+      return np.zeros(self.size, dtype=bool) if rows is not None else np.zeros_like(value, dtype=bool)
+    if rows is not None:
+      rows_value = value
+      value = np.zeros(self.size, dtype=bool)
+      value[rows] = rows_value
+    return value
+
+  def take_rows(self, value, rows):
+    if isinstance(value, (pd.Series, pd.Index)):
+      value = value.to_numpy()
+    if type(value) is np.ndarray and value.ndim == 1 and value.shape[0] == self.size:
+      return value[rows]
+    return value
+
+  def evaluate_rows(self, node, rows, rows_values: dict, values: dict, uses: dict):
+    """The value of an expression on some rows only, computing the element-wise nodes on these rows."""
+    if type(node) is not EntryExpression:
+      return self.take_rows(node, rows)
+    node_id = node.id
+    if node_id in rows_values:
+      return rows_values[node_id]
+    func = node.func
+    if node_id in values:
+      value = self.take_rows(values[node_id], rows)
+    elif func is operator.and_ or func is operator.or_:
+      value = self.reduce_rows(node, rows, rows_values, values, uses)
+    elif func in self.elementwise_funcs or func is self.divide_values or type(func) is np.ufunc:
+      value = func(*[self.evaluate_rows(arg, rows, rows_values, values, uses) for arg in node.args])
+    else:
+      value = self.take_rows(self.evaluate_node(node, values, uses), rows)
+    rows_values[node_id] = value
+    return value
+
+  def reduce_rows(self, node, rows, rows_values: dict, values: dict, uses: dict):
+    func = node.func
+    logical_func = np.logical_and if func is operator.and_ else np.logical_or
+    operands = []
+    stack = [node]
+    while stack:
+      item = stack.pop()
+      if type(item) is EntryExpression and item.func is func and item.id not in rows_values and item.id not in values:
+        stack.extend(reversed(item.args))
+      else:
+        operands.append(item)
+    value = None
+    is_owned = False
+    for operand in operands:
+      operand = self.evaluate_rows(operand, rows, rows_values, values, uses)
+      if value is None:
+        value = operand
+      elif (
+        type(value) is np.ndarray
+        and type(operand) is np.ndarray
+        and value.dtype is _BOOL_DTYPE
+        and operand.dtype is _BOOL_DTYPE
+        and value.shape == operand.shape
+      ):
+        value = logical_func(value, operand, out=value if is_owned else None)
+        is_owned = True
+      else:
+        value = func(value, operand)
+        is_owned = False
+    return value
+
+
+# Entry Expression Class
+# ---------------------------------------------------------------------------------------------
+class EntryExpression:
+  """
+  A node of the entry conditions graph of EntryExpressions. The operators, and the numpy ufuncs called without
+  options, build new nodes. Anything else (indexing, converting to an array) computes the node.
+  """
+
+  __slots__ = ("expressions", "id", "func", "args", "size", "uses")
+  # Take over the operators when the other side is a pandas object
+  __pandas_priority__ = 5000
+
+  def __init__(self, expressions: EntryExpressions, id: int, func, args: tuple, size: int):
+    self.expressions = expressions
+    self.id = id
+    self.func = func
+    self.args = args
+    # Number of nodes of its tree, to compute the cheapest conditions first
+    self.size = size
+    # Number of nodes using it
+    self.uses = 0
+
+  def __bool__(self):
+    raise ValueError("The truth value of an entry expression is ambiguous. Combine it with & and | instead.")
+
+  def __getitem__(self, index):
+    return self.expressions.value(self)[index]
+
+  def __array__(self, dtype=None, copy=None):
+    value = np.asarray(self.expressions.value(self))
+    return value if dtype is None else value.astype(dtype, copy=False)
+
+  def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+    if method == "__call__" and not kwargs and ufunc.nout == 1:
+      return self.expressions.apply(ufunc, *inputs)
+    value = self.expressions.value
+    inputs = [value(item) if isinstance(item, EntryExpression) else item for item in inputs]
+    kwargs = {name: value(item) if isinstance(item, EntryExpression) else item for name, item in kwargs.items()}
+    return getattr(ufunc, method)(*inputs, **kwargs)
+
+  __lt__ = _entry_expression_operator(operator.lt)
+  __le__ = _entry_expression_operator(operator.le)
+  __gt__ = _entry_expression_operator(operator.gt)
+  __ge__ = _entry_expression_operator(operator.ge)
+  __eq__ = _entry_expression_operator(operator.eq)
+  __ne__ = _entry_expression_operator(operator.ne)
+  __add__ = _entry_expression_operator(operator.add)
+  __sub__ = _entry_expression_operator(operator.sub)
+  __mul__ = _entry_expression_operator(operator.mul)
+  __truediv__ = _entry_expression_operator(operator.truediv)
+  __and__ = _entry_expression_operator(operator.and_)
+  __or__ = _entry_expression_operator(operator.or_)
+  __radd__ = _entry_expression_reflected_operator(operator.add)
+  __rsub__ = _entry_expression_reflected_operator(operator.sub)
+  __rmul__ = _entry_expression_reflected_operator(operator.mul)
+  __rtruediv__ = _entry_expression_reflected_operator(operator.truediv)
+  __rand__ = _entry_expression_reflected_operator(operator.and_)
+  __ror__ = _entry_expression_reflected_operator(operator.or_)
+  __neg__ = _entry_expression_unary_operator(operator.neg)
+  __abs__ = _entry_expression_unary_operator(operator.abs)
+  __invert__ = _entry_expression_unary_operator(operator.invert)
+  __hash__ = None
+
+
+# Threshold Masks Class
+# ---------------------------------------------------------------------------------------------
+class ThresholdMasks:
+  """
+  The comparison masks of the dataframe columns against a threshold, keyed by (column, operator, threshold), so
+  the same comparison declared twice is computed once.
+
+  The masks used on the previous candles (their keys are kept in `used`) are computed right away. The others are
+  LazyThresholdMask placeholders, computed on their first use, so the masks only needed by the disabled signals
+  cost nothing. Without a `used` set all the masks are computed right away.
+  """
+
+  symbols = {operator.gt: ">", operator.ge: ">=", operator.lt: "<", operator.le: "<="}
+
+  def __init__(self, np_view, used: set = None):
+    self.np_view = np_view
+    self.used = used
+    self.masks = {}
+
+  def mask(self, column: str, op, threshold: float):
+    key = (column, op, threshold)
+    mask = self.masks.get(key)
+    if mask is None:
+      if self.used is None or key in self.used:
+        mask = op(self.np_view(column), threshold)
+      else:
+        mask = LazyThresholdMask(self, key)
+      self.masks[key] = mask
+    return mask
+
+  def gt(self, column: str, threshold: float):
+    return self.mask(column, operator.gt, threshold)
+
+  def ge(self, column: str, threshold: float):
+    return self.mask(column, operator.ge, threshold)
+
+  def lt(self, column: str, threshold: float):
+    return self.mask(column, operator.lt, threshold)
+
+  def le(self, column: str, threshold: float):
+    return self.mask(column, operator.le, threshold)
+
+  def compute(self, key: tuple):
+    column, op, threshold = key
+    mask = op(self.np_view(column), threshold)
+    self.masks[key] = mask
+    if self.used is not None:
+      self.used.add(key)
+    return mask
+
+  def unused(self) -> list:
+    return [key for key, mask in self.masks.items() if type(mask) is LazyThresholdMask and mask.values is None]
+
+  def report(self) -> str:
+    unused = self.unused()
+    report = f"{len(self.masks) - len(unused)}/{len(self.masks)} threshold masks used"
+    if unused:
+      report += ", never used: " + ", ".join(
+        f"{column} {self.symbols[op]} {threshold}" for column, op, threshold in unused
+      )
+    return report
+
+
+# Lazy Threshold Mask Class
+# ---------------------------------------------------------------------------------------------
+class LazyThresholdMask:
+  """A mask of ThresholdMasks not computed yet. It's computed on its first use, as an operand or as an array."""
+
+  __slots__ = ("masks", "key", "values")
+  # Take over the operators when the other side is a pandas object
+  __pandas_priority__ = 5000
+
+  def __init__(self, masks: ThresholdMasks, key: tuple):
+    self.masks = masks
+    self.key = key
+    self.values = None
+
+  def value(self):
+    if self.values is None:
+      self.values = self.masks.compute(self.key)
+    return self.values
+
+  def __array__(self, dtype=None, copy=None):
+    values = self.value()
+    return values if dtype is None else values.astype(dtype, copy=False)
+
+  def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+    inputs = [item.value() if isinstance(item, LazyThresholdMask) else item for item in inputs]
+    return getattr(ufunc, method)(*inputs, **kwargs)
+
+  def __and__(self, other):
+    return self.value() & other
+
+  def __rand__(self, other):
+    return other & self.value()
+
+  def __or__(self, other):
+    return self.value() | other
+
+  def __ror__(self, other):
+    return other | self.value()
+
+  def __invert__(self):
+    return ~self.value()
+
+  def __eq__(self, other):
+    return self.value() == other
+
+  def __ne__(self, other):
+    return self.value() != other
+
+  def __getitem__(self, index):
+    return self.value()[index]
+
+  def __len__(self):
+    return len(self.value())
+
+  __hash__ = None
+
+
+# Candle Columns Class
+# ---------------------------------------------------------------------------------------------
+class CandleColumns(dict):
+  """
+  The columns of an analyzed dataframe by name, each one indexed by position like the candle Series of `df.iloc`.
+
+  A column is looked up on its first read: numpy columns as a view of their values, the other ones as their pandas
+  array, which returns the same scalars as the Series. With `periods`, the columns are shifted by that many candles,
+  so the previous candle is at the position of each candle for 1.
+  """
+
+  def __init__(self, df: DataFrame, periods: int = 0):
+    super().__init__()
+    self.frame = df
+    self.periods = periods
+
+  def __missing__(self, column):
+    values = self.frame[column]
+    if self.periods:
+      values = values.shift(self.periods)
+    dtype = values.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufO":
+      values = values.to_numpy(copy=False)
+    else:
+      values = values.array
+    self[column] = values
+    return values
+
+
+# Candle Row Class
+# ---------------------------------------------------------------------------------------------
+class CandleRow:
+  """
+  A candle of `CandleColumns`, read by column like the candle Series, without boxing the other columns.
+  """
+
+  __slots__ = ("columns", "position")
+
+  def __init__(self, columns: CandleColumns, position: int):
+    self.columns = columns
+    self.position = position
+
+  def __getitem__(self, column):
+    return self.columns[column][self.position]
+
+
+# Exit Features Class
+# ---------------------------------------------------------------------------------------------
+class ExitFeatures:
+  """
+  The columns of an analyzed dataframe, for custom_exit in the backtests.
+
+  `candles(current_time)` returns the last candle closed at `current_time` and the one before, the rows the
+  dataframe of `dp.get_analyzed_dataframe` ends with in the backtests, as `CandleRow`.
+  """
+
+  def __init__(self, df: DataFrame, timeframe: str):
+    self.columns = CandleColumns(df)
+    dates = pd.DatetimeIndex(df["date"]).as_unit("ns")
+    self.close_times = (dates + pd.Timedelta(minutes=timeframe_to_minutes(timeframe))).asi8
+
+  def candles(self, current_time: datetime):
+    position = int(np.searchsorted(self.close_times, pd.Timestamp(current_time).as_unit("ns").value, side="right"))
+    if position < 2:
+      return None
+    return CandleRow(self.columns, position - 1), CandleRow(self.columns, position - 2)
+
+
+# Exit Ladder Class
+# ---------------------------------------------------------------------------------------------
+class ExitLadder:
+  """
+  Exit thresholds by profit bucket, for each regime of the trade.
+
+  The bucket i holds the profits in [edges[i], edges[i + 1]), the last bucket has no upper edge. A trade exits when
+  `compare(value, threshold)` is true for the threshold of its regime and profit bucket, the signal is named after the
+  regime and the bucket index. The value is the `column` of the candle.
+  """
+
+  def __init__(self, edges: tuple, thresholds: dict, compare, column: str):
+    self.edges = edges
+    self.thresholds = thresholds
+    self.compare = compare
+    self.column = column
+    self.regimes = tuple(thresholds)
+    self.edges_array = np.array(edges)
+    self.thresholds_array = np.array([thresholds[regime] for regime in self.regimes])
+
+  def exit_bucket(self, regime: str, profit: float, value: float):
+    """The profit bucket the trade exits on, None if it doesn't exit."""
+    if not profit >= self.edges[0]:
+      return None
+    bucket = bisect.bisect_right(self.edges, profit) - 1
+    if self.compare(value, self.thresholds[regime][bucket]):
+      return bucket
+    return None
+
+  def exit_buckets(self, regimes: np.ndarray, profits: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    `exit_bucket` for many (trade, candle) pairs at once.
+
+    `regimes` are the indexes in `self.regimes`, -1 for no regime. Returns the buckets, -1 where there is no exit.
+    """
+    regimes = np.asarray(regimes)
+    profits = np.asarray(profits)
+    buckets = np.searchsorted(self.edges_array, profits, side="right") - 1
+    in_ladder = (regimes >= 0) & (profits >= self.edges[0])
+    thresholds = self.thresholds_array[np.where(in_ladder, regimes, 0), np.where(in_ladder, buckets, 0)]
+    is_exit = in_ladder & self.compare(np.asarray(values), thresholds)
+    return np.where(is_exit, buckets, -1)
+
+  def candle_exit_bucket(self, candle, regime: str, profit: float, value: float):
+    """
+    `exit_bucket` on a candle. On the `CandleRow` of the backtests, the exits of all the candles of the dataframe are
+    computed with `exit_buckets` on the first lookup, as a bitmask of the exiting buckets by regime and candle.
+    """
+    if not isinstance(candle, CandleRow):
+      return self.exit_bucket(regime, profit, value)
+    if not profit >= self.edges[0]:
+      return None
+    # Kept with the columns, so it goes away with the dataframe
+    columns = candle.columns
+    exits = columns.get(self)
+    if exits is None:
+      values = np.asarray(columns[self.column])
+      exits = np.zeros((len(self.regimes), len(values)), dtype=np.int32)
+      for index in range(len(self.regimes)):
+        buckets = self.exit_buckets(np.full((1, 1), index), self.edges_array[None, :], values[:, None])
+        exits[index] = ((buckets >= 0) << np.arange(len(self.edges))).sum(axis=1)
+      columns[self] = exits
+    bucket = bisect.bisect_right(self.edges, profit) - 1
+    if exits[self.regimes.index(regime), candle.position] >> bucket & 1:
+      return bucket
+    return None
+
+
+EXIT_MAIN_PROFIT_EDGES = (0.001, 0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09, 0.1, 0.12, 0.2)
+
+# RSI_14 below the threshold, "o" over the EMA_200, "u" under it
+LONG_EXIT_MAIN_LADDER = ExitLadder(
+  EXIT_MAIN_PROFIT_EDGES,
+  {
+    "o": (10.0, 28.0, 30.0, 32.0, 34.0, 36.0, 38.0, 40.0, 42.0, 44.0, 46.0, 44.0, 42.0),
+    "u": (12.0, 30.0, 32.0, 34.0, 36.0, 38.0, 40.0, 42.0, 44.0, 46.0, 48.0, 46.0, 44.0),
+  },
+  operator.lt,
+  "RSI_14",
+)
+
+# RSI_14 above the threshold, "o" under the EMA_200, "u" over it
+SHORT_EXIT_MAIN_LADDER = ExitLadder(
+  EXIT_MAIN_PROFIT_EDGES,
+  {
+    "o": (90.0, 72.0, 70.0, 68.0, 66.0, 64.0, 62.0, 60.0, 58.0, 56.0, 54.0, 56.0, 58.0),
+    "u": (88.0, 70.0, 68.0, 66.0, 64.0, 62.0, 60.0, 58.0, 56.0, 54.0, 52.0, 54.0, 56.0),
+  },
+  operator.gt,
+  "RSI_14",
+)
+
+
+# Grind Entry Rules Class
+# ---------------------------------------------------------------------------------------------
+class GrindEntryRules:
+  """
+  The rules of a grind entry, in the order they are checked.
+
+  The candle part of the rules is computed for all the candles by the `<grind entry>_rules` method of the strategy,
+  and stored in the `column` of the analyzed dataframe, as a bit by rule. The trade part of a rule is the trade value
+  ("slice_profit", "slice_profit_entry" or "is_derisk") compared to a threshold, None for the rules on the candle only.
+  """
+
+  def __init__(self, column: str, rules: tuple):
+    self.column = column
+    self.rules = rules
+
+  def bits(self, is_rules: list) -> np.ndarray:
+    """The rules bits of each candle, from the candle part of each rule."""
+    if len(is_rules) != len(self.rules):
+      raise ValueError(f"{self.column}: {len(is_rules)} rules computed, {len(self.rules)} expected")
+    bits = np.zeros(len(is_rules[0]), dtype=np.int64)
+    for rule, is_rule in enumerate(is_rules):
+      bits[is_rule] |= 1 << rule
+    return bits
+
+  def first_rule(self, candle, slice_profit: float, slice_profit_entry: float = None, is_derisk: bool = False):
+    """The tag of the first rule matched by the candle and the trade, None if there is none."""
+    bits = int(candle[self.column])
+    rule = 0
+    while bits:
+      if bits & 1:
+        tag, trade_value, compare, threshold = self.rules[rule]
+        if trade_value is None:
+          return tag
+        if trade_value == "slice_profit":
+          value = slice_profit
+        elif trade_value == "slice_profit_entry":
+          value = slice_profit_entry
+        else:
+          value = is_derisk
+        if compare(value, threshold):
+          return tag
+      bits >>= 1
+      rule += 1
+    return None
+
+
+LONG_GRIND_ENTRY_V3_RULES = GrindEntryRules(
+  "long_grind_entry_v3_rules",
+  (
+    ("g1", None, None, None),
+    ("g2", None, None, None),
+    ("g3", None, None, None),
+    ("g4", None, None, None),
+    ("g5", None, None, None),
+    ("g6", None, None, None),
+    ("g7", None, None, None),
+    ("g8", None, None, None),
+    ("g9", None, None, None),
+    ("g10", None, None, None),
+    ("g11", None, None, None),
+    ("g12", None, None, None),
+    ("g13", None, None, None),
+    ("g14", None, None, None),
+    ("g15", "slice_profit", operator.lt, -0.16),
+    ("g16", None, None, None),
+    ("g17", None, None, None),
+    ("g18", "slice_profit", operator.lt, -0.1),
+    ("g19", "slice_profit", operator.lt, -0.06),
+    ("g20", None, None, None),
+    ("g21", "slice_profit_entry", operator.lt, -0.02),
+    ("g22", None, None, None),
+    ("g23", None, None, None),
+    ("g24", None, None, None),
+    ("g27", None, None, None),
+  ),
+)
+
+# The v2 and the regular grind entries don't tag their entries
+LONG_GRIND_ENTRY_V2_RULES = GrindEntryRules(
+  "long_grind_entry_v2_rules",
+  (
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", "slice_profit", operator.lt, -0.12),
+    ("", None, None, None),
+  ),
+)
+
+LONG_GRIND_ENTRY_RULES = GrindEntryRules(
+  "long_grind_entry_rules",
+  (
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", "is_derisk", operator.eq, True),
+  ),
+)
+
+SHORT_GRIND_ENTRY_V3_RULES = GrindEntryRules(
+  "short_grind_entry_v3_rules",
+  (
+    ("g1", None, None, None),
+    ("g2", None, None, None),
+    ("g3", None, None, None),
+    ("g4", None, None, None),
+    ("g5", None, None, None),
+    ("g6", None, None, None),
+    ("g7", None, None, None),
+    ("g8", None, None, None),
+    ("g9", None, None, None),
+    ("g10", None, None, None),
+    ("g11", None, None, None),
+    ("g12", None, None, None),
+    ("g13", None, None, None),
+    ("g14", None, None, None),
+    ("g15", "slice_profit", operator.lt, -0.16),
+    ("g16", None, None, None),
+    ("g17", None, None, None),
+    ("g18", "slice_profit", operator.lt, -0.1),
+    ("g19", "slice_profit", operator.lt, -0.06),
+    ("g20", None, None, None),
+    ("g21", "slice_profit", operator.lt, -0.02),
+    ("g22", None, None, None),
+    ("g23", None, None, None),
+    ("g24", None, None, None),
+    ("g27", None, None, None),
+  ),
+)
+
+SHORT_GRIND_ENTRY_V2_RULES = GrindEntryRules(
+  "short_grind_entry_v2_rules",
+  (
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", "slice_profit", operator.gt, 0.12),
+    ("", None, None, None),
+  ),
+)
+
+SHORT_GRIND_ENTRY_RULES = GrindEntryRules(
+  "short_grind_entry_rules",
+  (
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", None, None, None),
+    ("", "is_derisk", operator.eq, True),
+  ),
+)
+
+
+# Profit Aggregate Class
+# ---------------------------------------------------------------------------------------------
+class ProfitAggregate:
+  """
+  The filled orders part of the total profit of a trade: the amount left, the entries stake with fees, the profit of
+  the entries and exits, and the first entry stake.
+
+  It's valid for the order `state` it was summed for, the profit at a new rate is then computed without going
+  through the orders again, with the same result as summing them. The order state doesn't cover every fill, so it's
+  summed again on each filled order (`refresh_profit_aggregate`).
+  """
+
+  __slots__ = (
+    "state",
+    "is_short",
+    "fee_close_multiplier",
+    "total_amount",
+    "total_stake",
+    "orders_profit",
+    "init_stake",
+  )
+
+  def __init__(
+    self,
+    state: tuple,
+    is_short: bool,
+    filled_entries: list,
+    filled_exits: list,
+    fee_open_rate: float,
+    fee_close_rate: float,
+  ):
+    total_amount = 0.0
+    total_stake = 0.0
+    total_profit = 0.0
+    if is_short:
+      fee_open_multiplier = 1 - fee_open_rate
+      fee_close_multiplier = 1 + fee_close_rate
+      for entry_order in filled_entries:
+        filled = entry_order.safe_filled
+        entry_stake = filled * entry_order.safe_price * fee_open_multiplier
+        total_amount += filled
+        total_stake += entry_stake
+        total_profit += entry_stake
+      for exit_order in filled_exits:
+        filled = exit_order.safe_filled
+        exit_stake = filled * exit_order.safe_price * fee_close_multiplier
+        total_amount -= filled
+        total_profit -= exit_stake
+    else:
+      fee_open_multiplier = 1 + fee_open_rate
+      fee_close_multiplier = 1 - fee_close_rate
+      for entry_order in filled_entries:
+        filled = entry_order.safe_filled
+        entry_stake = filled * entry_order.safe_price * fee_open_multiplier
+        total_amount += filled
+        total_stake += entry_stake
+        total_profit -= entry_stake
+      for exit_order in filled_exits:
+        filled = exit_order.safe_filled
+        exit_stake = filled * exit_order.safe_price * fee_close_multiplier
+        total_amount -= filled
+        total_profit += exit_stake
+    self.state = state
+    self.is_short = is_short
+    self.fee_close_multiplier = fee_close_multiplier
+    self.total_amount = total_amount
+    self.total_stake = total_stake
+    self.orders_profit = total_profit
+    self.init_stake = (filled_entries[0].safe_filled * filled_entries[0].safe_price) if filled_entries else None
+
+  def total_profit(self, exit_rate: float, funding_fees: float | None) -> tuple:
+    """The total profit in stake, ratio, ratio based on current stake, and ratio based on the first entry stake."""
+    current_stake = self.total_amount * exit_rate * self.fee_close_multiplier
+    if self.is_short:
+      total_profit = self.orders_profit - current_stake
+    else:
+      total_profit = self.orders_profit + current_stake
+    if funding_fees is not None:
+      total_profit += funding_fees
+    total_profit_ratio = total_profit / self.total_stake
+    current_profit_ratio = total_profit / current_stake
+    init_profit_ratio = total_profit / self.init_stake
+    return total_profit, total_profit_ratio, current_profit_ratio, init_profit_ratio
+
+  def to_custom_data(self) -> dict:
+    return {slot: getattr(self, slot) for slot in self.__slots__}
+
+  @classmethod
+  def from_custom_data(cls, data):
+    if not isinstance(data, dict) or set(data) != set(cls.__slots__):
+      return None
+    profit_aggregate = cls.__new__(cls)
+    for slot in cls.__slots__:
+      setattr(profit_aggregate, slot, data[slot])
+    # The state tuples come back as lists
+    order_state, *state = data["state"]
+    profit_aggregate.state = (tuple(order_state), *state)
+    return profit_aggregate
+
+
+# Profit Snapshots Class
+# ---------------------------------------------------------------------------------------------
+class ProfitSnapshots:
+  """
+  Filled orders and profit of the open trades by (trade, rate, order state, fees and funding fees), computed by one
+  callback and reused by the next ones on the same candle.
+
+  The snapshots are cleared on each new candle, and at most `max_entries` are kept.
+  """
+
+  def __init__(self, timeframe_minutes: int, max_entries: int = 1000):
+    self.candle_seconds = timeframe_minutes * 60
+    self.max_entries = max_entries
+    self.candle = None
+    self.entries = {}
+    self.hits = 0
+    self.misses = 0
+
+  def start_candle(self, current_time: datetime) -> None:
+    candle = int(current_time.timestamp()) // self.candle_seconds
+    if candle != self.candle:
+      if self.entries:
+        log.debug("Profit snapshots: %s", self.report())
+      self.candle = candle
+      self.entries.clear()
+
+  def get(self, key):
+    snapshot = self.entries.get(key)
+    if snapshot is None:
+      self.misses += 1
+    else:
+      self.hits += 1
+    return snapshot
+
+  def set(self, key, snapshot) -> None:
+    entries = self.entries
+    if len(entries) >= self.max_entries and key not in entries:
+      entries.pop(next(iter(entries)))
+    entries[key] = snapshot
+
+  def report(self) -> str:
+    lookups = self.hits + self.misses
+    hit_rate = self.hits / lookups if lookups else 0.0
+    return f"{len(self.entries)} snapshots, {self.hits}/{lookups} hits ({hit_rate:.1%})"
+
+
+# Open Trade Index Class
+# ---------------------------------------------------------------------------------------------
+class OpenTradeIndex:
+  """
+  Counts of the open trades by side, mode and pair, so the entry checks don't scan the open trades.
+
+  Rebuilt from the open trades once per bot loop, and kept up to date in between: confirmed entries count as
+  pending until their order fills, and trades with a confirmed or filled exit are dropped once closed.
+  """
+
+  def __init__(self):
+    self.built = False
+    self.trades = {}
+    self.exiting = {}
+    self.sides = {}
+    self.modes = {}
+    self.pairs = {}
+
+  def clear(self) -> None:
+    self.built = False
+    self.trades.clear()
+    self.exiting.clear()
+    self.sides.clear()
+    self.modes.clear()
+    self.pairs.clear()
+
+  def _count(self, entry: tuple, step: int) -> None:
+    _, pair, side, modes = entry
+    sides = self.sides
+    pairs = self.pairs
+    sides[side] = sides.get(side, 0) + step
+    pairs[pair] = pairs.get(pair, 0) + step
+    for mode in modes:
+      self.modes[mode] = self.modes.get(mode, 0) + step
+
+  def add(self, key, trade, pair: str, side: str, modes: tuple) -> None:
+    self.remove(("pending", pair))
+    if key not in self.trades:
+      entry = (trade, pair, side, modes)
+      self.trades[key] = entry
+      self._count(entry, 1)
+
+  def pending(self, pair: str, side: str, modes: tuple) -> None:
+    """An entry confirmed for the pair, counted until its trade is added or the next rebuild."""
+    key = ("pending", pair)
+    if key not in self.trades:
+      entry = (None, pair, side, modes)
+      self.trades[key] = entry
+      self._count(entry, 1)
+
+  def remove(self, key) -> None:
+    entry = self.trades.pop(key, None)
+    if entry is not None:
+      self._count(entry, -1)
+    self.exiting.pop(key, None)
+
+  def closing(self, key, trade) -> None:
+    """An exit of the trade was confirmed or filled, drop it once it's closed."""
+    if key in self.trades:
+      self.exiting[key] = trade
+
+  def _drop_closed(self) -> None:
+    exiting = self.exiting
+    if exiting:
+      for key, trade in list(exiting.items()):
+        if not trade.is_open:
+          self.remove(key)
+
+  def count(self) -> int:
+    self._drop_closed()
+    return len(self.trades)
+
+  def side_count(self, side: str) -> int:
+    self._drop_closed()
+    return self.sides.get(side, 0)
+
+  def mode_count(self, mode: str) -> int:
+    self._drop_closed()
+    return self.modes.get(mode, 0)
+
+  def pair_count(self, pair: str) -> int:
+    self._drop_closed()
+    return self.pairs.get(pair, 0)
+
+  def pairs_with_open_orders(self) -> list:
+    return list(
+      {pair: None for trade, pair, _, _ in self.trades.values() if trade is not None and trade.has_open_orders}
+    )
+
+
+# Enter Tag Modes Class
+# ---------------------------------------------------------------------------------------------
+class EnterTagModes:
+  """
+  Enter tags classified by the mode tag groups, as a bitmask of:
+  - `any_bits[group]`, some of the tags are in the group;
+  - `all_bits[group]`, all the tags are in the group;
+  - `mixed_bits[group]`, all the tags are in the main group of `mixed`, or some are and the rest is in the group.
+
+  The groups are frozensets, and the bitmasks of the last `max_entries` enter tags are kept.
+  """
+
+  def __init__(self, groups: dict, mixed: dict, max_entries: int = 1024):
+    self.groups = {name: frozenset(tags) for name, tags in groups.items()}
+    self.mixed = mixed
+    self.any_bits = {}
+    self.all_bits = {}
+    self.mixed_bits = {}
+    bit = 1
+    for name in self.groups:
+      self.any_bits[name] = bit
+      self.all_bits[name] = bit << 1
+      bit <<= 2
+    for name in mixed:
+      self.mixed_bits[name] = bit
+      bit <<= 1
+    self.max_entries = max_entries
+    self.entries = OrderedDict()
+    self.hits = 0
+    self.misses = 0
+
+  def modes(self, enter_tag: str) -> int:
+    entries = self.entries
+    modes = entries.get(enter_tag)
+    if modes is not None:
+      entries.move_to_end(enter_tag)
+      self.hits += 1
+      return modes
+    self.misses += 1
+
+    modes = self.classify(enter_tag.split())
+    entries[enter_tag] = modes
+    if len(entries) > self.max_entries:
+      entries.popitem(last=False)
+    return modes
+
+  def classify(self, enter_tags: list) -> int:
+    tags = frozenset(enter_tags)
+    modes = 0
+    any_bits = self.any_bits
+    all_bits = self.all_bits
+    for name, group in self.groups.items():
+      if not tags.isdisjoint(group):
+        modes |= any_bits[name]
+      if tags <= group:
+        modes |= all_bits[name]
+    for name, main_group in self.mixed.items():
+      if modes & all_bits[main_group] or (modes & any_bits[main_group] and modes & all_bits[name]):
+        modes |= self.mixed_bits[name]
+    return modes
+
+
+# Notification Queue Class
+# ---------------------------------------------------------------------------------------------
+class NotificationQueue:
+  """
+  Trade notifications, formatted and sent on a background thread.
+
+  `put` queues the notification_msg arguments of a notification and returns, the notifications past `max_queued`
+  are dropped and counted. The thread sends the first notification of a pair right away, the ones queued less than
+  `min_interval` seconds after the last one sent are merged into the next message of the pair.
+  """
+
+  max_message_length = 4000
+
+  def __init__(self, format_msg, send_msg, max_queued: int = 1000, min_interval: float = 2.0):
+    self.format_msg = format_msg
+    self.send_msg = send_msg
+    self.min_interval = min_interval
+    self.events = queue.Queue(maxsize=max_queued)
+    self.pending = {}
+    self.last_sent = {}
+    self.sent = 0
+    self.dropped = 0
+    self._lock = threading.Lock()
+    self._stop_event = threading.Event()
+    self._thread = None
+
+  def start(self) -> None:
+    if self._thread is None and not self._stop_event.is_set():
+      self._thread = threading.Thread(target=self._run, name="nfi-notifications", daemon=True)
+      self._thread.start()
+
+  def stop(self) -> None:
+    self._stop_event.set()
+    if self._thread is not None:
+      self._thread.join(timeout=self.min_interval + 1.0)
+      self._thread = None
+    # Send all that's left, regardless of the interval
+    self.collect()
+    self.dispatch(time.monotonic(), force=True)
+    if self.dropped:
+      log.warning("Dropped %d notifications, the notifications queue was full", self.dropped)
+
+  def put(self, event: tuple) -> None:
+    try:
+      self.events.put_nowait(event)
+    except queue.Full:
+      self.dropped += 1
+
+  def _run(self) -> None:
+    while not self._stop_event.is_set():
+      try:
+        event = self.events.get(timeout=self._timeout(time.monotonic()))
+      except queue.Empty:
+        pass
+      else:
+        self._add(event)
+      self.collect()
+      self.dispatch(time.monotonic())
+
+  def _timeout(self, now: float) -> float:
+    with self._lock:
+      if not self.pending:
+        return self.min_interval
+      due = min(self.last_sent.get(pair, now) for pair in self.pending) + self.min_interval
+    return min(max(due - now, 0.0), self.min_interval)
+
+  def _add(self, event: tuple) -> None:
+    try:
+      msg = self.format_msg(*event)
+    except Exception as exc:
+      log.error("Failed to format the %s notification for %s: %s", event[0], event[2], exc)
+      return
+    if msg:
+      with self._lock:
+        self.pending.setdefault(event[2], []).append(msg)
+
+  def collect(self) -> None:
+    """Format the queued notifications, into the pending messages by pair."""
+    while True:
+      try:
+        event = self.events.get_nowait()
+      except queue.Empty:
+        return
+      self._add(event)
+
+  def dispatch(self, now: float, force: bool = False) -> None:
+    """Send the pending messages of the pairs not sent to in the last `min_interval` seconds."""
+    with self._lock:
+      ready = []
+      for pair, msgs in list(self.pending.items()):
+        last_sent = self.last_sent.get(pair)
+        if force or last_sent is None or now - last_sent >= self.min_interval:
+          ready.append(msgs)
+          del self.pending[pair]
+          self.last_sent[pair] = now
+    for msgs in ready:
+      for msg in self._merge(msgs):
+        try:
+          self.send_msg(msg)
+          self.sent += 1
+        except Exception as exc:
+          log.error("Failed to send a notification: %s", exc)
+
+  def _merge(self, msgs: list) -> list:
+    merged = [msgs[0]]
+    for msg in msgs[1:]:
+      if len(merged[-1]) + len(msg) + 2 > self.max_message_length:
+        merged.append(msg)
+      else:
+        merged[-1] = f"{merged[-1]}\n\n{msg}"
+    return merged
+
+
+# Indicators Profiler Class
+# ---------------------------------------------------------------------------------------------
+class IndicatorsProfiler:
+  """
+  Wall time and allocated memory of the indicator stages, by pair, timeframe and stage.
+
+  `start` returns a mark, and `record` keeps the time since a mark as a sample of a stage and returns a new mark, so
+  the stages can be chained. With `memory`, the samples also have the bytes allocated since the mark and the peak
+  above it, traced by tracemalloc. The last `window` samples of each stage are written with their percentiles across
+  the pairs to `path`, as CSV for a .csv path and as JSON otherwise, by `flush` at most every `write_interval`
+  seconds.
+  """
+
+  percentiles = (50, 90, 99)
+
+  def __init__(self, path, memory: bool = False, window: int = 1000, write_interval: float = 60.0):
+    self.path = pathlib.Path(path)
+    self.memory = memory
+    self.window = window
+    self.write_interval = write_interval
+    self.samples = {}
+    self.dirty = False
+    self._last_write = time.monotonic()
+    if memory and not tracemalloc.is_tracing():
+      tracemalloc.start()
+
+  def start(self) -> tuple:
+    if self.memory:
+      tracemalloc.reset_peak()
+      return time.perf_counter(), tracemalloc.get_traced_memory()[0]
+    return time.perf_counter(), 0
+
+  def record(self, mark: tuple, pair: str, timeframe: str, stage: str) -> tuple:
+    seconds = time.perf_counter() - mark[0]
+    allocated = peak = 0
+    if self.memory:
+      current, peak = tracemalloc.get_traced_memory()
+      allocated = current - mark[1]
+      peak -= mark[1]
+    samples = self.samples.get((stage, timeframe))
+    if samples is None:
+      samples = self.samples[(stage, timeframe)] = deque(maxlen=self.window)
+    samples.append((pair, seconds, allocated, peak))
+    self.dirty = True
+    self.flush()
+    return self.start()
+
+  def report(self) -> list:
+    """One row by stage and timeframe, with the percentiles of its samples."""
+    rows = []
+    for (stage, timeframe), samples in self.samples.items():
+      values = np.array([sample[1:] for sample in samples], dtype=np.float64)
+      row = {"stage": stage, "timeframe": timeframe, "samples": len(samples), "pairs": len({s[0] for s in samples})}
+      for column, name in ((0, "seconds"), (1, "allocated_bytes"), (2, "peak_bytes")):
+        if column and not self.memory:
+          break
+        for percentile, value in zip(
+          self.percentiles, np.percentile(values[:, column], self.percentiles), strict=True
+        ):
+          row[f"{name}_p{percentile}"] = round(float(value), 6)
+        row[f"{name}_max"] = round(float(values[:, column].max()), 6)
+      rows.append(row)
+    return rows
+
+  def flush(self) -> None:
+    if self.dirty and time.monotonic() - self._last_write >= self.write_interval:
+      self.save()
+
+  def save(self) -> None:
+    if not self.dirty:
+      return
+    rows = self.report()
+    temp_path = self.path.with_name(self.path.name + ".tmp")
+    try:
+      with temp_path.open("w", newline="") as wfh:
+        if self.path.suffix == ".csv":
+          writer = csv.DictWriter(wfh, fieldnames=list(rows[0]))
+          writer.writeheader()
+          writer.writerows(rows)
+        else:
+          rapidjson.dump(
+            {"updated": datetime.now().isoformat(timespec="seconds"), "window": self.window, "stages": rows},
+            wfh,
+            indent=2,
+          )
+      os.replace(temp_path, self.path)
+    except OSError as exc:
+      log.warning("Failed to write the indicators profile to %s: %s", self.path, exc)
+    self._last_write = time.monotonic()
+    self.dirty = False
+
+
+# Grind Ladders Class
+# ---------------------------------------------------------------------------------------------
+class GrindLadders:
+  """
+  The grind ladders of a trade (grind_1 to grind_5, buyback_1 and rebuy): the entries of each ladder since its last
+  exit, the last exit of each ladder and the last de-risk exit of each level.
+
+  The filled orders are folded in one at a time from `order_filled`, so the grinding doesn't go through all the
+  orders of the trade on every call. It's valid for the filled orders it was folded from, it's rebuilt from the
+  orders otherwise (after a restart, or if an order was filled without the callback).
+  """
+
+  names = ("grind_1", "grind_2", "grind_3", "grind_4", "grind_5", "buyback_1", "rebuy")
+  derisk_levels = {"derisk_level_1": 0, "derisk_level_2": 1, "derisk_level_3": 2, "derisk_level_4": 3}
+
+  __slots__ = (
+    "is_short",
+    "entry_side",
+    "exit_side",
+    "orders_count",
+    "last_order",
+    "last_filled",
+    "entries",
+    "exit_orders",
+    "derisk_orders",
+    "ladders",
+  )
+
+  def __init__(self, is_short: bool, entry_side: str, exit_side: str, filled_orders: list = ()):
+    self.is_short = is_short
+    self.entry_side = entry_side
+    self.exit_side = exit_side
+    self.orders_count = 0
+    self.last_order = None
+    self.last_filled = None
+    # oldest first
+    self.entries = {name: [] for name in self.names}
+    self.exit_orders = dict.fromkeys(self.names)
+    self.derisk_orders = [None, None, None, None]
+    # the ladders as used by the grinding, summed when they change
+    self.ladders = {}
+    for order in filled_orders:
+      self.add(order)
+
+  def is_valid(self, filled_orders: list) -> bool:
+    if len(filled_orders) != self.orders_count:
+      return False
+    last_order = filled_orders[-1] if filled_orders else None
+    return last_order is self.last_order and (last_order is None or last_order.safe_filled == self.last_filled)
+
+  def add(self, order) -> None:
+    """Fold the next filled order of the trade into the ladders."""
+    is_first_order = self.orders_count == 0
+    self.orders_count += 1
+    self.last_order = order
+    self.last_filled = order.safe_filled
+    order_tag = getattr(order, "ft_order_tag", None) or ""
+    if order.ft_order_side == self.entry_side:
+      if is_first_order or not order_tag.endswith("_entry"):
+        return
+      name = order_tag[: -len("_entry")]
+      if name in self.entries:
+        self.entries[name].append(order)
+        self.ladders.pop(name, None)
+    elif order.ft_order_side == self.exit_side:
+      order_tag = order_tag.partition(" ")[0]
+      if order_tag in self.derisk_levels:
+        self.derisk_orders[self.derisk_levels[order_tag]] = order
+      elif order_tag == "derisk_global":
+        for name in self.names:
+          self.close(name, order)
+      else:
+        name, _, exit_type = order_tag.rpartition("_")
+        if exit_type in ("exit", "derisk") and name in self.entries:
+          self.close(name, order)
+
+  def close(self, name: str, exit_order) -> None:
+    self.entries[name] = []
+    self.exit_orders[name] = exit_order
+    self.ladders.pop(name, None)
+
+  def ladder(self, name: str) -> tuple:
+    """The entries since the last exit (newest first), their ids, total amount and cost, and the last exit."""
+    ladder = self.ladders.get(name)
+    if ladder is None:
+      orders = self.entries[name][::-1]
+      total_amount = 0.0
+      total_cost = 0.0
+      for order in orders:
+        total_amount += order.safe_filled
+        total_cost += order.safe_filled * order.safe_price
+      ladder = (orders, [order.id for order in orders], total_amount, total_cost, self.exit_orders[name])
+      self.ladders[name] = ladder
+    return ladder
+
+  @staticmethod
+  def cluster_max_profit(custom_data: "TradeCustomData", name: str) -> tuple:
+    """The grind cluster max profit (stake, rate) stored with the trade."""
+    return (
+      custom_data.get(key=f"{name}_cluster_max_profit_stake") or 0.0,
+      custom_data.get(key=f"{name}_cluster_max_profit_rate") or 0.0,
+    )
+
+  def update_cluster_max_profit(
+    self, custom_data: "TradeCustomData", name: str, profit_stake: float, profit_rate: float
+  ) -> tuple:
+    """Store the new grind cluster max profit with the trade, returns the previous one."""
+    max_profit = self.cluster_max_profit(custom_data, name)
+    max_profit_stake, max_profit_rate = max_profit
+    if profit_stake > max_profit_stake:
+      custom_data.set(key=f"{name}_cluster_max_profit_stake", value=profit_stake)
+    if (profit_rate < max_profit_rate) if self.is_short else (profit_rate > max_profit_rate):
+      custom_data.set(key=f"{name}_cluster_max_profit_rate", value=profit_rate)
+    return max_profit
+
+
+# Trade Custom Data Class
+# ---------------------------------------------------------------------------------------------
+class TradeCustomData:
+  """
+  The custom data of a trade, read with one lookup and then served from memory.
+
+  The writes are kept until `flush` at the end of the callback, a key set several times is written once, and a key
+  set to the value it already has isn't written. All the strategy reads and writes of the trade custom data go
+  through it, so it stays in sync with the stored data.
+  """
+
+  # Stored as text by freqtrade, the other values are stored as JSON
+  scalar_types = ("bool", "float", "int", "str")
+
+  __slots__ = ("trade", "values", "pending")
+
+  def __init__(self, trade):
+    self.trade = trade
+    self.values = {entry.cd_key: entry.value for entry in trade.get_all_custom_data()}
+    self.pending = {}
+
+  def get(self, key: str, default=None):
+    return self.values.get(key, default)
+
+  def set(self, key: str, value) -> None:
+    if type(value).__name__ not in self.scalar_types:
+      # Keep what's read back from the stored JSON (lists for tuples, floats for numpy floats)
+      try:
+        value = rapidjson.loads(rapidjson.dumps(value, number_mode=rapidjson.NM_NAN), number_mode=rapidjson.NM_NAN)
+      except (TypeError, ValueError) as e:
+        log.warning(f"Could not serialize the {key} custom data of {self.trade.pair}: {e}")
+        return
+    values = self.values
+    if key in values and key not in self.pending:
+      current_value = values[key]
+      if type(current_value) is type(value) and current_value == value:
+        return
+    values[key] = value
+    self.pending[key] = value
+
+  def flush(self) -> None:
+    pending = self.pending
+    if not pending:
+      return
+    set_custom_data = self.trade.set_custom_data
+    for key, value in pending.items():
+      set_custom_data(key=key, value=value)
+    pending.clear()
@@ -0,0 +1,103 @@
+#!/bin/bash
+# Verifies the "indicators_compact_storage_enable" mode (float32 oscillators, bool flags) on the focus groups.
+#
+# Runs the focus group backtests twice, with the default float64 storage and with the compact storage,
+# then compares the trades (pair, dates, enter tag, exit reason, profit) of both runs with
+# tools/compare_backtest_results.py. Exits with 1 if any focus group trades differently.
+
+# If you need to change settings before run you can set environment variables like this
+
+# export EXCHANGE=binance gateio okx
+# export TRADING_MODE=futures spot
+# export STRATEGY_NAME=NostalgiaForInfinityX7
+# export TIMERANGE=20240801-
+
+# Exchange Config
+EXCHANGE_CONFIG=""
+if [[ -z ${EXCHANGE} ]]; then
+  EXCHANGE_CONFIG="binance kucoin"
+else
+  EXCHANGE_CONFIG=${EXCHANGE}
+fi
+
+# Time Range Config
+TIMERANGE_CONFIG=""
+if [ -z "${TIMERANGE}" ]; then
+  unset TIMERANGE_CONFIG
+else
+  TIMERANGE_CONFIG="--timerange ${TIMERANGE}"
+fi
+
+# Trading Mode Config
+TRADING_MODE_CONFIG=""
+if [[ -z ${TRADING_MODE} ]]; then
+  TRADING_MODE_CONFIG="futures spot"
+else
+  TRADING_MODE_CONFIG=${TRADING_MODE}
+fi
+
+# Strategy Config
+STRATEGY_NAME_CONFIG=""
+if [[ -z ${STRATEGY_NAME} ]]; then
+  STRATEGY_NAME_CONFIG="NostalgiaForInfinityX7"
+else
+  STRATEGY_NAME_CONFIG=${STRATEGY_NAME}
+fi
+
+RESULTS_DIR=user_data/backtest_results/compact-storage
+COMPACT_CONFIG_FILE=$RESULTS_DIR/compact-storage-config.json
+mkdir -p $RESULTS_DIR
+echo '{"nfi_parameters": {"indicators_compact_storage_enable": true}}' >$COMPACT_CONFIG_FILE
+
+FAILED=0
+
+echo "# Verifying Compact Indicator Storage on Focus Group(s)"
+for TRADING_MODE_RUN in ${TRADING_MODE_CONFIG[*]}; do
+
+  for EXCHANGE_RUN in ${EXCHANGE_CONFIG[*]}; do
+
+    EXCHANGE_CONFIG_FILE=tests/backtests/pairlist-backtest-static-focus-group-$EXCHANGE_RUN-$TRADING_MODE_RUN-usdt.json
+    if [[ -f "$EXCHANGE_CONFIG_FILE" ]]; then
+
+      echo -e "\n---\n"
+      echo -e "## Strategy Name : $STRATEGY_NAME_CONFIG"
+      echo -e "\n### ${EXCHANGE_RUN} FOCUS GROUP" | tr '[a-z]' '[A-Z]'
+      echo -e "\n#### Trading Mode: $TRADING_MODE_RUN"
+
+      for STORAGE_RUN in default compact; do
+        EXTRA_CONFIG=""
+        if [[ $STORAGE_RUN == "compact" ]]; then
+          EXTRA_CONFIG="-c $COMPACT_CONFIG_FILE"
+        fi
+
+        EXPORT_DIR=$RESULTS_DIR/$EXCHANGE_RUN-$TRADING_MODE_RUN-$STORAGE_RUN
+        rm -rf $EXPORT_DIR
+        mkdir -p $EXPORT_DIR
+
+        freqtrade backtesting --export trades \
+          $TIMERANGE_CONFIG --strategy $STRATEGY_NAME_CONFIG \
+          --strategy-path . -c configs/trading_mode-$TRADING_MODE_RUN.json \
+          -c configs/exampleconfig.json -c configs/exampleconfig_secret.json \
+          -c $EXCHANGE_CONFIG_FILE $EXTRA_CONFIG \
+          --log-file user_data/logs/backtesting-$STRATEGY_NAME_CONFIG-$EXCHANGE_RUN-$TRADING_MODE_RUN-compact-storage-$STORAGE_RUN.log \
+          --export-directory $EXPORT_DIR \
+          --cache none --timeframe-detail 1m --dry-run-wallet 100000 --stake-amount 100 --max-open-trades 1000 --eps
+      done
+
+      echo -e "\n### ${EXCHANGE_RUN} ${TRADING_MODE_RUN} DEFAULT VS COMPACT STORAGE" | tr '[a-z]' '[A-Z]'
+      python tools/compare_backtest_results.py \
+        $(ls -t $RESULTS_DIR/$EXCHANGE_RUN-$TRADING_MODE_RUN-default/*.zip | head -n 1) \
+        $(ls -t $RESULTS_DIR/$EXCHANGE_RUN-$TRADING_MODE_RUN-compact/*.zip | head -n 1)
+      if [[ $? -ne 0 ]]; then
+        FAILED=1
+      fi
+    fi
+  done
+
+done
+
+if [[ $FAILED -ne 0 ]]; then
+  echo -e "\nCOMPACT STORAGE CHANGES THE TRADES, DON'T ENABLE IT"
+  exit 1
+fi
+echo -e "\nCOMPACT STORAGE TRADES UNCHANGED"
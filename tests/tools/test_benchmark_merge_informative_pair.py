@@ -5,8 +5,10 @@ import pytest
 from tools.benchmark_merge_informative_pair import build_merge_specs
 from tools.benchmark_merge_informative_pair import build_report
 from tools.benchmark_merge_informative_pair import format_text_report
+from tools.benchmark_merge_informative_pair import main
 from tools.benchmark_merge_informative_pair import informative_rows
 from tools.benchmark_merge_informative_pair import parse_timeframes
+from tools.benchmark_merge_informative_pair import summarize_compare_runs
 from tools.benchmark_merge_informative_pair import summarize_runs
 from tools.benchmark_merge_informative_pair import timeframe_to_minutes
 
@@ -141,3 +143,37 @@ def test_build_report_validates_positive_repeat_before_runtime_imports():
 
   with pytest.raises(RuntimeError, match="--repeat must be greater than 0"):
     build_report(args)
+
+
+def test_summarize_compare_runs_reports_speedup_and_equality():
+  runs = [
+    {
+      "chained_seconds": 0.40,
+      "single_pass_seconds": 0.10,
+      "columns_after": 100,
+      "memory_after_bytes": 2048,
+      "frames_equal": True,
+    },
+    {
+      "chained_seconds": 0.20,
+      "single_pass_seconds": 0.10,
+      "columns_after": 100,
+      "memory_after_bytes": 2048,
+      "frames_equal": False,
+    },
+  ]
+
+  summary = summarize_compare_runs(runs)
+
+  assert summary["chained"]["mean_seconds"] == pytest.approx(0.30)
+  assert summary["single_pass"]["max_seconds"] == 0.10
+  assert summary["speedup"] == pytest.approx(3.0)
+  assert summary["frames_equal"] is False
+
+
+def test_compare_mode_reports_equal_frames(capsys):
+  assert main(["--compare", "--rows", "600", "--repeat", "1", "--json"]) == 0
+
+  output = capsys.readouterr().out
+  assert '"benchmark": "merge_informative_pair_compare"' in output
+  assert '"frames_equal": true' in output
@@ -0,0 +1,135 @@
+import argparse
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tools.benchmark_strategy_stages import BenchmarkDataProvider
+from tools.benchmark_strategy_stages import benchmark_pairs
+from tools.benchmark_strategy_stages import build_report
+from tools.benchmark_strategy_stages import compare_reports
+from tools.benchmark_strategy_stages import format_text_report
+from tools.benchmark_strategy_stages import import_runtime_dependencies
+from tools.benchmark_strategy_stages import load_frames
+from tools.benchmark_strategy_stages import main
+from tools.benchmark_strategy_stages import percentile
+from tools.benchmark_strategy_stages import resample_ohlcv
+from tools.benchmark_strategy_stages import summarize_seconds
+from tools.benchmark_strategy_stages import synthetic_ohlcv
+
+
+def benchmark_args(**kwargs):
+  args = {
+    "pairs": 2,
+    "pair_list": None,
+    "days": 30,
+    "repeat": 1,
+    "trade_candles": 10,
+    "trading_mode": "spot",
+    "exchange": "binance",
+    "seed": 1000,
+    "datadir": None,
+    "output": None,
+    "baseline": None,
+    "json": False,
+  }
+  args.update(kwargs)
+  return argparse.Namespace(**args)
+
+
+def test_summarize_seconds_reports_the_p95():
+  summary = summarize_seconds([float(value) for value in range(1, 21)])
+
+  assert summary["count"] == 20
+  assert summary["mean_seconds"] == pytest.approx(10.5)
+  assert summary["median_seconds"] == pytest.approx(10.5)
+  assert summary["p95_seconds"] == pytest.approx(19.05)
+  assert percentile([3.0], 95.0) == 3.0
+
+
+def test_synthetic_ohlcv_resamples_to_the_informative_timeframes():
+  frame_5m = synthetic_ohlcv(np, pd, 288 * 3, seed=1)
+  frame_1h = resample_ohlcv(frame_5m, "1h")
+
+  assert len(frame_1h) == 72
+  assert (frame_5m["high"] >= frame_5m[["open", "close"]].max(axis=1)).all()
+  assert frame_1h["volume"].sum() == pytest.approx(frame_5m["volume"].sum())
+  assert frame_1h["open"].iloc[1] == frame_5m["open"].iloc[12]
+
+
+def test_benchmark_pairs_adds_the_settle_currency_in_futures():
+  assert benchmark_pairs(benchmark_args(pairs=2)) == ["ETH/USDT", "SOL/USDT"]
+  assert benchmark_pairs(benchmark_args(pair_list="BTC/USDT, ETH/USDT", trading_mode="futures")) == [
+    "BTC/USDT:USDT",
+    "ETH/USDT:USDT",
+  ]
+  with pytest.raises(RuntimeError, match="use --pair-list for more pairs"):
+    benchmark_pairs(benchmark_args(pairs=100))
+
+
+def test_data_provider_returns_the_analyzed_dataframe_up_to_the_slice_end():
+  analyzed = synthetic_ohlcv(np, pd, 10, seed=2)
+  dp = BenchmarkDataProvider({}, None)
+  dp.analyzed["ETH/USDT"] = analyzed
+  dp.slice_end["ETH/USDT"] = 6
+
+  df, analyzed_time = dp.get_analyzed_dataframe("ETH/USDT", "5m")
+
+  assert len(df) == 6
+  assert analyzed_time == analyzed["date"].iloc[5]
+
+
+def test_load_frames_reads_the_recorded_ohlcv(tmp_path):
+  from freqtrade.data.history import get_datahandler
+  from freqtrade.enums import CandleType
+
+  frame_5m = synthetic_ohlcv(np, pd, 288 * 2, seed=3)
+  data_handler = get_datahandler(tmp_path, "feather")
+  for timeframe in ("5m", "1h"):
+    data_handler.ohlcv_store("ETH/USDT", timeframe, resample_ohlcv(frame_5m, timeframe), CandleType.SPOT)
+
+  frames = load_frames(
+    import_runtime_dependencies(), benchmark_args(datadir=tmp_path, days=1), ["ETH/USDT"], ["5m", "1h"]
+  )
+
+  assert len(frames[("ETH/USDT", "5m")]) == 288
+  assert len(frames[("ETH/USDT", "1h")]) == 48
+  with pytest.raises(RuntimeError, match="No 4h data for ETH/USDT"):
+    load_frames(import_runtime_dependencies(), benchmark_args(datadir=tmp_path), ["ETH/USDT"], ["4h"])
+
+
+def test_compare_reports_reports_the_speedup_of_the_common_stages():
+  report = {"stages": {"custom_exit": {"mean_seconds": 0.5, "median_seconds": 0.25}, "new_stage": {}}}
+  baseline = {"stages": {"custom_exit": {"mean_seconds": 1.0, "median_seconds": 1.0}}}
+
+  comparison = compare_reports(report, baseline)
+
+  assert list(comparison) == ["custom_exit"]
+  assert comparison["custom_exit"]["mean_speedup"] == pytest.approx(2.0)
+  assert comparison["custom_exit"]["median_speedup"] == pytest.approx(4.0)
+
+
+def test_build_report_validates_positive_repeat_before_runtime_imports():
+  with pytest.raises(RuntimeError, match="--repeat must be greater than 0"):
+    build_report(benchmark_args(repeat=0))
+
+
+def test_benchmark_times_every_stage_and_compares_with_the_baseline(tmp_path, capsys):
+  output = tmp_path / "report.json"
+  arguments = ["--pairs", "1", "--days", "30", "--repeat", "1", "--trade-candles", "5"]
+
+  assert main([*arguments, "--output", str(output), "--json"]) == 0
+  report = json.loads(output.read_text(encoding="utf-8"))
+  assert report["pairs"] == ["ETH/USDT"]
+  assert report["stages"]["populate_indicators"]["count"] == 1
+  assert report["stages"]["custom_exit"]["count"] == 5
+  assert report["stages"]["adjust_trade_position"]["count"] == 5
+  assert report["peak_rss_bytes"] > 0
+  capsys.readouterr()
+
+  assert main([*arguments, "--baseline", str(output)]) == 0
+  text = capsys.readouterr().out
+  assert "custom_exit" in text
+  assert "speedup over" in text
+  assert format_text_report(report).startswith("benchmark=strategy_stages")
@@ -0,0 +1,1424 @@
+import inspect
+import json
+import logging
+import os
+import re
+import time
+from datetime import datetime
+from datetime import timezone
+from types import SimpleNamespace
+import operator
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+import talib
+import talib.abstract as ta
+import tracemalloc
+from NostalgiaForInfinityX7 import Cache
+from NostalgiaForInfinityX7 import CandleColumns
+from NostalgiaForInfinityX7 import EnterTagModes
+from NostalgiaForInfinityX7 import EntryExpressions
+from NostalgiaForInfinityX7 import EXIT_MAIN_PROFIT_EDGES
+from NostalgiaForInfinityX7 import GrindEntryRules
+from NostalgiaForInfinityX7 import GrindLadders
+from NostalgiaForInfinityX7 import HoldTrades
+from NostalgiaForInfinityX7 import HoldTradesWatcher
+from NostalgiaForInfinityX7 import ExitFeatures
+from NostalgiaForInfinityX7 import IndicatorsProfiler
+from NostalgiaForInfinityX7 import IndicatorWorkerPool
+from NostalgiaForInfinityX7 import InformativeCache
+from NostalgiaForInfinityX7 import LONG_EXIT_MAIN_LADDER
+from NostalgiaForInfinityX7 import LONG_GRIND_ENTRY_RULES
+from NostalgiaForInfinityX7 import LONG_GRIND_ENTRY_V3_RULES
+from NostalgiaForInfinityX7 import NostalgiaForInfinityX7
+from NostalgiaForInfinityX7 import NotificationQueue
+from NostalgiaForInfinityX7 import OpenTradeIndex
+from NostalgiaForInfinityX7 import ProfitAggregate
+from NostalgiaForInfinityX7 import ProfitSnapshots
+from NostalgiaForInfinityX7 import SHORT_EXIT_MAIN_LADDER
+from NostalgiaForInfinityX7 import ThresholdMasks
+from NostalgiaForInfinityX7 import TopOfBookCache
+from NostalgiaForInfinityX7 import _entry_tag_bits
+from NostalgiaForInfinityX7 import _render_entry_tags
+from NostalgiaForInfinityX7 import merge_informative_frames
+from freqtrade.strategy import merge_informative_pair
+
+
+@pytest.fixture
+def mock_config(tmp_path):
+  class RunModeMock:
+    def __init__(self, value):
+      self.value = value
+
+  return {
+    "exchange": {
+      "name": "binance",
+      "ccxt_config": {
+        "apiKey": "dummy_key",
+        "secret": "dummy_secret",
+        "password": None,
+      },
+      "pair_whitelist": ["BTC/USDT"],
+      "pair_blacklist": [],
+    },
+    "stake_currency": "USDT",
+    "stake_amount": 10,
+    "dry_run": True,
+    "timeframe": "5m",
+    "max_open_trades": 10,
+    "user_data_dir": tmp_path,  # Use pytest's temporary directory
+    "runmode": RunModeMock("backtest"),  # Simulate the execution mode
+  }
+
+
+def synthetic_series(rows, seed=1):
+  rng = np.random.default_rng(seed)
+  values = 100.0 + np.cumsum(rng.standard_t(3, rows))
+  values[:3] = np.nan
+  values[rows // 2 : rows // 2 + 20] = values[rows // 2 - 1]
+  return values
+
+
+def synthetic_ohlcv(rows, freq="5min", seed=1):
+  close = synthetic_series(rows + 3, seed=seed)[3:]
+  return pd.DataFrame(
+    {
+      "date": pd.date_range("2026-01-01", periods=rows, freq=freq, tz="UTC"),
+      "open": close,
+      "high": close * 1.01,
+      "low": close * 0.99,
+      "close": close,
+      "volume": np.full(rows, 1000.0),
+    }
+  )
+
+
+class FakeDataProvider:
+  def __init__(self, frames):
+    self.frames = frames
+    self.calls = []
+
+  def get_pair_dataframe(self, pair, timeframe):
+    self.calls.append((pair, timeframe))
+    return self.frames[(pair, timeframe)].copy()
+
+
+def test_btc_informative_frame_is_shared_between_pairs(mock_config, mocker):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  strategy.dp = FakeDataProvider({("BTC/USDT", "4h"): synthetic_ohlcv(300, "4h")})
+  btc_informative_4h_indicators = mocker.spy(strategy, "btc_informative_4h_indicators")
+
+  first = strategy.btc_informative_frame("BTC/USDT", "4h")
+  second = strategy.btc_informative_frame("BTC/USDT", "4h")
+
+  assert second is first
+  assert btc_informative_4h_indicators.call_count == 1
+  assert list(first.columns) == ["date", "BTC_RSI_14"]
+  assert (strategy.btc_informative_cache.hits, strategy.btc_informative_cache.misses) == (1, 1)
+
+
+def test_btc_informative_frame_is_recomputed_on_new_candle(mock_config, mocker):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  btc_4h = synthetic_ohlcv(301, "4h")
+  strategy.dp = FakeDataProvider({("BTC/USDT", "4h"): btc_4h.iloc[:300]})
+  btc_informative_4h_indicators = mocker.spy(strategy, "btc_informative_4h_indicators")
+
+  strategy.btc_informative_frame("BTC/USDT", "4h")
+  strategy.dp.frames[("BTC/USDT", "4h")] = btc_4h
+  frame = strategy.btc_informative_frame("BTC/USDT", "4h")
+
+  assert btc_informative_4h_indicators.call_count == 2
+  assert len(frame) == 301
+  assert np.array_equal(
+    frame["BTC_RSI_14"].to_numpy(), ta.RSI(btc_4h["close"].to_numpy(), timeperiod=14), equal_nan=True
+  )
+
+
+def test_informative_cache_drops_least_recently_used_entries():
+  cache = InformativeCache(max_entries=2)
+  source = synthetic_ohlcv(10)
+  source_key = cache.source_key(source)
+
+  cache.set(("ETH/USDT", "1h"), source_key, "eth")
+  cache.set(("SOL/USDT", "1h"), source_key, "sol")
+  assert cache.get(("ETH/USDT", "1h"), source_key) == "eth"
+  cache.set(("XRP/USDT", "1h"), source_key, "xrp")
+
+  assert cache.get(("SOL/USDT", "1h"), source_key) is None
+  assert cache.get(("ETH/USDT", "1h"), source_key) == "eth"
+  assert cache.get(("ETH/USDT", "1h"), cache.source_key(source.iloc[:-1])) is None
+
+
+def test_informative_frame_is_not_cached_in_backtest(mock_config):
+  strategy = NostalgiaForInfinityX7(mock_config)
+
+  assert strategy.informative_cache is None
+
+
+def test_informative_frame_is_reused_until_new_informative_candle(mock_config, mocker):
+  mock_config["runmode"].value = "dry_run"
+  strategy = NostalgiaForInfinityX7(mock_config)
+  info_1d = synthetic_ohlcv(101, "1D")
+  strategy.dp = FakeDataProvider({("ETH/USDT", "1d"): info_1d.iloc[:100]})
+  informative_1d_indicators = mocker.spy(strategy, "informative_1d_indicators")
+
+  first = strategy.informative_frame({"pair": "ETH/USDT"}, "1d")
+  second = strategy.informative_frame({"pair": "ETH/USDT"}, "1d")
+  strategy.dp.frames[("ETH/USDT", "1d")] = info_1d
+  third = strategy.informative_frame({"pair": "ETH/USDT"}, "1d")
+
+  assert second is first
+  assert len(third) == 101
+  assert informative_1d_indicators.call_count == 2
+  assert "close" not in first.columns
+  assert (strategy.informative_cache.hits, strategy.informative_cache.misses) == (1, 2)
+
+
+def test_informative_cache_is_bounded_by_the_whitelist(mock_config):
+  mock_config["runmode"].value = "dry_run"
+  strategy = NostalgiaForInfinityX7(mock_config)
+  strategy.dp = MagicMock()
+  strategy.dp.current_whitelist.return_value = ["ETH/USDT", "SOL/USDT", "XRP/USDT"]
+
+  strategy.informative_pairs()
+
+  assert strategy.informative_cache.max_entries == 3 * len(strategy.info_timeframes)
+
+
+def test_indicator_worker_pool_frames_round_trip_through_shared_memory():
+  frame = synthetic_ohlcv(50)
+  frame["flag"] = frame["close"] > 100.0
+  frame["count"] = np.arange(50, dtype=np.int64)
+  frame.index = pd.RangeIndex(10, 60)
+
+  shm, descriptor = IndicatorWorkerPool.write_frame(frame)
+  try:
+    result = IndicatorWorkerPool.read_frame(descriptor, frame.index)
+  finally:
+    shm.close()
+    shm.unlink()
+
+  pd.testing.assert_frame_equal(result, frame, check_exact=True)
+
+
+def test_informative_frames_on_indicator_workers_match_serial(mock_config, caplog):
+  frames = {
+    ("BTC/USDT", "1h"): synthetic_ohlcv(300, "1h", seed=1),
+    ("BTC/USDT", "4h"): synthetic_ohlcv(300, "4h", seed=2),
+    ("ETH/USDT", "1h"): synthetic_ohlcv(300, "1h", seed=3),
+    ("ETH/USDT", "4h"): synthetic_ohlcv(300, "4h", seed=4),
+  }
+  requests = [
+    ("btc", "BTC/USDT", "1h"),
+    ("btc", "BTC/USDT", "4h"),
+    ("pair", "ETH/USDT", "1h"),
+    ("pair", "ETH/USDT", "4h"),
+  ]
+  serial = NostalgiaForInfinityX7(mock_config)
+  serial.dp = FakeDataProvider(frames)
+  mock_config["nfi_parameters"] = {"num_cores_indicators_calc": 2, "indicators_profiler_enable": True}
+  strategy = NostalgiaForInfinityX7(mock_config)
+  strategy.dp = FakeDataProvider(frames)
+
+  try:
+    results = strategy.informative_frames(requests, "ETH/USDT")
+    assert isinstance(strategy.indicator_pool, IndicatorWorkerPool)
+    assert [sample[0] for sample in strategy.indicators_profiler.samples[("informative_workers", "all")]] == [
+      "ETH/USDT"
+    ]
+    # Every frame came from the workers, none was computed serially after a failure
+    assert "Indicator worker failed" not in caplog.text
+  finally:
+    if strategy.indicator_pool:
+      strategy.indicator_pool.close()
+
+  for result, expected in zip(results, serial.informative_frames(requests), strict=True):
+    pd.testing.assert_frame_equal(result, expected, check_exact=True)
+
+
+def test_informative_frames_with_unsupported_dtypes_are_computed_serially(mock_config, caplog):
+  frames = {
+    (pair, timeframe): synthetic_ohlcv(300, timeframe)
+    for pair in ("BTC/USDT", "ETH/USDT")
+    for timeframe in ("1h", "4h")
+  }
+  for frame in frames.values():
+    frame["trades"] = pd.array(np.arange(300), dtype="Int64")
+  requests = [("btc", "BTC/USDT", "1h"), ("btc", "BTC/USDT", "4h")]
+  serial = NostalgiaForInfinityX7(mock_config)
+  serial.dp = FakeDataProvider(frames)
+  mock_config["nfi_parameters"] = {"num_cores_indicators_calc": 2}
+  strategy = NostalgiaForInfinityX7(mock_config)
+  strategy.dp = FakeDataProvider(frames)
+  pool = strategy.indicator_pool
+
+  try:
+    results = strategy.informative_frames(requests)
+    strategy.informative_frames([("pair", "ETH/USDT", "1h"), ("pair", "ETH/USDT", "4h")])
+  finally:
+    pool.close()
+
+  assert strategy.indicator_pool is False
+  assert caplog.text.count("The indicator workers can't pass these frames") == 1
+  for result, expected in zip(results, serial.informative_frames(requests), strict=True):
+    pd.testing.assert_frame_equal(result, expected, check_exact=True)
+
+
+def test_indicator_workers_report_the_unsupported_dtypes_of_the_computed_frames(mock_config, mocker):
+  def informative_task(self, source_type, pair, timeframe, source):
+    return source.assign(tag="unsupported")
+
+  mocker.patch.object(NostalgiaForInfinityX7, "informative_task", informative_task)
+  mock_config["nfi_parameters"] = {"num_cores_indicators_calc": 1}
+  strategy = NostalgiaForInfinityX7(mock_config)
+  pool = strategy.indicator_pool
+
+  try:
+    with pytest.raises(TypeError, match="Column tag has an unsupported dtype"):
+      pool.compute([("btc", "BTC/USDT", "1h", synthetic_ohlcv(300, "1h"))])
+    # Nothing was left behind for the next compute
+    assert pool.compute([]) == []
+  finally:
+    pool.close()
+
+
+def test_indicator_workers_are_started_with_the_strategy(mock_config):
+  mock_config["nfi_parameters"] = {"num_cores_indicators_calc": 1}
+  strategy = NostalgiaForInfinityX7(mock_config)
+  pool = strategy.indicator_pool
+
+  try:
+    assert isinstance(pool, IndicatorWorkerPool)
+    pool.processes[0].terminate()
+    pool.processes[0].join()
+    with pytest.raises(ChildProcessError):
+      pool.compute([("btc", "BTC/USDT", "1h", synthetic_ohlcv(300, "1h"))])
+  finally:
+    pool.close()
+
+
+def test_indicator_workers_unlink_the_unread_results_on_close(mock_config):
+  mock_config["nfi_parameters"] = {"num_cores_indicators_calc": 1}
+  strategy = NostalgiaForInfinityX7(mock_config)
+  pool = strategy.indicator_pool
+  blocks = set(os.listdir("/dev/shm"))
+  source, descriptor = IndicatorWorkerPool.write_frame(synthetic_ohlcv(300, "1h"))
+
+  try:
+    pool.tasks.put((0, "btc", "BTC/USDT", "1h", descriptor))
+    # Wait for the worker to write its result block
+    deadline = time.monotonic() + 60.0
+    while len(set(os.listdir("/dev/shm")) - blocks) < 2 and time.monotonic() < deadline:
+      time.sleep(0.05)
+    assert len(set(os.listdir("/dev/shm")) - blocks) == 2
+    pool.close()
+  finally:
+    source.close()
+    source.unlink()
+
+  assert set(os.listdir("/dev/shm")) - blocks == set()
+
+
+def test_merge_informative_frames_matches_chained_merges():
+  base = synthetic_ohlcv(600).drop(index=range(100, 130)).reset_index(drop=True)
+  info_1h = synthetic_ohlcv(60, "1h", seed=2)
+  info_1h.loc[20:25, "close"] = np.nan
+  info_1h["count"] = np.arange(60)
+  info_1h["flag"] = info_1h["open"] > 100.0
+  btc_4h = synthetic_ohlcv(20, "4h", seed=3).iloc[2:]
+  informatives = [(btc_4h[["date", "close"]], "4h", True), (info_1h, "1h", False)]
+
+  expected = merge_informative_pair(base, informatives[0][0], "5m", "4h", ffill=False).drop(columns="date_4h")
+  expected = merge_informative_pair(expected, info_1h, "5m", "1h", ffill=False)
+  merged_columns = expected.columns[len(base.columns) :]
+  expected[merged_columns] = expected[merged_columns].ffill()
+
+  pd.testing.assert_frame_equal(merge_informative_frames(base, informatives, "5m"), expected, check_exact=True)
+
+
+@pytest.mark.parametrize("timeperiod", [6, 12, 14, 48, 72])
+def test_min_max_function_api_matches_the_abstract_api(timeperiod):
+  values = synthetic_series(1500)
+  rsi_14 = ta.RSI(values, timeperiod=14)
+
+  for series in (values, rsi_14, values[::2]):
+    np.testing.assert_array_equal(talib.MIN(series, timeperiod=timeperiod), ta.MIN(series, timeperiod=timeperiod))
+    np.testing.assert_array_equal(talib.MAX(series, timeperiod=timeperiod), ta.MAX(series, timeperiod=timeperiod))
+
+
+def test_compact_indicator_storage_keeps_the_exit_decisions(mock_config):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  frames = {}
+  for seed, pair in enumerate(("ETH/USDT", "BTC/USDT")):
+    for timeframe, frame in synthetic_market(60, seed=seed).items():
+      frames[(pair, timeframe)] = frame
+  strategy.dp = FakeDataProvider(frames)
+  strategy.dp.runmode = SimpleNamespace(value="backtest")
+  df = strategy.populate_indicators(frames[("ETH/USDT", "5m")].copy(), {"pair": "ETH/USDT"})
+  compact = strategy.compact_indicator_storage(df)
+
+  # Every column the exit functions read behind an np.float64 type check stays float64
+  source = inspect.getsource(NostalgiaForInfinityX7)
+  columns = dict(re.findall(r'(last_\w+) = last_candle\["(\w+)"\]', source))
+  for name in set(re.findall(r"isinstance\((last_\w+), np\.float64\)", source)):
+    assert compact[columns[name]].dtype == np.float64
+  assert compact["RSI_14"].dtype == np.float32
+
+  exits = 0
+  for row in range(len(df) - 3000, len(df), 6):
+    for exit_func in (strategy.long_exit_dec, strategy.long_exit_williams_r):
+      for profit in (0.005, 0.02, 0.05, 0.1):
+        expected = exit_func("long_normal", profit, profit, 0.0, df.iloc[row], df.iloc[row - 1], None, None, "1")
+        result = exit_func(
+          "long_normal", profit, profit, 0.0, compact.iloc[row], compact.iloc[row - 1], None, None, "1"
+        )
+        assert result == expected
+        exits += expected[0]
+  assert exits > 0
+
+
+def test_np_shift_of_flags_starts_with_nan():
+  shifted = NostalgiaForInfinityX7.np_shift(np.array([True, False, True]), 1)
+
+  assert np.isnan(shifted[0])
+  assert shifted[1:].tolist() == [1.0, 0.0]
+
+
+def entry_expressions_frame(rows=400, seed=5):
+  rng = np.random.default_rng(seed)
+  return pd.DataFrame(
+    {
+      "close": rng.normal(100.0, 5.0, rows),
+      "RSI_3": rng.uniform(0.0, 100.0, rows),
+      "RSI_14": rng.uniform(0.0, 100.0, rows),
+      "CMF_20": rng.uniform(-1.0, 1.0, rows),
+      "protections_long_global": rng.random(rows) > 0.1,
+    }
+  )
+
+
+def entry_conditions(expressions, np_shift):
+  close = expressions.column("close")
+  rsi_3 = expressions.column("RSI_3")
+  rsi_14 = expressions.column("RSI_14")
+  cmf_20 = expressions.column("CMF_20")
+  rsi_3_gt_10 = rsi_3 > 10.0
+  conditions = []
+  for rsi_14_max in (20.0, 40.0, 70.0):
+    logic = [True, expressions.column("protections_long_global") == True]
+    logic.append(
+      ((rsi_3_gt_10) | (cmf_20 > -0.2) | (rsi_14 > 80.0))
+      & ((rsi_3_gt_10) | (np_shift(close, 1) < close * 1.01))
+      & ((rsi_3 > 5.0) | (expressions.divide(close - 90.0, close - 100.0) > 0.5))
+    )
+    logic.append(rsi_14 < rsi_14_max)
+    logic.append((rsi_3 < 30.0) & (cmf_20 < 0.5))
+    conditions.append(expressions.all(logic))
+  return conditions
+
+
+@pytest.mark.parametrize("rows_ratio", [1, 4, 1000])
+def test_entry_expressions_match_eager_conditions(rows_ratio, monkeypatch):
+  df = entry_expressions_frame()
+  monkeypatch.setattr(EntryExpressions, "rows_ratio", rows_ratio)
+  eager = EntryExpressions(df, NostalgiaForInfinityX7.np_shift, is_lazy=False)
+  lazy = EntryExpressions(df, NostalgiaForInfinityX7.np_shift)
+
+  expected = entry_conditions(eager, eager.shift)
+  results = lazy.evaluate(entry_conditions(lazy, lazy.shift))
+
+  assert all(isinstance(condition, np.ndarray) for condition in expected)
+  for result, condition in zip(results, expected, strict=True):
+    assert result.dtype == bool
+    np.testing.assert_array_equal(result, condition)
+
+
+def synthetic_market(days, seed=1):
+  rows = days * 288
+  rng = np.random.default_rng(seed)
+  close = 100.0 * np.exp(np.cumsum(rng.standard_t(3, rows) * 0.003))
+  open_rate = np.r_[close[0], close[:-1]]
+  df = pd.DataFrame(
+    {
+      "date": pd.date_range(end="2026-01-10", periods=rows, freq="5min", tz="UTC"),
+      "open": open_rate,
+      "high": np.maximum(open_rate, close) * 1.001,
+      "low": np.minimum(open_rate, close) * 0.999,
+      "close": close,
+      "volume": rng.lognormal(6.0, 1.0, rows),
+    }
+  )
+  frames = {"5m": df}
+  ohlcv = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+  for timeframe, freq in (("15m", "15min"), ("1h", "1h"), ("4h", "4h"), ("1d", "1D")):
+    frames[timeframe] = df.set_index("date").resample(freq).agg(ohlcv).dropna().reset_index()
+  return frames
+
+
+def test_populate_entry_trend_lazy_matches_eager(mock_config):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  frames = {}
+  for seed, pair in enumerate(("ETH/USDT", "BTC/USDT")):
+    for timeframe, frame in synthetic_market(60, seed=seed).items():
+      frames[(pair, timeframe)] = frame
+  strategy.dp = FakeDataProvider(frames)
+  strategy.dp.runmode = SimpleNamespace(value="backtest")
+  df = strategy.populate_indicators(frames[("ETH/USDT", "5m")].copy(), {"pair": "ETH/USDT"})
+
+  eager = strategy.populate_entry_trend(df.copy(), {"pair": "ETH/USDT"})
+  strategy.entry_conditions_lazy_min_rows = 1
+  lazy = strategy.populate_entry_trend(df.copy(), {"pair": "ETH/USDT"})
+
+  assert eager["enter_long"].sum() > 0
+  for column in ("enter_long", "enter_short", "enter_tag"):
+    pd.testing.assert_series_equal(lazy[column], eager[column], check_exact=True)
+
+
+def test_entry_expressions_share_equal_sub_expressions():
+  expressions = EntryExpressions(entry_expressions_frame(), NostalgiaForInfinityX7.np_shift)
+  rsi_3 = expressions.column("RSI_3")
+
+  assert expressions.column("RSI_3") is rsi_3
+  assert (rsi_3 > 10.0) is (rsi_3 > 10.0)
+  assert ((rsi_3 > 10.0) | (rsi_3 < 5.0)) is ((rsi_3 > 10.0) | (rsi_3 < 5.0))
+  assert (rsi_3 > 10.0) is not (rsi_3 > 10)
+  assert (rsi_3 > 0.0) is not (rsi_3 > -0.0)
+
+
+def test_entry_expressions_compute_only_the_used_nodes(mocker):
+  df = entry_expressions_frame()
+  expressions = EntryExpressions(df, NostalgiaForInfinityX7.np_shift)
+  unused = mocker.Mock(side_effect=lambda values: values > 50.0)
+  used = mocker.Mock(side_effect=lambda values: values > 50.0)
+  rsi_14 = expressions.column("RSI_14")
+  expressions.apply(unused, rsi_14)
+  condition = expressions.apply(used, rsi_14) & (rsi_14 < 90.0)
+
+  result = expressions.value(condition)
+
+  unused.assert_not_called()
+  used.assert_called_once()
+  np.testing.assert_array_equal(result, (df["RSI_14"] > 50.0).to_numpy() & (df["RSI_14"] < 90.0).to_numpy())
+
+
+def test_entry_expressions_all_stops_when_no_row_is_left(mocker):
+  df = entry_expressions_frame()
+  expressions = EntryExpressions(df, NostalgiaForInfinityX7.np_shift)
+  protection = mocker.Mock(side_effect=lambda values: values > 50.0)
+  rsi_14 = expressions.column("RSI_14")
+  condition = expressions.all([True, rsi_14 > 200.0, expressions.apply(protection, rsi_14) | (rsi_14 < 10.0)])
+
+  result = expressions.value(condition)
+
+  protection.assert_not_called()
+  assert result.dtype == bool
+  assert not result.any()
+
+
+def test_threshold_masks_are_computed_on_first_use(mocker):
+  df = entry_expressions_frame()
+  np_view = mocker.Mock(side_effect=lambda column: df[column].to_numpy(copy=False))
+  used = set()
+  masks = ThresholdMasks(np_view, used)
+  rsi_3_gt_10 = masks.gt("RSI_3", 10.0)
+  masks.lt("RSI_14", 30.0)
+
+  assert masks.gt("RSI_3", 10.0) is rsi_3_gt_10
+  assert masks.gt("CMF_20", -0.2) is masks.gt("CMF_20", -0.20)
+  np_view.assert_not_called()
+
+  rsi_3 = df["RSI_3"].to_numpy()
+  cmf_20_gt = df["CMF_20"].to_numpy() > -0.2
+  np.testing.assert_array_equal(cmf_20_gt | rsi_3_gt_10, cmf_20_gt | (rsi_3 > 10.0))
+  np.testing.assert_array_equal(rsi_3_gt_10 & cmf_20_gt, (rsi_3 > 10.0) & cmf_20_gt)
+  np.testing.assert_array_equal(np.asarray(rsi_3_gt_10, dtype=bool), rsi_3 > 10.0)
+  np_view.assert_called_once_with("RSI_3")
+  assert used == {("RSI_3", operator.gt, 10.0)}
+  assert masks.report() == ("1/3 threshold masks used, never used: RSI_14 < 30.0, CMF_20 > -0.2")
+
+  # The masks used before are computed right away
+  next_masks = ThresholdMasks(np_view, used)
+  assert isinstance(next_masks.gt("RSI_3", 10.0), np.ndarray)
+  assert not isinstance(next_masks.lt("RSI_14", 30.0), np.ndarray)
+
+
+def test_entry_tags_are_rendered_from_the_conditions_bitset():
+  rng = np.random.default_rng(7)
+  num_rows = 500
+  masks = [rng.random(num_rows) < 0.05 for _ in range(70)]
+  masks[3] = False
+  masks[66] = True
+  tags = [f"{index + 1} " for index in range(len(masks))]
+  expected = np.full(num_rows, "", dtype=object)
+  for mask, tag in zip(masks, tags, strict=True):
+    if mask is True:
+      expected = expected + tag
+    elif mask is not False:
+      expected[mask] = expected[mask] + tag
+
+  rows = np.flatnonzero(expected != "")
+  bits = _entry_tag_bits(masks, rows)
+  entry_tags = _render_entry_tags(bits, tags, rows, num_rows)
+
+  assert bits.shape == (2, len(rows))
+  assert list(entry_tags) == list(expected)
+  # Only the last candle is rendered in live
+  rows = np.arange(num_rows)[-1:]
+  last_candle_tags = _render_entry_tags(_entry_tag_bits(masks, rows), tags, rows, num_rows)
+  assert last_candle_tags[-1] == expected[-1]
+  assert (last_candle_tags[:-1] == "").all()
+  # No entry, no tag
+  rows = np.flatnonzero(np.zeros(num_rows, dtype=bool))
+  assert (_render_entry_tags(_entry_tag_bits(masks, rows), tags, rows, num_rows) == "").all()
+
+
+def test_exit_features_candles_match_the_backtest_analyzed_dataframe(mock_config):
+  from freqtrade.data.dataprovider import DataProvider
+  from freqtrade.enums import CandleType, RunMode
+
+  df = synthetic_ohlcv(300)
+  df["RSI_14"] = np.linspace(0.0, 100.0, len(df), dtype=np.float32)
+  df["protections_long_global"] = np.arange(len(df)) % 3 == 0
+  df["enter_tag"] = ""
+  strategy = NostalgiaForInfinityX7(mock_config)
+  strategy.populate_exit_trend(df, {"pair": "ETH/USDT"})
+  features = strategy.exit_features["ETH/USDT"]
+  assert isinstance(features, ExitFeatures)
+  dp = DataProvider({"runmode": RunMode.BACKTEST, "timeframe": "5m"}, None)
+  dp._set_cached_df("ETH/USDT", "5m", df, CandleType.SPOT)
+
+  for max_index in (1, 2, 150, 300):
+    dp._set_dataframe_max_index("ETH/USDT", max_index)
+    analyzed_df, _ = dp.get_analyzed_dataframe("ETH/USDT", "5m")
+    # The main candle, then the detail candles of the backtests with a detail timeframe
+    for minutes in (0, 1, 4):
+      current_time = df["date"].iloc[max_index - 1] + pd.Timedelta(minutes=5 + minutes)
+      candles = features.candles(current_time.to_pydatetime())
+      if max_index < 2:
+        assert candles is None
+        continue
+      for candle, expected in zip(candles, (analyzed_df.iloc[-1], analyzed_df.iloc[-2]), strict=True):
+        for column in df.columns:
+          assert type(candle[column]) is type(expected[column])
+          assert candle[column] == expected[column]
+
+
+def test_exit_features_are_only_built_in_backtest(mock_config):
+  mock_config["runmode"].value = "dry_run"
+  strategy = NostalgiaForInfinityX7(mock_config)
+
+  strategy.populate_exit_trend(synthetic_ohlcv(10), {"pair": "ETH/USDT"})
+
+  assert strategy.exit_features is None
+
+
+@pytest.mark.parametrize(
+  "close, profit, rsi_14, expected",
+  [
+    (2.0, 0.0009, 5.0, (False, None)),
+    (2.0, 0.001, 9.0, (True, "exit_long_normal_o_0")),
+    (2.0, 0.01, 27.0, (True, "exit_long_normal_o_1")),
+    (2.0, 0.01, 28.0, (False, None)),
+    (2.0, 0.12, 43.0, (True, "exit_long_normal_o_11")),
+    (2.0, 5.0, 41.0, (True, "exit_long_normal_o_12")),
+    (0.5, 0.119, 47.0, (True, "exit_long_normal_u_10")),
+    (1.0, 0.05, 5.0, (False, None)),
+    (2.0, float("nan"), 5.0, (False, None)),
+  ],
+)
+def test_long_exit_main_ladder(close, profit, rsi_14, expected):
+  last_candle = {"RSI_14": rsi_14, "close": close, "EMA_200": 1.0}
+
+  assert (
+    NostalgiaForInfinityX7.long_exit_main(None, "long_normal", profit, 0.0, 0.0, last_candle, None, None, None, None)
+    == expected
+  )
+
+
+@pytest.mark.parametrize("ladder", [LONG_EXIT_MAIN_LADDER, SHORT_EXIT_MAIN_LADDER])
+def test_exit_ladder_batch_matches_single_trade(ladder):
+  rng = np.random.default_rng(3)
+  regimes = rng.integers(-1, len(ladder.regimes), 2000)
+  profits = np.concatenate([rng.uniform(-0.05, 0.3, 1990), np.array(ladder.edges[:9]), [np.nan]])
+  values = rng.uniform(0.0, 100.0, 2000)
+
+  buckets = ladder.exit_buckets(regimes, profits, values)
+
+  for regime, profit, value, bucket in zip(regimes, profits, values, buckets, strict=True):
+    expected = ladder.exit_bucket(ladder.regimes[regime], profit, value) if regime >= 0 else None
+    assert bucket == (-1 if expected is None else expected)
+
+
+@pytest.mark.parametrize("is_short", [False, True])
+def test_exit_main_on_the_backtest_candles_matches_the_analyzed_candles(mock_config, is_short):
+  df = synthetic_ohlcv(300)
+  df["RSI_14"] = np.linspace(0.0, 100.0, len(df), dtype=np.float32)
+  df["EMA_200"] = df["close"].rolling(20).mean()
+  df["enter_tag"] = ""
+  strategy = NostalgiaForInfinityX7(mock_config)
+  strategy.populate_exit_trend(df, {"pair": "ETH/USDT"})
+  features = strategy.exit_features["ETH/USDT"]
+  exit_main = strategy.short_exit_main if is_short else strategy.long_exit_main
+  profits = np.r_[np.array(EXIT_MAIN_PROFIT_EDGES), np.linspace(-0.01, 0.3, 40), np.nan]
+
+  exits = 0
+  for row in range(2, len(df)):
+    last_candle = features.candles(df["date"].iloc[row].to_pydatetime() + pd.Timedelta(minutes=5))[0]
+    for profit in profits:
+      expected = exit_main("normal", profit, 0.0, 0.0, df.iloc[row], None, None, None, None)
+      assert exit_main("normal", profit, 0.0, 0.0, last_candle, None, None, None, None) == expected
+      exits += expected[0]
+  assert exits > 0
+
+
+def test_analyzed_candles_are_shared_until_the_next_analysis(mock_config):
+  df = synthetic_ohlcv(50)
+  df["RSI_14"] = np.linspace(0.0, 100.0, len(df), dtype=np.float32)
+  df["enter_tag"] = pd.array([""] * len(df), dtype="string")
+  analyzed_time = pd.Timestamp("2026-01-02", tz="UTC")
+  strategy = NostalgiaForInfinityX7(mock_config)
+  strategy.dp = MagicMock()
+  strategy.dp.get_analyzed_dataframe.return_value = (df, analyzed_time)
+
+  last_candle, previous_candle = strategy.analyzed_candles("ETH/USDT")
+
+  assert strategy.analyzed_candles("ETH/USDT")[0] is last_candle
+  for candle, expected in ((last_candle, df.iloc[-1]), (previous_candle, df.iloc[-2])):
+    for column in df.columns:
+      assert type(candle[column]) is type(expected[column])
+      assert candle[column] == expected[column]
+  with pytest.raises(KeyError):
+    last_candle["missing"]
+
+  strategy.dp.get_analyzed_dataframe.return_value = (df.iloc[:1], analyzed_time + pd.Timedelta(minutes=5))
+  (only_candle,) = strategy.analyzed_candles("ETH/USDT")
+  assert only_candle["close"] == df["close"].iloc[0]
+
+
+def test_candle_columns_shifted_by_periods_hold_the_previous_candle():
+  df = synthetic_ohlcv(5)
+  df["RSI_14"] = np.linspace(0.0, 100.0, len(df), dtype=np.float32)
+
+  previous_candle = CandleColumns(df, periods=1)
+
+  assert np.isnan(previous_candle["close"][0])
+  assert (previous_candle["close"][1:] == df["close"].to_numpy()[:-1]).all()
+  assert previous_candle["RSI_14"].dtype == np.float32
+  assert previous_candle["RSI_14"][4] == df["RSI_14"].iloc[3]
+
+
+def test_grind_entry_rules_check_the_trade_part_of_the_candle_rules():
+  rules = GrindEntryRules(
+    "rules",
+    (
+      ("a", "slice_profit", operator.lt, -0.10),
+      ("b", "slice_profit_entry", operator.lt, -0.02),
+      ("c", "is_derisk", operator.eq, True),
+      ("d", None, None, None),
+    ),
+  )
+  bits = rules.bits(
+    [np.array([True, True, False]), np.array([True, False, False]), True, np.array([False, True, False])]
+  )
+
+  assert list(bits) == [0b0111, 0b1101, 0b0100]
+  assert rules.first_rule({"rules": bits[0]}, -0.2, 0.0) == "a"
+  assert rules.first_rule({"rules": bits[0]}, 0.0, -0.05) == "b"
+  assert rules.first_rule({"rules": bits[0]}, float("nan"), 0.0) is None
+  assert rules.first_rule({"rules": bits[0]}, 0.0, 0.0, is_derisk=True) == "c"
+  assert rules.first_rule({"rules": bits[1]}, 0.0, 0.0) == "d"
+  assert rules.first_rule({"rules": bits[2]}, -0.2, -0.2) is None
+  with pytest.raises(ValueError, match="3 rules computed, 4 expected"):
+    rules.bits([True, True, True])
+
+
+def test_grind_entries_combine_the_precomputed_rules_with_the_trade(mock_config):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  tags = [rule[0] for rule in LONG_GRIND_ENTRY_V3_RULES.rules]
+  g15, g27 = tags.index("g15"), tags.index("g27")
+  last_candle = {
+    "protections_long_global": True,
+    "enter_long": False,
+    "long_grind_entry_v3_rules": (1 << g15) | (1 << g27),
+  }
+
+  assert strategy.long_grind_entry_v3(last_candle, last_candle, 0, -0.2, 0.0, 0.0, False)
+  assert strategy._grind_entry_tag == "g15"
+  assert strategy.long_grind_entry_v3(last_candle, last_candle, 0, -0.1, 0.0, 0.0, False)
+  assert strategy._grind_entry_tag == "g27"
+  last_candle["long_grind_entry_v3_rules"] = 1 << g15
+  assert not strategy.long_grind_entry_v3(last_candle, last_candle, 0, -0.1, 0.0, 0.0, False)
+  assert strategy._grind_entry_tag == ""
+  last_candle["protections_long_global"] = False
+  assert not strategy.long_grind_entry_v3(last_candle, last_candle, 0, -0.2, 0.0, 0.0, False)
+
+  last_candle = {
+    "protections_long_global": True,
+    "protections_long_rebuy": True,
+    "global_protections_long_pump": True,
+    "global_protections_long_dump": True,
+    "enter_long": False,
+    # Only the de-risk rule
+    "long_grind_entry_rules": 1 << (len(LONG_GRIND_ENTRY_RULES.rules) - 1),
+  }
+  assert strategy.long_grind_entry(last_candle, last_candle, 0.0, True)
+  assert not strategy.long_grind_entry(last_candle, last_candle, 0.0, False)
+
+
+class FilledOrder:
+  def __init__(self, order_id, side, filled, price, tag=None):
+    self.id = order_id
+    self.ft_order_side = side
+    self.ft_order_tag = tag
+    self.status = "closed"
+    self.filled = filled
+    self.safe_filled = filled
+    self.safe_price = price
+
+
+def profit_trade(is_short):
+  trade = MagicMock()
+  trade.id = 7
+  trade.is_short = is_short
+  trade.entry_side = "sell" if is_short else "buy"
+  trade.exit_side = "buy" if is_short else "sell"
+  trade.fee_open = 0.001
+  trade.fee_close = 0.001
+  trade.funding_fees = 0.0
+  trade.orders = []
+  trade.select_filled_orders.side_effect = lambda side=None: [
+    order for order in trade.orders if side is None or order.ft_order_side == side
+  ]
+  return trade
+
+
+@pytest.mark.parametrize("is_short", [False, True])
+def test_profit_aggregate_matches_the_full_recompute(mock_config, is_short):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  trade = profit_trade(is_short)
+  rng = np.random.default_rng(11)
+
+  for order_id in range(30):
+    side = trade.entry_side if order_id == 0 or rng.random() < 0.6 else trade.exit_side
+    trade.orders.append(FilledOrder(order_id, side, rng.uniform(0.1, 2.0), rng.uniform(90.0, 110.0)))
+    strategy.refresh_profit_aggregate(trade)
+    _, filled_entries, filled_exits = strategy.filled_order_snapshot(trade)
+    for rate in rng.uniform(80.0, 120.0, 3):
+      profit_values = strategy.calc_total_profit(trade, filled_entries, filled_exits, rate)
+
+      expected = ProfitAggregate(
+        strategy.profit_aggregates[7].state, is_short, filled_entries, filled_exits, 0.001, 0.001
+      ).total_profit(rate, None)
+      assert profit_values == expected
+      sign = -1.0 if is_short else 1.0
+      entry_stakes = [order.safe_filled * order.safe_price for order in filled_entries]
+      exit_stakes = [order.safe_filled * order.safe_price for order in filled_exits]
+      amount = sum(order.safe_filled for order in filled_entries) - sum(order.safe_filled for order in filled_exits)
+      total_profit = sign * (
+        sum(exit_stakes) * (1 - sign * 0.001)
+        + amount * rate * (1 - sign * 0.001)
+        - sum(entry_stakes) * (1 + sign * 0.001)
+      )
+      assert profit_values[0] == pytest.approx(total_profit)
+      assert profit_values[1] == pytest.approx(total_profit / (sum(entry_stakes) * (1 + sign * 0.001)))
+
+  # The orders are only summed again when they change
+  profit_aggregate = strategy.profit_aggregates[7]
+  strategy.calc_total_profit(trade, filled_entries, filled_exits, 100.0)
+  assert strategy.profit_aggregates[7] is profit_aggregate
+  trade.fee_close = 0.002
+  strategy.calc_total_profit(trade, filled_entries, filled_exits, 100.0)
+  assert strategy.profit_aggregates[7] is not profit_aggregate
+
+
+def test_profit_aggregate_round_trips_through_custom_data(mock_config):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  trade = profit_trade(False)
+  trade.orders = [FilledOrder(1, "buy", 1.0, 100.0), FilledOrder(2, "sell", 0.5, 110.0)]
+  _, filled_entries, filled_exits = strategy.filled_order_snapshot(trade)
+  profit_aggregate = strategy.profit_aggregate(trade, filled_entries, filled_exits, 0.001, 0.001)
+
+  restored = ProfitAggregate.from_custom_data(json.loads(json.dumps(profit_aggregate.to_custom_data())))
+
+  assert restored.state == profit_aggregate.state
+  assert restored.total_profit(105.0, None) == profit_aggregate.total_profit(105.0, None)
+  assert ProfitAggregate.from_custom_data(None) is None
+
+
+def test_profit_aggregate_is_summed_again_on_each_fill(mock_config):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  trade = profit_trade(False)
+  trade.orders = [
+    FilledOrder(1, "buy", 1.0, 100.0),
+    FilledOrder(2, "buy", 1.0, 90.0),
+    FilledOrder(3, "sell", 0.5, 95.0),
+  ]
+  strategy.refresh_profit_aggregate(trade)
+  trade.select_filled_orders.reset_mock()
+
+  # The orders are only selected again when the order state changed
+  profit_values = strategy.calc_total_profit(trade, None, None, 100.0)
+  trade.select_filled_orders.assert_not_called()
+
+  # A fill the order state doesn't show
+  trade.orders[1].safe_filled = 2.0
+  strategy.order_filled("ETH/USDT", trade, trade.orders[1], datetime(2026, 1, 1, tzinfo=timezone.utc))
+  _, filled_entries, filled_exits = strategy.filled_order_snapshot(trade)
+  expected = ProfitAggregate(None, False, filled_entries, filled_exits, 0.001, 0.001).total_profit(100.0, None)
+
+  assert strategy.calc_total_profit(trade, None, None, 100.0) == expected
+  assert expected != profit_values
+
+
+GRIND_LADDER_TAGS = [
+  "grind_1_entry",
+  "grind_2_entry",
+  "grind_5_entry",
+  "buyback_1_entry",
+  "rebuy_entry",
+  "grind_1_exit 3 4",
+  "grind_2_derisk 5",
+  "buyback_1_exit",
+  "rebuy_derisk",
+  "derisk_global",
+  "derisk_level_1",
+  "derisk_level_3",
+  "grind_10_exit",
+  None,
+]
+
+
+def walk_grind_ladder(filled_orders, entry_side, name):
+  orders = []
+  exit_order = None
+  for order in reversed(filled_orders):
+    order_tag = order.ft_order_tag or ""
+    if order.ft_order_side == entry_side:
+      if exit_order is None and order is not filled_orders[0] and order_tag == f"{name}_entry":
+        orders.append(order)
+    elif exit_order is None and order_tag.partition(" ")[0] in [f"{name}_exit", f"{name}_derisk", "derisk_global"]:
+      exit_order = order
+  return orders, exit_order
+
+
+@pytest.mark.parametrize("is_short", [False, True])
+def test_grind_ladders_match_the_orders_walk(mock_config, is_short):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  trade = profit_trade(is_short)
+  trade.is_open = True
+  rng = np.random.default_rng(12)
+
+  for order_id in range(80):
+    tag = GRIND_LADDER_TAGS[rng.integers(len(GRIND_LADDER_TAGS))]
+    side = trade.exit_side if order_id > 0 and tag is not None and "entry" not in tag else trade.entry_side
+    order = FilledOrder(order_id, side, rng.uniform(0.1, 2.0), rng.uniform(90.0, 110.0), tag)
+    trade.orders.append(order)
+    strategy.order_filled("ETH/USDT", trade, order, datetime.now(timezone.utc))
+    filled_orders = trade.select_filled_orders()
+    previous = strategy.grind_ladders.get(7)
+    grind_ladders = strategy.trade_grind_ladders(trade, filled_orders)
+    assert order_id == 0 or grind_ladders is previous
+
+    for name in GrindLadders.names:
+      orders, buy_orders, total_amount, total_cost, exit_order = grind_ladders.ladder(name)
+      expected_orders, expected_exit_order = walk_grind_ladder(filled_orders, trade.entry_side, name)
+      assert orders == expected_orders
+      assert buy_orders == [order.id for order in expected_orders]
+      assert exit_order is expected_exit_order
+      assert total_amount == sum(order.safe_filled for order in expected_orders)
+      assert total_cost == sum(order.safe_filled * order.safe_price for order in expected_orders)
+    derisk_3_orders = [order for order in filled_orders if order.ft_order_tag == "derisk_level_3"]
+    assert grind_ladders.derisk_orders[2] is (derisk_3_orders[-1] if derisk_3_orders else None)
+
+  # Only rebuilt when an order was filled without order_filled
+  trade.orders.append(FilledOrder(80, trade.entry_side, 1.0, 100.0, "grind_3_entry"))
+  rebuilt = strategy.trade_grind_ladders(trade, trade.select_filled_orders())
+  assert rebuilt is not grind_ladders
+  assert rebuilt.ladder("grind_3")[0] == [trade.orders[-1]]
+
+
+def custom_data_trade(trade, stored):
+  trade.get_all_custom_data.side_effect = lambda: [
+    SimpleNamespace(cd_key=key, value=value) for key, value in stored.items()
+  ]
+  trade.set_custom_data.side_effect = lambda key, value: stored.__setitem__(key, value)
+  return trade
+
+
+@pytest.mark.parametrize("is_short", [False, True])
+def test_grind_ladders_keep_the_cluster_max_profit_in_the_custom_data(mock_config, is_short):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  stored = {"grind_1_cluster_max_profit_stake": 2.0}
+  trade = custom_data_trade(profit_trade(is_short), stored)
+  trade.is_open = True
+  trade.orders = [FilledOrder(1, trade.entry_side, 1.0, 100.0)]
+  grind_ladders = strategy.trade_grind_ladders(trade, trade.select_filled_orders())
+  custom_data = strategy.trade_custom_data(trade)
+  higher_rate, lower_rate = (-0.02, 0.01) if is_short else (0.03, -0.01)
+
+  assert grind_ladders.update_cluster_max_profit(custom_data, "grind_1", 1.0, higher_rate) == (2.0, 0.0)
+  assert grind_ladders.update_cluster_max_profit(custom_data, "grind_1", 3.0, lower_rate) == (2.0, higher_rate)
+  assert grind_ladders.cluster_max_profit(custom_data, "grind_1") == (3.0, higher_rate)
+  strategy.flush_trade_custom_data(trade)
+  assert stored["grind_1_cluster_max_profit_stake"] == 3.0
+  assert stored["grind_1_cluster_max_profit_rate"] == higher_rate
+
+  # order_filled resets the cluster of a grind exit
+  exit_order = FilledOrder(2, trade.exit_side, 0.5, 100.0, "grind_1_exit")
+  trade.orders.append(exit_order)
+  strategy.order_filled("ETH/USDT", trade, exit_order, datetime.now(timezone.utc))
+  assert grind_ladders.cluster_max_profit(custom_data, "grind_1") == (0.0, 0.0)
+  assert stored["grind_1_cluster_max_profit_stake"] == 0.0
+
+
+def test_trade_custom_data_is_read_once_and_written_on_flush(mock_config):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  stored = {"system_version": "v3_2", "derisk_level_1": True}
+  trade = custom_data_trade(profit_trade(False), stored)
+  trade.is_open = True
+  custom_data = strategy.trade_custom_data(trade)
+
+  assert custom_data.get(key="system_version") == "v3_2"
+  assert custom_data.get(key="missing", default=1.0) == 1.0
+  assert strategy.trade_custom_data(trade) is custom_data
+  assert trade.get_all_custom_data.call_count == 1
+
+  custom_data.set(key="derisk_level_1", value=True)
+  custom_data.set(key="grind_1_cluster_max_profit_stake", value=1.0)
+  custom_data.set(key="grind_1_cluster_max_profit_stake", value=2.0)
+  custom_data.set(key="profit_aggregate", value={"state": (1, 2)})
+  assert custom_data.get(key="grind_1_cluster_max_profit_stake") == 2.0
+  assert custom_data.get(key="profit_aggregate") == {"state": [1, 2]}
+  assert trade.set_custom_data.call_count == 0
+  custom_data.flush()
+  assert trade.set_custom_data.call_count == 2
+  assert stored["grind_1_cluster_max_profit_stake"] == 2.0
+
+  # Read again for another trade object, and dropped once the trade is closed
+  other_trade = custom_data_trade(profit_trade(False), stored)
+  other_trade.is_open = False
+  assert strategy.trade_custom_data(other_trade).get(key="grind_1_cluster_max_profit_stake") == 2.0
+  strategy.flush_trade_custom_data(other_trade)
+  assert 7 not in strategy.trades_custom_data
+
+
+def test_adjust_trade_position_flushes_the_custom_data(mock_config, mocker):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  stored = {}
+  trade = custom_data_trade(profit_trade(False), stored)
+  trade.is_open = True
+
+  def trade_position_adjustment(trade, *args):
+    strategy.trade_custom_data(trade).set(key="gd5_liquidation_rescue_used", value=True)
+    raise ValueError
+
+  mocker.patch.object(strategy, "trade_position_adjustment", side_effect=trade_position_adjustment)
+  with pytest.raises(ValueError):
+    strategy.adjust_trade_position(trade, datetime.now(timezone.utc), 1.0, 0.0, 5.0, 100.0, 1.0, 1.0, 0.0, 0.0)
+
+  assert stored == {"gd5_liquidation_rescue_used": True}
+
+
+def test_profit_snapshots_are_shared_by_the_trades_of_a_candle(mock_config, mocker):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  trades = [profit_trade(False), profit_trade(True)]
+  trades[1].id = 8
+  for trade in trades:
+    trade.orders = [FilledOrder(1, trade.entry_side, 1.0, 100.0)]
+  calc_total_profit = mocker.spy(strategy, "calc_total_profit")
+  candle_time = datetime(2026, 1, 1, 0, 5, tzinfo=timezone.utc)
+
+  first = [strategy.profit_or_order_snapshot(trade, candle_time, 101.0) for trade in trades]
+  assert all(snapshot[3] is None for snapshot in first)
+  for trade, (filled_orders, filled_entries, filled_exits, _) in zip(trades, first, strict=True):
+    profit_values = strategy.calc_total_profit(trade, filled_entries, filled_exits, 101.0)
+    strategy.cache_profit_snapshot(
+      trade, candle_time, 101.0, filled_orders, filled_entries, filled_exits, profit_values
+    )
+
+  later_time = datetime(2026, 1, 1, 0, 9, tzinfo=timezone.utc)
+  for trade in trades:
+    profit_values = strategy.profit_or_order_snapshot(trade, later_time, 101.0)[3]
+    assert profit_values == strategy.calc_total_profit(trade, *strategy.filled_order_snapshot(trade)[1:], 101.0)
+  assert calc_total_profit.call_count == 4
+  assert strategy.profit_snapshots.hits == 2
+
+  # A new order, another rate or a new candle miss the snapshot
+  trades[0].orders.append(FilledOrder(2, "buy", 1.0, 95.0))
+  assert strategy.profit_snapshot(trades[0], later_time, 101.0) is None
+  assert strategy.profit_snapshot(trades[1], later_time, 102.0) is None
+  assert strategy.profit_snapshot(trades[1], datetime(2026, 1, 1, 0, 10, tzinfo=timezone.utc), 101.0) is None
+  assert strategy.profit_snapshots.entries == {}
+
+
+def test_profit_snapshots_are_bounded():
+  profit_snapshots = ProfitSnapshots(5, max_entries=3)
+  profit_snapshots.start_candle(datetime(2026, 1, 1, tzinfo=timezone.utc))
+  for key in range(5):
+    profit_snapshots.set(key, (key,))
+
+  assert list(profit_snapshots.entries) == [2, 3, 4]
+  assert profit_snapshots.get(0) is None
+  assert profit_snapshots.get(4) == (4,)
+  assert (profit_snapshots.hits, profit_snapshots.misses) == (1, 1)
+  assert profit_snapshots.report() == "3 snapshots, 1/2 hits (50.0%)"
+
+
+def open_trade(trade_id, pair, enter_tag, side="long"):
+  trade = MagicMock()
+  trade.id = trade_id
+  trade.pair = pair
+  trade.enter_tag = enter_tag
+  trade.trade_direction = side
+  trade.is_open = True
+  return trade
+
+
+def test_open_trade_index_counts_by_side_mode_and_pair(mock_config, mocker):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  trades = [
+    open_trade(1, "ETH/USDT", "120"),
+    open_trade(2, "SOL/USDT", "161 162"),
+    open_trade(3, "XRP/USDT", "61 120", side="short"),
+    open_trade(4, "ADA/USDT", None),
+  ]
+  get_trades_proxy = mocker.patch("NostalgiaForInfinityX7.Trade.get_trades_proxy", return_value=trades)
+
+  open_trades = strategy.open_trades()
+  assert open_trades.count() == 4
+  assert (open_trades.side_count("long"), open_trades.side_count("short")) == (3, 1)
+  assert (open_trades.mode_count("grind"), open_trades.mode_count("scalp"), open_trades.mode_count("rebuy")) == (
+    1,
+    1,
+    0,
+  )
+  assert open_trades.pair_count("ETH/USDT") == 1
+  assert not strategy._handle_grind_mode("BTC/USDT", datetime(2026, 1, 1, tzinfo=timezone.utc))
+
+  # Rebuilt once per bot loop only
+  strategy.open_trades()
+  strategy.bot_loop_start(datetime(2026, 1, 1, tzinfo=timezone.utc))
+  strategy.open_trades()
+  assert get_trades_proxy.call_count == 2
+
+
+def test_open_trade_index_follows_entries_and_exits():
+  open_trade_index = OpenTradeIndex()
+  trade = open_trade(1, "ETH/USDT", "120")
+
+  open_trade_index.pending("ETH/USDT", "long", ("grind",))
+  assert (open_trade_index.count(), open_trade_index.mode_count("grind")) == (1, 1)
+  assert open_trade_index.pair_count("ETH/USDT") == 1
+  open_trade_index.add(1, trade, "ETH/USDT", "long", ("grind",))
+  assert (open_trade_index.count(), open_trade_index.mode_count("grind")) == (1, 1)
+  assert (open_trade_index.pair_count("ETH/USDT"), open_trade_index.pair_count("BTC/USDT")) == (1, 0)
+
+  # A partial exit keeps the trade, a closed trade is dropped
+  open_trade_index.closing(1, trade)
+  assert open_trade_index.count() == 1
+  assert open_trade_index.pair_count("ETH/USDT") == 1
+  trade.is_open = False
+  assert open_trade_index.count() == 0
+  assert open_trade_index.side_count("long") == 0
+  assert open_trade_index.pair_count("ETH/USDT") == 0
+
+
+@pytest.mark.parametrize("enter_tag", ["", "empty", "1", "61", "61 120", "61 120 2", "120", "161 62", "501 999"])
+def test_enter_tag_modes_match_the_mode_tag_lists(mock_config, enter_tag):
+  strategy = NostalgiaForInfinityX7(mock_config)
+  enter_tag_modes = strategy.enter_tag_modes
+  enter_tags = enter_tag.split()
+  tag_modes = enter_tag_modes.modes(enter_tag)
+
+  for name in enter_tag_modes.groups:
+    mode_tags = getattr(strategy, f"{name}_mode_tags")
+    assert bool(tag_modes & enter_tag_modes.any_bits[name]) == any(c in mode_tags for c in enter_tags)
+    assert bool(tag_modes & enter_tag_modes.all_bits[name]) == all(c in mode_tags for c in enter_tags)
+  for name, main_group in enter_tag_modes.mixed.items():
+    main_tags = getattr(strategy, f"{main_group}_mode_tags")
+    mode_tags = getattr(strategy, f"{name}_mode_tags")
+    assert bool(tag_modes & enter_tag_modes.mixed_bits[name]) == (
+      all(c in main_tags for c in enter_tags)
+      or (any(c in main_tags for c in enter_tags) and all(c in mode_tags for c in enter_tags))
+    )
+
+
+def test_enter_tag_modes_keep_the_last_enter_tags():
+  enter_tag_modes = EnterTagModes({"rebuy": ["61", "62"], "rebuy_grind": ["61", "62", "120"]}, {}, max_entries=2)
+
+  for enter_tag in ["61", "62", "61", "120"]:
+    enter_tag_modes.modes(enter_tag)
+
+  assert list(enter_tag_modes.entries) == ["61", "120"]
+  assert (enter_tag_modes.hits, enter_tag_modes.misses) == (1, 3)
+  any_bits = enter_tag_modes.any_bits
+  all_bits = enter_tag_modes.all_bits
+  assert enter_tag_modes.modes("61 120") == any_bits["rebuy"] | any_bits["rebuy_grind"] | all_bits["rebuy_grind"]
+
+
+def test_cache_writes_are_coalesced_and_atomic(tmp_path, mocker):
+  cache_file = tmp_path / "cache.json"
+  cache = Cache(cache_file, write_interval=60.0)
+  save = mocker.spy(cache, "_save")
+
+  cache.set("ETH/USDT", {"rate": 1.0})
+  cache.flush()
+  cache.set("SOL/USDT", {"rate": 2.0})
+  cache.remove("ETH/USDT")
+  cache.flush()
+  assert save.call_count == 1
+  assert json.loads(cache_file.read_text()) == {"ETH/USDT": {"rate": 1.0}}
+
+  cache.save()
+  assert save.call_count == 2
+  assert json.loads(cache_file.read_text()) == {"SOL/USDT": {"rate": 2.0}}
+  assert [path.name for path in tmp_path.iterdir()] == ["cache.json"]
+  cache.save()
+  assert save.call_count == 2
+
+
+def test_cache_journal_keeps_the_changes_of_a_crash(tmp_path):
+  cache_file = tmp_path / "cache.json"
+  cache = Cache(cache_file, write_interval=60.0, journal=True)
+  cache.set("ETH/USDT", {"rate": 1.0})
+  cache.flush()
+  cache.set("SOL/USDT", {"rate": 2.0})
+  cache.remove("ETH/USDT")
+  # A change cut short by the crash
+  with cache.journal_path.open("a") as wfh:
+    wfh.write('{"key": "XRP/USDT", "val')
+
+  restored = Cache(cache_file)
+  assert restored.data == {"SOL/USDT": {"rate": 2.0}}
+  restored.save()
+  assert not restored.journal_path.exists()
+  assert json.loads(cache_file.read_text()) == {"SOL/USDT": {"rate": 2.0}}
+
+
+def test_hold_trades_watcher_swaps_in_valid_files_only(tmp_path, caplog):
+  holds_file = tmp_path / "nfi-hold-trades.json"
+  holds_file.write_text('{"trade_ids": {"1": 0.01, "x": 0.02}, "trade_pairs": {"ETH/USDT": 0.03, "SOL": 0.04}}')
+  watcher = HoldTradesWatcher(lambda: holds_file if holds_file.is_file() else None)
+
+  watcher.reload()
+  hold_trades = watcher.hold_trades
+  assert dict(hold_trades.trade_ids) == {1: 0.01}
+  assert dict(hold_trades.trade_pairs) == {"ETH/USDT": 0.03}
+  watcher.reload()
+  assert watcher.hold_trades is hold_trades
+
+  holds_file.write_text('{"trade_ids": {"1": 0.0')
+  os.utime(holds_file, ns=(0, holds_file.stat().st_mtime_ns + 1_000_000))
+  with caplog.at_level(logging.ERROR):
+    watcher.reload()
+    watcher.reload()
+  assert watcher.hold_trades is hold_trades
+  # Reported once until the file changes again
+  assert caplog.text.count("Failed to load JSON") == 1
+
+  holds_file.write_text('{"trade_pairs": {"XRP/USDT": 0.05}}')
+  os.utime(holds_file, ns=(0, holds_file.stat().st_mtime_ns + 2_000_000))
+  watcher.reload()
+  assert dict(watcher.hold_trades.trade_pairs) == {"XRP/USDT": 0.05}
+  assert watcher.hold_trades.version == hold_trades.version + 1
+
+
+def test_hold_trades_watcher_reports_an_invalid_first_file_once(tmp_path, caplog):
+  holds_file = tmp_path / "nfi-hold-trades.json"
+  holds_file.write_text('{"trade_ids": [1')
+  watcher = HoldTradesWatcher(lambda: holds_file)
+
+  with caplog.at_level(logging.ERROR):
+    for _ in range(3):
+      watcher.reload()
+  assert caplog.text.count("Failed to load JSON") == 1
+  assert not watcher.hold_trades.trade_ids
+
+  holds_file.write_text('{"trade_ids": [1]}')
+  os.utime(holds_file, ns=(0, holds_file.stat().st_mtime_ns + 1_000_000))
+  watcher.reload()
+  assert dict(watcher.hold_trades.trade_ids) == {1: 0.005}
+
+
+def test_should_hold_trade_reads_the_published_holds(mock_config, mocker):
+  mock_config["runmode"].value = "dry_run"
+  strategy = NostalgiaForInfinityX7(mock_config)
+  strategy.hold_trades_watcher = watcher = HoldTradesWatcher(lambda: None)
+  watcher.hold_trades = HoldTrades({"trade_ids": {7: 0.05}, "trade_pairs": {"SOL/USDT": 0.01}}, 1)
+  mocker.patch("NostalgiaForInfinityX7.Trade.get_trades_proxy", return_value=[])
+  mocker.patch.object(strategy, "calc_total_profit", return_value=(0.0, 0.0, 0.0, 0.02))
+  trade = profit_trade(False)
+
+  trade.pair = "ETH/USDT"
+  assert strategy._should_hold_trade(trade, 100.0, "exit_signal")
+  assert not strategy._should_hold_trade(trade, 100.0, "force_sell")
+  trade.pair = "SOL/USDT"
+  assert not strategy._should_hold_trade(trade, 100.0, "exit_signal")
+  trade.id = 8
+  assert not strategy._should_hold_trade(trade, 100.0, "exit_signal")
+  trade.pair = "XRP/USDT"
+  assert not strategy._should_hold_trade(trade, 100.0, "exit_signal")
+
+
+class TickersExchange:
+  def __init__(self, tickers):
+    self.tickers = tickers
+    self.calls = 0
+
+  def exchange_has(self, endpoint):
+    return endpoint == "fetchTickers"
+
+  def get_tickers(self, symbols=None):
+    self.calls += 1
+    return {pair: ticker for pair, ticker in self.tickers.items() if symbols is None or pair in symbols}
+
+
+class OrderBookDataProvider:
+  def __init__(self, tickers=None):
+    self._exchange = TickersExchange(tickers or {})
+    self.orderbook_calls = []
+
+  def orderbook(self, pair, maximum):
+    self.orderbook_calls.append(pair)
+    return {"bids": [[99.0, 1.0]], "asks": [[101.0, 1.0]]}
+
+
+def test_order_timeout_checks_share_the_top_of_book(mock_config):
+  mock_config["runmode"].value = "dry_run"
+  strategy = NostalgiaForInfinityX7(mock_config)
+  strategy.dp = dp = OrderBookDataProvider()
+  trade = MagicMock(is_short=False)
+  order = MagicMock(price=100.0, ft_order_tag=None)
+  now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+  assert not strategy.check_entry_timeout("ETH/USDT", trade, order, now)
+  assert not strategy.check_exit_timeout("ETH/USDT", trade, order, now)
+  order.price = 95.0
+  assert strategy.check_entry_timeout("ETH/USDT", trade, order, now)
+
+  assert dp.orderbook_calls == ["ETH/USDT"]
+  assert (strategy.top_of_book_cache.exchange_calls, strategy.top_of_book_cache.calls_saved) == (1, 2)
+
+
+def test_top_of_book_prefetch_uses_the_fresh_tickers_only(mocker):
+  now_ms = time.time() * 1000.0
+  dp = OrderBookDataProvider(
+    {
+      "ETH/USDT": {"bid": 10.0, "ask": 10.1, "timestamp": now_ms - 5_000.0},
+      "SOL/USDT": {"bid": 20.0, "ask": 20.1, "timestamp": now_ms - 60_000.0},
+      "XRP/USDT": {"bid": None, "ask": None, "timestamp": now_ms},
+    }
+  )
+  top_of_book_cache = TopOfBookCache(ttl=10.0)
+
+  top_of_book_cache.prefetch(dp, ["ETH/USDT", "SOL/USDT", "XRP/USDT"])
+  top_of_book_cache.prefetch(dp, ["ETH/USDT"])
+  assert dp._exchange.calls == 1
+  assert top_of_book_cache.get(dp, "ETH/USDT") == (10.0, 10.1)
+  assert top_of_book_cache.get(dp, "SOL/USDT") == (99.0, 101.0)
+  assert dp.orderbook_calls == ["SOL/USDT"]
+
+  # The ticker was 5 seconds old when fetched
+  mocker.patch("NostalgiaForInfinityX7.time.time", return_value=now_ms / 1000.0 + 6.0)
+  top_of_book_cache.get(dp, "ETH/USDT")
+  assert dp.orderbook_calls == ["SOL/USDT", "ETH/USDT"]
+  assert top_of_book_cache.report() == "2 pairs, 3 exchange calls, 1 calls saved"
+
+
+@pytest.mark.parametrize("exchange", [None, SimpleNamespace(), SimpleNamespace(get_tickers=None)])
+def test_top_of_book_prefetch_warns_once_without_a_tickers_exchange(exchange, caplog):
+  dp = OrderBookDataProvider()
+  dp._exchange = exchange
+  top_of_book_cache = TopOfBookCache(ttl=10.0)
+
+  with caplog.at_level(logging.WARNING):
+    top_of_book_cache.prefetch(dp, ["ETH/USDT"])
+    top_of_book_cache.prefetch(dp, ["SOL/USDT"])
+
+  assert caplog.text.count("Top of book prefetch unavailable") == 1
+  assert top_of_book_cache.get(dp, "ETH/USDT") == (99.0, 101.0)
+  assert top_of_book_cache.exchange_calls == 1
+
+
+def test_notification_queue_merges_the_messages_of_a_pair_within_the_interval():
+  sent = []
+  notification_queue = NotificationQueue(lambda msg_type, tag, *args: f"{msg_type} {tag}", sent.append, 3, 2.0)
+
+  for event in [
+    ("grinding-entry", "gd1", "ETH/USDT"),
+    ("grinding-exit", "gd1", "ETH/USDT"),
+    ("rebuy", "r", "SOL/USDT"),
+  ]:
+    notification_queue.put(event)
+  notification_queue.put(("grinding-entry", "gd2", "ETH/USDT"))
+  notification_queue.collect()
+  notification_queue.dispatch(100.0)
+  assert sent == ["grinding-entry gd1\n\ngrinding-exit gd1", "rebuy r"]
+  assert notification_queue.dropped == 1
+
+  notification_queue.put(("grinding-entry", "gd2", "ETH/USDT"))
+  notification_queue.collect()
+  notification_queue.dispatch(101.0)
+  assert len(sent) == 2
+  notification_queue.dispatch(102.0)
+  assert sent[2:] == ["grinding-entry gd2"]
+
+
+@pytest.mark.parametrize("runmode", ["live", "dry_run"])
+def test_notify_queues_the_notifications_in_live_and_dry_run(mock_config, mocker, runmode):
+  notification_msg = mocker.spy(NostalgiaForInfinityX7, "notification_msg")
+  strategy = NostalgiaForInfinityX7(mock_config)
+  strategy.notify("rebuy", "r", "ETH/USDT", 10.0, 100.0, 1.0, 0.01)
+  assert strategy.notification_queue is None
+  # Backtests don't even format the message
+  notification_msg.assert_not_called()
+
+  mock_config["runmode"].value = runmode
+  strategy = NostalgiaForInfinityX7(mock_config)
+  strategy.dp = MagicMock()
+  strategy.dp.runmode.value = runmode
+  strategy.notify("rebuy", "r", "ETH/USDT", 10.0, 100.0, 1.0, 0.01, stake_currency="USDT")
+  strategy.dp.send_msg.assert_not_called()
+
+  strategy.notification_queue.stop()
+  notification_msg.assert_called_once()
+  strategy.dp.send_msg.assert_called_once()
+  msg = strategy.dp.send_msg.call_args.args[0]
+  assert "**Rebuy:** `(r)`" in msg
+  assert "`100.00 USDT`" in msg
+
+
+def test_indicators_profiler_writes_the_stage_percentiles_across_the_pairs(tmp_path, mocker):
+  mocker.patch("NostalgiaForInfinityX7.time.perf_counter", side_effect=[0.0, 1.0, 1.0, 3.0, 3.0, 4.0, 4.0, 5.0, 5.0])
+  profiler = IndicatorsProfiler(tmp_path / "profile.json", window=2, write_interval=3600.0)
+
+  mark = profiler.start()
+  mark = profiler.record(mark, "ETH/USDT", "5m", "merge")
+  mark = profiler.record(mark, "ETH/USDT", "5m", "protections")
+  for pair in ["SOL/USDT", "XRP/USDT"]:
+    mark = profiler.record(mark, pair, "5m", "merge")
+  assert not profiler.path.exists()
+
+  profiler.save()
+  stages = json.loads(profiler.path.read_text())["stages"]
+  assert [(row["stage"], row["samples"], row["pairs"]) for row in stages] == [("merge", 2, 2), ("protections", 1, 1)]
+  assert stages[0]["seconds_p50"] == 1.0
+  assert stages[1]["seconds_max"] == 2.0
+  assert "allocated_bytes_p50" not in stages[0]
+
+
+def test_indicators_profiler_traces_the_memory_to_csv(tmp_path):
+  profiler = IndicatorsProfiler(tmp_path / "profile.csv", memory=True)
+  try:
+    mark = profiler.start()
+    data = np.ones(1_000_000)
+    profiler.record(mark, "ETH/USDT", "1h", "pair_informative")
+    profiler.save()
+  finally:
+    tracemalloc.stop()
+
+  header, row = profiler.path.read_text().splitlines()
+  values = dict(zip(header.split(","), row.split(","), strict=True))
+  assert values["stage"] == "pair_informative"
+  assert float(values["allocated_bytes_max"]) >= data.nbytes
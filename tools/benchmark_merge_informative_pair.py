@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Benchmark repeated informative-pair merges with synthetic data.
 
-This helper isolates DataFrame merge overhead. It does not import or execute
-strategy code, and it does not change trading behavior.
+This helper isolates DataFrame merge overhead. It does not execute strategy
+code, and it does not change trading behavior. With --compare it times the
+chained merges against the strategy's single-pass merge_informative_frames
+helper and checks that both produce the same DataFrame.
 """
 
 from __future__ import annotations
@@ -12,6 +14,7 @@ from dataclasses import asdict
 from dataclasses import dataclass
 import json
 import math
+from pathlib import Path
 from statistics import mean
 from statistics import median
 import sys
@@ -89,6 +92,20 @@ def import_runtime_dependencies() -> tuple[Any, Any]:
   return pd, merge_informative_pair
 
 
+def import_single_pass_merge() -> Any:
+  repo_root = str(Path(__file__).resolve().parents[1])
+  if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+  try:
+    from NostalgiaForInfinityX7 import merge_informative_frames
+  except ModuleNotFoundError as exc:
+    raise RuntimeError(
+      "The compare mode needs the strategy dependencies (TA-Lib, freqtrade) installed. Run it inside the "
+      "Freqtrade environment or container used for backtesting/dry-run work."
+    ) from exc
+  return merge_informative_frames
+
+
 def informative_rows(base_rows: int, base_timeframe: str, informative_timeframe: str) -> int:
   base_minutes = timeframe_to_minutes(base_timeframe)
   informative_minutes = timeframe_to_minutes(informative_timeframe)
@@ -177,6 +194,76 @@ def run_iteration(
   return results
 
 
+def prepare_compare_frame(informative: Any, spec: MergeSpec, drop_ohlcv: bool) -> Any:
+  # The strategy drops the unused OHLCV columns before merging, only the BTC frames drop the date column
+  if not drop_ohlcv:
+    return informative
+  dropped = set(drop_columns_for_spec(spec))
+  return informative[
+    [column for column in informative.columns if column == "date" or f"{column}_{spec.timeframe}" not in dropped]
+  ]
+
+
+def run_chained_merge(
+  base_frame: Any,
+  informatives: list[tuple[Any, str, bool]],
+  merge_informative_pair: Any,
+  base_timeframe: str,
+) -> Any:
+  dataframe = base_frame
+  for informative, timeframe, drop_date in informatives:
+    dataframe = merge_informative_pair(dataframe, informative, base_timeframe, timeframe, ffill=False)
+    if drop_date:
+      dataframe = dataframe.drop(columns=f"date_{timeframe}")
+  return dataframe.ffill()
+
+
+def run_compare_iteration(
+  base_frame: Any,
+  informatives: list[tuple[Any, str, bool]],
+  merge_informative_pair: Any,
+  merge_informative_frames: Any,
+  base_timeframe: str,
+) -> dict[str, Any]:
+  started_at = time.perf_counter()
+  chained = run_chained_merge(base_frame.copy(deep=True), informatives, merge_informative_pair, base_timeframe)
+  chained_seconds = time.perf_counter() - started_at
+
+  started_at = time.perf_counter()
+  single_pass = merge_informative_frames(base_frame.copy(deep=True), informatives, base_timeframe)
+  single_pass_seconds = time.perf_counter() - started_at
+
+  return {
+    "chained_seconds": chained_seconds,
+    "single_pass_seconds": single_pass_seconds,
+    "columns_after": len(single_pass.columns),
+    "memory_after_bytes": dataframe_memory_bytes(single_pass),
+    "frames_equal": bool(chained.equals(single_pass) and list(chained.columns) == list(single_pass.columns)),
+  }
+
+
+def summarize_seconds(seconds: list[float]) -> dict[str, float]:
+  return {
+    "mean_seconds": mean(seconds),
+    "median_seconds": median(seconds),
+    "min_seconds": min(seconds),
+    "max_seconds": max(seconds),
+  }
+
+
+def summarize_compare_runs(runs: list[dict[str, Any]]) -> dict[str, Any]:
+  chained = summarize_seconds([run["chained_seconds"] for run in runs])
+  single_pass = summarize_seconds([run["single_pass_seconds"] for run in runs])
+  return {
+    "chained": chained,
+    "single_pass": single_pass,
+    "speedup": chained["mean_seconds"] / single_pass["mean_seconds"] if single_pass["mean_seconds"] else None,
+    "columns_after": runs[-1]["columns_after"],
+    "memory_after_bytes": runs[-1]["memory_after_bytes"],
+    "frames_equal": all(run["frames_equal"] for run in runs),
+  }
+
+
 def summarize_step(name: str, measurements: list[dict[str, Any]]) -> dict[str, Any]:
   seconds = [item["seconds"] for item in measurements]
   last = measurements[-1]
@@ -196,12 +283,7 @@ def summarize_step(name: str, measurements: list[dict[str, Any]]) -> dict[str, A
 def summarize_runs(runs: list[list[dict[str, Any]]], specs: list[MergeSpec]) -> dict[str, Any]:
   totals = [sum(step["seconds"] for step in iteration) for iteration in runs]
   return {
-    "total": {
-      "mean_seconds": mean(totals),
-      "median_seconds": median(totals),
-      "min_seconds": min(totals),
-      "max_seconds": max(totals),
-    },
+    "total": summarize_seconds(totals),
     "steps": [summarize_step(spec.name, [iteration[index] for iteration in runs]) for index, spec in enumerate(specs)],
   }
 
@@ -215,6 +297,7 @@ def build_report(args: argparse.Namespace) -> dict[str, Any]:
     raise RuntimeError("Indicator column counts must not be negative.")
 
   pd, merge_informative_pair = import_runtime_dependencies()
+  merge_informative_frames = import_single_pass_merge() if args.compare else None
   specs = build_merge_specs(
     btc_timeframes=parse_timeframes(args.btc_timeframes),
     info_timeframes=parse_timeframes(args.informative_timeframes),
@@ -233,6 +316,35 @@ def build_report(args: argparse.Namespace) -> dict[str, Any]:
     )
     for spec in specs
   }
+  if args.compare:
+    informatives = [
+      (
+        prepare_compare_frame(informative_frames[spec.name], spec, not args.no_drop_ohlcv),
+        spec.timeframe,
+        spec.source == "btc",
+      )
+      for spec in specs
+    ]
+    compare_runs = [
+      run_compare_iteration(
+        base_frame=base_frame,
+        informatives=informatives,
+        merge_informative_pair=merge_informative_pair,
+        merge_informative_frames=merge_informative_frames,
+        base_timeframe=args.base_timeframe,
+      )
+      for _ in range(args.repeat)
+    ]
+    return {
+      "benchmark": "merge_informative_pair_compare",
+      "rows": args.rows,
+      "repeat": args.repeat,
+      "base_timeframe": args.base_timeframe,
+      "drop_ohlcv": not args.no_drop_ohlcv,
+      "specs": [asdict(spec) for spec in specs],
+      "summary": summarize_compare_runs(compare_runs),
+    }
+
   runs = [
     run_iteration(
       base_frame=base_frame,
@@ -261,7 +373,39 @@ def bytes_to_mib(value: int) -> float:
   return value / 1024 / 1024
 
 
+def format_compare_report(report: dict[str, Any]) -> str:
+  summary = report["summary"]
+  speedup = summary["speedup"]
+  lines = [
+    f"benchmark={report['benchmark']}",
+    f"rows={report['rows']}",
+    f"repeat={report['repeat']}",
+    f"base_timeframe={report['base_timeframe']}",
+    f"drop_ohlcv={report['drop_ohlcv']}",
+    f"frames_equal={summary['frames_equal']}",
+    f"speedup={speedup:.2f}x" if speedup is not None else "speedup=n/a",
+    f"columns_after={summary['columns_after']}",
+    f"memory_after_mib={bytes_to_mib(summary['memory_after_bytes']):.3f}",
+    "",
+    "path                         mean_s    median_s     min_s     max_s",
+  ]
+
+  for name in ("chained", "single_pass"):
+    stats = summary[name]
+    lines.append(
+      f"{name:<28} "
+      f"{stats['mean_seconds']:>8.6f}  "
+      f"{stats['median_seconds']:>8.6f}  "
+      f"{stats['min_seconds']:>8.6f}  "
+      f"{stats['max_seconds']:>8.6f}"
+    )
+
+  return "\n".join(lines)
+
+
 def format_text_report(report: dict[str, Any]) -> str:
+  if report["benchmark"] == "merge_informative_pair_compare":
+    return format_compare_report(report)
   total = report["summary"]["total"]
   lines = [
     f"benchmark={report['benchmark']}",
@@ -301,6 +445,11 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     "--btc-indicator-columns", type=int, default=0, help="Synthetic indicator columns per BTC frame."
   )
   parser.add_argument("--no-drop-ohlcv", action="store_true", help="Keep merged OHLCV/date columns.")
+  parser.add_argument(
+    "--compare",
+    action="store_true",
+    help="Compare the chained merges with the strategy's single-pass merge and check the results are equal.",
+  )
   parser.add_argument("--json", action="store_true", help="Print machine-readable JSON.")
   return parser.parse_args(argv)
 
@@ -318,6 +467,8 @@ def main(argv: list[str] | None = None) -> int:
   else:
     print(format_text_report(report))
 
+  if report["benchmark"] == "merge_informative_pair_compare" and not report["summary"]["frames_equal"]:
+    return 1
   return 0
 
 
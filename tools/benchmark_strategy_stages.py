@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""Benchmark the NostalgiaForInfinityX7 stages on synthetic or recorded OHLCV.
+
+The strategy runs in backtest mode against a local data provider, so the
+benchmark works offline. For each pair it times populate_indicators,
+populate_entry_trend and populate_exit_trend. It then holds one trade per pair
+over the last candles and times custom_exit and adjust_trade_position on each
+candle. The trades are not changed by the exits and adjustments returned.
+
+The report has the mean, median and p95 of each stage and the peak RSS. It
+can be written as JSON with --output and compared with the report of another
+commit with --baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from pathlib import Path
+from statistics import mean
+from statistics import median
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+
+DEFAULT_PAIRS = ("ETH/USDT", "SOL/USDT", "XRP/USDT", "ADA/USDT", "DOGE/USDT", "LINK/USDT", "AVAX/USDT", "DOT/USDT")
+TIMEFRAME_FREQS = {"5m": "5min", "15m": "15min", "1h": "1h", "4h": "4h", "1d": "1D"}
+POPULATE_STAGES = ("populate_indicators", "populate_entry_trend", "populate_exit_trend")
+TRADE_STAGES = ("custom_exit", "adjust_trade_position")
+MIN_STAKE = 5.0
+# The first tag of each long mode, cycled over the pairs so the trades go through the different exit and grind paths
+TRADE_MODE_TAGS = (
+  "long_normal_mode_tags",
+  "long_pump_mode_tags",
+  "long_quick_mode_tags",
+  "long_rebuy_mode_tags",
+  "long_rapid_mode_tags",
+  "long_grind_mode_tags",
+  "long_scalp_mode_tags",
+)
+
+
+def percentile(values: list[float], percent: float) -> float:
+  ordered = sorted(values)
+  position = (len(ordered) - 1) * percent / 100.0
+  lower = math.floor(position)
+  upper = math.ceil(position)
+  return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize_seconds(seconds: list[float]) -> dict[str, float]:
+  return {
+    "count": len(seconds),
+    "mean_seconds": mean(seconds),
+    "median_seconds": median(seconds),
+    "p95_seconds": percentile(seconds, 95.0),
+    "min_seconds": min(seconds),
+    "max_seconds": max(seconds),
+    "total_seconds": sum(seconds),
+  }
+
+
+def peak_rss_bytes() -> int | None:
+  try:
+    import resource
+  except ImportError:
+    return None
+  peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  # Reported in kilobytes on Linux, in bytes on macOS
+  return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def git_commit() -> str | None:
+  try:
+    result = subprocess.run(
+      ["git", "rev-parse", "--short", "HEAD"],
+      cwd=Path(__file__).resolve().parents[1],
+      capture_output=True,
+      text=True,
+      check=True,
+    )
+  except (OSError, subprocess.CalledProcessError):
+    return None
+  return result.stdout.strip() or None
+
+
+def import_runtime_dependencies() -> dict[str, Any]:
+  repo_root = str(Path(__file__).resolve().parents[1])
+  if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+  try:
+    import numpy as np
+    import pandas as pd
+    from freqtrade.enums import CandleType
+    from freqtrade.enums import RunMode
+    from freqtrade.enums import TradingMode
+    from freqtrade.persistence import LocalTrade
+    from freqtrade.persistence import Order
+    from freqtrade.persistence import disable_database_use
+    from NostalgiaForInfinityX7 import NostalgiaForInfinityX7
+  except ModuleNotFoundError as exc:
+    raise RuntimeError(
+      "This benchmark needs the strategy dependencies (TA-Lib, freqtrade) installed. Run it inside the "
+      "Freqtrade environment or container used for backtesting/dry-run work."
+    ) from exc
+  return {
+    "np": np,
+    "pd": pd,
+    "CandleType": CandleType,
+    "RunMode": RunMode,
+    "TradingMode": TradingMode,
+    "LocalTrade": LocalTrade,
+    "Order": Order,
+    "disable_database_use": disable_database_use,
+    "NostalgiaForInfinityX7": NostalgiaForInfinityX7,
+  }
+
+
+def synthetic_ohlcv(np: Any, pd: Any, rows: int, seed: int, end: str = "2025-12-31 23:55") -> Any:
+  """A 5m random walk with volatility regimes, fat tails and a few zero volume candles."""
+  rng = np.random.default_rng(seed)
+  dates = pd.date_range(end=pd.Timestamp(end, tz="UTC"), periods=rows, freq="5min")
+  volatility = 0.003 * np.exp(np.cumsum(rng.normal(0.0, 0.05, rows)).clip(-2.0, 2.0))
+  close = 100.0 * np.exp(np.cumsum(rng.standard_t(3, rows) * volatility))
+  open_rate = np.r_[close[0], close[:-1]]
+  high = np.maximum(open_rate, close) * (1.0 + np.abs(rng.normal(0.0, 0.0015, rows)))
+  low = np.minimum(open_rate, close) * (1.0 - np.abs(rng.normal(0.0, 0.0015, rows)))
+  volume = rng.lognormal(6.0, 1.0, rows)
+  volume[rng.random(rows) < 0.002] = 0.0
+  return pd.DataFrame({"date": dates, "open": open_rate, "high": high, "low": low, "close": close, "volume": volume})
+
+
+def resample_ohlcv(frame: Any, timeframe: str) -> Any:
+  if timeframe == "5m":
+    return frame.copy()
+  aggregations = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+  resampled = frame.set_index("date").resample(TIMEFRAME_FREQS[timeframe], label="left", closed="left")
+  return resampled.agg(aggregations).dropna().reset_index()
+
+
+def benchmark_pairs(args: argparse.Namespace) -> list[str]:
+  if args.pair_list:
+    pairs = [pair.strip() for pair in args.pair_list.split(",") if pair.strip()]
+  else:
+    if args.pairs > len(DEFAULT_PAIRS):
+      raise RuntimeError(f"--pairs must be at most {len(DEFAULT_PAIRS)}, use --pair-list for more pairs.")
+    pairs = list(DEFAULT_PAIRS[: args.pairs])
+  if args.trading_mode == "futures":
+    pairs = [pair if ":" in pair else f"{pair}:{pair.split('/')[1]}" for pair in pairs]
+  return pairs
+
+
+def load_frames(runtime: dict[str, Any], args: argparse.Namespace, pairs: list[str], timeframes: list[str]) -> dict:
+  """The OHLCV by (pair, timeframe), generated, or read from the Freqtrade data directory with --datadir."""
+  np = runtime["np"]
+  pd = runtime["pd"]
+  frames = {}
+  if args.datadir is None:
+    for index, pair in enumerate(pairs):
+      frame_5m = synthetic_ohlcv(np, pd, args.days * 288, args.seed + index)
+      for timeframe in timeframes:
+        frames[(pair, timeframe)] = resample_ohlcv(frame_5m, timeframe)
+    return frames
+
+  from freqtrade.data.history import load_pair_history
+
+  candle_type = runtime["CandleType"].FUTURES if args.trading_mode == "futures" else runtime["CandleType"].SPOT
+  for pair in pairs:
+    for timeframe in timeframes:
+      frame = load_pair_history(pair, timeframe, Path(args.datadir), candle_type=candle_type)
+      if frame.empty:
+        raise RuntimeError(f"No {timeframe} data for {pair} in {args.datadir}.")
+      if timeframe == "5m":
+        frame = frame.iloc[-args.days * 288 :]
+      frames[(pair, timeframe)] = frame.reset_index(drop=True)
+  return frames
+
+
+class BenchmarkDataProvider:
+  """
+  The data provider calls of the strategy, answered from local frames.
+
+  `get_analyzed_dataframe` returns the analyzed dataframe of a pair up to `slice_end`, like the backtests do.
+  """
+
+  def __init__(self, frames: dict, runmode: Any):
+    self.frames = frames
+    self.runmode = runmode
+    self.analyzed = {}
+    self.slice_end = {}
+
+  def get_pair_dataframe(self, pair: str, timeframe: str = None, candle_type: str = "") -> Any:
+    return self.frames[(pair, timeframe)].copy()
+
+  def current_whitelist(self) -> list[str]:
+    return sorted({pair for pair, _ in self.frames})
+
+  def get_analyzed_dataframe(self, pair: str, timeframe: str) -> tuple[Any, Any]:
+    analyzed = self.analyzed[pair]
+    end = self.slice_end.get(pair, len(analyzed))
+    return analyzed.iloc[:end], analyzed["date"].iloc[end - 1]
+
+  def send_msg(self, message: str, *, always_send: bool = False) -> None:
+    pass
+
+
+def build_strategy(runtime: dict[str, Any], args: argparse.Namespace, pairs: list[str], user_data_dir: Path) -> Any:
+  config = {
+    "exchange": {"name": args.exchange, "pair_whitelist": pairs, "pair_blacklist": []},
+    "stake_currency": "USDT",
+    "stake_amount": 100.0,
+    "dry_run": True,
+    "timeframe": "5m",
+    "max_open_trades": len(pairs),
+    "user_data_dir": user_data_dir,
+    "runmode": runtime["RunMode"].BACKTEST,
+  }
+  if args.trading_mode == "futures":
+    config.update({"trading_mode": "futures", "margin_mode": "isolated"})
+  return runtime["NostalgiaForInfinityX7"](config)
+
+
+def open_trade(
+  runtime: dict[str, Any], strategy: Any, trade_id: int, pair: str, candle: Any, args: argparse.Namespace
+):
+  rate = float(candle["close"])
+  open_date = candle["date"].to_pydatetime()
+  amount = 100.0 / rate
+  enter_tag = getattr(strategy, TRADE_MODE_TAGS[(trade_id - 1) % len(TRADE_MODE_TAGS)])[0]
+  trade = runtime["LocalTrade"](
+    pair=pair,
+    open_rate=rate,
+    open_date=open_date,
+    stake_amount=100.0,
+    amount=amount,
+    amount_requested=amount,
+    fee_open=0.001,
+    fee_close=0.001,
+    is_open=True,
+    exchange=args.exchange,
+    enter_tag=f"{enter_tag} ",
+    leverage=1.0,
+    is_short=False,
+    trading_mode=runtime["TradingMode"].FUTURES if args.trading_mode == "futures" else runtime["TradingMode"].SPOT,
+  )
+  trade.id = trade_id
+  trade.orders.append(
+    runtime["Order"](
+      ft_order_side="buy",
+      ft_pair=pair,
+      ft_is_open=False,
+      ft_order_tag=f"{enter_tag} ",
+      order_id=str(trade_id),
+      status="closed",
+      symbol=pair,
+      order_type="limit",
+      side="buy",
+      price=rate,
+      average=rate,
+      amount=amount,
+      filled=amount,
+      remaining=0.0,
+      cost=100.0,
+      order_date=open_date,
+      order_filled_date=open_date,
+    )
+  )
+  runtime["LocalTrade"].add_bt_trade(trade)
+  return trade
+
+
+def run_iteration(runtime: dict[str, Any], args: argparse.Namespace, pairs: list[str], frames: dict) -> dict:
+  """One pass over the pairs, the seconds of each call by stage."""
+  samples = {stage: [] for stage in POPULATE_STAGES + TRADE_STAGES}
+  runtime["LocalTrade"].reset_trades()
+  with tempfile.TemporaryDirectory() as user_data_dir:
+    strategy = build_strategy(runtime, args, pairs, Path(user_data_dir))
+    dp = BenchmarkDataProvider(frames, strategy.config["runmode"])
+    strategy.dp = dp
+
+    for pair in pairs:
+      metadata = {"pair": pair}
+      df = frames[(pair, strategy.timeframe)].copy()
+      for stage in POPULATE_STAGES:
+        started_at = time.perf_counter()
+        df = getattr(strategy, stage)(df, metadata)
+        samples[stage].append(time.perf_counter() - started_at)
+      dp.analyzed[pair] = df
+
+    for trade_id, pair in enumerate(pairs, start=1):
+      df = dp.analyzed[pair]
+      start = max(len(df) - args.trade_candles, 2)
+      trade = open_trade(runtime, strategy, trade_id, pair, df.iloc[start - 1], args)
+      dates = df["date"]
+      open_rates = df["open"].to_numpy()
+      for position in range(start, len(df)):
+        # The candle opening at current_time isn't analyzed yet, the last one is the candle before
+        dp.slice_end[pair] = position
+        current_time = dates.iloc[position].to_pydatetime()
+        current_rate = float(open_rates[position])
+        current_profit = trade.calc_profit_ratio(current_rate)
+
+        started_at = time.perf_counter()
+        strategy.custom_exit(pair, trade, current_time, current_rate, current_profit)
+        samples["custom_exit"].append(time.perf_counter() - started_at)
+
+        started_at = time.perf_counter()
+        strategy.adjust_trade_position(
+          trade,
+          current_time,
+          current_rate,
+          current_profit,
+          MIN_STAKE,
+          trade.stake_amount * 10.0,
+          current_rate,
+          current_rate,
+          current_profit,
+          current_profit,
+        )
+        samples["adjust_trade_position"].append(time.perf_counter() - started_at)
+  runtime["LocalTrade"].reset_trades()
+  return samples
+
+
+def summarize_runs(runs: list[dict[str, list[float]]]) -> dict[str, dict[str, float]]:
+  return {stage: summarize_seconds([value for run in runs for value in run[stage]]) for stage in runs[0]}
+
+
+def compare_reports(report: dict[str, Any], baseline: dict[str, Any]) -> dict[str, dict[str, float]]:
+  """The speedup of each stage over the baseline report, from the mean and the median seconds."""
+  comparison = {}
+  for stage, stats in report["stages"].items():
+    baseline_stats = baseline.get("stages", {}).get(stage)
+    if baseline_stats is None:
+      continue
+    comparison[stage] = {
+      "baseline_mean_seconds": baseline_stats["mean_seconds"],
+      "mean_speedup": baseline_stats["mean_seconds"] / stats["mean_seconds"] if stats["mean_seconds"] else None,
+      "median_speedup": baseline_stats["median_seconds"] / stats["median_seconds"]
+      if stats["median_seconds"]
+      else None,
+    }
+  return comparison
+
+
+def build_report(args: argparse.Namespace) -> dict[str, Any]:
+  if args.repeat <= 0:
+    raise RuntimeError("--repeat must be greater than 0.")
+  if args.days <= 0:
+    raise RuntimeError("--days must be greater than 0.")
+  if args.trade_candles <= 0:
+    raise RuntimeError("--trade-candles must be greater than 0.")
+  if args.pair_list is None and args.pairs <= 0:
+    raise RuntimeError("--pairs must be greater than 0.")
+
+  runtime = import_runtime_dependencies()
+  runtime["disable_database_use"]("5m")
+  pairs = benchmark_pairs(args)
+  with tempfile.TemporaryDirectory() as user_data_dir:
+    probe = build_strategy(runtime, args, pairs, Path(user_data_dir))
+    btc_pair = probe.btc_informative_pair()
+    timeframes = sorted({"5m", *probe.info_timeframes, *probe.btc_info_timeframes}, key=list(TIMEFRAME_FREQS).index)
+  frames = load_frames(runtime, args, [*pairs, btc_pair] if btc_pair not in pairs else pairs, timeframes)
+
+  runs = [run_iteration(runtime, args, pairs, frames) for _ in range(args.repeat)]
+  report = {
+    "benchmark": "strategy_stages",
+    "git_commit": git_commit(),
+    "trading_mode": args.trading_mode,
+    "data": "synthetic" if args.datadir is None else str(args.datadir),
+    "pairs": pairs,
+    "days": args.days,
+    "trade_candles": args.trade_candles,
+    "repeat": args.repeat,
+    "stages": summarize_runs(runs),
+    "peak_rss_bytes": peak_rss_bytes(),
+  }
+  if args.baseline is not None:
+    try:
+      baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+      raise RuntimeError(f"Unable to read the baseline report {args.baseline}: {exc}") from exc
+    report["baseline_git_commit"] = baseline.get("git_commit")
+    report["comparison"] = compare_reports(report, baseline)
+  return report
+
+
+def format_text_report(report: dict[str, Any]) -> str:
+  peak_rss = report["peak_rss_bytes"]
+  lines = [
+    f"benchmark={report['benchmark']}",
+    f"git_commit={report['git_commit']}",
+    f"trading_mode={report['trading_mode']}",
+    f"data={report['data']}",
+    f"pairs={len(report['pairs'])}",
+    f"days={report['days']}",
+    f"repeat={report['repeat']}",
+    f"peak_rss_mib={peak_rss / 1024 / 1024:.1f}" if peak_rss is not None else "peak_rss_mib=n/a",
+    "",
+    "stage                         calls      mean_s    median_s       p95_s     total_s",
+  ]
+
+  for stage, stats in report["stages"].items():
+    lines.append(
+      f"{stage:<28} "
+      f"{stats['count']:>6}  "
+      f"{stats['mean_seconds']:>10.6f}  "
+      f"{stats['median_seconds']:>10.6f}  "
+      f"{stats['p95_seconds']:>10.6f}  "
+      f"{stats['total_seconds']:>10.4f}"
+    )
+
+  comparison = report.get("comparison")
+  if comparison:
+    lines.extend(["", f"speedup over {report.get('baseline_git_commit')}:"])
+    for stage, stats in comparison.items():
+      mean_speedup = stats["mean_speedup"]
+      lines.append(f"{stage:<28} " + (f"{mean_speedup:>6.2f}x" if mean_speedup is not None else "   n/a"))
+
+  return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+  parser = argparse.ArgumentParser(
+    description="Benchmark the NostalgiaForInfinityX7 populate and trade callbacks on synthetic or recorded OHLCV."
+  )
+  parser.add_argument("--pairs", type=int, default=4, help="Number of synthetic pairs.")
+  parser.add_argument("--pair-list", help="Comma separated pairs, instead of the synthetic pair names.")
+  parser.add_argument("--days", type=int, default=75, help="Days of 5m candles for each pair.")
+  parser.add_argument("--repeat", type=int, default=3, help="Number of benchmark repetitions.")
+  parser.add_argument(
+    "--trade-candles", type=int, default=288, help="Last candles of each pair the trade callbacks are timed on."
+  )
+  parser.add_argument("--trading-mode", choices=("spot", "futures"), default="spot")
+  parser.add_argument("--exchange", default="binance", help="Exchange name in the strategy config.")
+  parser.add_argument("--seed", type=int, default=1000, help="Seed of the synthetic OHLCV of the first pair.")
+  parser.add_argument(
+    "--datadir", help="Freqtrade data directory to read recorded OHLCV from, instead of generating it."
+  )
+  parser.add_argument("--output", help="Write the JSON report to this file.")
+  parser.add_argument("--baseline", help="JSON report of a previous run to compare the stages with.")
+  parser.add_argument("--json", action="store_true", help="Print machine-readable JSON.")
+  return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+  args = parse_args(argv)
+  try:
+    report = build_report(args)
+  except RuntimeError as exc:
+    print(str(exc), file=sys.stderr)
+    return 2
+
+  if args.output:
+    Path(args.output).write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+
+  if args.json:
+    print(json.dumps(report, indent=2, sort_keys=True))
+  else:
+    print(format_text_report(report))
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())